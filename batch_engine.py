@@ -0,0 +1,674 @@
+from __future__ import annotations
+
+import math
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from match_engine import (
+    BOX_STAT_KEYS,
+    PLAY_TYPES,
+    SHOT_TYPES,
+    Player,
+    Team,
+    TeamProfile,
+    _assist_scheme_adjustment,
+    _def_rating_adjustment,
+    _is_aggressive_defense,
+    _play_type_weights,
+    _rebound_scheme_adjustment,
+    _shot_type_distribution,
+    _turnover_scheme_adjustment,
+)
+from sim_pool import get_pool
+from variance_reduction import RandomStream
+
+
+# -----------------------------
+# 배열 인덱스
+# -----------------------------
+_S = {k: i for i, k in enumerate(BOX_STAT_KEYS)}
+_PT = {k: i for i, k in enumerate(PLAY_TYPES)}
+_SHOT = {k: i for i, k in enumerate(SHOT_TYPES)}
+
+# 포제션 1스텝에서 쓰는 난수 슬롯 (경기마다 항상 같은 개수를 뽑아 스트림을 맞춘다)
+(
+    _U_OFF_SCHEME,
+    _U_DEF_SCHEME,
+    _U_TOV,
+    _U_BALLHANDLER,
+    _U_STEALER,
+    _U_PLAY_TYPE,
+    _U_SHOOTER,
+    _U_ROLL_MAN,
+    _U_SHOT_TYPE,
+    _U_FOUL,
+    _U_MADE,
+    _U_FOULER,
+    _U_FT1,
+    _U_FT2,
+    _U_FT3,
+    _U_FOLLOW,
+    _U_FOLLOW_PICK,
+) = range(17)
+N_UNIFORMS = 17
+
+# Team.avg 로 집계하는 팀 평균 레이팅
+_AVG_KEYS = (
+    "Stamina", "Playmaking", "Defense", "Perimeter Defense", "Interior Defense",
+    "Athleticism", "Hands", "Offensive Rebound", "Defensive Rebound", "Help Defense IQ",
+)
+_A = {k: i for i, k in enumerate(_AVG_KEYS)}
+
+
+def _pick_index(cum: np.ndarray, u: np.ndarray) -> np.ndarray:
+    """누적 가중치 행(cum[..., -1] = total)에서 u*total 이하가 처음 되는 인덱스."""
+    r = u * cum[:, -1]
+    return (cum < r[:, None]).sum(axis=1)
+
+
+class BatchMatchEngine:
+    """N개의 매치업을 포제션 단위로 한꺼번에 시뮬레이션하는 NumPy 엔진.
+
+    확률 모델은 MatchEngine 과 동일하며, 각 포제션 스텝마다 모든 경기에 대해
+    (경기 수 x N_UNIFORMS) 난수 블록을 한 번에 뽑는다. 반환 형식은
+    MatchEngine.simulate_game() 결과 dict 의 리스트다.
+
+    antithetic=True 이면 경기 g 와 g + ceil(G/2) 가 서로 반대 난수 (U, 1 - U) 를 쓴다.
+    같은 매치업을 여러 번 돌려 평균을 낼 때 분산을 줄이는 용도다.
+
+    crn_block=n 이면 경기들을 n 개씩 묶어 각 묶음의 j 번째 경기가 같은 난수를 쓴다
+    (common random numbers). 후보 설정 여러 개를 같은 순서의 n 경기로 나란히 넣으면
+    설정 간 비교가 짝지어진다. 같은 seed / n 이면 묶음 수와 무관하게 같은 난수다.
+    (antithetic 과 함께 쓰면 묶음 안에서 j 와 j + ceil(n/2) 가 반대 난수)
+    """
+
+    def __init__(
+        self,
+        matchups: Sequence[Tuple[Team, Team]],
+        seed: Optional[int] = None,
+        antithetic: bool = False,
+        crn_block: Optional[int] = None,
+    ):
+        self.matchups = list(matchups)
+        self.rng = np.random.default_rng(seed)
+        self.antithetic = antithetic
+        if crn_block is not None and (crn_block <= 0 or len(self.matchups) % crn_block):
+            raise ValueError(f"crn_block must divide the number of matchups: {crn_block}")
+        self.crn_block = crn_block
+        self.stream = RandomStream(self.rng, antithetic=antithetic, block=crn_block)
+
+    # -----------------------------
+    # 입력 배열 구성
+    # -----------------------------
+    def _build_arrays(self) -> None:
+        G = len(self.matchups)
+        P = max(
+            [len(t.rotation_players) for pair in self.matchups for t in pair] or [1]
+        )
+        P = max(P, 1)
+        self.G, self.P = G, P
+
+        off_names: List[str] = []
+        def_names: List[str] = []
+
+        def _scheme_idx(names: List[str], name: str) -> int:
+            if name not in names:
+                names.append(name)
+            return names.index(name)
+
+        # 같은 Team 객체가 여러 매치업에 반복되면 프로필 컴파일과 배열 채우기는 팀당 한 번만 하고
+        # 매치업별 배열은 팀 행을 인덱싱해서 만든다
+        team_rows: Dict[int, int] = {}
+        teams: List[Team] = []
+        team_idx = np.zeros((G, 2), dtype=np.int64)
+        for g, pair in enumerate(self.matchups):
+            for side, team in enumerate(pair):
+                t = team_rows.get(id(team))
+                if t is None:
+                    t = team_rows[id(team)] = len(teams)
+                    teams.append(team)
+                team_idx[g, side] = t
+        T = len(teams)
+
+        n_players = np.zeros(T, dtype=np.int64)
+        avg = np.zeros((T, len(_AVG_KEYS)))
+        pace = np.zeros(T)
+        press = np.zeros(T)
+        fatigue = np.ones(T)
+        off_scheme = np.zeros((T, 2), dtype=np.int64)
+        off_scheme_w = np.zeros((T, 2))
+        def_scheme = np.zeros((T, 2), dtype=np.int64)
+        def_scheme_w = np.zeros((T, 2))
+        share = np.zeros((T, P))
+
+        shooter_w = np.zeros((T, len(PLAY_TYPES), P))
+        bh_w = np.zeros((T, P))
+        stl_w = np.zeros((T, P))
+        roll_w = np.zeros((T, P))
+        foul_w = np.zeros((T, P))
+        oreb_w = np.zeros((T, P))
+        dreb_w = np.zeros((T, P))
+        ast_w = np.zeros((T, P))
+
+        att = np.zeros((T, len(SHOT_TYPES), P))
+        roll_ins = np.zeros((T, P))
+        post_skill = np.zeros((T, P))
+        post_move = np.zeros((T, P))
+        shot_iq = np.zeros((T, P))
+        athleticism = np.zeros((T, P))
+        draw_foul = np.zeros((T, P))
+        ft_prob = np.zeros((T, P))
+
+        for t, team in enumerate(teams):
+            prof = TeamProfile.compile(team)
+            n = len(prof.players)
+            n_players[t] = n
+            for k, key in enumerate(_AVG_KEYS):
+                avg[t, k] = prof.avg.get(key, 50.0)
+            pace[t] = team.tactics.get("pace", 0)
+            press[t] = 1.0 if team.tactics.get("defense_scheme") == "full_court_press" else 0.0
+            fatigue[t] = prof.fatigue_factor
+
+            prim, sec, prim_w, total = prof.schemes["offense"]
+            off_scheme[t] = (_scheme_idx(off_names, prim), _scheme_idx(off_names, sec or prim))
+            off_scheme_w[t] = (prim_w, total)
+            prim, sec, prim_w, total = prof.schemes["defense"]
+            def_scheme[t] = (_scheme_idx(def_names, prim), _scheme_idx(def_names, sec or prim))
+            def_scheme_w[t] = (prim_w, total)
+
+            share[t, :n] = prof.minute_shares
+            for pt in PLAY_TYPES:
+                shooter_w[t, _PT[pt], :n] = prof.shooter_weights[pt]
+            bh_w[t, :n] = prof.ballhandler_weights
+            stl_w[t, :n] = prof.steal_weights
+            roll_w[t, :n] = prof.roll_weights
+            foul_w[t, :n] = prof.foul_weights
+            oreb_w[t, :n] = prof.off_reb_weights
+            dreb_w[t, :n] = prof.def_reb_weights
+            ast_w[t, :n] = prof.assist_weights
+
+            # 샷 성공 판정용 레이팅 (MatchEngine._resolve_shot)
+            for j, p in enumerate(prof.players):
+                r = p.ratings
+                att[t, _SHOT["three"], j] = r.get("Three-Point Shot", 70.0)
+                att[t, _SHOT["mid"], j] = r.get("Mid-Range Shot", 70.0)
+                att[t, _SHOT["rim"], j] = max(
+                    r.get("Layup", 70.0), r.get("Driving Dunk", 70.0), r.get("Close Shot", 70.0)
+                )
+                roll_ins[t, j] = r.get("Inside Scoring", 70.0)
+                post_skill[t, j] = r.get("Post Control", 70.0)
+                post_move[t, j] = max(r.get("Post Hook", 70.0), r.get("Post Fade", 70.0))
+                shot_iq[t, j] = r.get("Shot IQ", 70.0)
+                athleticism[t, j] = r.get("Athleticism", 75.0)
+                draw_foul[t, j] = r.get("Draw Foul", 70.0)
+                ft = r.get("Free Throw", 75.0)
+                ft_prob[t, j] = max(0.55, min(0.95, 0.75 + (ft - 75.0) / 200.0))
+
+        (
+            n_players, avg, pace, press, fatigue, off_scheme, off_scheme_w, def_scheme, def_scheme_w, share,
+            shooter_w, bh_w, stl_w, roll_w, foul_w, oreb_w, dreb_w, ast_w,
+            att, roll_ins, post_skill, post_move, shot_iq, athleticism, draw_foul, ft_prob,
+        ) = (
+            a[team_idx] for a in (
+                n_players, avg, pace, press, fatigue, off_scheme, off_scheme_w, def_scheme, def_scheme_w, share,
+                shooter_w, bh_w, stl_w, roll_w, foul_w, oreb_w, dreb_w, ast_w,
+                att, roll_ins, post_skill, post_move, shot_iq, athleticism, draw_foul, ft_prob,
+            )
+        )
+
+        # 전술 조합별 룩업 테이블
+        n_off, n_def = len(off_names), len(def_names)
+        play_cum = np.zeros((n_off, len(PLAY_TYPES)))
+        ast_adj = np.zeros(n_off)
+        for i, name in enumerate(off_names):
+            w = _play_type_weights(name)
+            play_cum[i] = np.cumsum([w[pt] for pt in PLAY_TYPES])
+            ast_adj[i] = _assist_scheme_adjustment(name)
+
+        shot_cum = np.zeros((n_off, len(PLAY_TYPES), n_def, len(SHOT_TYPES)))
+        for i, off_name in enumerate(off_names):
+            for pt in PLAY_TYPES:
+                for k, def_name in enumerate(def_names):
+                    dist = _shot_type_distribution(pt, off_name, def_name)
+                    shot_cum[i, _PT[pt], k] = np.cumsum([dist.get(st, 0.0) for st in SHOT_TYPES])
+
+        tov_adj = np.zeros(n_def)
+        reb_adj = np.zeros(n_def)
+        def_agg = np.zeros(n_def)
+        def_adj = np.zeros((n_def, len(PLAY_TYPES), len(SHOT_TYPES)))
+        for k, name in enumerate(def_names):
+            tov_adj[k] = _turnover_scheme_adjustment(name)
+            reb_adj[k] = _rebound_scheme_adjustment(name)
+            def_agg[k] = 2.0 if _is_aggressive_defense(name) else 1.0
+            for pt in PLAY_TYPES:
+                for st in SHOT_TYPES:
+                    def_adj[k, _PT[pt], _SHOT[st]] = _def_rating_adjustment(name, pt, st)
+
+        self.n_players = n_players
+        self.avg = avg
+        self.fatigue = fatigue
+        self.off_scheme, self.off_scheme_w = off_scheme, off_scheme_w
+        self.def_scheme, self.def_scheme_w = def_scheme, def_scheme_w
+        self.share = share
+        self.shooter_cum = np.cumsum(shooter_w, axis=-1)
+        self.bh_cum = np.cumsum(bh_w, axis=-1)
+        self.stl_cum = np.cumsum(stl_w, axis=-1)
+        self.roll_w = roll_w
+        self.foul_cum = np.cumsum(foul_w, axis=-1)
+        self.oreb_cum = np.cumsum(oreb_w, axis=-1)
+        self.dreb_cum = np.cumsum(dreb_w, axis=-1)
+        self.ast_w = ast_w
+        self.att = att
+        self.roll_ins = roll_ins
+        self.post_skill = post_skill
+        self.post_move = post_move
+        self.shot_iq = shot_iq
+        self.athleticism = athleticism
+        self.draw_foul = draw_foul
+        self.ft_prob = ft_prob
+        self.play_cum = play_cum
+        self.shot_cum = shot_cum
+        self.ast_adj = ast_adj
+        self.tov_adj = tov_adj
+        self.reb_adj = reb_adj
+        self.def_agg = def_agg
+        self.def_adj = def_adj
+
+        # 포제션 수 (MatchEngine._estimate_possessions)
+        pace_factor = 1.0 + 0.04 * pace[:, 0] + 0.04 * pace[:, 1]
+        stam = avg[:, :, _A["Stamina"]]
+        stamina_factor = 1.0 + (stam[:, 0] + stam[:, 1] - 150.0) / 400.0 + 0.05 * press.sum(axis=1)
+        poss = np.floor(96 * pace_factor * stamina_factor).astype(np.int64)
+        self.poss = np.clip(poss, 80, 120)
+
+    # -----------------------------
+    # 시뮬레이션
+    # -----------------------------
+    def simulate_games(self) -> List[Dict[str, Any]]:
+        """모든 매치업을 시뮬레이션하고 경기별 결과 dict 리스트를 반환한다.
+
+        boxscore 는 BoxScore (team_id -> 선수 라인 리스트 Mapping) 로, 선수 라인 dict 는
+        그 팀을 처음 읽을 때 만든다. 누적 스탯은 BoxScore.stat_matrix() 로 배열째 반영한다.
+        """
+        if not self.matchups:
+            return []
+        stats = self._run()
+        # 점수는 전체 배열에서 한 번에 (득점은 정수 카운트라 반올림 전 합과 같다)
+        scores = np.rint(stats[..., _S["PTS"]].sum(axis=2)).astype(np.int64).tolist()
+        idents: Dict[int, List[Tuple[Any, str, str]]] = {}
+        results = []
+        for g, (home, away) in enumerate(self.matchups):
+            who = []
+            for team in (home, away):
+                ident = idents.get(id(team))
+                if ident is None:
+                    ident = idents[id(team)] = [(p.player_id, p.name, p.team_id) for p in team.rotation_players]
+                who.append(ident)
+            results.append({
+                "final_score": {home.team_id: scores[g][0], away.team_id: scores[g][1]},
+                "boxscore": BoxScore((home.team_id, away.team_id), who, stats[g]),
+                "meta": {
+                    "possessions": int(self.poss[g]),
+                },
+            })
+        return results
+
+    def simulate_scores(self) -> np.ndarray:
+        """박스스코어 없이 최종 점수만 (G, 2) 정수 배열 [home, away] 로 반환한다."""
+        if not self.matchups:
+            return np.zeros((0, 2), dtype=np.int64)
+        stats = self._run()
+        return np.rint(stats[:, :, :, _S["PTS"]].sum(axis=2)).astype(np.int64)
+
+    def _run(self) -> np.ndarray:
+        """포제션 루프를 돌려 (G, 2, P, 스탯) 박스스코어 배열을 만든다."""
+        self._build_arrays()
+        G, P = self.G, self.P
+        stats = np.zeros((G, 2, P, len(BOX_STAT_KEYS)))
+        offense = np.zeros(G, dtype=np.int64)  # 0 = home, 1 = away
+        minutes_per_possession = 48.0 * 5.0 / self.poss
+        max_poss = int(self.poss.max())
+
+        for step in range(max_poss):
+            active = np.flatnonzero(self.poss > step)
+            U = self._uniforms(G)[active]
+            stats[active, :, :, _S["MIN"]] += (
+                minutes_per_possession[active, None, None] * self.share[active]
+            )
+            offense[active] = self._simulate_possessions(active, offense[active], U, stats)
+
+        return stats
+
+    def _uniforms(self, G: int) -> np.ndarray:
+        """포제션 1스텝용 (G, N_UNIFORMS) 난수 블록."""
+        return self.stream.uniforms(G, N_UNIFORMS)
+
+    def _simulate_possessions(
+        self,
+        g: np.ndarray,
+        o: np.ndarray,
+        U: np.ndarray,
+        stats: np.ndarray,
+    ) -> np.ndarray:
+        """활성 경기들의 포제션 1개씩을 처리하고 다음 공격 측(0/1)을 반환한다."""
+        d = 1 - o
+
+        # 0) 전술 선택
+        sw = self.off_scheme_w[g, o]
+        off_s = np.where(U[:, _U_OFF_SCHEME] * sw[:, 1] < sw[:, 0], 0, 1)
+        off_s = np.where(sw[:, 1] <= 0, 0, off_s)
+        off_s = self.off_scheme[g, o, off_s]
+        sw = self.def_scheme_w[g, d]
+        def_s = np.where(U[:, _U_DEF_SCHEME] * sw[:, 1] < sw[:, 0], 0, 1)
+        def_s = np.where(sw[:, 1] <= 0, 0, def_s)
+        def_s = self.def_scheme[g, d, def_s]
+
+        off_avg = self.avg[g, o]
+        def_avg = self.avg[g, d]
+        n_off = self.n_players[g, o]
+        n_def = self.n_players[g, d]
+
+        # 1) 초기 턴오버
+        tov_prob = (
+            0.11
+            - (off_avg[:, _A["Playmaking"]] - 75.0) / 250.0
+            + (def_avg[:, _A["Defense"]] - 75.0) / 250.0
+            + self.tov_adj[def_s]
+        )
+        tov_prob = np.clip(tov_prob, 0.05, 0.25)
+        tov = U[:, _U_TOV] < tov_prob
+
+        t = np.flatnonzero(tov)
+        if len(t):
+            bh = np.minimum(_pick_index(self.bh_cum[g[t], o[t]], U[t, _U_BALLHANDLER]), n_off[t] - 1)
+            sl = np.minimum(_pick_index(self.stl_cum[g[t], d[t]], U[t, _U_STEALER]), n_def[t] - 1)
+            stats[g[t], o[t], bh, _S["TOV"]] += 1
+            stats[g[t], d[t], sl, _S["STL"]] += 1
+
+        next_offense = d.copy()
+        s = np.flatnonzero(~tov)
+        if not len(s):
+            return next_offense
+
+        gs, os_, ds = g[s], o[s], d[s]
+        us = U[s]
+        off_ss, def_ss = off_s[s], def_s[s]
+
+        # 2) 플레이 타입
+        play = _pick_index(self.play_cum[off_ss], us[:, _U_PLAY_TYPE])
+        play = np.minimum(play, _PT["generic"])
+        is_pnr = play == _PT["pnr"]
+
+        # 3) 공격수 / 롤맨
+        shooter = _pick_index(self.shooter_cum[gs, os_, play], us[:, _U_SHOOTER])
+        shooter = np.where(shooter >= n_off[s], 0, shooter)
+        rs = np.arange(len(s))
+
+        roll_w = self.roll_w[gs, os_].copy()
+        roll_w[rs, shooter] = 0.0
+        roll_cum = np.cumsum(roll_w, axis=1)
+        roll = _pick_index(roll_cum, us[:, _U_ROLL_MAN])
+        has_roll = is_pnr & (roll_cum[:, -1] > 0) & (roll < n_off[s])
+        roll = np.minimum(roll, self.P - 1)
+
+        # 4) 샷 타입
+        shot = _pick_index(self.shot_cum[off_ss, play, def_ss], us[:, _U_SHOT_TYPE])
+        shot = np.where(shot >= len(SHOT_TYPES), _SHOT["rim"], shot)
+        is_three = shot == _SHOT["three"]
+        is_rim = shot == _SHOT["rim"]
+
+        # 5) 샷 성공 / 파울 판정
+        att = self.att[gs, os_, shot, shooter]
+        att = np.where(has_roll, att * 0.6 + self.roll_ins[gs, os_, roll] * 0.4, att)
+        is_post = play == _PT["post"]
+        att = np.where(
+            is_post,
+            att * 0.3 + self.post_skill[gs, os_, shooter] * 0.4 + self.post_move[gs, os_, shooter] * 0.3,
+            att,
+        )
+        is_iso = play == _PT["iso"]
+        att = np.where(is_iso, att + (self.shot_iq[gs, os_, shooter] - 70.0) * 0.5, att)
+
+        d_avg = def_avg[s]
+        def_rating = np.where(
+            is_rim, d_avg[:, _A["Interior Defense"]], d_avg[:, _A["Perimeter Defense"]]
+        )
+        def_rating = def_rating + self.def_adj[def_ss, play, shot]
+
+        ath_delta = (self.athleticism[gs, os_, shooter] - d_avg[:, _A["Athleticism"]]) / 20.0
+        base_prob = 0.45 + (att - def_rating) / 150.0
+        base_prob += ath_delta * 0.05
+        base_prob += (self.fatigue[gs, os_] - 1.0) * 0.08
+        base_prob -= (self.fatigue[gs, ds] - 1.0) * 0.05
+        base_prob += np.where(is_three, -0.08, np.where(is_rim, 0.05, -0.03))
+        prob = np.clip(base_prob, 0.20, 0.80)
+
+        foul_base = (
+            0.10
+            + (self.draw_foul[gs, os_, shooter] - 70.0) / 350.0
+            + (self.def_agg[def_ss] - 1.0) * 0.03
+        )
+        foul_base -= (d_avg[:, _A["Hands"]] - 70.0) / 400.0
+        foul_base += np.where((is_iso | (play == _PT["drive_kick"])) & is_rim, 0.03, 0.0)
+        foul_prob = np.clip(foul_base, 0.05, 0.30)
+
+        foul = us[:, _U_FOUL] < foul_prob
+        made = us[:, _U_MADE] < prob
+
+        f = np.flatnonzero(foul)
+        if len(f):
+            fouler = _pick_index(self.foul_cum[gs[f], ds[f]], us[f, _U_FOULER])
+            ok = fouler < n_def[s][f]
+            stats[gs[f][ok], ds[f][ok], fouler[ok], _S["PF"]] += 1
+
+        # 6) 자유투
+        ft_count = np.where(foul, np.where(made, 1, np.where(is_three, 3, 2)), 0)
+        ft_p = self.ft_prob[gs, os_, shooter]
+        for k, slot in enumerate((_U_FT1, _U_FT2, _U_FT3)):
+            shoot = ft_count > k
+            if not shoot.any():
+                break
+            hit = shoot & (us[:, slot] < ft_p)
+            stats[gs[shoot], os_[shoot], shooter[shoot], _S["FTA"]] += 1
+            stats[gs[hit], os_[hit], shooter[hit], _S["FTM"]] += 1
+            stats[gs[hit], os_[hit], shooter[hit], _S["PTS"]] += 1
+
+        # 7) 득점
+        stats[gs, os_, shooter, _S["FGA"]] += 1
+        stats[gs, os_, shooter, _S["3PA"]] += is_three
+        stats[gs, os_, shooter, _S["PTS"]] += np.where(made, np.where(is_three, 3, 2), 0)
+        stats[gs, os_, shooter, _S["FGM"]] += made
+        stats[gs, os_, shooter, _S["3PM"]] += made & is_three
+
+        # 8) 어시스트
+        m = np.flatnonzero(made)
+        if len(m):
+            base_ast = (
+                0.55
+                + (off_avg[s][m, _A["Playmaking"]] - d_avg[m, _A["Help Defense IQ"]]) / 300.0
+                + self.ast_adj[off_ss[m]]
+            )
+            base_ast = np.clip(base_ast, 0.15, 0.85)
+            m = m[(us[m, _U_FOLLOW] <= base_ast) & (n_off[s][m] > 1)]
+            if len(m):
+                ast_w = self.ast_w[gs[m], os_[m]].copy()
+                ast_w[np.arange(len(m)), shooter[m]] = 0.0
+                ast_cum = np.cumsum(ast_w, axis=1)
+                assister = _pick_index(ast_cum, us[m, _U_FOLLOW_PICK])
+                ok = assister < n_off[s][m]
+                stats[gs[m][ok], os_[m][ok], assister[ok], _S["AST"]] += 1
+
+        # 9) 리바운드
+        b = np.flatnonzero(~made & ~foul)
+        if len(b):
+            share = (
+                0.75
+                + (d_avg[b, _A["Defensive Rebound"]] - off_avg[s][b, _A["Offensive Rebound"]]) / 400.0
+                + self.reb_adj[def_ss[b]]
+            )
+            share = np.clip(share, 0.60, 0.90)
+            def_reb = us[b, _U_FOLLOW] < share
+            reb_side = np.where(def_reb, ds[b], os_[b])
+            reb_cum = np.where(
+                def_reb[:, None], self.dreb_cum[gs[b], ds[b]], self.oreb_cum[gs[b], os_[b]]
+            )
+            reb_n = self.n_players[gs[b], reb_side]
+            rebounder = _pick_index(reb_cum, us[b, _U_FOLLOW_PICK])
+            ok = rebounder < reb_n
+            stats[gs[b][ok], reb_side[ok], rebounder[ok], _S["REB"]] += 1
+            next_offense[s[b]] = reb_side
+
+        return next_offense
+
+
+# 박스스코어 행 (MatchEngine._box_row 와 같은 키 순서): 소수 첫째 자리 반올림 스탯 + 정수 스탯
+_BOX_FLOAT_KEYS = ("MIN", "PTS", "REB", "AST", "STL", "BLK", "TOV")
+_BOX_INT_KEYS = ("FGM", "FGA", "3PM", "3PA", "FTM", "FTA", "PF")
+_BOX_ROW_KEYS = ("PlayerID", "Name", "Team") + _BOX_FLOAT_KEYS + _BOX_INT_KEYS
+_BOX_FLOAT_IDX = [_S[k] for k in _BOX_FLOAT_KEYS]
+_BOX_INT_IDX = [_S[k] for k in _BOX_INT_KEYS]
+
+
+# -----------------------------
+# 박스스코어 (배열 기반, MatchEngine.simulate_game 과 동일한 형태)
+# -----------------------------
+class BoxScore(Mapping):
+    """경기 하나의 박스스코어: team_id -> 선수 라인 dict 리스트.
+
+    배치 / quick 엔진은 (2, P, 스탯) 배열만 들고 있다가 팀 라인을 처음 읽을 때
+    MatchEngine._box_row 와 같은 dict 로 만든다 (값 / 타입 / 키 순서 동일).
+    dict 를 거치지 않는 소비자 (StatAggregator) 는 player_idents() / stat_matrix() 를 쓴다.
+    """
+
+    __slots__ = ("_team_ids", "_idents", "_stats", "_rows")
+
+    def __init__(
+        self,
+        team_ids: Tuple[str, str],
+        idents: List[List[Tuple[Any, str, str]]],
+        stats: np.ndarray,
+    ):
+        self._team_ids = team_ids  # (home, away)
+        self._idents = idents      # 팀별 [(PlayerID, Name, Team)] (로테이션 순서)
+        self._stats = stats        # (2, P, len(BOX_STAT_KEYS)), P >= 로테이션 인원
+        self._rows: Dict[str, List[Dict[str, Any]]] = {}
+
+    def __getitem__(self, team_id: str) -> List[Dict[str, Any]]:
+        rows = self._rows.get(team_id)
+        if rows is not None:
+            return rows
+        if team_id not in self._team_ids:
+            raise KeyError(team_id)
+        side = self._team_ids.index(team_id)
+        ident = self._idents[side]
+        team_stats = self._stats[side, : len(ident)]
+        floats = np.round(team_stats[:, _BOX_FLOAT_IDX], 1).tolist()
+        ints = team_stats[:, _BOX_INT_IDX].astype(np.int64).tolist()
+        # 키 순서는 _BOX_ROW_KEYS (= MatchEngine._box_row) 와 같아야 한다.
+        rows = self._rows[team_id] = [
+            {
+                "PlayerID": pid, "Name": name, "Team": tid,
+                "MIN": mn, "PTS": pt, "REB": reb, "AST": ast, "STL": stl, "BLK": blk, "TOV": tov,
+                "FGM": fgm, "FGA": fga, "3PM": m3, "3PA": a3, "FTM": ftm, "FTA": fta, "PF": pf,
+            }
+            for (pid, name, tid), (mn, pt, reb, ast, stl, blk, tov), (fgm, fga, m3, a3, ftm, fta, pf)
+            in zip(ident, floats, ints)
+        ]
+        return rows
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._team_ids)
+
+    def __len__(self) -> int:
+        return len(self._team_ids)
+
+    def __repr__(self) -> str:
+        return f"BoxScore({dict(self)!r})"
+
+    def player_idents(self) -> List[Tuple[Any, str, str]]:
+        """선수 라인 순서 (홈 팀 -> 원정 팀) 의 (PlayerID, Name, Team)."""
+        return self._idents[0] + self._idents[1]
+
+    def stat_matrix(self) -> np.ndarray:
+        """(선수 라인 수, len(BOX_STAT_KEYS)) 값 배열. 선수 라인 dict 의 값과 같다."""
+        n0, n1 = len(self._idents[0]), len(self._idents[1])
+        values = np.concatenate([self._stats[0, :n0], self._stats[1, :n1]])
+        values[:, _BOX_FLOAT_IDX] = np.round(values[:, _BOX_FLOAT_IDX], 1)
+        values[:, _BOX_INT_IDX] = np.trunc(values[:, _BOX_INT_IDX])
+        return values
+
+
+def simulate_games_batch(
+    matchups: Sequence[Tuple[Team, Team]],
+    seed: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """(home, away) Team 쌍 리스트를 배치 엔진으로 시뮬레이션한다."""
+    return BatchMatchEngine(matchups, seed=seed).simulate_games()
+
+
+def _simulate_block(
+    matchups: List[Tuple[Team, Team]], seed: int, antithetic: bool, crn_block: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """(점수 (G, 2), 경기별 포제션 스텝 수 (G,)). simulate_paired 의 프로세스 풀 작업."""
+    engine = BatchMatchEngine(matchups, seed=seed, antithetic=antithetic, crn_block=crn_block)
+    return engine.simulate_scores(), engine.poss
+
+
+def simulate_paired(
+    teams: Sequence[Team],
+    schedule: Sequence[Tuple[Team, bool]],
+    seed: int,
+    antithetic: bool = False,
+    workers: int = 1,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """설정이 다른 팀(후보)들이 같은 일정을 같은 난수로 치른다 (common random numbers).
+
+    schedule: 후보마다 치르는 (상대, 후보가 홈인지) 목록.
+    반환: (후보 관점 점수차 (후보 수, 경기 수), 경기별 포제션 스텝 수 (후보 수, 경기 수)).
+
+    - 일정 길이를 crn_block 으로 쓰므로 후보 i 의 j 번째 경기와 후보 k 의 j 번째 경기는 같은 난수다.
+    - antithetic=True 면 j 와 j + ceil(n/2) 가 반대 난수 (variance_reduction.mirrored 일정과 함께 쓴다).
+    - workers > 1 이면 후보를 나눠 프로세스 풀로 돌린다. 같은 seed / 블록이면 같은 난수라
+      결과는 workers 와 무관하다.
+    """
+    n_games = len(schedule)
+    if workers > 1 and len(teams) > 1:
+        size = math.ceil(len(teams) / workers)
+        groups = [teams[i:i + size] for i in range(0, len(teams), size)]
+    else:
+        groups = [teams]
+
+    jobs = [
+        [(team, opp) if home else (opp, team) for team in group for opp, home in schedule]
+        for group in groups
+    ]
+    if len(jobs) > 1:
+        pool = get_pool(workers)
+        futures = [pool.submit(_simulate_block, matchups, seed, antithetic, n_games) for matchups in jobs]
+        parts = [f.result() for f in futures]
+    else:
+        parts = [_simulate_block(jobs[0], seed, antithetic, n_games)]
+
+    scores = np.concatenate([p[0] for p in parts])
+    poss = np.concatenate([p[1] for p in parts]).reshape(len(teams), n_games)
+    sign = np.array([1.0 if home else -1.0 for _, home in schedule])
+    margin = (scores[:, 0] - scores[:, 1]).astype(float).reshape(len(teams), n_games) * sign
+    return margin, poss
+
+
+def simulate_matchup_totals(
+    home: Team,
+    away: Team,
+    n_games: int,
+    seed: Optional[int] = None,
+    antithetic: bool = False,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """home vs away 를 n_games 번 돌려 (경기별 점수 (n, 2), 선수별 스탯 합계 (2, P, 스탯)) 를 반환한다.
+
+    박스스코어 dict 를 만들지 않으므로 예측용 대량 시뮬레이션 (워커 프로세스 포함) 에 쓴다.
+    """
+    stats = BatchMatchEngine([(home, away)] * n_games, seed=seed, antithetic=antithetic)._run()
+    scores = np.rint(stats[:, :, :, _S["PTS"]].sum(axis=2)).astype(np.int64)
+    return scores, stats.sum(axis=0)
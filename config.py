@@ -45,6 +45,9 @@ if "Salary" in ROSTER_DF.columns:
 else:
     ROSTER_DF["SalaryAmount"] = 0.0
 
+# 트레이드 이전(엑셀 기준) 소속 팀. 세이브 파일에는 이것과 달라진 선수만 저장한다.
+ROSTER_BASE_TEAMS = ROSTER_DF["Team"].copy()
+
 # 리그/디비전 설정 (프론트 script.js 의 DIVISIONS와 동일하게 맞춤)
 ALL_TEAM_IDS: List[str] = sorted(ROSTER_DF["Team"].unique())
 
@@ -0,0 +1,385 @@
+from __future__ import annotations
+
+import functools
+import inspect
+import json
+import os
+import threading
+import time
+from collections.abc import Mapping
+from contextlib import contextmanager
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from config import BASE_DIR
+
+# 상태 변경 이벤트 로그 (append-only) + 주기적 체크포인트.
+#
+# GAME_STATE 를 바꾸는 진입점 (update_state_with_game, _execute_trade, set_current_date,
+# 스케줄 생성, 포스트시즌 진행 등) 이 record_event(...) 로 타입이 있는 이벤트를 남긴다.
+#   events.jsonl                : 한 줄에 이벤트 하나 {"seq", "type", "date", "data"}
+#   checkpoints/<slot>/         : persistence.save_league 스냅샷 (이벤트 seq 시점)
+#   checkpoints.json            : 체크포인트 목록 (seq, 로그 파일 offset, 날짜)
+#
+# - 복구: 가장 최근 체크포인트를 불러온 뒤 그 뒤 이벤트만 다시 적용한다.
+#   CHECKPOINT_EVERY 이벤트마다 체크포인트를 찍으므로 재생할 꼬리 길이가 제한된다.
+# - 과거 날짜로 되돌리기: 그 날짜 이전의 가장 가까운 체크포인트 + 그 날짜까지의 이벤트.
+# - 포스트시즌 진행은 결과 대신 호출 (op + 인자) 을 기록한다. 포스트시즌 경기 seed 는
+#   리그 마스터 seed 에서 파생되므로 다시 호출하면 같은 결과가 나온다.
+# - 기록은 열린 로그가 있을 때만 한다 (서버는 시작할 때 open_event_log() 로 연다).
+#   이벤트 적용 중 (다른 기록 진입점 안 / 재생 중) 에 일어나는 하위 변경은 기록하지 않는다.
+
+EVENT_LOG_DIR = os.path.join(BASE_DIR, "saves", "events")
+LOG_NAME = "events.jsonl"
+CHECKPOINT_INDEX_NAME = "checkpoints.json"
+CHECKPOINT_DIR = "checkpoints"
+
+# 이 개수만큼 이벤트가 쌓이면 자동으로 체크포인트를 찍는다
+CHECKPOINT_EVERY = 500
+# 현재 타임라인 기준 체크포인트 외에 남겨 둘 최근 체크포인트 수
+KEEP_CHECKPOINTS = 6
+
+_LOCAL = threading.local()
+
+
+def _depth() -> int:
+    return getattr(_LOCAL, "depth", 0)
+
+
+@contextmanager
+def _suppressed() -> Iterator[None]:
+    """이 블록 안 (같은 스레드) 의 record_event 는 무시한다."""
+    _LOCAL.depth = _depth() + 1
+    try:
+        yield
+    finally:
+        _LOCAL.depth -= 1
+
+
+# -----------------------------
+# 이벤트 로그
+# -----------------------------
+def _json_default(value: Any) -> Any:
+    """엔진 BoxScore 같은 Mapping 은 dict 로 쓴다."""
+    if isinstance(value, Mapping):
+        return dict(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class EventLog:
+    """root 디렉터리 하나에 이벤트 로그와 체크포인트를 둔다."""
+
+    def __init__(
+        self,
+        root: str = EVENT_LOG_DIR,
+        checkpoint_every: int = CHECKPOINT_EVERY,
+        keep_checkpoints: int = KEEP_CHECKPOINTS,
+    ):
+        if checkpoint_every < 1:
+            raise ValueError(f"invalid checkpoint_every: {checkpoint_every}")
+        self.root = root
+        self.checkpoint_every = checkpoint_every
+        self.keep_checkpoints = keep_checkpoints
+        self._lock = threading.RLock()
+        os.makedirs(os.path.join(root, CHECKPOINT_DIR), exist_ok=True)
+
+        self._checkpoints: List[Dict[str, Any]] = self._read_index()
+        self.seq = self._scan_tail()
+        self._file = open(self._log_path, "ab")
+
+    @property
+    def _log_path(self) -> str:
+        return os.path.join(self.root, LOG_NAME)
+
+    def _read_index(self) -> List[Dict[str, Any]]:
+        path = os.path.join(self.root, CHECKPOINT_INDEX_NAME)
+        if not os.path.exists(path):
+            return []
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def _write_index(self) -> None:
+        path = os.path.join(self.root, CHECKPOINT_INDEX_NAME)
+        with open(f"{path}.tmp", "w", encoding="utf-8") as f:
+            json.dump(self._checkpoints, f, ensure_ascii=False)
+        os.replace(f"{path}.tmp", path)
+
+    def _scan_tail(self) -> int:
+        """마지막 체크포인트 이후를 읽어 마지막 seq 를 찾는다. 끊긴 마지막 줄은 잘라낸다."""
+        last = self._checkpoints[-1] if self._checkpoints else {"seq": 0, "offset": 0}
+        if not os.path.exists(self._log_path):
+            return last["seq"]
+
+        seq, good_end = last["seq"], last["offset"]
+        with open(self._log_path, "rb") as f:
+            f.seek(good_end)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                try:
+                    seq = json.loads(line)["seq"]
+                except (ValueError, KeyError):
+                    break
+                good_end += len(line)
+        if good_end < os.path.getsize(self._log_path):
+            with open(self._log_path, "r+b") as f:
+                f.truncate(good_end)
+        return seq
+
+    # -----------------------------
+    # 기록
+    # -----------------------------
+    def append(self, event_type: str, data: Dict[str, Any], date: Optional[str] = None) -> int:
+        """이벤트 하나를 로그 끝에 쓰고 seq 를 반환한다. 필요하면 체크포인트를 찍는다."""
+        with self._lock:
+            seq = self.seq + 1
+            event = {"seq": seq, "type": event_type, "date": date, "data": data}
+            self._file.write(json.dumps(event, ensure_ascii=False, separators=(",", ":"), default=_json_default).encode("utf-8") + b"\n")
+            self._file.flush()
+            self.seq = seq
+
+            last = self._checkpoints[-1]["seq"] if self._checkpoints else 0
+            if seq - last >= self.checkpoint_every:
+                self.checkpoint()
+            return seq
+
+    def events(self, after_seq: int = 0, until_seq: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """after_seq 보다 뒤의 이벤트 (until_seq 포함까지). 가까운 체크포인트 offset 부터 읽는다."""
+        with self._lock:
+            self._file.flush()
+            start = 0
+            for ckpt in self._checkpoints:
+                if ckpt["seq"] <= after_seq:
+                    start = max(start, ckpt["offset"])
+
+        with open(self._log_path, "rb") as f:
+            f.seek(start)
+            for line in f:
+                event = json.loads(line)
+                if event["seq"] <= after_seq:
+                    continue
+                if until_seq is not None and event["seq"] > until_seq:
+                    return
+                yield event
+
+    # -----------------------------
+    # 체크포인트
+    # -----------------------------
+    def checkpoints(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [dict(c) for c in self._checkpoints]
+
+    def checkpoint(self, base: bool = False, reason: Optional[str] = None) -> Dict[str, Any]:
+        """현재 GAME_STATE 를 seq 시점 체크포인트로 저장한다.
+
+        base=True 는 새 타임라인의 시작 (세이브 불러오기 / 날짜 되돌리기 직후) 이다.
+        그 이전 이벤트는 되돌리기 대상에서 빠진다.
+        """
+        from persistence import save_league  # 지연 import (state -> event_log 순환 방지)
+        from state import get_current_date
+
+        with self._lock:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            slot = f"ckpt-{self.seq:010d}"
+            saved = save_league(slot, os.path.join(self.root, CHECKPOINT_DIR))
+
+            # 같은 seq 의 체크포인트는 새 것으로 바꾼다 (base 여부는 유지)
+            replaced = [c for c in self._checkpoints if c["seq"] == self.seq]
+            rest = [c for c in self._checkpoints if c["seq"] != self.seq]
+            entry = {
+                "seq": self.seq,
+                "offset": self._file.tell(),
+                "slot": slot,
+                "date": get_current_date(),
+                "base": base or not rest or any(c["base"] for c in replaced),
+                "reason": reason,
+                "created_at": datetime.now().isoformat(timespec="seconds"),
+            }
+            self._checkpoints = rest + [entry]
+            self._prune()
+            self._write_index()
+            return dict(entry, seconds=saved["seconds"])
+
+    def _timeline(self) -> List[Dict[str, Any]]:
+        """마지막 base 체크포인트부터의 체크포인트 목록."""
+        bases = [i for i, c in enumerate(self._checkpoints) if c["base"]]
+        return self._checkpoints[bases[-1]:] if bases else list(self._checkpoints)
+
+    def _prune(self) -> None:
+        timeline = self._timeline()
+        keep = {id(timeline[0])} | {id(c) for c in timeline[-self.keep_checkpoints:]} if timeline else set()
+        for c in [c for c in self._checkpoints if id(c) not in keep]:
+            _remove_tree(os.path.join(self.root, CHECKPOINT_DIR, c["slot"]))
+        self._checkpoints = [c for c in self._checkpoints if id(c) in keep]
+
+    # -----------------------------
+    # 복구 / 되돌리기
+    # -----------------------------
+    def _load_and_replay(self, ckpt: Dict[str, Any], until_seq: Optional[int]) -> int:
+        from game_store import get_game_store
+        from persistence import load_league
+
+        load_league(ckpt["slot"], os.path.join(self.root, CHECKPOINT_DIR))
+        replayed = 0
+        with _suppressed():
+            for event in self.events(ckpt["seq"], until_seq):
+                apply_event(event)
+                replayed += 1
+        get_game_store().flush()
+        return replayed
+
+    def recover(self) -> Dict[str, Any]:
+        """가장 최근 체크포인트 + 그 뒤 이벤트로 GAME_STATE 를 되살린다.
+
+        체크포인트가 하나도 없으면 (새 로그) 현재 상태를 첫 체크포인트로 찍는다.
+        이때 이전 리그가 남긴 경기 기록 (game_store) 은 비운다.
+        """
+        from game_store import get_game_store
+
+        t0 = time.perf_counter()
+        with self._lock:
+            if not self._checkpoints:
+                get_game_store().clear()
+                self.checkpoint(base=True, reason="init")
+                return {"checkpoint_seq": self.seq, "replayed": 0, "seq": self.seq, "seconds": 0.0}
+            ckpt = self._checkpoints[-1]
+            replayed = self._load_and_replay(ckpt, None)
+            return {
+                "checkpoint_seq": ckpt["seq"],
+                "replayed": replayed,
+                "seq": self.seq,
+                "seconds": round(time.perf_counter() - t0, 4),
+            }
+
+    def restore_to(self, date_str: str) -> Dict[str, Any]:
+        """현재 타임라인을 date_str (그 날짜까지의 이벤트 포함) 시점으로 되돌린다.
+
+        되돌린 상태를 새 base 체크포인트로 찍으므로 이후 이벤트는 새 타임라인이 된다.
+        날짜 형식이 잘못됐거나 타임라인 시작보다 앞서면 ValueError.
+        """
+        try:
+            date_str = date.fromisoformat(date_str).isoformat()
+        except ValueError:
+            raise ValueError(f"invalid date: {date_str}")
+
+        t0 = time.perf_counter()
+        with self._lock:
+            timeline = self._timeline()
+            if not timeline:
+                raise ValueError("event log has no checkpoints")
+
+            # date_str 보다 늦은 첫 이벤트 직전까지가 목표 구간
+            stop_seq = self.seq
+            for event in self.events(timeline[0]["seq"]):
+                if event["date"] and event["date"] > date_str:
+                    stop_seq = event["seq"] - 1
+                    break
+
+            candidates = [c for c in timeline if c["seq"] <= stop_seq]
+            if not candidates or (timeline[0]["date"] and timeline[0]["date"] > date_str):
+                raise ValueError(f"date is before the start of the event log timeline: {date_str}")
+            ckpt = candidates[-1]
+            replayed = self._load_and_replay(ckpt, stop_seq)
+            self.checkpoint(base=True, reason=f"restore:{date_str}")
+            return {
+                "date": date_str,
+                "checkpoint_seq": ckpt["seq"],
+                "replayed": replayed,
+                "restored_seq": stop_seq,
+                "seconds": round(time.perf_counter() - t0, 4),
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+
+def _remove_tree(path: str) -> None:
+    for dirpath, _, filenames in os.walk(path, topdown=False):
+        for name in filenames:
+            os.remove(os.path.join(dirpath, name))
+        os.rmdir(dirpath)
+
+
+# -----------------------------
+# 재생
+# -----------------------------
+def apply_event(event: Dict[str, Any]) -> None:
+    """이벤트 하나를 GAME_STATE 에 다시 적용한다 (기록 진입점 함수를 그대로 호출)."""
+    import playoffs  # 지연 import
+    import state
+    import trades_ai
+
+    kind, data = event["type"], event["data"]
+    if kind == "game":
+        state.update_state_with_game(**data)
+    elif kind == "set_date":
+        state.set_current_date(data["date"])
+    elif kind == "master_seed":
+        state.set_league_master_seed(data["seed"])
+    elif kind == "schedule":
+        state._install_master_schedule(data["season_year"], [tuple(g) for g in data["games"]])
+    elif kind == "trade":
+        trades_ai._execute_trade(**data)
+    elif kind == "gm_tick":
+        state._ensure_league_state()["last_gm_tick_date"] = data["date"]
+    elif kind == "postseason":
+        getattr(playoffs, data["op"])(**data["args"])
+    else:
+        raise ValueError(f"unknown event type: {kind}")
+
+
+# -----------------------------
+# 기록 진입점
+# -----------------------------
+_LOG: Optional[EventLog] = None
+
+
+def get_event_log() -> Optional[EventLog]:
+    return _LOG
+
+
+def set_event_log(log: Optional[EventLog]) -> None:
+    """기록할 로그를 지정한다. None 이면 기록하지 않는다."""
+    global _LOG
+    if _LOG is not None and _LOG is not log:
+        _LOG.close()
+    _LOG = log
+
+
+def open_event_log(root: str = EVENT_LOG_DIR) -> Tuple[EventLog, Dict[str, Any]]:
+    """root 의 로그를 열어 기록 대상으로 지정하고 GAME_STATE 를 복구한다."""
+    log = EventLog(root)
+    set_event_log(log)
+    return log, log.recover()
+
+
+def record_event(event_type: str, data: Dict[str, Any], date: Optional[str] = None) -> Optional[int]:
+    """열린 로그가 있고, 다른 이벤트를 적용하는 중이 아니면 기록한다."""
+    if _LOG is None or _depth():
+        return None
+    return _LOG.append(event_type, data, date)
+
+
+def logged_op(func: Callable[..., Any]) -> Callable[..., Any]:
+    """함수 호출 자체 (이름 + 인자) 를 "postseason" 이벤트로 남기는 데코레이터.
+
+    함수 안에서 일어나는 하위 변경은 따로 기록하지 않는다. 예외로 끝난 호출은 기록하지 않는다.
+    """
+    signature = inspect.signature(func)
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        if _LOG is None or _depth():
+            return func(*args, **kwargs)
+        bound = signature.bind(*args, **kwargs)
+        with _suppressed():
+            result = func(*args, **kwargs)
+
+        from state import get_current_date  # 지연 import
+
+        record_event("postseason", {"op": func.__name__, "args": dict(bound.arguments)}, get_current_date())
+        return result
+
+    return wrapper
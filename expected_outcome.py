@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import math
+import weakref
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from match_engine import Team
+from quick_sim import MAX_ROTATION, _LAYOUT, _SHOT_KINDS, pair_models
+
+# NOTE: 샘플링 없이 quick_sim 의 쌍 모델(포제션 1스텝 결과 분포)을 그대로 적분한다.
+#       쌍 모델은 Team 객체별로 캐시되므로 같은 팀들을 반복 평가하면 모델 계산은 한 번뿐이다.
+
+# 슛 결과 종류별 (야투 득점, 자유투 시도 수). quick_sim._SHOT_KINDS 순서.
+_KIND_POINTS = {
+    "m2": (2, 0),
+    "m2f": (2, 1),
+    "m3": (3, 0),
+    "m3f": (3, 1),
+    "x2f": (0, 2),
+    "x3f": (0, 3),
+    "x2d": (0, 0),
+    "x3d": (0, 0),
+}
+_FG_POINTS = np.array([_KIND_POINTS[k][0] for k in _SHOT_KINDS], dtype=float)[None, :, None]
+_FT_COUNT = np.array([_KIND_POINTS[k][1] for k in _SHOT_KINDS], dtype=float)[None, :, None]
+
+# 매치업 결과 캐시 상한 (quick_sim 의 쌍 모델 캐시와 같은 방식으로 Team 객체가 살아 있는 동안 유효)
+_OUTCOME_CACHE_MAX = 4096
+
+
+@dataclass(frozen=True)
+class ExpectedOutcome:
+    """한 매치업의 기대 결과.
+
+    possessions 는 MatchEngine 의 포제션(스텝) 수다. 공격 리바운드 뒤의 재공격도
+    한 스텝이므로 points_per_possession 도 스텝 기준이다.
+    무승부(동점)는 어느 쪽 승리로도 세지 않는다 (state 의 팀 성적 집계와 동일).
+    """
+
+    home_team_id: str
+    away_team_id: str
+    possessions: int
+    home_possessions: float
+    away_possessions: float
+    home_points_per_possession: float
+    away_points_per_possession: float
+    home_score: float
+    away_score: float
+    margin_std: float
+    home_win_prob: float
+    away_win_prob: float
+
+    @property
+    def margin(self) -> float:
+        return self.home_score - self.away_score
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def _trip_points(models: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """쌍 모델 (n, MODEL_SIZE) → 연속 공격 1회(공격권이 넘어가는 스텝) 득점의 (평균, 분산).
+
+    공격 리바운드(stay) 스텝은 득점이 없으므로 연속 공격의 득점은 마지막 스텝에서만 나온다.
+    """
+    n_kinds = len(_SHOT_KINDS)
+    p = models[:, _LAYOUT["switch"]].reshape(len(models), n_kinds + 1, MAX_ROTATION)[:, :n_kinds]
+    ft = models[:, None, _LAYOUT["ft_prob"]]
+
+    mean_k = _FG_POINTS + _FT_COUNT * ft
+    var_k = _FT_COUNT * ft * (1.0 - ft)
+    mean = (p * mean_k).sum(axis=(1, 2))
+    second = (p * (mean_k * mean_k + var_k)).sum(axis=(1, 2))
+    return mean, np.maximum(second - mean * mean, 0.0)
+
+
+def _home_steps(n: np.ndarray, q_home: np.ndarray, q_away: np.ndarray) -> np.ndarray:
+    """홈 공격으로 시작하는 n 스텝 공격권 체인에서 홈 공격 스텝 수의 기대값 (2상태 마르코프 체인)."""
+    stay = q_home + q_away - 1.0
+    pi = (1.0 - q_away) / (2.0 - q_home - q_away)
+    return n * pi + (1.0 - pi) * (1.0 - stay ** n) / (1.0 - stay)
+
+
+_OUTCOMES: Dict[Tuple[int, int], Tuple[weakref.ref, weakref.ref, "ExpectedOutcome"]] = {}
+
+
+def _normal_cdf(x: np.ndarray) -> np.ndarray:
+    return 0.5 * (1.0 + np.vectorize(math.erf)(x / math.sqrt(2.0)))
+
+
+def _compute_outcomes(matchups: Sequence[Tuple[Team, Team]]) -> List[ExpectedOutcome]:
+    pairs: List[Tuple[Team, Team]] = []
+    for home, away in matchups:
+        pairs.append((home, away))
+        pairs.append((away, home))
+    models = pair_models(pairs)
+    home_m, away_m = models[0::2], models[1::2]
+
+    n = home_m[:, _LAYOUT["poss"]][:, 0]
+    q_h, q_a = home_m[:, _LAYOUT["q"]][:, 0], away_m[:, _LAYOUT["q"]][:, 0]
+    nu_h, var_h = _trip_points(home_m)
+    nu_a, var_a = _trip_points(away_m)
+    mu_h, mu_a = nu_h * (1.0 - q_h), nu_a * (1.0 - q_a)
+    steps_h = _home_steps(n, q_h, q_a)
+    steps_a = n - steps_h
+
+    score_h = mu_h * steps_h
+    score_a = mu_a * steps_a
+    margin = score_h - score_a
+
+    # 분산: 두 팀은 연속 공격을 번갈아 하므로 연속 공격 횟수 T 는 (거의) 같다.
+    #   Var(D) ~= E[T](Var(Y_h) + Var(Y_a)) + Var(T)(nu_h - nu_a)^2
+    # T 는 (홈 + 원정 연속 공격) 주기를 갱신 과정으로 보고 근사한다.
+    len_h, len_a = 1.0 / (1.0 - q_h), 1.0 / (1.0 - q_a)
+    cycle_mean = len_h + len_a
+    cycle_var = q_h * len_h ** 2 + q_a * len_a ** 2
+    trips = n / cycle_mean
+    trips_var = n * cycle_var / cycle_mean ** 3
+    sd = np.sqrt(trips * (var_h + var_a) + trips_var * (nu_h - nu_a) ** 2)
+    sd = np.maximum(sd, 1e-9)
+
+    # 점수는 정수이므로 연속성 보정: 홈 승리 = 점수차 >= 1
+    home_win = 1.0 - _normal_cdf((0.5 - margin) / sd)
+    away_win = _normal_cdf((-0.5 - margin) / sd)
+
+    columns = zip(
+        n.astype(np.int64).tolist(),
+        steps_h.tolist(), steps_a.tolist(),
+        mu_h.tolist(), mu_a.tolist(),
+        score_h.tolist(), score_a.tolist(),
+        sd.tolist(),
+        home_win.tolist(), away_win.tolist(),
+    )
+    return [
+        ExpectedOutcome(home.team_id, away.team_id, *values)
+        for (home, away), values in zip(matchups, columns)
+    ]
+
+
+def expected_outcomes(matchups: Sequence[Tuple[Team, Team]]) -> List[ExpectedOutcome]:
+    """(home, away) Team 쌍들의 기대 점수 / 승리 확률을 한꺼번에 계산한다.
+
+    처음 보는 매치업만 벡터화해서 계산하고, 결과는 두 Team 객체가 살아 있는 동안 캐시된다.
+    """
+    found: Dict[Tuple[int, int], ExpectedOutcome] = {}
+    missing: Dict[Tuple[int, int], Tuple[Team, Team]] = {}
+    for home, away in matchups:
+        key = (id(home), id(away))
+        if key in found or key in missing:
+            continue
+        entry = _OUTCOMES.get(key)
+        if entry is not None and entry[0]() is home and entry[1]() is away:
+            found[key] = entry[2]
+        else:
+            missing[key] = (home, away)
+
+    if missing:
+        if len(_OUTCOMES) + len(missing) > _OUTCOME_CACHE_MAX:
+            _OUTCOMES.clear()
+        for (key, (home, away)), outcome in zip(missing.items(), _compute_outcomes(list(missing.values()))):
+            found[key] = outcome
+            _OUTCOMES[key] = (weakref.ref(home), weakref.ref(away), outcome)
+
+    return [found[(id(home), id(away))] for home, away in matchups]
+
+
+def expected_outcome(home: Team, away: Team) -> ExpectedOutcome:
+    """home vs away 한 경기의 기대 결과 (샘플링 없음)."""
+    return expected_outcomes([(home, away)])[0]
@@ -0,0 +1,324 @@
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+from operator import itemgetter
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from config import BASE_DIR
+from match_engine import BOX_STAT_KEYS
+
+# 경기 / 선수 경기 기록 / 트랜잭션 SQLite 저장소.
+#
+# GAME_STATE 의 player_stats 는 시즌 누적만 남기므로, 경기별 박스스코어는 여기에 둔다.
+# 기록은 메모리 버퍼에 모았다가 flush() 때 한 트랜잭션으로 쓴다.
+# (리그 진행은 하루 단위로 flush 한다) 조회 전에는 남은 버퍼를 먼저 flush 한다.
+
+GAME_STORE_PATH = os.path.join(BASE_DIR, "saves", "league.sqlite")
+
+# 버퍼가 이만큼(선수 라인 수) 쌓이면 flush 를 기다리지 않고 쓴다
+MAX_PENDING_LINES = 20000
+
+# MatchEngine._box_row 과 같은 타입: 카운팅 스탯은 정수, 나머지는 소수 첫째 자리 실수
+_INT_STAT_KEYS = frozenset(("FGM", "FGA", "3PM", "3PA", "FTM", "FTA", "PF"))
+
+_STAT_COLUMNS = ", ".join(
+    f'"{k}" {"INTEGER" if k in _INT_STAT_KEYS else "REAL"} NOT NULL DEFAULT 0' for k in BOX_STAT_KEYS
+)
+_STAT_NAMES = ", ".join(f'"{k}"' for k in BOX_STAT_KEYS)
+
+_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS games (
+    game_id TEXT PRIMARY KEY,
+    date TEXT NOT NULL,
+    phase TEXT NOT NULL,
+    home_team_id TEXT NOT NULL,
+    away_team_id TEXT NOT NULL,
+    home_score INTEGER,
+    away_score INTEGER,
+    status TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_games_date ON games (date);
+CREATE INDEX IF NOT EXISTS idx_games_home_date ON games (home_team_id, date);
+CREATE INDEX IF NOT EXISTS idx_games_away_date ON games (away_team_id, date);
+
+CREATE TABLE IF NOT EXISTS player_games (
+    game_id TEXT NOT NULL,
+    line_no INTEGER NOT NULL,
+    player_id INTEGER NOT NULL,
+    name TEXT,
+    team_id TEXT NOT NULL,
+    opponent_id TEXT NOT NULL,
+    date TEXT NOT NULL,
+    phase TEXT NOT NULL,
+    is_home INTEGER NOT NULL,
+    {_STAT_COLUMNS},
+    PRIMARY KEY (game_id, line_no)
+);
+CREATE INDEX IF NOT EXISTS idx_player_games_player_date ON player_games (player_id, date);
+CREATE INDEX IF NOT EXISTS idx_player_games_team_date ON player_games (team_id, date);
+CREATE INDEX IF NOT EXISTS idx_player_games_game ON player_games (game_id);
+
+CREATE TABLE IF NOT EXISTS transactions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    date TEXT,
+    type TEXT,
+    team_ids TEXT NOT NULL,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_transactions_date ON transactions (date);
+"""
+
+# 박스 라인 dict -> BOX_STAT_KEYS 순서 튜플 (엔진 박스스코어는 모든 키를 가진다)
+_box_stats = itemgetter(*BOX_STAT_KEYS)
+
+_GAME_COLUMNS = ("game_id", "date", "phase", "home_team_id", "away_team_id", "home_score", "away_score", "status")
+_LINE_COLUMNS = ("game_id", "line_no", "player_id", "name", "team_id", "opponent_id", "date", "phase", "is_home")
+
+
+def _typed_stats(row: Dict[str, Any]) -> Dict[str, Any]:
+    """선수 라인의 스탯 값을 엔진 박스스코어 타입으로 맞춘다 (예전 REAL 컬럼 파일도 같은 모양으로)."""
+    for k in BOX_STAT_KEYS:
+        row[k] = int(row[k]) if k in _INT_STAT_KEYS else float(row[k])
+    return row
+
+
+def _date_filter(column: str, start: Optional[str], end: Optional[str]) -> Tuple[str, List[Any]]:
+    sql, args = "", []
+    if start:
+        sql += f" AND {column} >= ?"
+        args.append(start)
+    if end:
+        sql += f" AND {column} <= ?"
+        args.append(end)
+    return sql, args
+
+
+# -----------------------------
+# 저장소
+# -----------------------------
+class GameStore:
+    """SQLite 한 파일(또는 ":memory:")에 경기 기록을 쌓는다. 스레드 간에 공유해도 된다."""
+
+    def __init__(self, path: str = GAME_STORE_PATH):
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        if path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+        self._pending_games: List[Tuple[Any, ...]] = []
+        self._pending_lines: List[Tuple[Any, ...]] = []
+        self._pending_transactions: List[Tuple[Any, ...]] = []
+
+    # -----------------------------
+    # 기록 (버퍼)
+    # -----------------------------
+    def record_game(
+        self,
+        game: Dict[str, Any],
+        boxscore: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+        phase: str = "regular",
+    ) -> None:
+        """경기 한 개 (update_state_with_game 의 game_obj 형식) 와 박스스코어를 버퍼에 넣는다.
+
+        같은 game_id 가 다시 기록되면 flush 때 예전 기록을 덮어쓴다.
+        """
+        game_id = game["game_id"]
+        home_id, away_id = game["home_team_id"], game["away_team_id"]
+        row = (
+            game_id, game["date"], phase, home_id, away_id,
+            game.get("home_score"), game.get("away_score"), game.get("status", "final"),
+        )
+
+        lines = []
+        for team_id, rows in (boxscore or {}).items():
+            is_home = int(team_id == home_id)
+            opponent_id = away_id if is_home else home_id
+            for r in rows:
+                lines.append((
+                    game_id, len(lines), int(r["PlayerID"]), r.get("Name"), team_id, opponent_id,
+                    game["date"], phase, is_home,
+                ) + _box_stats(r))
+
+        with self._lock:
+            self._pending_games.append(row)
+            self._pending_lines.extend(lines)
+            if len(self._pending_lines) >= MAX_PENDING_LINES:
+                self.flush()
+
+    def record_transaction(self, transaction: Dict[str, Any]) -> None:
+        """GAME_STATE["transactions"] 항목 하나를 버퍼에 넣는다."""
+        row = (
+            transaction.get("date"),
+            transaction.get("type"),
+            json.dumps(list(transaction.get("teams_involved") or [])),
+            json.dumps(transaction, ensure_ascii=False, default=str),
+        )
+        with self._lock:
+            self._pending_transactions.append(row)
+
+    def flush(self) -> int:
+        """버퍼를 한 트랜잭션으로 쓴다. 쓴 경기 수를 반환한다."""
+        with self._lock:
+            games, lines, transactions = self._pending_games, self._pending_lines, self._pending_transactions
+            if not (games or lines or transactions):
+                return 0
+            self._pending_games, self._pending_lines, self._pending_transactions = [], [], []
+
+            with self._conn:
+                if games:
+                    self._conn.executemany("DELETE FROM player_games WHERE game_id = ?", [(g[0],) for g in games])
+                    self._conn.executemany(
+                        f"INSERT OR REPLACE INTO games ({', '.join(_GAME_COLUMNS)}) VALUES ({', '.join('?' * len(_GAME_COLUMNS))})",
+                        games,
+                    )
+                if lines:
+                    n = len(_LINE_COLUMNS) + len(BOX_STAT_KEYS)
+                    self._conn.executemany(
+                        f"INSERT OR REPLACE INTO player_games ({', '.join(_LINE_COLUMNS)}, {_STAT_NAMES}) VALUES ({', '.join('?' * n)})",
+                        lines,
+                    )
+                if transactions:
+                    self._conn.executemany(
+                        "INSERT INTO transactions (date, type, team_ids, payload) VALUES (?, ?, ?, ?)",
+                        transactions,
+                    )
+            return len(games)
+
+    # -----------------------------
+    # 조회
+    # -----------------------------
+    def _query(self, sql: str, args: Iterable[Any] = ()) -> List[Dict[str, Any]]:
+        with self._lock:
+            self.flush()
+            return [dict(r) for r in self._conn.execute(sql, list(args))]
+
+    def count_games(self) -> int:
+        return self._query("SELECT COUNT(*) AS n FROM games")[0]["n"]
+
+    def games(
+        self,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        team_id: Optional[str] = None,
+        phase: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """날짜 구간 / 팀 / 페이즈로 거른 경기 목록 (날짜순)."""
+        sql, args = _date_filter("date", start, end)
+        if phase:
+            sql += " AND phase = ?"
+            args.append(phase)
+        if team_id:
+            # (home, date) / (away, date) 인덱스를 각각 타도록 UNION 으로 나눈다
+            query = (
+                f"SELECT * FROM games WHERE home_team_id = ?{sql} "
+                f"UNION ALL SELECT * FROM games WHERE away_team_id = ?{sql} ORDER BY date, game_id"
+            )
+            return self._query(query, [team_id, *args, team_id, *args])
+        return self._query(f"SELECT * FROM games WHERE 1 = 1{sql} ORDER BY date, game_id", args)
+
+    def player_games(self, player_id: int, start: Optional[str] = None, end: Optional[str] = None) -> List[Dict[str, Any]]:
+        """선수의 경기별 박스 라인 (날짜순)."""
+        sql, args = _date_filter("date", start, end)
+        rows = self._query(
+            f"SELECT * FROM player_games WHERE player_id = ?{sql} ORDER BY date, game_id",
+            [int(player_id), *args],
+        )
+        return [_typed_stats(r) for r in rows]
+
+    def team_player_games(self, team_id: str, start: Optional[str] = None, end: Optional[str] = None) -> List[Dict[str, Any]]:
+        """팀 소속으로 뛴 모든 선수 라인 (날짜순)."""
+        sql, args = _date_filter("date", start, end)
+        rows = self._query(
+            f"SELECT * FROM player_games WHERE team_id = ?{sql} ORDER BY date, game_id, line_no",
+            [team_id, *args],
+        )
+        return [_typed_stats(r) for r in rows]
+
+    def boxscore(self, game_id: str) -> Optional[Dict[str, List[Dict[str, Any]]]]:
+        """MatchEngine 결과와 같은 형식의 박스스코어. 없는 경기면 None."""
+        rows = self._query("SELECT * FROM player_games WHERE game_id = ? ORDER BY line_no", [game_id])
+        if not rows and not self._query("SELECT 1 FROM games WHERE game_id = ?", [game_id]):
+            return None
+
+        out: Dict[str, List[Dict[str, Any]]] = {}
+        for r in map(_typed_stats, rows):
+            line = {"PlayerID": r["player_id"], "Name": r["name"], "Team": r["team_id"]}
+            line.update((k, r[k]) for k in BOX_STAT_KEYS)
+            out.setdefault(r["team_id"], []).append(line)
+        return out
+
+    def transactions(
+        self,
+        team_id: Optional[str] = None,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        sql, args = _date_filter("date", start, end)
+        rows = self._query(f"SELECT team_ids, payload FROM transactions WHERE 1 = 1{sql} ORDER BY id", args)
+        return [
+            json.loads(r["payload"]) for r in rows
+            if team_id is None or team_id in json.loads(r["team_ids"])
+        ]
+
+    # -----------------------------
+    # 백업 / 복원 (세이브 슬롯용)
+    # -----------------------------
+    def backup_to(self, path: str) -> None:
+        with self._lock:
+            self.flush()
+            dest = sqlite3.connect(path)
+            try:
+                self._conn.backup(dest)
+            finally:
+                dest.close()
+
+    def restore_from(self, path: str) -> None:
+        """path 의 내용으로 저장소 전체를 교체한다 (버퍼는 버린다)."""
+        with self._lock:
+            self._pending_games, self._pending_lines, self._pending_transactions = [], [], []
+            src = sqlite3.connect(path)
+            try:
+                src.backup(self._conn)
+            finally:
+                src.close()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._pending_games, self._pending_lines, self._pending_transactions = [], [], []
+            with self._conn:
+                for table in ("games", "player_games", "transactions"):
+                    self._conn.execute(f"DELETE FROM {table}")
+
+    def close(self) -> None:
+        with self._lock:
+            self.flush()
+            self._conn.close()
+
+
+_STORE: Optional[GameStore] = None
+_STORE_LOCK = threading.Lock()
+
+
+def get_game_store() -> GameStore:
+    """리그 기록 저장소 (최초 호출 시 GAME_STORE_PATH 에 연다)."""
+    global _STORE
+    with _STORE_LOCK:
+        if _STORE is None:
+            _STORE = GameStore(GAME_STORE_PATH)
+        return _STORE
+
+
+def set_game_store(store: Optional[GameStore]) -> None:
+    """다른 저장소로 교체한다 (테스트 / 다른 경로). None 이면 다음 호출 때 기본 경로로 다시 연다."""
+    global _STORE
+    with _STORE_LOCK:
+        _STORE = store
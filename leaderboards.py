@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# 스탯별 경기당 순위표 (증분 유지).
+#
+# 스탯 하나 = (-경기당 값, 행 번호) 튜플의 정렬 리스트. 값이 큰 순, 동점이면 먼저 기록된 선수 순
+# (예전 전체 정렬 sorted(..., reverse=True) 와 같은 순서).
+# 박스스코어가 들어오면 그 경기에 뛴 선수 행만 꺼냈다가 새 값으로 다시 꽂는다 (bisect).
+# 조회는 앞에서부터 최소 경기 수를 만족하는 선수를 k 명 모으면 끝난다.
+#
+# 순위표는 행 번호만 들고 있으므로 선수 이름 / 소속 (트레이드) 은 조회할 때 StatAggregator 에서 읽는다.
+
+
+class Leaderboards:
+    """스탯 열 번호 -> 정렬 리스트. 처음 조회한 스탯만 만들고, 그 뒤로는 증분 갱신한다."""
+
+    def __init__(self) -> None:
+        self._keys: Dict[int, List[Tuple[float, int]]] = {}
+        # 스탯 열 번호 -> 행별 현재 정렬 키 값 (-경기당 값, 리스트에 없으면 None)
+        self._current: Dict[int, List[Optional[float]]] = {}
+
+    def has(self, col: int) -> bool:
+        return col in self._keys
+
+    def build(self, col: int, per_game: np.ndarray, games: np.ndarray) -> None:
+        """열 col 의 순위표를 처음부터 만든다 (per_game: (n,) 경기당 값)."""
+        neg = (-per_game).tolist()
+        played = games > 0
+        self._current[col] = [v if p else None for v, p in zip(neg, played.tolist())]
+        self._keys[col] = sorted((v, row) for row, v in enumerate(self._current[col]) if v is not None)
+
+    def update(self, rows: Sequence[int], per_game_rows: np.ndarray, n_rows: int) -> None:
+        """rows 선수들의 경기당 값이 바뀌었다 (per_game_rows: (len(rows), 전체 스탯 수))."""
+        for col, keys in self._keys.items():
+            current = self._current[col]
+            if len(current) < n_rows:
+                current.extend([None] * (n_rows - len(current)))
+            for row, value in zip(rows, (-per_game_rows[:, col]).tolist()):
+                old = current[row]
+                if old is not None:
+                    del keys[bisect_left(keys, (old, row))]
+                insort(keys, (value, row))
+                current[row] = value
+
+    def top(self, col: int, k: int, games: np.ndarray, min_games: int = 0) -> List[Tuple[int, float]]:
+        """열 col 상위 k 명의 (행, 경기당 값). min_games 경기 미만 출전 선수는 건너뛴다."""
+        out: List[Tuple[int, float]] = []
+        for neg, row in self._keys[col]:
+            if len(out) >= k:
+                break
+            if games[row] >= min_games:
+                out.append((row, -neg))
+        return out
@@ -1,22 +1,38 @@
 from __future__ import annotations
 
+import json
+import zlib
 from datetime import date, timedelta
-from typing import Any, Dict, List, Optional
+from itertools import groupby
+from operator import itemgetter
+from typing import Any, Dict, List, Optional, Tuple
 
-from config import ROSTER_DF
+from roster_registry import TeamCache, get_roster_registry
+from seed_util import derive_seed
 from state import (
     _ensure_league_state,
+    _get_master_schedule_game,
+    get_league_master_seed,
     initialize_master_schedule_if_needed,
     set_current_date,
     update_state_with_game,
 )
 from trades_ai import _run_ai_gm_tick_if_needed
 from match_engine import Team, MatchEngine
+from batch_engine import simulate_games_batch
+from quick_sim import simulate_games_quick
+from sim_pool import simulate_games_parallel
+from live_games import LiveGame, start_live_game
+from game_store import get_game_store
+
+ENGINE_MODES = ("standard", "batch", "quick")
 
 
 def advance_league_until(
     target_date_str: str,
     user_team_id: Optional[str] = None,
+    engine_mode: str = "standard",
+    workers: int = 1,
 ) -> List[Dict[str, Any]]:
     """리그 전체를 target_date_str까지 자동 진행한다.
 
@@ -26,15 +42,28 @@ def advance_league_until(
       * 아직 status != 'final' 인 경기만
       매치 엔진으로 시뮬레이션한다.
     - 각 경기 결과는 update_state_with_game(...)을 통해 GAME_STATE에 반영한다.
+    - engine_mode="batch" 이면 하루치 경기를 BatchMatchEngine으로 한꺼번에 돌린다.
+      (AI GM 트레이드는 진행이 끝난 뒤에만 일어나므로 구간 내 로스터는 고정)
+    - engine_mode="quick" 이면 포제션 루프 없이 점수/박스스코어를 바로 샘플링하는
+      저정밀 엔진(quick_sim)을 쓴다. 유저 팀 경기는 원래 여기서 돌리지 않는다.
+    - workers > 1 이면 (standard 모드에서) 경기들을 프로세스 풀로 나눠 돌린다.
+    - 경기별 seed 는 리그 마스터 seed 와 game_id 로 (batch / quick 은 날짜별 seed 로)
+      정해지므로 직렬 / 병렬 / 재실행 / 구간을 나눠 진행한 결과가 모두 같다.
     - 반환값: update_state_with_game가 반환한 game_obj 리스트
 
-    target_date_str 형식이 잘못된 경우 ValueError를 발생시킨다.
+    target_date_str 형식이나 engine_mode가 잘못된 경우 ValueError를 발생시킨다.
     """
+    if engine_mode not in ENGINE_MODES:
+        raise ValueError(f"invalid engine_mode: {engine_mode}")
+    if workers < 1:
+        raise ValueError(f"invalid workers: {workers}")
+    if workers > 1 and engine_mode != "standard":
+        raise ValueError("workers is only supported with engine_mode='standard'")
+
     initialize_master_schedule_if_needed()
     league = _ensure_league_state()
     master_schedule = league["master_schedule"]
     by_date: Dict[str, List[str]] = master_schedule.get("by_date") or {}
-    games: List[Dict[str, Any]] = master_schedule.get("games") or []
 
     try:
         target_date = date.fromisoformat(target_date_str)
@@ -59,9 +88,13 @@ def advance_league_until(
             season_start = target_date
         current_date = season_start - timedelta(days=1)
 
-    simulated_game_objs: List[Dict[str, Any]] = []
     user_team_upper = user_team_id.upper() if user_team_id else None
+    master_seed = get_league_master_seed()
+    registry = get_roster_registry()
+    team_cache = TeamCache(registry)
 
+    # 1) 구간 내 시뮬레이션 대상 경기 수집 (스케줄 순서 유지)
+    pending: List[Tuple[str, Dict[str, Any], Team, Team, int]] = []
     day = current_date + timedelta(days=1)
     while day <= target_date:
         day_str = day.isoformat()
@@ -72,7 +105,7 @@ def advance_league_until(
 
         for gid in game_ids:
             # 해당 game_id에 대응하는 스케줄 엔트리 찾기
-            g = next((x for x in games if x.get("game_id") == gid), None)
+            g = _get_master_schedule_game(gid)
             if not g:
                 continue
             if g.get("status") == "final":
@@ -85,38 +118,58 @@ def advance_league_until(
             if user_team_upper and (home_id == user_team_upper or away_id == user_team_upper):
                 continue
 
-            home_df = ROSTER_DF[ROSTER_DF["Team"] == home_id]
-            away_df = ROSTER_DF[ROSTER_DF["Team"] == away_id]
-            if home_df.empty or away_df.empty:
+            if not (registry.has_team(home_id) and registry.has_team(away_id)):
                 continue
 
-            home_team = Team(home_id, home_df)
-            away_team = Team(away_id, away_df)
-            engine = MatchEngine(home_team, away_team)
-            result = engine.simulate_game()
-            score = result.get("final_score", {})
+            seed = derive_seed(master_seed, "game", gid)
+            pending.append((day_str, g, team_cache.get(home_id), team_cache.get(away_id), seed))
+
+        day += timedelta(days=1)
 
-            game_obj = update_state_with_game(
-                home_id=home_id,
-                away_id=away_id,
-                score=score,
-                boxscore=result.get("boxscore"),
-                game_date=day_str,
-            )
+    # 2) 시뮬레이션
+    if engine_mode in ("batch", "quick"):
+        # 하루치 경기를 한 엔진으로 돌리고 seed 는 날짜로 정한다
+        # (한 번에 진행하든 하루씩 나눠 진행하든 같은 결과)
+        simulate = simulate_games_batch if engine_mode == "batch" else simulate_games_quick
+        results = []
+        for day_str, day_games in groupby(pending, key=itemgetter(0)):
+            matchups = [(home, away) for _, _, home, away, _ in day_games]
+            results.extend(simulate(matchups, seed=derive_seed(master_seed, engine_mode, day_str)))
+    else:
+        results = simulate_games_parallel(
+            [(home, away, seed) for _, _, home, away, seed in pending],
+            workers=workers,
+        )
 
-            # master_schedule 엔트리에도 결과를 저장
-            g["status"] = "final"
-            g["home_score"] = int(score.get(home_id, 0))
-            g["away_score"] = int(score.get(away_id, 0))
+    # 3) 결과 반영 (스케줄 순서대로)
+    simulated_game_objs: List[Dict[str, Any]] = []
+    # (master_schedule 엔트리의 final 처리와 팀 성적 갱신은 update_state_with_game 이 한다)
+    # 경기 기록 저장소에는 하루치씩 한 트랜잭션으로 쓴다.
+    store = get_game_store()
+    last_day = None
+    for (day_str, _, home_team, away_team, _), result in zip(pending, results):
+        if last_day is not None and day_str != last_day:
+            store.flush()
+        last_day = day_str
+        home_id = home_team.team_id
+        away_id = away_team.team_id
+        score = result.get("final_score", {})
 
-            simulated_game_objs.append(game_obj)
+        game_obj = update_state_with_game(
+            home_id=home_id,
+            away_id=away_id,
+            score=score,
+            boxscore=result.get("boxscore"),
+            game_date=day_str,
+        )
 
-        day += timedelta(days=1)
+        simulated_game_objs.append(game_obj)
 
     set_current_date(target_date_str)
 
     # AI GM 트레이드 틱 (트레이드 데드라인 및 7일 간격 체크 포함)
     _run_ai_gm_tick_if_needed(target_date)
+    store.flush()
 
     return simulated_game_objs
 
@@ -133,22 +186,67 @@ def simulate_single_game(
     - 팀 ID는 로스터 엑셀의 Team 값과 동일해야 한다.
     - 팀을 찾을 수 없는 경우 ValueError를 발생시킨다.
     """
+    home_team, away_team, seed = _prepare_single_game(
+        home_team_id, away_team_id, game_date, home_tactics, away_tactics
+    )
+    result = MatchEngine(home_team, away_team, seed=seed).simulate_game()
+    _record_single_game(home_team.team_id, away_team.team_id, result, game_date)
+    return result
+
+
+def start_live_single_game(
+    home_team_id: str,
+    away_team_id: str,
+    game_date: Optional[str] = None,
+    home_tactics: Optional[Dict[str, Any]] = None,
+    away_tactics: Optional[Dict[str, Any]] = None,
+) -> LiveGame:
+    """simulate_single_game 의 라이브 버전: 이벤트를 스트리밍하는 LiveGame 을 시작한다.
+
+    - 같은 경기(팀 / 날짜 / 전술)를 다시 요청하면 진행 중이거나 끝난 같은 LiveGame 을 돌려준다.
+    - 결과(simulate_single_game 과 같음)는 경기가 끝날 때 GAME_STATE에 반영된다.
+      이벤트 루프 안에서 부르면 반영은 그 루프에서 돌고, clear_live_games() 로 버린 경기는 반영하지 않는다.
+    """
+    home_team, away_team, seed = _prepare_single_game(
+        home_team_id, away_team_id, game_date, home_tactics, away_tactics
+    )
+    home_id, away_id = home_team.team_id, away_team.team_id
+    tactics_key = json.dumps([home_tactics or {}, away_tactics or {}], sort_keys=True, default=str)
+    live_id = f"{seed:016x}{zlib.crc32(tactics_key.encode('utf-8')):08x}"
+
+    def _on_finish(result: Dict[str, Any]) -> None:
+        _record_single_game(home_id, away_id, result, game_date)
+
+    return start_live_game(live_id, home_team, away_team, seed=seed, on_finish=_on_finish)
+
+
+def _prepare_single_game(
+    home_team_id: str,
+    away_team_id: str,
+    game_date: Optional[str],
+    home_tactics: Optional[Dict[str, Any]],
+    away_tactics: Optional[Dict[str, Any]],
+) -> Tuple[Team, Team, int]:
+    """(홈 팀, 원정 팀, seed). 팀을 찾을 수 없으면 ValueError."""
     home_id = home_team_id.upper()
     away_id = away_team_id.upper()
 
-    home_df = ROSTER_DF[ROSTER_DF["Team"] == home_id]
-    away_df = ROSTER_DF[ROSTER_DF["Team"] == away_id]
-
-    if home_df.empty:
+    registry = get_roster_registry()
+    if not registry.has_team(home_id):
         raise ValueError(f"Home team '{home_id}' not found in roster excel")
-    if away_df.empty:
+    if not registry.has_team(away_id):
         raise ValueError(f"Away team '{away_id}' not found in roster excel")
 
-    home_team = Team(home_id, home_df, tactics=home_tactics or {})
-    away_team = Team(away_id, away_df, tactics=away_tactics or {})
-    engine = MatchEngine(home_team, away_team)
-    result = engine.simulate_game()
+    home_team = registry.build_team(home_id, tactics=home_tactics or {})
+    away_team = registry.build_team(away_id, tactics=away_tactics or {})
+
+    # 스케줄의 game_id 와 같은 형식으로 seed 를 파생 (같은 경기는 같은 결과)
+    seed_date = game_date or _ensure_league_state().get("current_date") or "unscheduled"
+    seed = derive_seed(get_league_master_seed(), "game", f"{seed_date}_{home_id}_{away_id}")
+    return home_team, away_team, seed
 
+
+def _record_single_game(home_id: str, away_id: str, result: Dict[str, Any], game_date: Optional[str]) -> None:
     # 인게임 날짜를 서버 STATE에도 반영
     update_state_with_game(
         home_id,
@@ -157,5 +255,4 @@ def simulate_single_game(
         boxscore=result.get("boxscore"),
         game_date=game_date,
     )
-
-    return result
+    get_game_store().flush()
@@ -0,0 +1,280 @@
+from __future__ import annotations
+
+import math
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, FrozenSet, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from batch_engine import simulate_paired
+from config import ALL_TEAM_IDS
+from match_engine import Team
+from roster_registry import get_roster_registry, tactics_key
+from seed_util import derive_seed
+from state import get_league_master_seed
+from variance_reduction import Z_95, StoppingRule, estimate, mirrored, pair_means
+
+# NOTE: 엔진에서 경기 결과에 영향을 주는 것은 로테이션에 누가 들어가는지(팀 평균 레이팅)와
+#       누가 선발인지(usage 가중치)다. 출전 시간은 MIN 기록의 배분에만 쓰이므로
+#       탐색 대상은 (선발 5명, 벤치 멤버) 이고, 출전 시간은 로테이션 인원별 기본값을 제안한다.
+
+DEFAULT_GAMES = 48          # 라인업 하나를 평가하는 경기 수 (모든 라인업이 같은 일정 / 같은 난수)
+MAX_GAMES = 1024
+# 최종 / 기준 라인업 재평가: games * 2 경기씩, vs_baseline 신뢰구간 반폭이 목표 이하가 되거나
+# games * MAX_VALIDATION_FACTOR 경기가 될 때까지
+MAX_VALIDATION_FACTOR = 8
+DEFAULT_TARGET_HALF_WIDTH = 2.0
+DEFAULT_BEAM_WIDTH = 1
+DEFAULT_MAX_ITERATIONS = 8
+MAX_ITERATIONS = 50
+
+# 점수를 매긴 라인업 캐시 (평가 조건별, LRU)
+_CACHE_MAX = 32
+_CACHE: "OrderedDict[Tuple[Any, ...], Dict[LineupKey, np.ndarray]]" = OrderedDict()
+_CACHE_LOCK = threading.Lock()
+
+LineupKey = Tuple[FrozenSet[int], FrozenSet[int]]
+
+
+# -----------------------------
+# 라인업 이웃
+# -----------------------------
+def _lineup_key(starters: Sequence[int], bench: Sequence[int]) -> LineupKey:
+    # 벤치 순서는 로테이션 멤버가 정해지면 경기 결과에 영향이 없다
+    return frozenset(starters), frozenset(bench)
+
+
+def _neighbours(key: LineupKey, roster: Sequence[int]) -> List[LineupKey]:
+    """선수 한 명만 바꾼 라인업들.
+
+    - 선발 <-> 벤치 맞바꾸기
+    - 선발 또는 벤치 한 명을 로테이션 밖 선수로 교체
+    """
+    starters, bench = key
+    outside = [pid for pid in roster if pid not in starters and pid not in bench]
+    out: List[LineupKey] = []
+    for s in starters:
+        for b in bench:
+            out.append(((starters - {s}) | {b}, (bench - {b}) | {s}))
+        for o in outside:
+            out.append(((starters - {s}) | {o}, bench))
+    for b in bench:
+        for o in outside:
+            out.append((starters, (bench - {b}) | {o}))
+    return out
+
+
+# -----------------------------
+# 평가 (CRN + 안티테틱 배치)
+# -----------------------------
+def _schedule(opponents: Sequence[Team], n_games: int, offset: int = 0) -> List[Tuple[Team, bool]]:
+    """라인업 하나가 치르는 (상대, 홈 여부) 목록.
+
+    상대를 offset 부터 돌아가며 홈 / 원정을 번갈아 두고, 안티테틱 쌍(j, j + n/2)은 같은 경기가 되게 한다.
+    """
+    half = (n_games + 1) // 2
+    items = [(opponents[(offset + i) % len(opponents)], (offset + i) % 2 == 0) for i in range(half)]
+    return mirrored(items, n_games)
+
+
+def _net_ratings(teams: Sequence[Team], schedule: Sequence[Tuple[Team, bool]], seed: int, workers: int) -> np.ndarray:
+    """라인업(Team)별 넷 레이팅 표본 (라인업 수, 안티테틱 쌍 수).
+
+    넷 레이팅 = 100 * 점수차 / 팀 포제션. 팀 포제션은 경기 포제션 스텝의 절반으로 본다.
+    """
+    margin, poss = simulate_paired(teams, schedule, seed, antithetic=True, workers=workers)
+    return pair_means(100.0 * margin / (poss / 2.0))
+
+
+# -----------------------------
+# 공개 API
+# -----------------------------
+def optimize_lineup(
+    team_id: str,
+    opponent_id: Optional[str] = None,
+    base_tactics: Optional[Dict[str, Any]] = None,
+    opponent_tactics: Optional[Dict[str, Any]] = None,
+    games: int = DEFAULT_GAMES,
+    beam_width: int = DEFAULT_BEAM_WIDTH,
+    max_iterations: int = DEFAULT_MAX_ITERATIONS,
+    workers: int = 1,
+    target_half_width: Optional[float] = DEFAULT_TARGET_HALF_WIDTH,
+) -> Dict[str, Any]:
+    """시뮬레이션 넷 레이팅이 가장 높은 선발 / 벤치 순서 / 출전 시간을 제안한다.
+
+    - opponent_id 가 없으면 리그의 다른 모든 팀을 돌아가며 상대한다. 이때 games 는
+      모든 상대를 같은 횟수만큼 만나도록 (2 * 상대 수) 의 배수로 올린다.
+    - 로테이션 인원은 base 전술의 rotation_size. 시작점은 base 전술의 라인업(없으면 OVR 순).
+    - 빔 서치: 빔의 라인업마다 선수 한 명을 바꾼 이웃을 만들고, 처음 보는 라인업만
+      한 배치(workers > 1 이면 프로세스 풀)로 평가해 상위 beam_width 개를 남긴다.
+      최고 넷 레이팅이 더 오르지 않으면 멈춘다.
+    - 모든 라인업은 같은 일정 / 같은 난수(crn_block)로 평가되므로 점수끼리 바로 비교되고,
+      점수는 평가 조건(로스터 버전 / 전술 / 상대 / 경기 수 / 마스터 seed)별로 캐시된다.
+    - 경기는 안티테틱 쌍으로 돌리고, 점수 / 신뢰구간은 쌍 평균을 독립 표본으로 본다.
+    - 탐색 점수는 같은 난수에 맞춰 고른 최댓값이라 낙관적이므로, 최종 라인업과 기준 라인업은
+      다른 seed 로 다시 돌려 넷 레이팅 / 신뢰구간을 보고한다. 재평가는 vs_baseline 95% 신뢰구간
+      반폭이 target_half_width 이하가 되면 멈춘다 (None 이면 최대 경기 수까지).
+    - 벤치 순서는 최종 라인업에서 그 선수를 빼면 (탐색 점수 기준) 넷 레이팅이 얼마나 떨어지는지 순이다.
+
+    팀을 찾을 수 없거나 인자가 범위를 벗어나면 ValueError를 발생시킨다.
+    """
+    if not 4 <= games <= MAX_GAMES:
+        raise ValueError(f"games must be between 4 and {MAX_GAMES}")
+    if beam_width < 1:
+        raise ValueError(f"invalid beam_width: {beam_width}")
+    if not 1 <= max_iterations <= MAX_ITERATIONS:
+        raise ValueError(f"max_iterations must be between 1 and {MAX_ITERATIONS}")
+    if workers < 1:
+        raise ValueError(f"invalid workers: {workers}")
+
+    team_upper = team_id.upper()
+    registry = get_roster_registry()
+    if not registry.has_team(team_upper):
+        raise ValueError(f"Team '{team_upper}' not found in roster excel")
+    if opponent_id is not None:
+        opponent_ids = [opponent_id.upper()]
+        if not registry.has_team(opponent_ids[0]):
+            raise ValueError(f"Team '{opponent_ids[0]}' not found in roster excel")
+        if opponent_ids[0] == team_upper:
+            raise ValueError("team and opponent must differ")
+    else:
+        opponent_ids = [tid for tid in ALL_TEAM_IDS if tid != team_upper and registry.has_team(tid)]
+        if not opponent_ids:
+            raise ValueError("no opponents available")
+        # 안티테틱 쌍은 같은 경기이므로 경기 수의 절반 안에서 모든 상대를 같은 횟수만큼 만나게 한다
+        cycle = 2 * len(opponent_ids)
+        games = -(-games // cycle) * cycle
+
+    tactics = {**(base_tactics or {}), "minutes": {}}
+    base_team = registry.build_team(team_upper, tactics=tactics)
+    rotation = [p.player_id for p in base_team.rotation_players]
+    roster = [p.player_id for p in base_team.players]
+    names = {p.player_id: p.name for p in base_team.players}
+    n_starters = min(5, len(rotation))
+    initial = _lineup_key(rotation[:n_starters], rotation[n_starters:])
+
+    opponents = [registry.build_team(tid, tactics=opponent_tactics or {}) for tid in opponent_ids]
+    schedule = _schedule(opponents, games)
+    master_seed = get_league_master_seed()
+    seed = derive_seed(master_seed, "lineup_opt", team_upper, opponent_id.upper() if opponent_id else "league")
+
+    context = (
+        team_upper, registry.roster_version(team_upper),
+        tactics_key({k: v for k, v in tactics.items() if k not in ("lineup", "minutes")}),
+        tuple((tid, registry.roster_version(tid)) for tid in opponent_ids), tactics_key(opponent_tactics),
+        games, master_seed,
+    )
+    with _CACHE_LOCK:
+        scores = _CACHE.setdefault(context, {})
+        _CACHE.move_to_end(context)
+        while len(_CACHE) > _CACHE_MAX:
+            _CACHE.popitem(last=False)
+    cached_before = len(scores)
+
+    def _build(key: LineupKey) -> Team:
+        return registry.build_team(team_upper, tactics={
+            **tactics,
+            "lineup": {"starters": sorted(key[0]), "bench": sorted(key[1])},
+        })
+
+    def _evaluate(keys: Sequence[LineupKey]) -> None:
+        missing = list(dict.fromkeys(k for k in keys if k not in scores))
+        if not missing:
+            return
+        ratings = _net_ratings([_build(k) for k in missing], schedule, seed, workers)
+        with _CACHE_LOCK:
+            for key, row in zip(missing, ratings):
+                scores[key] = row
+
+    def _score(key: LineupKey) -> float:
+        return float(scores[key].mean())
+
+    _evaluate([initial])
+    beam = [initial]
+    best = initial
+    iterations = 0
+    for _ in range(max_iterations):
+        iterations += 1
+        pool_keys = list(dict.fromkeys(beam + [n for key in beam for n in _neighbours(key, roster)]))
+        _evaluate(pool_keys)
+        beam = sorted(pool_keys, key=_score, reverse=True)[:beam_width]
+        if _score(beam[0]) <= _score(best):
+            break
+        best = beam[0]
+
+    # 최종 라인업의 이웃은 모두 평가돼 있다: 선수별로 빠졌을 때의 최소 하락폭
+    _evaluate(_neighbours(best, roster))
+    best_score = _score(best)
+    drop: Dict[int, float] = {}
+    for n in _neighbours(best, roster):
+        removed = (best[0] | best[1]) - (n[0] | n[1])
+        for pid in removed:
+            drop[pid] = min(drop.get(pid, math.inf), best_score - _score(n))
+    starters = sorted(best[0], key=lambda pid: -drop.get(pid, 0.0))
+    bench = sorted(best[1], key=lambda pid: -drop.get(pid, 0.0))
+
+    rotation_size = len(starters) + len(bench)
+    default_minutes = base_team._default_minutes(rotation_size)
+    minutes = {pid: default_minutes["starter"] for pid in starters}
+    minutes.update({pid: default_minutes["bench"] for pid in bench})
+
+    batch_games = games * 2
+    rule = StoppingRule(
+        max_samples=games * MAX_VALIDATION_FACTOR,
+        target_std_error=target_half_width / Z_95 if target_half_width is not None else None,
+        min_samples=batch_games * 2,
+    )
+    validation_teams = [_build(best), _build(initial)]
+    parts: List[np.ndarray] = []
+    validation_games = 0
+    while True:
+        parts.append(_net_ratings(
+            validation_teams,
+            _schedule(opponents, batch_games, offset=validation_games // 2),
+            derive_seed(seed, "validate", len(parts)),
+            workers,
+        ))
+        validation_games += batch_games
+        validation = np.concatenate(parts, axis=1)
+        diff = estimate(validation[0] - validation[1])
+        if rule.should_stop(validation_games, diff.std_error):
+            break
+    rating = estimate(validation[0])
+    base_rating = estimate(validation[1])
+
+    return {
+        "team_id": team_upper,
+        "opponent_id": opponent_ids[0] if opponent_id is not None else None,
+        "games_per_lineup": games,
+        "validation_games": validation_games,
+        "lineup": {"starters": starters, "bench": bench},
+        "minutes": minutes,
+        "players": [
+            {
+                "PlayerID": pid,
+                "Name": names[pid],
+                "role": "starter" if pid in best[0] else "bench",
+                "minutes": minutes[pid],
+                "net_rating_drop_if_removed": drop.get(pid),
+            }
+            for pid in starters + bench
+        ],
+        "search_net_rating": best_score,
+        "net_rating": rating.mean,
+        "net_rating_ci95": rating.ci95,
+        "baseline": {
+            "lineup": {"starters": rotation[:n_starters], "bench": rotation[n_starters:]},
+            "net_rating": base_rating.mean,
+            "net_rating_ci95": base_rating.ci95,
+        },
+        "vs_baseline": {"net_rating": diff.mean, "ci95": diff.ci95},
+        "iterations": iterations,
+        "evaluated_lineups": len(scores) - cached_before,
+        "search_space": math.comb(len(roster), rotation_size) * math.comb(rotation_size, len(starters)),
+    }
+
+
+def clear_lineup_cache() -> None:
+    with _CACHE_LOCK:
+        _CACHE.clear()
@@ -0,0 +1,263 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, Tuple
+
+from match_engine import Team
+from play_by_play import stream_game
+
+# 라이브 경기 허브.
+#
+# 경기 하나는 백그라운드 스레드에서 play_by_play.stream_game 으로 딱 한 번 시뮬레이션하고,
+# 이벤트를 순서대로 로그에 쌓는다. 시청자는 몇 명이든 이 로그를 처음(또는 중간)부터
+# 따라 읽으므로 다시 시뮬레이션하지 않는다. 페이싱(포제션당 대기 시간)은 시청자별로 따로 준다.
+# 서버 (SSE) 시청자는 aiter_events 로 이벤트 루프 안에서 기다리고 쉬므로 스레드를 잡지 않는다
+# (프로듀서는 새 이벤트마다 기다리는 시청자의 asyncio.Event 를 그 루프에서 깨운다).
+#
+# 경기 결과 반영 (on_finish) 은 리그 상태를 바꾸므로 프로듀서 스레드에서 바로 돌리지 않는다.
+# 이벤트 루프 (서버 핸들러) 안에서 시작한 경기는 그 루프로 넘겨 다른 상태 변경 핸들러와
+# 차례로 돌게 하고, clear_live_games() (리그 로드 / 되돌리기) 로 버린 경기는 반영하지 않는다.
+
+# 라이브 경기에서 박스스코어 스냅샷을 보내는 간격 (포제션)
+DEFAULT_BOX_EVERY = 10
+# 시청자 페이싱 상한 (초 / 포제션)
+MAX_PACE = 2.0
+
+_GAMES_MAX = 32
+_GAMES: "OrderedDict[str, LiveGame]" = OrderedDict()
+_GAMES_LOCK = threading.Lock()
+
+
+# -----------------------------
+# 라이브 경기
+# -----------------------------
+class LiveGame:
+    """한 번 시뮬레이션되는 경기의 이벤트 로그.
+
+    on_finish(result) 는 game_end 직후 한 번 호출된다 (결과를 리그 상태에 반영하는 용도).
+    이벤트 루프 안에서 만든 경기면 그 루프에서, 아니면 프로듀서 스레드에서 돈다.
+    cancel() 된 경기는 시뮬레이션을 멈추고 on_finish 를 부르지 않는다.
+    """
+
+    def __init__(
+        self,
+        live_id: str,
+        home: Team,
+        away: Team,
+        seed: Optional[int],
+        on_finish: Optional[Callable[[Dict[str, Any]], None]] = None,
+        box_every: Optional[int] = DEFAULT_BOX_EVERY,
+    ):
+        self.live_id = live_id
+        self.home_team_id = home.team_id
+        self.away_team_id = away.team_id
+        self.events: List[Dict[str, Any]] = []
+        self.done = False
+        self.error: Optional[str] = None
+        self.result: Optional[Dict[str, Any]] = None
+        self.cancelled = False
+        self._cond = threading.Condition()
+        # 다음 이벤트를 기다리는 async 시청자 (루프, 깨울 Event). _cond 아래에서만 바꾼다.
+        self._waiters: List[Tuple[asyncio.AbstractEventLoop, asyncio.Event]] = []
+        self._on_finish = on_finish
+        self._finish_lock = threading.Lock()
+        try:
+            self._loop: Optional[asyncio.AbstractEventLoop] = asyncio.get_running_loop()
+        except RuntimeError:
+            self._loop = None
+        self._thread = threading.Thread(
+            target=self._produce,
+            args=(home, away, seed, box_every),
+            name=f"live-game-{live_id}",
+            daemon=True,
+        )
+
+    def start(self) -> "LiveGame":
+        self._thread.start()
+        return self
+
+    def cancel(self) -> None:
+        """경기를 버린다. 돌아온 뒤로는 on_finish 가 불리지 않는다 (이미 돌고 있었으면 끝난 뒤 돌아온다)."""
+        with self._finish_lock:
+            self.cancelled = True
+
+    def _report(self, result: Dict[str, Any]) -> None:
+        """on_finish 를 경기를 시작한 루프로 넘긴다. 루프가 없거나 이미 닫혔으면 여기서 부른다."""
+        if self._loop is not None:
+            try:
+                self._loop.call_soon_threadsafe(self._finish, result)
+                return
+            except RuntimeError:
+                pass
+        self._finish(result)
+
+    def _finish(self, result: Dict[str, Any]) -> None:
+        with self._finish_lock:
+            if not self.cancelled and self._on_finish is not None:
+                self._on_finish(result)
+
+    def _notify(self) -> None:
+        """이벤트 로그 / done 이 바뀌었다 (_cond 를 잡은 채로 부른다)."""
+        self._cond.notify_all()
+        for loop, event in self._waiters:
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:  # 시청자의 루프가 이미 닫혔다
+                pass
+
+    def _produce(self, home: Team, away: Team, seed: Optional[int], box_every: Optional[int]) -> None:
+        try:
+            for event in stream_game(home, away, seed=seed, box_every=box_every):
+                if self.cancelled:
+                    with self._cond:
+                        self.events.append({"type": "game_cancelled"})
+                        self._notify()
+                    break
+                if event["type"] == "game_end":
+                    self.result = event["result"]
+                    self._report(self.result)
+                with self._cond:
+                    self.events.append(event)
+                    self._notify()
+        except Exception as e:  # 시청자가 무한 대기하지 않도록 오류도 이벤트로 남긴다
+            with self._cond:
+                self.error = str(e)
+                self.events.append({"type": "game_error", "detail": str(e)})
+                self._notify()
+        finally:
+            with self._cond:
+                self.done = True
+                self._notify()
+
+    def status(self) -> Dict[str, Any]:
+        with self._cond:
+            return {
+                "live_id": self.live_id,
+                "home_team_id": self.home_team_id,
+                "away_team_id": self.away_team_id,
+                "events": len(self.events),
+                "done": self.done,
+                "error": self.error,
+            }
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """경기가 끝날 때까지 기다린다. 끝났으면 True."""
+        self._thread.join(timeout)
+        return self.done
+
+    def iter_events(self, start: int = 0, pace: float = 0.0, timeout: float = 30.0) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """start 번째 이벤트부터 (index, event) 를 순서대로 내보낸다.
+
+        - pace > 0 이면 포제션이 바뀔 때마다 pace 초씩 쉰다 (이미 만들어진 이벤트라도).
+        - 다음 이벤트가 timeout 초 안에 나오지 않으면 멈춘다.
+        - 인자가 잘못되면 (첫 이벤트 전에) 바로 ValueError.
+        """
+        _check_viewer(start, pace)
+        return self._follow(start, pace, timeout)
+
+    def aiter_events(self, start: int = 0, pace: float = 0.0, timeout: float = 30.0) -> AsyncIterator[Tuple[int, Dict[str, Any]]]:
+        """iter_events 의 async 버전 (서버 스트림용). 기다림 / 페이싱 중에 스레드를 잡지 않는다."""
+        _check_viewer(start, pace)
+        return self._afollow(start, pace, timeout)
+
+    def _follow(self, start: int, pace: float, timeout: float) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        i = start
+        last_possession = None
+        while True:
+            with self._cond:
+                if i >= len(self.events) and not self.done:
+                    self._cond.wait_for(lambda: i < len(self.events) or self.done, timeout)
+                if i >= len(self.events):
+                    return
+                event = self.events[i]
+
+            possession = event.get("possession")
+            if pace and possession is not None and possession != last_possession:
+                if last_possession is not None:
+                    time.sleep(pace)
+                last_possession = possession
+
+            yield i, event
+            i += 1
+
+    async def _afollow(self, start: int, pace: float, timeout: float) -> AsyncIterator[Tuple[int, Dict[str, Any]]]:
+        loop = asyncio.get_running_loop()
+        i = start
+        last_possession = None
+        while True:
+            waiter = None
+            with self._cond:
+                if i >= len(self.events) and not self.done:
+                    waiter = (loop, asyncio.Event())
+                    self._waiters.append(waiter)
+            if waiter is not None:
+                try:
+                    await asyncio.wait_for(waiter[1].wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+                finally:
+                    with self._cond:
+                        self._waiters.remove(waiter)
+            with self._cond:
+                if i >= len(self.events):
+                    return
+                ready = self.events[i:]
+
+            for event in ready:
+                possession = event.get("possession")
+                if pace and possession is not None and possession != last_possession:
+                    if last_possession is not None:
+                        await asyncio.sleep(pace)
+                    last_possession = possession
+
+                yield i, event
+                i += 1
+
+
+def _check_viewer(start: int, pace: float) -> None:
+    if start < 0:
+        raise ValueError(f"invalid start: {start}")
+    if not 0.0 <= pace <= MAX_PACE:
+        raise ValueError(f"pace must be between 0 and {MAX_PACE}: {pace}")
+
+
+# -----------------------------
+# 허브
+# -----------------------------
+def start_live_game(
+    live_id: str,
+    home: Team,
+    away: Team,
+    seed: Optional[int] = None,
+    on_finish: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> LiveGame:
+    """live_id 경기를 시작한다. 이미 있는 live_id 면 그 경기를 그대로 돌려준다 (다시 돌리지 않음)."""
+    with _GAMES_LOCK:
+        game = _GAMES.get(live_id)
+        if game is not None:
+            _GAMES.move_to_end(live_id)
+            return game
+
+        game = LiveGame(live_id, home, away, seed, on_finish=on_finish)
+        _GAMES[live_id] = game
+        # 끝난 경기부터 오래된 순으로 정리 (진행 중인 경기는 남긴다)
+        for old_id in [k for k, g in _GAMES.items() if g.done][: max(0, len(_GAMES) - _GAMES_MAX)]:
+            del _GAMES[old_id]
+    return game.start()
+
+
+def get_live_game(live_id: str) -> Optional[LiveGame]:
+    with _GAMES_LOCK:
+        return _GAMES.get(live_id)
+
+
+def clear_live_games() -> None:
+    """모든 라이브 경기를 버린다. 진행 중인 경기도 취소되어 결과가 리그 상태에 반영되지 않는다."""
+    with _GAMES_LOCK:
+        games = list(_GAMES.values())
+        _GAMES.clear()
+    for game in games:
+        game.cancel()
@@ -2,8 +2,13 @@ from __future__ import annotations
 
 import math
 import random
+from array import array
+from bisect import bisect_left
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from itertools import accumulate
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, NamedTuple, Optional, Sequence, Tuple
 
 import pandas as pd
 
@@ -21,10 +26,361 @@ def _get_rating(row: pd.Series, col: str, default: float = 50.0) -> float:
     return max(1.0, min(99.0, v))
 
 
+# -----------------------------
+# 공용 테이블 (스칼라 엔진 / 배치 엔진 공통)
+# -----------------------------
+BOX_STAT_KEYS = (
+    "MIN", "PTS", "REB", "AST", "STL", "BLK", "TOV",
+    "FGM", "FGA", "3PM", "3PA", "FTM", "FTA", "PF",
+)
+
+# BOX_STAT_KEYS 순서의 고정 인덱스 (Player.add / 팀 스탯 행렬용)
+STAT_INDEX: Dict[str, int] = {k: i for i, k in enumerate(BOX_STAT_KEYS)}
+N_BOX_STATS = len(BOX_STAT_KEYS)
+
+_MIN = STAT_INDEX["MIN"]
+_PTS = STAT_INDEX["PTS"]
+_REB = STAT_INDEX["REB"]
+_AST = STAT_INDEX["AST"]
+_STL = STAT_INDEX["STL"]
+_TOV = STAT_INDEX["TOV"]
+_FGM = STAT_INDEX["FGM"]
+_FGA = STAT_INDEX["FGA"]
+_3PM = STAT_INDEX["3PM"]
+_3PA = STAT_INDEX["3PA"]
+_FTM = STAT_INDEX["FTM"]
+_FTA = STAT_INDEX["FTA"]
+_PF = STAT_INDEX["PF"]
+
+PLAY_TYPES = ("iso", "pnr", "post", "drive_kick", "motion", "generic")
+SHOT_TYPES = ("rim", "mid", "three")
+
+
+def _play_type_weights(scheme: str) -> Dict[str, float]:
+    """공격 전술별 플레이 타입 가중치."""
+    # 기본 가중치
+    w = {
+        "iso": 0.10,
+        "pnr": 0.25,
+        "post": 0.10,
+        "drive_kick": 0.20,
+        "motion": 0.20,
+        "generic": 0.15,
+    }
+    if scheme == "pace_space":
+        w.update({
+            "drive_kick": 0.30,
+            "motion": 0.25,
+            "pnr": 0.20,
+            "iso": 0.05,
+            "post": 0.05,
+            "generic": 0.15,
+        })
+    elif scheme == "five_out_motion":
+        w.update({
+            "motion": 0.35,
+            "drive_kick": 0.25,
+            "pnr": 0.20,
+            "iso": 0.05,
+            "post": 0.05,
+            "generic": 0.10,
+        })
+    elif scheme == "pnr_heavy":
+        w.update({
+            "pnr": 0.45,
+            "drive_kick": 0.15,
+            "motion": 0.15,
+            "post": 0.10,
+            "iso": 0.10,
+            "generic": 0.05,
+        })
+    elif scheme == "post_up_focus":
+        w.update({
+            "post": 0.40,
+            "drive_kick": 0.10,
+            "pnr": 0.15,
+            "motion": 0.10,
+            "iso": 0.15,
+            "generic": 0.10,
+        })
+    elif scheme == "iso_heavy":
+        w.update({
+            "iso": 0.40,
+            "pnr": 0.15,
+            "drive_kick": 0.15,
+            "post": 0.10,
+            "motion": 0.10,
+            "generic": 0.10,
+        })
+    elif scheme == "drive_kick":
+        w.update({
+            "drive_kick": 0.40,
+            "pnr": 0.20,
+            "motion": 0.15,
+            "iso": 0.10,
+            "post": 0.05,
+            "generic": 0.10,
+        })
+    return w
+
+
+def _shot_type_distribution(play_type: str, off_scheme: str, def_scheme: str) -> Dict[str, float]:
+    """플레이 타입/공수 전술에 따른 샷 타입 분포 (음수는 0으로 잘라낸 값)."""
+    # 기본 분포
+    dist = {"rim": 0.35, "mid": 0.25, "three": 0.40}
+
+    # 공격 전술 영향
+    if off_scheme == "pace_space":
+        dist["three"] += 0.10
+        dist["mid"] -= 0.05
+        dist["rim"] -= 0.05
+    elif off_scheme == "five_out_motion":
+        dist["three"] += 0.08
+        dist["rim"] += 0.05
+        dist["mid"] -= 0.13
+    elif off_scheme == "pnr_heavy":
+        if play_type == "pnr":
+            # 롤맨 림, 핸들러 풀업
+            dist["rim"] += 0.10
+            dist["mid"] += 0.05
+            dist["three"] -= 0.15
+    elif off_scheme == "post_up_focus":
+        dist["rim"] += 0.10
+        dist["mid"] += 0.10
+        dist["three"] -= 0.20
+    elif off_scheme == "iso_heavy":
+        dist["mid"] += 0.05
+        dist["rim"] += 0.05
+        dist["three"] -= 0.10
+    elif off_scheme == "drive_kick":
+        dist["rim"] += 0.10
+        dist["three"] += 0.05
+        dist["mid"] -= 0.15
+
+    # 수비 전술 영향
+    if def_scheme == "drop_coverage":
+        dist["rim"] -= 0.05
+        dist["mid"] += 0.05
+    elif def_scheme == "switch_all":
+        dist["three"] -= 0.05
+        dist["rim"] += 0.05
+    elif def_scheme == "zone_2_3":
+        dist["rim"] -= 0.08
+        dist["post"] = dist.get("post", 0.0) - 0.05
+        dist["three"] += 0.13
+    elif def_scheme == "full_court_press":
+        # 트랜지션에서 림/3 둘 다 늘어나는 느낌
+        dist["rim"] += 0.05
+        dist["three"] += 0.05
+        dist["mid"] -= 0.10
+
+    # 정규화
+    for k, v in list(dist.items()):
+        dist[k] = max(0.0, v)
+    if sum(dist.values()) <= 0:
+        dist = {"rim": 0.4, "mid": 0.2, "three": 0.4}
+    return dist
+
+
+# -----------------------------
+# 누적 가중치 테이블 (bisect 로 가중 랜덤 선택)
+# -----------------------------
+class WeightTable(NamedTuple):
+    """가중치의 누적합과 총합.
+
+    r = rng.random() * total 일 때 bisect_left(cum, r) 는
+    "acc += w; if r <= acc" 선형 탐색이 처음 멈추는 인덱스와 같다.
+    (범위를 벗어나면 len(cum))
+    """
+
+    cum: Tuple[float, ...]
+    total: float
+
+
+def _weight_table(weights: Sequence[float]) -> WeightTable:
+    return WeightTable(tuple(accumulate(weights)), sum(weights))
+
+
+@lru_cache(maxsize=None)
+def _play_type_table(scheme: str) -> Tuple[Tuple[str, ...], WeightTable]:
+    w = _play_type_weights(scheme)
+    return tuple(w.keys()), _weight_table(list(w.values()))
+
+
+@lru_cache(maxsize=None)
+def _shot_type_table(play_type: str, off_scheme: str, def_scheme: str) -> Tuple[Tuple[str, ...], WeightTable]:
+    dist = _shot_type_distribution(play_type, off_scheme, def_scheme)
+    return tuple(dist.keys()), _weight_table(list(dist.values()))
+
+
+def _turnover_scheme_adjustment(def_scheme: str) -> float:
+    if def_scheme == "full_court_press":
+        return 0.06  # 프레스면 턴오버↑
+    if def_scheme == "blitz_pnr":
+        return 0.03  # 적극적인 트랩
+    if def_scheme == "zone_2_3":
+        return -0.01  # 온볼 압박은 덜 하니까
+    return 0.0
+
+
+def _def_rating_adjustment(def_scheme: str, play_type: str, shot_type: str) -> float:
+    if def_scheme == "drop_coverage":
+        if shot_type == "rim":
+            return 6.0
+        if shot_type == "mid":
+            return -3.0
+    elif def_scheme == "switch_all":
+        if shot_type == "three":
+            return 5.0
+    elif def_scheme == "zone_2_3":
+        if shot_type == "rim":
+            return 6.0
+        if shot_type == "three":
+            return -4.0
+    elif def_scheme == "hedge_recover":
+        if play_type == "pnr" and shot_type in ("mid", "three"):
+            return 4.0
+    elif def_scheme == "blitz_pnr":
+        if play_type == "pnr":
+            return 3.0  # 온볼 압박
+    return 0.0
+
+
+def _is_aggressive_defense(def_scheme: str) -> bool:
+    return def_scheme in ("full_court_press", "blitz_pnr", "hedge_recover")
+
+
+def _rebound_scheme_adjustment(def_scheme: str) -> float:
+    if def_scheme in ("drop_coverage", "zone_2_3"):
+        return 0.03  # 빅이 안쪽에 있음
+    if def_scheme == "switch_all":
+        return -0.02  # 스몰볼 라인업이 많다고 가정
+    return 0.0
+
+
+def _assist_scheme_adjustment(off_scheme: str) -> float:
+    if off_scheme in ("pace_space", "five_out_motion", "drive_kick", "pnr_heavy"):
+        return 0.08
+    if off_scheme == "iso_heavy":
+        return -0.15
+    if off_scheme == "post_up_focus":
+        return -0.05
+    return 0.0
+
+
+# -----------------------------
+# 능력치 집계
+# -----------------------------
+def _build_ratings(row: pd.Series) -> Dict[str, float]:
+    r: Dict[str, float] = {}
+
+    # Outside
+    for col in [
+        "Close Shot", "Mid-Range Shot", "Three-Point Shot", "Free Throw",
+        "Shot IQ", "Offensive Consistency",
+    ]:
+        r[col] = _get_rating(row, col)
+
+    # Inside
+    for col in [
+        "Layup", "Standing Dunk", "Driving Dunk",
+        "Post Hook", "Post Fade", "Post Control",
+        "Draw Foul", "Hands",
+    ]:
+        r[col] = _get_rating(row, col)
+
+    # Playmaking
+    for col in [
+        "Pass Accuracy", "Ball Handle", "Speed with Ball",
+        "Pass IQ", "Pass Vision",
+    ]:
+        r[col] = _get_rating(row, col)
+
+    # Defense
+    for col in [
+        "Interior Defense", "Perimeter Defense", "Steal", "Block",
+        "Help Defense IQ", "Pass Perception", "Defensive Consistency",
+    ]:
+        r[col] = _get_rating(row, col)
+
+    # Rebounding
+    for col in ["Offensive Rebound", "Defensive Rebound"]:
+        r[col] = _get_rating(row, col)
+
+    # Athleticism
+    for col in ["Speed", "Agility", "Strength", "Vertical", "Stamina", "Hustle"]:
+        r[col] = _get_rating(row, col)
+
+    # 기타
+    for col in ["Overall Durability", "Intangibles", "Potential"]:
+        r[col] = _get_rating(row, col)
+
+    # 집계
+    def mean_of(keys: List[str], fallback: str) -> float:
+        vals = [r[k] for k in keys if k in r]
+        if not vals:
+            return _get_rating(row, fallback, 75.0)
+        return sum(vals) / len(vals)
+
+    r["Outside Scoring"] = mean_of(
+        ["Close Shot", "Mid-Range Shot", "Three-Point Shot", "Free Throw",
+         "Shot IQ", "Offensive Consistency"],
+        "Outside Scoring",
+    )
+    r["Inside Scoring"] = mean_of(
+        ["Layup", "Standing Dunk", "Driving Dunk", "Post Hook",
+         "Post Fade", "Post Control", "Draw Foul", "Hands"],
+        "Inside Scoring",
+    )
+    r["Playmaking"] = mean_of(
+        ["Pass Accuracy", "Ball Handle", "Speed with Ball", "Pass IQ", "Pass Vision"],
+        "Playmaking",
+    )
+    r["Defense"] = mean_of(
+        ["Interior Defense", "Perimeter Defense", "Steal", "Block",
+         "Help Defense IQ", "Pass Perception", "Defensive Consistency"],
+        "Defense",
+    )
+    r["Rebounding"] = mean_of(
+        ["Offensive Rebound", "Defensive Rebound"],
+        "Rebounding",
+    )
+    r["Athleticism"] = mean_of(
+        ["Speed", "Agility", "Strength", "Vertical", "Stamina", "Hustle"],
+        "Athleticism",
+    )
+
+    if "OVR" in row and not pd.isna(row["OVR"]):
+        r["Overall"] = float(row["OVR"])
+    elif "Overall" in row and not pd.isna(row["Overall"]):
+        r["Overall"] = float(row["Overall"])
+    else:
+        r["Overall"] = sum(r.values()) / max(1, len(r))
+
+    return r
+
+
+def _player_from_row(pid: Any, row: pd.Series, team_id: str, ratings: Optional[Dict[str, float]] = None) -> Player:
+    if ratings is None:
+        ratings = _build_ratings(row)
+    return Player(
+        player_id=int(pid),
+        name=str(row.get("Name", f"Player {pid}")),
+        team_id=team_id,
+        pos=str(row.get("POS", "")),
+        overall=float(row.get("OVR", row.get("Overall", ratings.get("Overall", 75.0)))),
+        ratings=ratings,
+    )
+
+
 # -----------------------------
 # Player / Team
 # -----------------------------
-@dataclass
+def _new_stats_matrix(n_players: int) -> array:
+    return array("d", bytes(8 * N_BOX_STATS * n_players))
+
+
+@dataclass(slots=True)
 class Player:
     player_id: int
     name: str
@@ -33,34 +389,33 @@ class Player:
     overall: float
     ratings: Dict[str, float]
 
-    # 박스스코어
-    stats: Dict[str, float] = field(default_factory=lambda: {
-        "MIN": 0.0,
-        "PTS": 0.0,
-        "REB": 0.0,
-        "AST": 0.0,
-        "STL": 0.0,
-        "BLK": 0.0,
-        "TOV": 0.0,
-        "FGM": 0.0,
-        "FGA": 0.0,
-        "3PM": 0.0,
-        "3PA": 0.0,
-        "FTM": 0.0,
-        "FTA": 0.0,
-        "PF": 0.0,
-    })
-
     # usage(공격 비중) 기본 가중치
     usage_weight: float = 1.0
     desired_minutes: float = 0.0
 
+    # 박스스코어: stats_buf[stats_offset : stats_offset + N_BOX_STATS]
+    # Team 에 속하면 팀 스탯 행렬의 한 행을 가리킨다.
+    stats_buf: array = field(default_factory=lambda: _new_stats_matrix(1), repr=False, compare=False)
+    stats_offset: int = field(default=0, repr=False, compare=False)
+
+    @property
+    def stats(self) -> Dict[str, float]:
+        """박스스코어 스냅샷 (읽기 전용 dict)."""
+        o = self.stats_offset
+        return dict(zip(BOX_STAT_KEYS, self.stats_buf[o:o + N_BOX_STATS]))
+
+    def stat(self, idx: int) -> float:
+        return self.stats_buf[self.stats_offset + idx]
+
+    def add(self, idx: int, val: float = 1.0) -> None:
+        self.stats_buf[self.stats_offset + idx] += val
+
     def inc(self, key: str, val: float = 1.0) -> None:
-        self.stats[key] = self.stats.get(key, 0.0) + val
+        self.add(STAT_INDEX[key], val)
 
     def reset_stats(self) -> None:
-        for k in list(self.stats.keys()):
-            self.stats[k] = 0.0
+        o = self.stats_offset
+        self.stats_buf[o:o + N_BOX_STATS] = _new_stats_matrix(1)
 
 
 @dataclass
@@ -69,23 +424,27 @@ class Team:
     players: List[Player]
     rotation_players: List[Player]
     tactics: Dict[str, Any]
+    stats_matrix: array
 
     def __init__(self, team_id: str, team_df: pd.DataFrame, tactics: Optional[Dict[str, Any]] = None):
-        self.team_id = team_id
-
         # 1) 전체 로스터 → Player 객체 생성
         all_players: List[Player] = []
         for pid, row in team_df.iterrows():
-            ratings = self._build_ratings(row)
-            p = Player(
-                player_id=int(pid),
-                name=str(row.get("Name", f"Player {pid}")),
-                team_id=team_id,
-                pos=str(row.get("POS", "")),
-                overall=float(row.get("OVR", row.get("Overall", ratings.get("Overall", 75.0)))),
-                ratings=ratings,
-            )
-            all_players.append(p)
+            all_players.append(_player_from_row(pid, row, team_id))
+        self._setup(team_id, all_players, tactics)
+
+    @classmethod
+    def from_players(cls, team_id: str, players: Sequence[Player], tactics: Optional[Dict[str, Any]] = None) -> "Team":
+        """이미 만들어진 Player 들로 팀을 구성한다 (DataFrame 파싱 없이).
+
+        players 는 로스터 순서대로, 이 팀 전용의 새 Player 객체여야 한다.
+        """
+        team = cls.__new__(cls)
+        team._setup(team_id, list(players), tactics)
+        return team
+
+    def _setup(self, team_id: str, all_players: List[Player], tactics: Optional[Dict[str, Any]]) -> None:
+        self.team_id = team_id
 
         # 전반적으로 OVR 순으로 정렬
         all_players.sort(key=lambda p: p.overall, reverse=True)
@@ -163,6 +522,17 @@ class Team:
         self._apply_minutes(starters, bench, rotation_players, rotation_size)
         self.players = all_players
         self.rotation_players = rotation_players
+        self._bind_stats_matrix()
+
+    def _bind_stats_matrix(self) -> None:
+        """전체 로스터의 박스스코어를 (선수 수 x N_BOX_STATS) 평면 배열 하나로 모은다."""
+        self.stats_matrix = _new_stats_matrix(len(self.players))
+        for i, p in enumerate(self.players):
+            p.stats_buf = self.stats_matrix
+            p.stats_offset = i * N_BOX_STATS
+
+    def reset_stats(self) -> None:
+        self.stats_matrix[:] = _new_stats_matrix(len(self.players))
 
     def _apply_minutes(self, starters: List[Player], bench: List[Player], rotation_players: List[Player], rotation_size: int) -> None:
         minutes_cfg = self.tactics.get("minutes") or {}
@@ -195,98 +565,206 @@ class Team:
         }
         return mapping.get(rotation_size, {"starter": 32.0, "bench": 22.0})
 
-    # 능력치 집계
-    def _build_ratings(self, row: pd.Series) -> Dict[str, float]:
-        r: Dict[str, float] = {}
-
-        # Outside
-        for col in [
-            "Close Shot", "Mid-Range Shot", "Three-Point Shot", "Free Throw",
-            "Shot IQ", "Offensive Consistency",
-        ]:
-            r[col] = _get_rating(row, col)
-
-        # Inside
-        for col in [
-            "Layup", "Standing Dunk", "Driving Dunk",
-            "Post Hook", "Post Fade", "Post Control",
-            "Draw Foul", "Hands",
-        ]:
-            r[col] = _get_rating(row, col)
-
-        # Playmaking
-        for col in [
-            "Pass Accuracy", "Ball Handle", "Speed with Ball",
-            "Pass IQ", "Pass Vision",
-        ]:
-            r[col] = _get_rating(row, col)
-
-        # Defense
-        for col in [
-            "Interior Defense", "Perimeter Defense", "Steal", "Block",
-            "Help Defense IQ", "Pass Perception", "Defensive Consistency",
-        ]:
-            r[col] = _get_rating(row, col)
-
-        # Rebounding
-        for col in ["Offensive Rebound", "Defensive Rebound"]:
-            r[col] = _get_rating(row, col)
-
-        # Athleticism
-        for col in ["Speed", "Agility", "Strength", "Vertical", "Stamina", "Hustle"]:
-            r[col] = _get_rating(row, col)
-
-        # 기타
-        for col in ["Overall Durability", "Intangibles", "Potential"]:
-            r[col] = _get_rating(row, col)
-
-        # 집계
-        def mean_of(keys: List[str], fallback: str) -> float:
-            vals = [r[k] for k in keys if k in r]
-            if not vals:
-                return _get_rating(row, fallback, 75.0)
-            return sum(vals) / len(vals)
-
-        r["Outside Scoring"] = mean_of(
-            ["Close Shot", "Mid-Range Shot", "Three-Point Shot", "Free Throw",
-             "Shot IQ", "Offensive Consistency"],
-            "Outside Scoring",
-        )
-        r["Inside Scoring"] = mean_of(
-            ["Layup", "Standing Dunk", "Driving Dunk", "Post Hook",
-             "Post Fade", "Post Control", "Draw Foul", "Hands"],
-            "Inside Scoring",
-        )
-        r["Playmaking"] = mean_of(
-            ["Pass Accuracy", "Ball Handle", "Speed with Ball", "Pass IQ", "Pass Vision"],
-            "Playmaking",
-        )
-        r["Defense"] = mean_of(
-            ["Interior Defense", "Perimeter Defense", "Steal", "Block",
-             "Help Defense IQ", "Pass Perception", "Defensive Consistency"],
-            "Defense",
-        )
-        r["Rebounding"] = mean_of(
-            ["Offensive Rebound", "Defensive Rebound"],
-            "Rebounding",
-        )
-        r["Athleticism"] = mean_of(
-            ["Speed", "Agility", "Strength", "Vertical", "Stamina", "Hustle"],
-            "Athleticism",
-        )
+    def avg(self, key: str) -> float:
+        vals = [p.ratings.get(key, 50.0) for p in self.rotation_players]
+        return sum(vals) / max(1, len(vals))
 
-        if "OVR" in row and not pd.isna(row["OVR"]):
-            r["Overall"] = float(row["OVR"])
-        elif "Overall" in row and not pd.isna(row["Overall"]):
-            r["Overall"] = float(row["Overall"])
+
+# -----------------------------
+# TeamProfile (경기 1회 동안 고정되는 팀 집계값)
+# -----------------------------
+@dataclass(frozen=True)
+class TeamProfile:
+    """경기 시작 시 한 번 컴파일하는 불변 팀 프로필.
+
+    로테이션 평균 레이팅과 선수별 선택 가중치를 미리 계산해 두고,
+    MatchEngine 은 포제션마다 Team.avg / 가중치 리스트를 다시 만들지 않고 이것을 읽는다.
+    모든 선수별 벡터는 players(= rotation_players) 순서를 따른다.
+    """
+
+    team: Team
+    players: Tuple[Player, ...]
+    avg: Mapping[str, float]
+    schemes: Mapping[str, Tuple[str, Optional[str], float, float]]
+    fatigue_factor: float
+    minute_shares: Tuple[float, ...]
+    shooter_weights: Mapping[str, Tuple[float, ...]]
+    ballhandler_weights: Tuple[float, ...]
+    steal_weights: Tuple[float, ...]
+    roll_weights: Tuple[float, ...]
+    foul_weights: Tuple[float, ...]
+    off_reb_weights: Tuple[float, ...]
+    def_reb_weights: Tuple[float, ...]
+    assist_weights: Tuple[float, ...]
+
+    # 누적 가중치 테이블 (rotation 순서)
+    shooter_tables: Mapping[str, WeightTable]
+    ballhandler_table: WeightTable
+    steal_table: WeightTable
+    foul_table: WeightTable
+    off_reb_table: WeightTable
+    def_reb_table: WeightTable
+    # 슈터 인덱스별: 슈터를 뺀 롤맨 테이블 / (어시스트 후보, 테이블)
+    roll_tables: Tuple[WeightTable, ...]
+    assist_tables: Tuple[Tuple[Tuple[Player, ...], WeightTable], ...]
+
+    @property
+    def team_id(self) -> str:
+        return self.team.team_id
+
+    @classmethod
+    def compile(cls, team: Team) -> "TeamProfile":
+        players = tuple(team.rotation_players)
+
+        # 로테이션 평균 (Team.avg 와 같은 계산)
+        keys = dict.fromkeys(k for p in players for k in p.ratings)
+        n = max(1, len(players))
+        avg = {k: sum([p.ratings.get(k, 50.0) for p in players]) / n for k in keys}
+
+        # 출전 시간 비율
+        total_minutes = sum(max(0.0, p.desired_minutes) for p in players)
+        if total_minutes <= 0:
+            uniform = 1.0 / len(players) if players else 0.0
+            minute_shares = tuple(uniform for _ in players)
         else:
-            r["Overall"] = sum(r.values()) / max(1, len(r))
+            minute_shares = tuple(max(0.0, p.desired_minutes) / total_minutes for p in players)
 
-        return r
+        # 공격수 가중치 (usage 기반, 플레이 타입별)
+        shooter_weights: Dict[str, Tuple[float, ...]] = {}
+        for play_type in PLAY_TYPES:
+            weights = []
+            for p in players:
+                w = p.usage_weight
+
+                if play_type == "pnr" or play_type == "drive_kick":
+                    # 볼 핸들러 우선: Ball Handle + Speed with Ball
+                    bh = p.ratings.get("Ball Handle", 70.0)
+                    swb = p.ratings.get("Speed with Ball", 70.0)
+                    w *= 1.0 + (bh + swb - 140.0) / 200.0
+                elif play_type == "post":
+                    # 포스트 옵션: Post Control + Strength
+                    pc = p.ratings.get("Post Control", 70.0)
+                    st = p.ratings.get("Strength", 70.0)
+                    w *= 1.0 + (pc + st - 140.0) / 200.0
+                elif play_type == "iso":
+                    # 에이스 중심: Outside/Inside Scoring + Shot IQ
+                    out = p.ratings.get("Outside Scoring", 70.0)
+                    ins = p.ratings.get("Inside Scoring", 70.0)
+                    iq = p.ratings.get("Shot IQ", 70.0)
+                    score = max(out, ins) + iq
+                    w *= 1.0 + (score - 150.0) / 200.0
+
+                weights.append(max(0.1, w))
+            shooter_weights[play_type] = tuple(weights)
+
+        # 턴오버 볼 핸들러 / 스틸
+        ballhandler_weights = []
+        steal_weights = []
+        for p in players:
+            handle = p.ratings.get("Ball Handle", 70.0)
+            w = p.usage_weight * max(0.0, 110.0 - handle)
+            ballhandler_weights.append(max(0.1, w))
+            rating = p.ratings.get("Steal", 70.0) * 0.7 + p.ratings.get("Perimeter Defense", 70.0) * 0.3
+            steal_weights.append(max(0.1, rating))
+
+        # PnR 롤맨
+        roll_weights = []
+        for p in players:
+            dd = p.ratings.get("Driving Dunk", 70.0)
+            sd = p.ratings.get("Standing Dunk", 70.0)
+            hands = p.ratings.get("Hands", 70.0)
+            st = p.ratings.get("Strength", 70.0)
+            w2 = max(dd, sd) * 0.5 + hands * 0.3 + st * 0.2
+            roll_weights.append(max(0.1, w2))
+
+        # 파울한 수비수
+        foul_weights = []
+        for p in players:
+            rating = (
+                p.ratings.get("Perimeter Defense", 70.0) * 0.4
+                + p.ratings.get("Defense", 70.0) * 0.4
+                + p.ratings.get("Steal", 70.0) * 0.2
+            )
+            foul_weights.append(max(0.1, rating))
 
-    def avg(self, key: str) -> float:
-        vals = [p.ratings.get(key, 50.0) for p in self.rotation_players]
-        return sum(vals) / max(1, len(vals))
+        # 리바운더
+        off_reb_weights = []
+        def_reb_weights = []
+        for p in players:
+            for key, out in (("Offensive Rebound", off_reb_weights), ("Defensive Rebound", def_reb_weights)):
+                r = p.ratings.get(key, 70.0)
+                r += p.ratings.get("Vertical", 70.0) * 0.3
+                r += p.ratings.get("Hustle", 70.0) * 0.2
+                out.append(max(1.0, r))
+
+        # 어시스트
+        assist_weights = []
+        for p in players:
+            pa = p.ratings.get("Pass Accuracy", 70.0)
+            pv = p.ratings.get("Pass Vision", 70.0)
+            piq = p.ratings.get("Pass IQ", 70.0)
+            w = pa * 0.5 + pv * 0.3 + piq * 0.2
+            assist_weights.append(max(1.0, w))
+
+        # 슈터가 정해진 뒤의 롤맨 / 어시스트 후보 테이블
+        roll_tables = []
+        assist_tables = []
+        for i in range(len(players)):
+            roll_tables.append(_weight_table([
+                0.0 if j == i else w2 for j, w2 in enumerate(roll_weights)
+            ]))
+            candidates = tuple(p for j, p in enumerate(players) if j != i)
+            cand_weights = [w for j, w in enumerate(assist_weights) if j != i]
+            assist_tables.append((candidates, _weight_table(cand_weights)))
+
+        return cls(
+            team=team,
+            players=players,
+            avg=MappingProxyType(avg),
+            schemes=MappingProxyType({
+                "offense": _scheme_mix(team, "offense"),
+                "defense": _scheme_mix(team, "defense"),
+            }),
+            fatigue_factor=team.tactics.get("fatigue_factor", 1.0),
+            minute_shares=minute_shares,
+            shooter_weights=MappingProxyType(shooter_weights),
+            ballhandler_weights=tuple(ballhandler_weights),
+            steal_weights=tuple(steal_weights),
+            roll_weights=tuple(roll_weights),
+            foul_weights=tuple(foul_weights),
+            off_reb_weights=tuple(off_reb_weights),
+            def_reb_weights=tuple(def_reb_weights),
+            assist_weights=tuple(assist_weights),
+            shooter_tables=MappingProxyType({
+                k: _weight_table(v) for k, v in shooter_weights.items()
+            }),
+            ballhandler_table=_weight_table(ballhandler_weights),
+            steal_table=_weight_table(steal_weights),
+            foul_table=_weight_table(foul_weights),
+            off_reb_table=_weight_table(off_reb_weights),
+            def_reb_table=_weight_table(def_reb_weights),
+            roll_tables=tuple(roll_tables),
+            assist_tables=tuple(assist_tables),
+        )
+
+
+def _scheme_mix(team: Team, kind: str) -> Tuple[str, Optional[str], float, float]:
+    """(primary, secondary, primary_weight, total_weight). secondary 가 없으면 None."""
+    primary_key = f"{kind}_scheme"
+    secondary_key = f"{kind}_secondary_scheme"
+    primary_default = "pace_space" if kind == "offense" else "drop_coverage"
+
+    primary = team.tactics.get(primary_key, primary_default)
+    secondary = team.tactics.get(secondary_key)
+    if not secondary or secondary in ("none", ""):
+        return primary, None, 0.0, 0.0
+
+    prim_w = max(0.0, float(team.tactics.get(f"{kind}_primary_weight", 10.0)))
+    sec_w = max(0.0, float(team.tactics.get(f"{kind}_secondary_weight", 0.0)))
+    if prim_w < sec_w:
+        prim_w = sec_w
+
+    return primary, secondary, prim_w, prim_w + sec_w
 
 
 # -----------------------------
@@ -300,39 +778,43 @@ class MatchEngine:
 
     def simulate_game(self) -> Dict[str, Any]:
         """Reset all player stats and simulate one full, independent game."""
-        for team in (self.home, self.away):
-            for p in team.players:
-                p.reset_stats()
+        home_profile, away_profile, poss = self._start_game()
 
-        poss = self._estimate_possessions()
-
-        offense = self.home
-        defense = self.away
+        offense = home_profile
+        defense = away_profile
 
         game_minutes = 48.0
         minutes_per_possession = game_minutes * 5.0 / poss
 
-        minute_shares = {
-            self.home.team_id: self._build_minute_shares(self.home),
-            self.away.team_id: self._build_minute_shares(self.away),
-        }
-
         for i in range(poss):
             next_offense = self._simulate_possession(offense, defense)
 
             # 사전에 지정한 출전 시간을 비율로 환산하여 분배
-            for team in (offense, defense):
-                shares = minute_shares.get(team.team_id) or {}
-                fallback = 1.0 / len(team.rotation_players) if team.rotation_players else 0
-                for p in team.rotation_players:
-                    share = shares.get(p.player_id, fallback)
-                    p.inc("MIN", minutes_per_possession * share)
+            for prof in (offense, defense):
+                for p, share in zip(prof.players, prof.minute_shares):
+                    p.add(_MIN, minutes_per_possession * share)
 
             offense = next_offense
-            defense = self.away if next_offense is self.home else self.home
+            defense = away_profile if next_offense is home_profile else home_profile
+
+        return self._finish_game(poss)
+
+    # -----------------------------
+    # 경기 시작 / 종료 (경기당 한 번)
+    # -----------------------------
+    def _start_game(self) -> Tuple[TeamProfile, TeamProfile, int]:
+        """박스스코어를 리셋하고 (홈 프로필, 원정 프로필, 포제션 수) 를 반환한다."""
+        self.home.reset_stats()
+        self.away.reset_stats()
+
+        home_profile = TeamProfile.compile(self.home)
+        away_profile = TeamProfile.compile(self.away)
 
-        home_score = sum(p.stats["PTS"] for p in self.home.rotation_players)
-        away_score = sum(p.stats["PTS"] for p in self.away.rotation_players)
+        return home_profile, away_profile, self._estimate_possessions(home_profile, away_profile)
+
+    def _finish_game(self, poss: int) -> Dict[str, Any]:
+        home_score = sum(p.stat(_PTS) for p in self.home.rotation_players)
+        away_score = sum(p.stat(_PTS) for p in self.away.rotation_players)
 
         final_score = {
             self.home.team_id: int(round(home_score)),
@@ -355,12 +837,12 @@ class MatchEngine:
     # -----------------------------
     # 포제션 수 추정 (pace + 체력)
     # -----------------------------
-    def _estimate_possessions(self) -> int:
+    def _estimate_possessions(self, home: TeamProfile, away: TeamProfile) -> int:
         base = 96  # 평균
         pace_factor = 1.0 + 0.04 * self.home.tactics.get("pace", 0) + 0.04 * self.away.tactics.get("pace", 0)
 
-        stam_home = self.home.avg("Stamina")
-        stam_away = self.away.avg("Stamina")
+        stam_home = home.avg["Stamina"]
+        stam_away = away.avg["Stamina"]
         stamina_factor = 1.0 + (stam_home + stam_away - 150.0) / 400.0  # 둘 합 150 기준
 
         # 풀코트 프레스는 pace↑
@@ -371,41 +853,22 @@ class MatchEngine:
         poss = int(base * pace_factor * stamina_factor)
         return max(80, min(120, poss))
 
-    def _build_minute_shares(self, team: Team) -> Dict[int, float]:
-        total_minutes = sum(max(0.0, p.desired_minutes) for p in team.rotation_players)
-        if total_minutes <= 0:
-            if not team.rotation_players:
-                return {}
-            uniform = 1.0 / len(team.rotation_players)
-            return {p.player_id: uniform for p in team.rotation_players}
-        return {p.player_id: max(0.0, p.desired_minutes) / total_minutes for p in team.rotation_players}
-
-    def _pick_scheme(self, team: Team, kind: str) -> str:
-        primary_key = f"{kind}_scheme"
-        secondary_key = f"{kind}_secondary_scheme"
-        primary_default = "pace_space" if kind == "offense" else "drop_coverage"
-
-        primary = team.tactics.get(primary_key, primary_default)
-        secondary = team.tactics.get(secondary_key)
-        if not secondary or secondary in ("none", ""):
-            return primary
-
-        prim_w = max(0.0, float(team.tactics.get(f"{kind}_primary_weight", 10.0)))
-        sec_w = max(0.0, float(team.tactics.get(f"{kind}_secondary_weight", 0.0)))
-        if prim_w < sec_w:
-            prim_w = sec_w
-
-        total = prim_w + sec_w
-        if total <= 0:
+    def _pick_scheme(self, prof: TeamProfile, kind: str) -> str:
+        primary, secondary, prim_w, total = prof.schemes[kind]
+        if secondary is None or total <= 0:
             return primary
 
         r = self.rng.random() * total
         return primary if r < prim_w else secondary
 
+    def _pick_index(self, table: WeightTable) -> int:
+        """table 에서 가중 랜덤으로 인덱스를 고른다. 범위를 벗어나면 len(table.cum)."""
+        return bisect_left(table.cum, self.rng.random() * table.total)
+
     # -----------------------------
     # 포제션 1개 시뮬
     # -----------------------------
-    def _simulate_possession(self, offense: Team, defense: Team) -> Team:
+    def _simulate_possession(self, offense: TeamProfile, defense: TeamProfile) -> TeamProfile:
         off_scheme = self._pick_scheme(offense, "offense")
         def_scheme = self._pick_scheme(defense, "defense")
 
@@ -432,13 +895,13 @@ class MatchEngine:
         # 6) 득점/리바운드/어시스트
         if made:
             pts = 3 if is_three else 2
-            shooter.inc("PTS", pts)
-            shooter.inc("FGM", 1)
+            shooter.add(_PTS, pts)
+            shooter.add(_FGM, 1)
             if is_three:
-                shooter.inc("3PM", 1)
-        shooter.inc("FGA", 1)
+                shooter.add(_3PM, 1)
+        shooter.add(_FGA, 1)
         if is_three:
-            shooter.inc("3PA", 1)
+            shooter.add(_3PA, 1)
 
         if made:
             self._maybe_assist(offense, defense, shooter, play_type, off_scheme)
@@ -452,9 +915,9 @@ class MatchEngine:
     # -----------------------------
     # 초기 턴오버 (프레스/트랩 등)
     # -----------------------------
-    def _maybe_early_turnover(self, offense: Team, defense: Team, def_scheme: str) -> bool:
-        off_pm = offense.avg("Playmaking")
-        def_def = defense.avg("Defense")
+    def _maybe_early_turnover(self, offense: TeamProfile, defense: TeamProfile, def_scheme: str) -> bool:
+        off_pm = offense.avg["Playmaking"]
+        def_def = defense.avg["Defense"]
 
         base_tov = 0.11  # 기본 11%
         pm_factor = (off_pm - 75.0) / 250.0
@@ -463,269 +926,69 @@ class MatchEngine:
         tov_prob = base_tov - pm_factor + def_factor
 
         # 수비 전술 효과
-        if def_scheme == "full_court_press":
-            tov_prob += 0.06  # 프레스면 턴오버↑
-        elif def_scheme == "blitz_pnr":
-            tov_prob += 0.03  # 적극적인 트랩
-        elif def_scheme == "switch_all":
-            tov_prob += 0.0
-        elif def_scheme == "zone_2_3":
-            tov_prob -= 0.01  # 온볼 압박은 덜 하니까
+        tov_prob += _turnover_scheme_adjustment(def_scheme)
 
         tov_prob = max(0.05, min(0.25, tov_prob))
 
         if self.rng.random() < tov_prob:
-            # 스틸 or 헛패스
-            def _weighted_pick(players: List[Player], weights: List[float]) -> Player:
-                total_w = sum(weights)
-                r = self.rng.random() * total_w
-                acc = 0.0
-                for pl, w in zip(players, weights):
-                    acc += w
-                    if r <= acc:
-                        return pl
-                return players[-1]
-
-            bh_weights = []
-            for p in offense.rotation_players:
-                handle = p.ratings.get("Ball Handle", 70.0)
-                w = p.usage_weight * max(0.0, 110.0 - handle)
-                bh_weights.append(max(0.1, w))
-
-            stl_weights = []
-            for p in defense.rotation_players:
-                rating = p.ratings.get("Steal", 70.0) * 0.7 + p.ratings.get("Perimeter Defense", 70.0) * 0.3
-                stl_weights.append(max(0.1, rating))
-
-            ballhandler = _weighted_pick(offense.rotation_players, bh_weights)
-            stealer = _weighted_pick(defense.rotation_players, stl_weights)
-
-            stealer.inc("STL", 1)
-            ballhandler.inc("TOV", 1)
+            # 스틸 or 헛패스 (범위를 벗어나면 마지막 선수)
+            i = self._pick_index(offense.ballhandler_table)
+            ballhandler = offense.players[min(i, len(offense.players) - 1)]
+            i = self._pick_index(defense.steal_table)
+            stealer = defense.players[min(i, len(defense.players) - 1)]
+
+            stealer.add(_STL, 1)
+            ballhandler.add(_TOV, 1)
             return True
         return False
 
     # -----------------------------
     # 플레이 타입 선택
     # -----------------------------
-    def _pick_play_type(self, offense: Team, defense: Team, scheme: str) -> str:
-        # 기본 가중치
-        w = {
-            "iso": 0.10,
-            "pnr": 0.25,
-            "post": 0.10,
-            "drive_kick": 0.20,
-            "motion": 0.20,
-            "generic": 0.15,
-        }
-        if scheme == "pace_space":
-            w.update({
-                "drive_kick": 0.30,
-                "motion": 0.25,
-                "pnr": 0.20,
-                "iso": 0.05,
-                "post": 0.05,
-                "generic": 0.15,
-            })
-        elif scheme == "five_out_motion":
-            w.update({
-                "motion": 0.35,
-                "drive_kick": 0.25,
-                "pnr": 0.20,
-                "iso": 0.05,
-                "post": 0.05,
-                "generic": 0.10,
-            })
-        elif scheme == "pnr_heavy":
-            w.update({
-                "pnr": 0.45,
-                "drive_kick": 0.15,
-                "motion": 0.15,
-                "post": 0.10,
-                "iso": 0.10,
-                "generic": 0.05,
-            })
-        elif scheme == "post_up_focus":
-            w.update({
-                "post": 0.40,
-                "drive_kick": 0.10,
-                "pnr": 0.15,
-                "motion": 0.10,
-                "iso": 0.15,
-                "generic": 0.10,
-            })
-        elif scheme == "iso_heavy":
-            w.update({
-                "iso": 0.40,
-                "pnr": 0.15,
-                "drive_kick": 0.15,
-                "post": 0.10,
-                "motion": 0.10,
-                "generic": 0.10,
-            })
-        elif scheme == "drive_kick":
-            w.update({
-                "drive_kick": 0.40,
-                "pnr": 0.20,
-                "motion": 0.15,
-                "iso": 0.10,
-                "post": 0.05,
-                "generic": 0.10,
-            })
-
-        total = sum(w.values())
-        r = self.rng.random() * total
-        acc = 0.0
-        for k, val in w.items():
-            acc += val
-            if r <= acc:
-                return k
-        return "generic"
+    def _pick_play_type(self, offense: TeamProfile, defense: TeamProfile, scheme: str) -> str:
+        keys, table = _play_type_table(scheme)
+        i = self._pick_index(table)
+        return keys[i] if i < len(keys) else "generic"
 
     # -----------------------------
     # 공격수 / 세컨더리 액터 선택
     # -----------------------------
-    def _pick_actors(self, offense: Team, play_type: str, scheme: str) -> (Player, Optional[Player]):
-        players = offense.rotation_players
+    def _pick_actors(self, offense: TeamProfile, play_type: str, scheme: str) -> (Player, Optional[Player]):
+        players = offense.players
 
         # usage 기반 기본 가중치
-        weights = []
-        for p in players:
-            w = p.usage_weight
-
-            if play_type == "pnr" or play_type == "drive_kick":
-                # 볼 핸들러 우선: Ball Handle + Speed with Ball
-                bh = p.ratings.get("Ball Handle", 70.0)
-                swb = p.ratings.get("Speed with Ball", 70.0)
-                w *= 1.0 + (bh + swb - 140.0) / 200.0
-            elif play_type == "post":
-                # 포스트 옵션: Post Control + Strength
-                pc = p.ratings.get("Post Control", 70.0)
-                st = p.ratings.get("Strength", 70.0)
-                w *= 1.0 + (pc + st - 140.0) / 200.0
-            elif play_type == "iso":
-                # 에이스 중심: Outside/Inside Scoring + Shot IQ
-                out = p.ratings.get("Outside Scoring", 70.0)
-                ins = p.ratings.get("Inside Scoring", 70.0)
-                iq = p.ratings.get("Shot IQ", 70.0)
-                score = max(out, ins) + iq
-                w *= 1.0 + (score - 150.0) / 200.0
-
-            weights.append(max(0.1, w))
-
-        total = sum(weights)
-        r = self.rng.random() * total
-        acc = 0.0
-        shooter = players[0]
-        for p, w in zip(players, weights):
-            acc += w
-            if r <= acc:
-                shooter = p
-                break
+        i = self._pick_index(offense.shooter_tables[play_type])
+        if i >= len(players):
+            i = 0
+        shooter = players[i]
 
         secondary: Optional[Player] = None
 
         if play_type == "pnr":
-            # 롤맨 선택
-            weights2 = []
-            for p in players:
-                if p is shooter:
-                    weights2.append(0.0)
-                    continue
-                dd = p.ratings.get("Driving Dunk", 70.0)
-                sd = p.ratings.get("Standing Dunk", 70.0)
-                hands = p.ratings.get("Hands", 70.0)
-                st = p.ratings.get("Strength", 70.0)
-                w2 = max(dd, sd) * 0.5 + hands * 0.3 + st * 0.2
-                weights2.append(max(0.1, w2))
-            total2 = sum(weights2)
-            if total2 > 0:
-                r2 = self.rng.random() * total2
-                acc2 = 0.0
-                for p, w2 in zip(players, weights2):
-                    acc2 += w2
-                    if r2 <= acc2:
-                        secondary = p
-                        break
+            # 롤맨 선택 (슈터 제외)
+            table = offense.roll_tables[i]
+            if table.total > 0:
+                j = self._pick_index(table)
+                if j < len(players):
+                    secondary = players[j]
 
         return shooter, secondary
 
     # -----------------------------
     # 샷 타입 선택 (rim/mid/three)
     # -----------------------------
-    def _pick_shot_type(self, offense: Team, defense: Team, play_type: str, off_scheme: str, def_scheme: str) -> str:
-
-        # 기본 분포
-        dist = {"rim": 0.35, "mid": 0.25, "three": 0.40}
-
-        # 공격 전술 영향
-        if off_scheme == "pace_space":
-            dist["three"] += 0.10
-            dist["mid"] -= 0.05
-            dist["rim"] -= 0.05
-        elif off_scheme == "five_out_motion":
-            dist["three"] += 0.08
-            dist["rim"] += 0.05
-            dist["mid"] -= 0.13
-        elif off_scheme == "pnr_heavy":
-            if play_type == "pnr":
-                # 롤맨 림, 핸들러 풀업
-                dist["rim"] += 0.10
-                dist["mid"] += 0.05
-                dist["three"] -= 0.15
-        elif off_scheme == "post_up_focus":
-            dist["rim"] += 0.10
-            dist["mid"] += 0.10
-            dist["three"] -= 0.20
-        elif off_scheme == "iso_heavy":
-            dist["mid"] += 0.05
-            dist["rim"] += 0.05
-            dist["three"] -= 0.10
-        elif off_scheme == "drive_kick":
-            dist["rim"] += 0.10
-            dist["three"] += 0.05
-            dist["mid"] -= 0.15
-
-        # 수비 전술 영향
-        if def_scheme == "drop_coverage":
-            dist["rim"] -= 0.05
-            dist["mid"] += 0.05
-        elif def_scheme == "switch_all":
-            dist["three"] -= 0.05
-            dist["rim"] += 0.05
-        elif def_scheme == "zone_2_3":
-            dist["rim"] -= 0.08
-            dist["post"] = dist.get("post", 0.0) - 0.05
-            dist["three"] += 0.13
-        elif def_scheme == "full_court_press":
-            # 트랜지션에서 림/3 둘 다 늘어나는 느낌
-            dist["rim"] += 0.05
-            dist["three"] += 0.05
-            dist["mid"] -= 0.10
-
-        # 정규화
-        for k, v in list(dist.items()):
-            dist[k] = max(0.0, v)
-        total = sum(dist.values())
-        if total <= 0:
-            dist = {"rim": 0.4, "mid": 0.2, "three": 0.4}
-            total = 1.0
-
-        r = self.rng.random() * total
-        acc = 0.0
-        for k, v in dist.items():
-            acc += v
-            if r <= acc:
-                return k
-        return "rim"
+    def _pick_shot_type(self, offense: TeamProfile, defense: TeamProfile, play_type: str, off_scheme: str, def_scheme: str) -> str:
+        keys, table = _shot_type_table(play_type, off_scheme, def_scheme)
+        i = self._pick_index(table)
+        return keys[i] if i < len(keys) else "rim"
 
     # -----------------------------
     # 샷 성공/파울 판정
     # -----------------------------
     def _resolve_shot(
         self,
-        offense: Team,
-        defense: Team,
+        offense: TeamProfile,
+        defense: TeamProfile,
         shooter: Player,
         secondary: Optional[Player],
         play_type: str,
@@ -736,17 +999,17 @@ class MatchEngine:
         # 공격 레이팅
         if shot_type == "three":
             att = shooter.ratings.get("Three-Point Shot", 70.0)
-            def_rating = defense.avg("Perimeter Defense")
+            def_rating = defense.avg["Perimeter Defense"]
         elif shot_type == "mid":
             att = shooter.ratings.get("Mid-Range Shot", 70.0)
-            def_rating = defense.avg("Perimeter Defense")
+            def_rating = defense.avg["Perimeter Defense"]
         else:  # rim
             att = max(
                 shooter.ratings.get("Layup", 70.0),
                 shooter.ratings.get("Driving Dunk", 70.0),
                 shooter.ratings.get("Close Shot", 70.0),
             )
-            def_rating = defense.avg("Interior Defense")
+            def_rating = defense.avg["Interior Defense"]
 
         # 플레이 타입 보정 (PnR, Post, Iso, Drive&Kick 등)
         if play_type == "pnr" and secondary is not None:
@@ -763,33 +1026,15 @@ class MatchEngine:
             att += (iq - 70.0) * 0.5
 
         # 수비 전술 보정
-        if def_scheme == "drop_coverage":
-            if shot_type == "rim":
-                def_rating += 6
-            elif shot_type == "mid":
-                def_rating -= 3
-        elif def_scheme == "switch_all":
-            if shot_type == "three":
-                def_rating += 5
-        elif def_scheme == "zone_2_3":
-            if shot_type == "rim":
-                def_rating += 6
-            elif shot_type == "three":
-                def_rating -= 4
-        elif def_scheme == "hedge_recover":
-            if play_type == "pnr" and shot_type in ("mid", "three"):
-                def_rating += 4
-        elif def_scheme == "blitz_pnr":
-            if play_type == "pnr":
-                def_rating += 3  # 온볼 압박
+        def_rating += _def_rating_adjustment(def_scheme, play_type, shot_type)
 
         # 피지컬/피로 보정
         off_ath = shooter.ratings.get("Athleticism", 75.0)
-        def_ath = defense.avg("Athleticism")
+        def_ath = defense.avg["Athleticism"]
         ath_delta = (off_ath - def_ath) / 20.0
 
-        off_fat = offense.tactics.get("fatigue_factor", 1.0)
-        def_fat = defense.tactics.get("fatigue_factor", 1.0)
+        off_fat = offense.fatigue_factor
+        def_fat = defense.fatigue_factor
 
         rating_diff = att - def_rating
         base_prob = 0.45 + rating_diff / 150.0
@@ -809,10 +1054,8 @@ class MatchEngine:
 
         # 파울 유도 확률
         draw = shooter.ratings.get("Draw Foul", 70.0)
-        hands = defense.avg("Hands")
-        def_agg = 1
-        if def_scheme in ("full_court_press", "blitz_pnr", "hedge_recover"):
-            def_agg = 2
+        hands = defense.avg["Hands"]
+        def_agg = 2 if _is_aggressive_defense(def_scheme) else 1
 
         foul_base = 0.10 + (draw - 70.0) / 350.0 + (def_agg - 1) * 0.03
         foul_base -= (hands - 70.0) / 400.0
@@ -826,24 +1069,10 @@ class MatchEngine:
         foul_drawn = self.rng.random() < foul_prob
         made = self.rng.random() < prob
 
-        if foul_drawn and defense.rotation_players:
-            weights = []
-            for p in defense.rotation_players:
-                rating = (
-                    p.ratings.get("Perimeter Defense", 70.0) * 0.4
-                    + p.ratings.get("Defense", 70.0) * 0.4
-                    + p.ratings.get("Steal", 70.0) * 0.2
-                )
-                weights.append(max(0.1, rating))
-
-            total = sum(weights)
-            r = self.rng.random() * total
-            acc = 0.0
-            for p, w in zip(defense.rotation_players, weights):
-                acc += w
-                if r <= acc:
-                    p.inc("PF", 1)
-                    break
+        if foul_drawn and defense.players:
+            i = self._pick_index(defense.foul_table)
+            if i < len(defense.players):
+                defense.players[i].add(_PF, 1)
 
         is_three = (shot_type == "three")
         ft_count = 0
@@ -863,100 +1092,64 @@ class MatchEngine:
         prob = 0.75 + (ft - 75.0) / 200.0
         prob = max(0.55, min(0.95, prob))
         for _ in range(n):
-            shooter.inc("FTA", 1)
+            shooter.add(_FTA, 1)
             if self.rng.random() < prob:
-                shooter.inc("FTM", 1)
-                shooter.inc("PTS", 1)
+                shooter.add(_FTM, 1)
+                shooter.add(_PTS, 1)
 
     # -----------------------------
     # 리바운드
     # -----------------------------
-    def _resolve_rebound(self, offense: Team, defense: Team, def_scheme: str) -> Team:
-        off_reb = offense.avg("Offensive Rebound")
-        def_reb = defense.avg("Defensive Rebound")
+    def _resolve_rebound(self, offense: TeamProfile, defense: TeamProfile, def_scheme: str) -> TeamProfile:
+        off_reb = offense.avg["Offensive Rebound"]
+        def_reb = defense.avg["Defensive Rebound"]
 
         # 기본: 수비 75%
         base_def_share = 0.75 + (def_reb - off_reb) / 400.0
 
         # 수비 전술 보정
-        if def_scheme in ("drop_coverage", "zone_2_3"):
-            base_def_share += 0.03  # 빅이 안쪽에 있음
-        elif def_scheme == "switch_all":
-            base_def_share -= 0.02  # 스몰볼 라인업이 많다고 가정
+        base_def_share += _rebound_scheme_adjustment(def_scheme)
 
         base_def_share = max(0.60, min(0.90, base_def_share))
 
         if self.rng.random() < base_def_share:
             reb_team = defense
-            key = "DEF"
+            table = defense.def_reb_table
         else:
             reb_team = offense
-            key = "OFF"
+            table = offense.off_reb_table
 
         # 누가 잡는가
-        weights = []
-        for p in reb_team.rotation_players:
-            if key == "OFF":
-                r = p.ratings.get("Offensive Rebound", 70.0)
-            else:
-                r = p.ratings.get("Defensive Rebound", 70.0)
-            r += p.ratings.get("Vertical", 70.0) * 0.3
-            r += p.ratings.get("Hustle", 70.0) * 0.2
-            weights.append(max(1.0, r))
-
-        total = sum(weights)
-        r = self.rng.random() * total
-        acc = 0.0
-        for p, w in zip(reb_team.rotation_players, weights):
-            acc += w
-            if r <= acc:
-                p.inc("REB", 1)
-                break
+        i = self._pick_index(table)
+        if i < len(reb_team.players):
+            reb_team.players[i].add(_REB, 1)
 
         return reb_team
 
     # -----------------------------
     # 어시스트
     # -----------------------------
-    def _maybe_assist(self, offense: Team, defense: Team, shooter: Player, play_type: str, scheme: str) -> None:
-        pm_team = offense.avg("Playmaking")
-        help_def = defense.avg("Help Defense IQ")
+    def _maybe_assist(self, offense: TeamProfile, defense: TeamProfile, shooter: Player, play_type: str, scheme: str) -> None:
+        pm_team = offense.avg["Playmaking"]
+        help_def = defense.avg["Help Defense IQ"]
 
         base_ast = 0.55 + (pm_team - help_def) / 300.0
 
         # 전술 보정
-        if scheme in ("pace_space", "five_out_motion", "drive_kick", "pnr_heavy"):
-            base_ast += 0.08
-        elif scheme == "iso_heavy":
-            base_ast -= 0.15
-        elif scheme == "post_up_focus":
-            base_ast -= 0.05
+        base_ast += _assist_scheme_adjustment(scheme)
 
         base_ast = max(0.15, min(0.85, base_ast))
 
         if self.rng.random() > base_ast:
             return
 
-        candidates = [p for p in offense.rotation_players if p is not shooter]
+        candidates, table = offense.assist_tables[offense.players.index(shooter)]
         if not candidates:
             return
 
-        weights = []
-        for p in candidates:
-            pa = p.ratings.get("Pass Accuracy", 70.0)
-            pv = p.ratings.get("Pass Vision", 70.0)
-            piq = p.ratings.get("Pass IQ", 70.0)
-            w = pa * 0.5 + pv * 0.3 + piq * 0.2
-            weights.append(max(1.0, w))
-
-        total = sum(weights)
-        r = self.rng.random() * total
-        acc = 0.0
-        for p, w in zip(candidates, weights):
-            acc += w
-            if r <= acc:
-                p.inc("AST", 1)
-                break
+        i = self._pick_index(table)
+        if i < len(candidates):
+            candidates[i].add(_AST, 1)
 
     # -----------------------------
     # 박스스코어 포맷
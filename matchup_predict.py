@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import math
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from batch_engine import simulate_matchup_totals
+from expected_outcome import expected_outcome
+from match_engine import BOX_STAT_KEYS, Team
+from roster_registry import get_roster_registry, tactics_key
+from seed_util import derive_seed
+from sim_pool import get_pool
+from state import get_league_master_seed
+from variance_reduction import StoppingRule, antithetic_pairs, split_batches
+
+DEFAULT_SIMULATIONS = 2000
+MAX_SIMULATIONS = 50000
+
+# 청크(워커 작업 단위)당 경기 수. 짝수여야 안티테틱 쌍이 청크 안에서 닫힌다.
+# 청크 나눔은 workers 와 무관하므로 결과도 workers 와 무관하다.
+CHUNK_GAMES = 500
+
+SCORE_PERCENTILES = (5, 25, 50, 75, 95)
+
+# 예측 결과 캐시 (LRU). 키에 로스터 버전 / 전술 해시 / 마스터 seed 가 들어간다.
+_CACHE_MAX = 128
+_CACHE: "OrderedDict[Tuple[Any, ...], Dict[str, Any]]" = OrderedDict()
+_CACHE_LOCK = threading.Lock()
+
+_BOX_LINE_KEYS = ("MIN", "PTS", "REB", "AST", "STL", "TOV", "FGM", "FGA", "3PM", "3PA", "FTM", "FTA", "PF")
+_S = {k: i for i, k in enumerate(BOX_STAT_KEYS)}
+
+
+# -----------------------------
+# 시뮬레이션
+# -----------------------------
+def _run_chunks(
+    home: Team, away: Team, sizes: List[int], seeds: List[int], workers: int
+) -> List[Tuple[np.ndarray, np.ndarray]]:
+    """청크들을 돌려 청크별 (경기별 점수 (n, 2), 선수별 스탯 합계 (2, P, 스탯)) 를 반환한다."""
+    if workers > 1 and len(sizes) > 1:
+        pool = get_pool(workers)
+        futures = [
+            pool.submit(simulate_matchup_totals, home, away, size, s, True)
+            for size, s in zip(sizes, seeds)
+        ]
+        return [f.result() for f in futures]
+    return [simulate_matchup_totals(home, away, size, s, True) for size, s in zip(sizes, seeds)]
+
+
+def _merge_chunks(
+    parts: List[Tuple[np.ndarray, np.ndarray]]
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """(경기별 점수 (n, 2), 안티테틱 쌍 인덱스 (쌍 수, 2), 선수별 스탯 합계 (2, P, 스탯))."""
+    scores = np.concatenate([p[0] for p in parts])
+    totals = sum(p[1] for p in parts)
+    pairs: List[np.ndarray] = []
+    start = 0
+    for p in parts:
+        pairs.append(antithetic_pairs(len(p[0])) + start)
+        start += len(p[0])
+    return scores, np.concatenate(pairs), totals
+
+
+def _control_variate(
+    y: np.ndarray, margin: np.ndarray, margin_mean: float, pairs: np.ndarray
+) -> Tuple[float, float]:
+    """기대 점수차(해석값)를 control variate 로 쓴 y 평균의 (추정치, 표준오차).
+
+    표준오차는 안티테틱 쌍 평균을 독립 표본으로 보고 계산한다.
+    """
+    var_m = margin.var()
+    beta = float(np.cov(y, margin, bias=True)[0, 1] / var_m) if var_m > 0 else 0.0
+    adjusted = y - beta * (margin - margin_mean)
+    estimate = float(adjusted.mean())
+    if len(pairs) > 1:
+        pair_means = adjusted[pairs].mean(axis=1)
+        std_error = float(pair_means.std(ddof=1) / math.sqrt(len(pair_means)))
+    else:
+        std_error = float(adjusted.std(ddof=1) / math.sqrt(len(adjusted))) if len(adjusted) > 1 else 0.0
+    return min(1.0, max(0.0, estimate)), std_error
+
+
+def _percentiles(values: np.ndarray) -> Dict[str, float]:
+    return {f"p{q}": float(v) for q, v in zip(SCORE_PERCENTILES, np.percentile(values, SCORE_PERCENTILES))}
+
+
+def _box_lines(team: Team, totals: np.ndarray, n: int) -> List[Dict[str, Any]]:
+    lines = []
+    for j, p in enumerate(team.rotation_players):
+        line: Dict[str, Any] = {"PlayerID": p.player_id, "Name": p.name, "Team": p.team_id}
+        for key in _BOX_LINE_KEYS:
+            line[key] = round(float(totals[j, _S[key]]) / n, 1)
+        lines.append(line)
+    return lines
+
+
+# -----------------------------
+# 공개 API
+# -----------------------------
+def predict_matchup(
+    home_team_id: str,
+    away_team_id: str,
+    home_tactics: Optional[Dict[str, Any]] = None,
+    away_tactics: Optional[Dict[str, Any]] = None,
+    simulations: int = DEFAULT_SIMULATIONS,
+    workers: int = 1,
+    target_std_error: Optional[float] = None,
+) -> Dict[str, Any]:
+    """home vs away 를 simulations 번 시뮬레이션해 경기 프리뷰를 만든다. (GAME_STATE 는 바꾸지 않는다)
+
+    - 배치 엔진(청크 단위, workers > 1 이면 프로세스 풀)으로 돌린다.
+    - 분산 감소: 청크 안의 안티테틱 쌍 + 해석적 기대 점수차(expected_outcome)를 쓴 control variate.
+    - seed 는 (마스터 seed, 두 팀) 으로 정해지므로 전술만 바꾼 예측끼리는 같은 난수를 쓴다.
+    - target_std_error 가 있으면 청크(workers > 1 이면 workers 개씩)를 돌릴 때마다 승리 확률
+      표준오차를 확인해 목표 이하가 되면 멈춘다. 이때 simulations 는 상한이다.
+    - 결과는 (팀, 로스터 버전, 전술 해시, simulations, target_std_error, 마스터 seed) 로 캐시된다.
+
+    팀을 찾을 수 없거나 simulations / workers 가 범위를 벗어나면 ValueError를 발생시킨다.
+    """
+    if not 2 <= simulations <= MAX_SIMULATIONS:
+        raise ValueError(f"simulations must be between 2 and {MAX_SIMULATIONS}")
+    if workers < 1:
+        raise ValueError(f"invalid workers: {workers}")
+    rule = StoppingRule(max_samples=simulations, target_std_error=target_std_error, min_samples=CHUNK_GAMES)
+
+    home_id = home_team_id.upper()
+    away_id = away_team_id.upper()
+    registry = get_roster_registry()
+    for tid in (home_id, away_id):
+        if not registry.has_team(tid):
+            raise ValueError(f"Team '{tid}' not found in roster excel")
+    if home_id == away_id:
+        raise ValueError("home and away teams must differ")
+
+    master_seed = get_league_master_seed()
+    key = (
+        home_id, registry.roster_version(home_id), tactics_key(home_tactics),
+        away_id, registry.roster_version(away_id), tactics_key(away_tactics),
+        simulations, target_std_error, master_seed,
+    )
+    with _CACHE_LOCK:
+        cached = _CACHE.get(key)
+        if cached is not None:
+            _CACHE.move_to_end(key)
+            return {**cached, "cached": True}
+
+    home = registry.build_team(home_id, tactics=home_tactics or {})
+    away = registry.build_team(away_id, tactics=away_tactics or {})
+    analytic = expected_outcome(home, away)
+
+    seed = derive_seed(master_seed, "predict", home_id, away_id)
+    sizes = split_batches(simulations, CHUNK_GAMES)
+    seeds = [derive_seed(seed, "chunk", i) for i in range(len(sizes))]
+    wave = max(1, workers) if target_std_error is not None else len(sizes)
+
+    parts: List[Tuple[np.ndarray, np.ndarray]] = []
+    while True:
+        start = len(parts)
+        parts += _run_chunks(home, away, sizes[start:start + wave], seeds[start:start + wave], workers)
+        scores, pairs, totals = _merge_chunks(parts)
+        margin = (scores[:, 0] - scores[:, 1]).astype(float)
+        home_win, home_se = _control_variate((margin > 0).astype(float), margin, analytic.margin, pairs)
+        away_win, away_se = _control_variate((margin < 0).astype(float), margin, analytic.margin, pairs)
+        if len(parts) == len(sizes) or rule.should_stop(len(scores), max(home_se, away_se)):
+            break
+    n = len(scores)
+
+    result = {
+        "home_team_id": home_id,
+        "away_team_id": away_id,
+        "simulations": n,
+        "home_win_prob": home_win,
+        "away_win_prob": away_win,
+        "tie_prob": max(0.0, 1.0 - home_win - away_win),
+        "win_prob_std_error": max(home_se, away_se),
+        "expected_score": {
+            home_id: float(scores[:, 0].mean()),
+            away_id: float(scores[:, 1].mean()),
+        },
+        "score_percentiles": {
+            home_id: _percentiles(scores[:, 0]),
+            away_id: _percentiles(scores[:, 1]),
+            "margin": _percentiles(margin),
+        },
+        "projected_box": {
+            home_id: _box_lines(home, totals[0], n),
+            away_id: _box_lines(away, totals[1], n),
+        },
+        "analytic": analytic.to_dict(),
+    }
+
+    with _CACHE_LOCK:
+        _CACHE[key] = result
+        _CACHE.move_to_end(key)
+        while len(_CACHE) > _CACHE_MAX:
+            _CACHE.popitem(last=False)
+    return {**result, "cached": False}
+
+
+def clear_prediction_cache() -> None:
+    with _CACHE_LOCK:
+        _CACHE.clear()
@@ -0,0 +1,298 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import pickle
+import re
+import time
+import zlib
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from config import BASE_DIR, ROSTER_BASE_TEAMS, ROSTER_DF
+from game_store import get_game_store
+from roster_registry import get_roster_registry
+from state import GAME_STATE, _new_game_state
+
+# 리그 세이브 / 로드.
+#
+# 슬롯 하나 = 디렉터리 하나:
+#   manifest.json      : 스냅샷 포맷 버전, 섹션 -> 블롭 digest 목록
+#   blobs/<digest>.z   : pickle + zlib 블롭 (내용 주소 방식이라 같은 내용은 한 번만 저장)
+#   games.sqlite       : game_store(경기별 박스스코어) 백업
+#
+# GAME_STATE 의 최상위 키가 각각 한 섹션이고, 경기 / 트랜잭션처럼 길게 자라는 리스트는
+# CHUNK_SIZE 개씩 잘라 따로 저장한다. 저장할 때 바뀐 블롭만 새로 쓰므로
+# (대개 마지막 청크 몇 개와 스탯 섹션) 시즌이 길어져도 저장 비용이 크게 늘지 않는다.
+# manifest 는 임시 파일에 쓴 뒤 교체하므로 저장 도중 중단돼도 이전 세이브는 그대로다.
+#
+# 로스터: 트레이드로 바뀐 ROSTER_DF 의 Team 값만 (엑셀 기준과의 차이) 저장한다.
+#
+# NOTE: pickle 을 쓰므로 직접 만든(신뢰할 수 있는) 세이브 파일만 불러와야 한다.
+
+SNAPSHOT_FORMAT = 1
+SAVE_DIR = os.path.join(BASE_DIR, "saves")
+CHUNK_SIZE = 256
+COMPRESS_LEVEL = 3
+
+MANIFEST_NAME = "manifest.json"
+BLOB_DIR = "blobs"
+GAME_STORE_NAME = "games.sqlite"
+
+# 청크로 나눠 저장하는 리스트 (GAME_STATE 안의 경로)
+_CHUNKED_PATHS: Tuple[Tuple[str, ...], ...] = (
+    ("games",),
+    ("transactions",),
+    ("league", "master_schedule", "games"),
+)
+
+_SLOT_RE = re.compile(r"^[A-Za-z0-9_-]{1,64}$")
+
+
+# -----------------------------
+# 경로 / 블롭
+# -----------------------------
+def _slot_dir(slot: str, save_dir: Optional[str]) -> str:
+    if not _SLOT_RE.match(slot or ""):
+        raise ValueError(f"invalid save slot: {slot!r}")
+    return os.path.join(save_dir or SAVE_DIR, slot)
+
+
+def _write_blob(blob_dir: str, obj: Any, existing: set) -> Tuple[str, int]:
+    """obj 를 블롭으로 저장하고 (digest, 새로 쓴 바이트 수) 를 반환한다. 이미 있으면 쓰지 않는다."""
+    raw = pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+    digest = hashlib.blake2b(raw, digest_size=16).hexdigest()
+    if digest in existing:
+        return digest, 0
+
+    data = zlib.compress(raw, COMPRESS_LEVEL)
+    path = os.path.join(blob_dir, f"{digest}.z")
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+    existing.add(digest)
+    return digest, len(data)
+
+
+def _read_blob(blob_dir: str, digest: str) -> Any:
+    with open(os.path.join(blob_dir, f"{digest}.z"), "rb") as f:
+        return pickle.loads(zlib.decompress(f.read()))
+
+
+def _existing_blobs(blob_dir: str) -> set:
+    return {name[:-2] for name in os.listdir(blob_dir) if name.endswith(".z")}
+
+
+# -----------------------------
+# GAME_STATE 분해 / 조립
+# -----------------------------
+def _split_state(state: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, List[Any]]]:
+    """(청크 리스트를 뺀 state, 경로 -> 리스트). 원본 state 는 바꾸지 않는다."""
+    skeleton = dict(state)
+    lists: Dict[str, List[Any]] = {}
+    for path in _CHUNKED_PATHS:
+        node = skeleton
+        for key in path[:-1]:
+            child = node.get(key)
+            if not isinstance(child, dict):
+                break
+            node[key] = node = dict(child)
+        else:
+            value = node.get(path[-1])
+            if isinstance(value, list):
+                lists[".".join(path)] = value
+                node[path[-1]] = None
+    return skeleton, lists
+
+
+def _join_state(skeleton: Dict[str, Any], lists: Dict[str, List[Any]]) -> Dict[str, Any]:
+    for dotted, items in lists.items():
+        path = dotted.split(".")
+        node = skeleton
+        for key in path[:-1]:
+            node = node.setdefault(key, {})
+        node[path[-1]] = items
+    return skeleton
+
+
+def _fill_defaults(state: Dict[str, Any], defaults: Dict[str, Any]) -> None:
+    """이전 버전 세이브에 없는 키를 현재 기본값으로 채운다 (재귀, 기존 값은 유지)."""
+    for key, value in defaults.items():
+        if key not in state:
+            state[key] = value
+        elif isinstance(value, dict) and isinstance(state[key], dict):
+            _fill_defaults(state[key], value)
+
+
+# -----------------------------
+# 로스터 변경분
+# -----------------------------
+def _roster_deltas() -> Dict[int, str]:
+    teams = ROSTER_DF["Team"]
+    changed = teams[teams != ROSTER_BASE_TEAMS]
+    return {int(pid): str(team_id) for pid, team_id in changed.items()}
+
+
+def _apply_roster_deltas(deltas: Dict[int, str]) -> int:
+    """ROSTER_DF / 레지스트리 소속을 (엑셀 기준 + deltas) 로 맞춘다. 바뀐 선수 수를 반환."""
+    target = ROSTER_BASE_TEAMS.copy()
+    for pid, team_id in deltas.items():
+        if pid in target.index:
+            target.at[pid] = team_id
+
+    moved = target[target != ROSTER_DF["Team"]]
+    registry = get_roster_registry()
+    for pid, team_id in moved.items():
+        ROSTER_DF.at[pid, "Team"] = team_id
+        registry.move_player(pid, team_id)
+    return len(moved)
+
+
+# -----------------------------
+# 저장 / 불러오기
+# -----------------------------
+def save_league(slot: str = "default", save_dir: Optional[str] = None) -> Dict[str, Any]:
+    """GAME_STATE 와 로스터 변경분을 slot 에 저장한다 (바뀐 블롭만 쓴다).
+
+    slot 이름이 잘못되면 ValueError.
+    """
+    t0 = time.perf_counter()
+    root = _slot_dir(slot, save_dir)
+    blob_dir = os.path.join(root, BLOB_DIR)
+    os.makedirs(blob_dir, exist_ok=True)
+    existing = _existing_blobs(blob_dir)
+
+    written_blobs = 0
+    written_bytes = 0
+
+    def put(obj: Any) -> str:
+        nonlocal written_blobs, written_bytes
+        digest, n = _write_blob(blob_dir, obj, existing)
+        if n:
+            written_blobs += 1
+            written_bytes += n
+        return digest
+
+    skeleton, lists = _split_state(GAME_STATE)
+    sections = {key: put(value) for key, value in skeleton.items()}
+    chunks = {
+        dotted: [put(items[i:i + CHUNK_SIZE]) for i in range(0, len(items), CHUNK_SIZE)]
+        for dotted, items in lists.items()
+    }
+    roster = put(_roster_deltas())
+
+    # 경기 기록 저장소는 SQLite 백업 API 로 통째로 복사한다 (manifest 보다 먼저)
+    store_tmp = os.path.join(root, f"{GAME_STORE_NAME}.tmp")
+    if os.path.exists(store_tmp):
+        os.remove(store_tmp)
+    get_game_store().backup_to(store_tmp)
+    os.replace(store_tmp, os.path.join(root, GAME_STORE_NAME))
+
+    manifest = {
+        "format": SNAPSHOT_FORMAT,
+        "state_schema": GAME_STATE.get("schema_version"),
+        "saved_at": datetime.now().isoformat(timespec="seconds"),
+        "sections": sections,
+        "chunks": chunks,
+        "roster": roster,
+    }
+    tmp = os.path.join(root, f"{MANIFEST_NAME}.tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False)
+    os.replace(tmp, os.path.join(root, MANIFEST_NAME))
+
+    # 새 manifest 가 참조하지 않는 블롭 정리
+    referenced = set(sections.values()) | {d for ds in chunks.values() for d in ds} | {roster}
+    for digest in existing - referenced:
+        os.remove(os.path.join(blob_dir, f"{digest}.z"))
+
+    return {
+        "slot": slot,
+        "saved_at": manifest["saved_at"],
+        "blobs": len(referenced),
+        "written_blobs": written_blobs,
+        "written_bytes": written_bytes,
+        "seconds": round(time.perf_counter() - t0, 4),
+    }
+
+
+def _read_manifest(root: str) -> Dict[str, Any]:
+    path = os.path.join(root, MANIFEST_NAME)
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"save slot not found: {os.path.basename(root)}")
+    with open(path, "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+
+    fmt = manifest.get("format")
+    if not isinstance(fmt, int) or fmt > SNAPSHOT_FORMAT:
+        raise ValueError(f"unsupported save format: {fmt} (supported <= {SNAPSHOT_FORMAT})")
+    return manifest
+
+
+def load_league(slot: str = "default", save_dir: Optional[str] = None) -> Dict[str, Any]:
+    """slot 을 불러와 GAME_STATE 와 로스터를 교체한다.
+
+    - GAME_STATE 는 같은 dict 객체를 유지한 채 내용만 바꾼다 (다른 모듈이 참조 중이므로).
+    - 경기 기록 저장소(game_store)도 슬롯의 백업으로 교체한다.
+    - 없는 slot 이면 FileNotFoundError, 지원하지 않는 포맷이면 ValueError.
+    """
+    t0 = time.perf_counter()
+    root = _slot_dir(slot, save_dir)
+    manifest = _read_manifest(root)
+    blob_dir = os.path.join(root, BLOB_DIR)
+
+    skeleton = {key: _read_blob(blob_dir, digest) for key, digest in manifest["sections"].items()}
+    lists = {}
+    for dotted, digests in manifest.get("chunks", {}).items():
+        items: List[Any] = []
+        for digest in digests:
+            items.extend(_read_blob(blob_dir, digest))
+        lists[dotted] = items
+    state = _join_state(skeleton, lists)
+    _fill_defaults(state, _new_game_state())
+    deltas = _read_blob(blob_dir, manifest["roster"])
+
+    GAME_STATE.clear()
+    GAME_STATE.update(state)
+    moved = _apply_roster_deltas(deltas)
+
+    store_path = os.path.join(root, GAME_STORE_NAME)
+    if os.path.exists(store_path):
+        get_game_store().restore_from(store_path)
+    else:
+        get_game_store().clear()
+
+    return {
+        "slot": slot,
+        "saved_at": manifest.get("saved_at"),
+        "state_schema": manifest.get("state_schema"),
+        "games": len(GAME_STATE.get("games") or []),
+        "roster_moves": moved,
+        "seconds": round(time.perf_counter() - t0, 4),
+    }
+
+
+def list_saves(save_dir: Optional[str] = None) -> List[Dict[str, Any]]:
+    """저장된 슬롯 목록 (최근 저장 순)."""
+    root = save_dir or SAVE_DIR
+    if not os.path.isdir(root):
+        return []
+
+    saves = []
+    for slot in os.listdir(root):
+        if not _SLOT_RE.match(slot):
+            continue
+        try:
+            manifest = _read_manifest(os.path.join(root, slot))
+        except (FileNotFoundError, ValueError, json.JSONDecodeError):
+            continue
+        saves.append({
+            "slot": slot,
+            "saved_at": manifest.get("saved_at"),
+            "state_schema": manifest.get("state_schema"),
+            "format": manifest.get("format"),
+        })
+    saves.sort(key=lambda s: s["saved_at"] or "", reverse=True)
+    return saves
@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+from array import array
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from match_engine import (
+    STAT_INDEX,
+    N_BOX_STATS,
+    MatchEngine,
+    Player,
+    Team,
+    TeamProfile,
+)
+
+# 플레이 바이 플레이 이벤트 스트림.
+#
+# MatchEngine.simulate_game 의 핫 루프에는 손대지 않는다. 구독자가 있을 때만
+# 이 모듈의 엔진(MatchEngine 서브클래스)이 같은 포제션 루프를 돌면서,
+# 포제션 전후의 팀 스탯 행렬 차이로 이벤트를 만든다. 난수 소비 순서가 같으므로
+# 같은 seed 면 마지막 game_end 이벤트의 result 는 simulate_game() 결과와 같다.
+#
+# 이벤트 (dict, "type" 키로 구분):
+#   game_start   : 팀 / 포제션 수
+#   turnover     : 볼 핸들러, 스틸한 선수
+#   shot         : 슈터, play_type, shot_type, made, points
+#   assist       : 어시스트한 선수 (성공한 슛 직후)
+#   foul         : 파울한 수비수 (슈팅 파울)
+#   free_throws  : 시도 / 성공 개수
+#   rebound      : 리바운드한 선수, offensive 여부
+#   box_score    : 그 시점까지의 박스스코어 (box_every 포제션마다)
+#   quarter_end  : 쿼터 종료
+#   game_end     : simulate_game() 과 같은 result dict
+# 포제션 이벤트에는 possession / quarter / clock(쿼터 남은 시간 "MM:SS") / score 가 붙는다.
+
+GAME_SECONDS = 48 * 60
+QUARTER_SECONDS = 12 * 60
+N_QUARTERS = 4
+
+_MIN = STAT_INDEX["MIN"]
+_REB = STAT_INDEX["REB"]
+_AST = STAT_INDEX["AST"]
+_STL = STAT_INDEX["STL"]
+_TOV = STAT_INDEX["TOV"]
+_FGM = STAT_INDEX["FGM"]
+_FGA = STAT_INDEX["FGA"]
+_3PA = STAT_INDEX["3PA"]
+_FTM = STAT_INDEX["FTM"]
+_FTA = STAT_INDEX["FTA"]
+_PF = STAT_INDEX["PF"]
+
+
+# -----------------------------
+# 기록용 엔진
+# -----------------------------
+class _PlayByPlayEngine(MatchEngine):
+    """플레이 / 샷 타입 선택을 기록하는 MatchEngine.
+
+    선택 자체는 부모 메서드가 하므로 난수 소비는 MatchEngine 과 같다.
+    """
+
+    play_type: Optional[str] = None
+    shot_type: Optional[str] = None
+
+    def _pick_play_type(self, offense, defense, scheme):
+        self.play_type = super()._pick_play_type(offense, defense, scheme)
+        return self.play_type
+
+    def _pick_shot_type(self, offense, defense, play_type, off_scheme, def_scheme):
+        self.shot_type = super()._pick_shot_type(offense, defense, play_type, off_scheme, def_scheme)
+        return self.shot_type
+
+
+def _changes(team: Team, before: array) -> Dict[int, Tuple[Player, float]]:
+    """포제션 동안 바뀐 스탯: 스탯 인덱스 -> (선수, 증가량). (MIN 제외)
+
+    한 포제션에서 같은 스탯이 한 팀의 두 선수에게 동시에 쌓이는 경우는 없다.
+    """
+    after = team.stats_matrix
+    out: Dict[int, Tuple[Player, float]] = {}
+    for row, p in enumerate(team.players):
+        o = row * N_BOX_STATS
+        for k in range(N_BOX_STATS):
+            if k != _MIN and after[o + k] != before[o + k]:
+                out[k] = (p, after[o + k] - before[o + k])
+    return out
+
+
+def _clock(possession: int, poss: int) -> Tuple[int, str]:
+    """possession 이 끝나는 시점의 (쿼터, 쿼터 남은 시간 "MM:SS")."""
+    start = GAME_SECONDS * possession / poss
+    end = GAME_SECONDS * (possession + 1) / poss
+    quarter = min(N_QUARTERS, int(start // QUARTER_SECONDS) + 1)
+    remaining = max(0, int(round(quarter * QUARTER_SECONDS - end)))
+    return quarter, f"{remaining // 60:02d}:{remaining % 60:02d}"
+
+
+def _quarter_of(possession: int, poss: int) -> int:
+    return min(N_QUARTERS, int(GAME_SECONDS * possession / poss // QUARTER_SECONDS) + 1)
+
+
+# -----------------------------
+# 스트림
+# -----------------------------
+def stream_game(
+    home: Team,
+    away: Team,
+    seed: Optional[int] = None,
+    box_every: Optional[int] = None,
+) -> Iterator[Dict[str, Any]]:
+    """한 경기를 시뮬레이션하면서 이벤트를 하나씩 yield 한다.
+
+    - 결과는 MatchEngine(home, away, seed).simulate_game() 과 같다 (game_end 의 result).
+    - box_every 가 있으면 그 포제션 수마다 box_score 이벤트를 끼워 넣는다.
+    - 중간에 소비를 멈추면 남은 포제션은 시뮬레이션하지 않는다.
+    """
+    if box_every is not None and box_every <= 0:
+        raise ValueError(f"invalid box_every: {box_every}")
+
+    engine = _PlayByPlayEngine(home, away, seed=seed)
+    home_profile, away_profile, poss = engine._start_game()
+    score = {home.team_id: 0, away.team_id: 0}
+
+    yield {
+        "type": "game_start",
+        "home": home.team_id,
+        "away": away.team_id,
+        "possessions": poss,
+    }
+
+    offense = home_profile
+    defense = away_profile
+    minutes_per_possession = 48.0 * 5.0 / poss
+
+    for i in range(poss):
+        before = {prof.team_id: array("d", prof.team.stats_matrix) for prof in (offense, defense)}
+        engine.play_type = engine.shot_type = None
+
+        next_offense = engine._simulate_possession(offense, defense)
+
+        # simulate_game 과 같은 출전 시간 분배
+        for prof in (offense, defense):
+            for p, share in zip(prof.players, prof.minute_shares):
+                p.add(_MIN, minutes_per_possession * share)
+
+        quarter, clock = _clock(i, poss)
+        base = {"possession": i, "quarter": quarter, "clock": clock}
+        yield from _possession_events(engine, offense, defense, before, base, score)
+
+        if box_every and (i + 1) % box_every == 0 and i + 1 < poss:
+            yield {"type": "box_score", **base, "score": dict(score), "boxscore": _boxscore(engine)}
+
+        if i + 1 == poss or _quarter_of(i + 1, poss) != quarter:
+            yield {"type": "quarter_end", "quarter": quarter, "score": dict(score)}
+
+        offense = next_offense
+        defense = away_profile if next_offense is home_profile else home_profile
+
+    yield {"type": "game_end", "score": dict(score), "result": engine._finish_game(poss)}
+
+
+def _boxscore(engine: MatchEngine) -> Dict[str, List[Dict[str, Any]]]:
+    return {
+        team.team_id: [engine._box_row(p) for p in team.rotation_players]
+        for team in (engine.home, engine.away)
+    }
+
+
+def _possession_events(
+    engine: _PlayByPlayEngine,
+    offense: TeamProfile,
+    defense: TeamProfile,
+    before: Dict[str, array],
+    base: Dict[str, Any],
+    score: Dict[str, int],
+) -> List[Dict[str, Any]]:
+    """포제션 한 개의 스탯 변화를 순서대로 이벤트로 바꾼다. (score 를 갱신한다)"""
+    off_id, def_id = offense.team_id, defense.team_id
+    off = _changes(offense.team, before[off_id])
+    dfn = _changes(defense.team, before[def_id])
+    events: List[Dict[str, Any]] = []
+
+    def emit(kind: str, team_id: str, player: Player, **fields: Any) -> None:
+        events.append({
+            "type": kind,
+            **base,
+            "team_id": team_id,
+            "player_id": player.player_id,
+            "player": player.name,
+            **fields,
+            "score": dict(score),
+        })
+
+    if _TOV in off:
+        ballhandler = off[_TOV][0]
+        stealer = dfn[_STL][0] if _STL in dfn else None
+        emit(
+            "turnover", off_id, ballhandler,
+            steal_player_id=stealer.player_id if stealer else None,
+            steal_player=stealer.name if stealer else None,
+        )
+        return events
+
+    shooter = off[_FGA][0]
+    made = _FGM in off
+    is_three = _3PA in off
+    points = (3 if is_three else 2) if made else 0
+    score[off_id] += points
+    emit(
+        "shot", off_id, shooter,
+        play_type=engine.play_type, shot_type=engine.shot_type,
+        made=made, three=is_three, points=points,
+    )
+
+    if _AST in off:
+        emit("assist", off_id, off[_AST][0])
+
+    if _PF in dfn:
+        emit("foul", def_id, dfn[_PF][0], shooting=True)
+
+    if _FTA in off:
+        ftm = int(off[_FTM][1]) if _FTM in off else 0
+        score[off_id] += ftm
+        emit("free_throws", off_id, shooter, attempts=int(off[_FTA][1]), made=ftm)
+
+    for team_id, changes, offensive in ((off_id, off, True), (def_id, dfn, False)):
+        if _REB in changes:
+            emit("rebound", team_id, changes[_REB][0], offensive=offensive)
+
+    return events
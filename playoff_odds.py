@@ -0,0 +1,456 @@
+from __future__ import annotations
+
+import math
+from concurrent.futures import as_completed
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from batch_engine import BatchMatchEngine
+from config import ALL_TEAM_IDS, TEAM_TO_CONF_DIV
+from playoffs import HomePattern, _pick_home_advantage
+from roster_registry import get_roster_registry
+from seed_util import derive_seed
+from sim_pool import get_pool
+from state import (
+    get_league_master_seed,
+    get_team_records,
+    initialize_master_schedule_if_needed,
+    _ensure_league_state,
+)
+from variance_reduction import RandomStream, StoppingRule, pair_means
+
+ROUND_NAMES = (
+    "Conference Quarterfinals",
+    "Conference Semifinals",
+    "Conference Finals",
+    "NBA Finals",
+)
+CONFERENCES = ("east", "west")
+
+# 팀 전력 모델 보정: 모든 (홈, 원정) 순서쌍마다 배치 엔진으로 돌릴 경기 수
+CALIBRATION_GAMES_PER_PAIR = 4
+
+# 청크(워커 작업 단위)당 시즌 수. 청크가 끝날 때마다 중간 추정치를 내보낸다.
+DEFAULT_CHUNK_RUNS = 500
+
+# 한 시즌의 포스트시즌에 필요한 난수 수 (플레이-인 6 + 시리즈 15 x 7)
+_POSTSEASON_UNIFORMS = 6 + 15 * 7
+
+
+# -----------------------------
+# 팀 전력 모델 (빠른 엔진 경로)
+# -----------------------------
+@dataclass(frozen=True)
+class StrengthModel:
+    """점수차 모델: margin = home_adv + strength[home] - strength[away] + N(0, sigma^2).
+
+    배치 엔진으로 모든 순서쌍을 돌려 최소제곱으로 맞춘다 (strength 합 = 0).
+    """
+
+    team_ids: Tuple[str, ...]
+    strength: np.ndarray
+    home_adv: float
+    sigma: float
+
+    def margin_mean(self, home_idx: np.ndarray, away_idx: np.ndarray) -> np.ndarray:
+        return self.home_adv + self.strength[home_idx] - self.strength[away_idx]
+
+    def home_win_matrix(self) -> np.ndarray:
+        """(T, T) 홈 팀 승리 확률 [home, away]."""
+        mu = self.home_adv + self.strength[:, None] - self.strength[None, :]
+        z = mu / (self.sigma * math.sqrt(2.0))
+        return 0.5 * (1.0 + np.vectorize(math.erf)(z))
+
+
+def fit_strength_model(
+    team_ids: Sequence[str],
+    games_per_pair: int = CALIBRATION_GAMES_PER_PAIR,
+    seed: Optional[int] = None,
+) -> StrengthModel:
+    registry = get_roster_registry()
+    teams = {tid: registry.build_team(tid) for tid in team_ids}
+    index = {tid: i for i, tid in enumerate(team_ids)}
+
+    pairs = [(h, a) for h in team_ids for a in team_ids if h != a] * games_per_pair
+    scores = BatchMatchEngine([(teams[h], teams[a]) for h, a in pairs], seed=seed).simulate_scores()
+    margins = (scores[:, 0] - scores[:, 1]).astype(float)
+
+    T = len(team_ids)
+    X = np.zeros((len(pairs), T + 1))
+    rows = np.arange(len(pairs))
+    X[:, 0] = 1.0
+    X[rows, 1 + np.array([index[h] for h, _ in pairs])] = 1.0
+    X[rows, 1 + np.array([index[a] for _, a in pairs])] = -1.0
+    # 팀 열들의 합이 null space 이므로 최소 노름 해는 strength 합이 0이 된다.
+    coef, *_ = np.linalg.lstsq(X, margins, rcond=None)
+    resid = margins - X @ coef
+    dof = max(1, len(pairs) - (T + 1))
+    sigma = float(math.sqrt(float(resid @ resid) / dof))
+
+    return StrengthModel(
+        team_ids=tuple(team_ids),
+        strength=coef[1:].copy(),
+        home_adv=float(coef[0]),
+        sigma=max(sigma, 1.0),
+    )
+
+
+_MODEL_CACHE: Dict[Tuple[Any, ...], StrengthModel] = {}
+
+
+def get_strength_model() -> StrengthModel:
+    """현재 로스터 기준 전력 모델 (트레이드로 roster_version 이 바뀌면 다시 맞춘다)."""
+    registry = get_roster_registry()
+    team_ids = tuple(ALL_TEAM_IDS)
+    versions = tuple(registry.roster_version(tid) for tid in team_ids)
+    master_seed = get_league_master_seed()
+    key = (team_ids, versions, master_seed)
+    model = _MODEL_CACHE.get(key)
+    if model is None:
+        _MODEL_CACHE.clear()
+        model = fit_strength_model(
+            team_ids, seed=derive_seed(master_seed, "strength_model", *versions)
+        )
+        _MODEL_CACHE[key] = model
+    return model
+
+
+# -----------------------------
+# 현재 시즌 스냅샷
+# -----------------------------
+def _season_snapshot(model: StrengthModel) -> Dict[str, Any]:
+    """워커에 넘길 수 있는 (picklable) 현재 성적 + 남은 경기 + 모델 요약."""
+    initialize_master_schedule_if_needed()
+    team_ids = list(model.team_ids)
+    index = {tid: i for i, tid in enumerate(team_ids)}
+    records = get_team_records()
+
+    T = len(team_ids)
+    wins = np.array([records.get(t, {}).get("wins", 0) for t in team_ids], dtype=np.int64)
+    losses = np.array([records.get(t, {}).get("losses", 0) for t in team_ids], dtype=np.int64)
+    point_diff = np.array(
+        [records.get(t, {}).get("pf", 0) - records.get(t, {}).get("pa", 0) for t in team_ids],
+        dtype=np.int64,
+    )
+
+    home_idx: List[int] = []
+    away_idx: List[int] = []
+    league = _ensure_league_state()
+    final_games = 0
+    for g in league["master_schedule"].get("games") or []:
+        if g.get("status") == "final":
+            final_games += 1
+            continue
+        h, a = g.get("home_team_id"), g.get("away_team_id")
+        if h in index and a in index:
+            home_idx.append(index[h])
+            away_idx.append(index[a])
+
+    conf_of = [(TEAM_TO_CONF_DIV.get(t, {}).get("conference") or "").lower() for t in team_ids]
+    return {
+        "team_ids": team_ids,
+        # 기본 seed 용 리그 진행 상태 (같은 날짜 / 같은 경기 결과 수면 같은 seed)
+        "current_date": league.get("current_date"),
+        "final_games": final_games,
+        "conf_members": {c: [i for i in range(T) if conf_of[i] == c] for c in CONFERENCES},
+        "wins": wins,
+        "losses": losses,
+        "point_diff": point_diff,
+        "rem_home": np.array(home_idx, dtype=np.int64),
+        "rem_away": np.array(away_idx, dtype=np.int64),
+        "mu": model.margin_mean(np.array(home_idx, dtype=np.int64), np.array(away_idx, dtype=np.int64)),
+        "sigma": model.sigma,
+        "p_home": model.home_win_matrix(),
+    }
+
+
+# -----------------------------
+# 시뮬레이션 (워커)
+# -----------------------------
+def _empty_counts(T: int) -> Dict[str, np.ndarray]:
+    return {
+        "seed": np.zeros((T, 16), dtype=np.int64),  # 정규시즌 컨퍼런스 순위 1~15
+        "play_in": np.zeros(T, dtype=np.int64),
+        "playoffs": np.zeros(T, dtype=np.int64),
+        "playoff_seed": np.zeros((T, 9), dtype=np.int64),  # 브래킷 시드 1~8
+        "round_wins": np.zeros((T, len(ROUND_NAMES)), dtype=np.int64),
+        # 표준오차용: 독립 표본(안티테틱이면 시즌 쌍) 단위 플레이오프 진출 비율의 제곱합과 표본 수
+        "playoffs_sq": np.zeros(T),
+        "units": np.zeros(1, dtype=np.int64),
+    }
+
+
+def _simulate_regular_season(snap: Dict[str, Any], n: int, stream: RandomStream):
+    """남은 정규시즌 n회: (wins, point_diff, games_played) 각 (n, T)."""
+    T = len(snap["team_ids"])
+    h, a = snap["rem_home"], snap["rem_away"]
+    M = len(h)
+    base_gp = snap["wins"] + snap["losses"]
+    wins = np.broadcast_to(snap["wins"], (n, T)).astype(np.int64)
+    point_diff = np.broadcast_to(snap["point_diff"], (n, T)).astype(np.int64)
+    gp = base_gp + np.bincount(h, minlength=T) + np.bincount(a, minlength=T)
+
+    if M:
+        raw = snap["mu"][None, :] + snap["sigma"] * stream.normals(n, M)
+        margin = np.rint(raw).astype(np.int64)
+        # 동점은 연장전 1점차로 처리
+        margin = np.where(margin == 0, np.where(raw >= 0, 1, -1), margin)
+        home_win = margin > 0
+
+        onehot_h = np.zeros((M, T), dtype=np.int64)
+        onehot_a = np.zeros((M, T), dtype=np.int64)
+        onehot_h[np.arange(M), h] = 1
+        onehot_a[np.arange(M), a] = 1
+        wins = wins + home_win.astype(np.int64) @ onehot_h + (~home_win).astype(np.int64) @ onehot_a
+        point_diff = point_diff + margin @ (onehot_h - onehot_a)
+
+    return wins, point_diff, np.broadcast_to(gp, (n, T))
+
+
+def _play_series(home: Dict[str, Any], road: Dict[str, Any], p_home: np.ndarray, u: np.ndarray, k: int):
+    """best-of-7 (HomePattern). (승자 entry, 사용한 난수 수) 반환."""
+    wins = {home["team_id"]: 0, road["team_id"]: 0}
+    game_idx = 0
+    while True:
+        if HomePattern[game_idx]:
+            gh, ga = home, road
+        else:
+            gh, ga = road, home
+        winner = gh if u[k] < p_home[gh["idx"], ga["idx"]] else ga
+        k += 1
+        game_idx += 1
+        wins[winner["team_id"]] += 1
+        if wins[winner["team_id"]] >= 4:
+            return winner, k
+
+
+def _simulate_chunk(snap: Dict[str, Any], n: int, seed: int, antithetic: bool = False) -> Dict[str, np.ndarray]:
+    """시즌 n회를 끝까지 (정규시즌 → 플레이-인 → 플레이오프) 돌리고 집계를 반환.
+
+    antithetic=True 면 시즌 j 와 j + ceil(n/2) 가 반대 난수 (경기 점수차 Z / -Z, 시리즈 U / 1 - U) 를 쓴다.
+    """
+    stream = RandomStream(np.random.default_rng(seed), antithetic=antithetic)
+    T = len(snap["team_ids"])
+    counts = _empty_counts(T)
+    team_ids = snap["team_ids"]
+    p_home = snap["p_home"]
+
+    wins, point_diff, gp = _simulate_regular_season(snap, n, stream)
+    win_pct = np.where(gp > 0, wins / np.maximum(gp, 1), 0.0)
+    U = stream.uniforms(n, _POSTSEASON_UNIFORMS)
+    made = np.zeros((n, T))
+
+    # 컨퍼런스별 순위: (승률, 득실차) 내림차순, 동률은 팀 순서 유지 (get_conference_standings 와 동일)
+    ranked: Dict[str, np.ndarray] = {}
+    for conf, members in snap["conf_members"].items():
+        if not members:
+            continue
+        m = np.array(members)
+        order = np.lexsort((-point_diff[:, m], -win_pct[:, m]), axis=-1)
+        ranked[conf] = m[order]
+        for r in range(len(members)):
+            np.add.at(counts["seed"], (m[order[:, r]], r + 1), 1)
+
+    for run in range(n):
+        u = U[run]
+        k = 0
+        conf_champs = []
+        for conf in CONFERENCES:
+            if conf not in ranked or len(ranked[conf]) < 10:
+                continue
+            seeds: Dict[int, Dict[str, Any]] = {}
+            for r, t in enumerate(ranked[conf][run][:10], start=1):
+                seeds[r] = {
+                    "idx": int(t),
+                    "team_id": team_ids[t],
+                    "seed": r,
+                    "win_pct": float(win_pct[run, t]),
+                    "point_diff": int(point_diff[run, t]),
+                }
+            for r in range(7, 11):
+                counts["play_in"][seeds[r]["idx"]] += 1
+
+            # 플레이-인: 7v8 승자 → 7번 시드, 패자 vs (9v10 승자) → 8번 시드
+            s7, s8 = seeds[7], seeds[8]
+            w78, l78 = (s7, s8) if u[k] < p_home[s7["idx"], s8["idx"]] else (s8, s7)
+            k += 1
+            s9, s10 = seeds[9], seeds[10]
+            w910 = s9 if u[k] < p_home[s9["idx"], s10["idx"]] else s10
+            k += 1
+            fh, fa = _pick_home_advantage(l78, w910)
+            w_final = fh if u[k] < p_home[fh["idx"], fa["idx"]] else fa
+            k += 1
+
+            bracket = {r: seeds[r] for r in range(1, 7)}
+            bracket[7] = dict(w78, seed=7)
+            bracket[8] = dict(w_final, seed=8)
+            for r, entry in bracket.items():
+                counts["playoffs"][entry["idx"]] += 1
+                made[run, entry["idx"]] = 1.0
+                counts["playoff_seed"][entry["idx"], r] += 1
+
+            # 플레이오프: (1,8) (4,5) (3,6) (2,7) → SF (1/8 vs 4/5), (2/7 vs 3/6) → CF
+            qf = {}
+            for high, low in ((1, 8), (4, 5), (3, 6), (2, 7)):
+                home, road = _pick_home_advantage(bracket[high], bracket[low])
+                qf[high], k = _play_series(home, road, p_home, u, k)
+                counts["round_wins"][qf[high]["idx"], 0] += 1
+            sf = []
+            for a, b in ((qf[1], qf[4]), (qf[2], qf[3])):
+                home, road = _pick_home_advantage(a, b)
+                winner, k = _play_series(home, road, p_home, u, k)
+                counts["round_wins"][winner["idx"], 1] += 1
+                sf.append(winner)
+            home, road = _pick_home_advantage(sf[0], sf[1])
+            champ, k = _play_series(home, road, p_home, u, k)
+            counts["round_wins"][champ["idx"], 2] += 1
+            conf_champs.append(champ)
+
+        if len(conf_champs) == 2:
+            home, road = _pick_home_advantage(conf_champs[0], conf_champs[1])
+            title, k = _play_series(home, road, p_home, u, k)
+            counts["round_wins"][title["idx"], 3] += 1
+
+    units = pair_means(made.T) if antithetic else made.T
+    counts["playoffs_sq"] += (units * units).sum(axis=1)
+    counts["units"] += units.shape[1]
+
+    return counts
+
+
+# -----------------------------
+# 집계 / 결과 포맷
+# -----------------------------
+def _playoff_std_error(counts: Dict[str, np.ndarray], runs: int) -> np.ndarray:
+    """팀별 플레이오프 진출 확률의 표준오차 (안티테틱이면 시즌 쌍 평균 기준)."""
+    units = int(counts["units"][0])
+    if units < 2:
+        return np.full(len(counts["playoffs"]), math.inf)
+    p = counts["playoffs"] / max(runs, 1)
+    var = np.maximum(counts["playoffs_sq"] / units - p * p, 0.0) * units / (units - 1)
+    return np.sqrt(var / units)
+
+
+def _format_odds(snap: Dict[str, Any], counts: Dict[str, np.ndarray], runs: int) -> Dict[str, Any]:
+    n = max(runs, 1)
+    seed = (counts["seed"] / n).tolist()
+    playoff_seed = (counts["playoff_seed"] / n).tolist()
+    round_wins = (counts["round_wins"] / n).tolist()
+    std_error = _playoff_std_error(counts, runs)
+    max_std_error = float(std_error.max()) if len(std_error) else 0.0
+    std_error = [v if math.isfinite(v) else None for v in std_error.tolist()]
+
+    teams: Dict[str, Any] = {}
+    for i, tid in enumerate(snap["team_ids"]):
+        teams[tid] = {
+            "seed": {r: seed[i][r] for r in range(1, 16) if seed[i][r]},
+            "make_play_in": int(counts["play_in"][i]) / n,
+            "make_playoffs": int(counts["playoffs"][i]) / n,
+            "make_playoffs_std_error": std_error[i],
+            "playoff_seed": {r: playoff_seed[i][r] for r in range(1, 9) if playoff_seed[i][r]},
+            "win_round": {name: round_wins[i][j] for j, name in enumerate(ROUND_NAMES)},
+            "title": round_wins[i][-1],
+        }
+    return {
+        "runs": runs,
+        "max_std_error": max_std_error if math.isfinite(max_std_error) else None,
+        "teams": teams,
+    }
+
+
+def iter_playoff_odds(
+    runs: int = 10_000,
+    workers: int = 1,
+    seed: Optional[int] = None,
+    chunk_runs: int = DEFAULT_CHUNK_RUNS,
+    antithetic: bool = True,
+    target_std_error: Optional[float] = None,
+) -> Iterator[Dict[str, Any]]:
+    """남은 시즌을 runs 번 시뮬레이션하며 청크가 끝날 때마다 중간 추정치를 낸다.
+
+    - 마지막으로 내는 dict 에는 "done": True 가 들어 있다.
+    - 청크 i 의 seed 는 (seed, i) 로 정해지므로 workers 수나 완료 순서와 무관하게
+      최종 결과는 같다.
+    - seed 가 없으면 리그 마스터 seed, 현재 날짜, 끝난 경기 수로 정한다
+      (같은 리그 상태면 다른 프로세스에서 불러와도 같은 결과).
+    - antithetic=True 면 청크 안의 시즌을 안티테틱 쌍으로 돌린다.
+    - target_std_error 가 있으면 청크를 workers 개씩 돌리고, 그때마다 플레이오프 진출 확률의
+      최대 표준오차(max_std_error)가 목표 이하이면 멈춘다. 이때 runs 는 상한이다.
+    - runs / workers / chunk_runs 가 1보다 작으면 ValueError를 발생시킨다.
+    """
+    if runs < 1:
+        raise ValueError(f"invalid runs: {runs}")
+    if workers < 1:
+        raise ValueError(f"invalid workers: {workers}")
+    if chunk_runs < 1:
+        raise ValueError(f"invalid chunk_runs: {chunk_runs}")
+    rule = StoppingRule(max_samples=runs, target_std_error=target_std_error, min_samples=chunk_runs)
+
+    model = get_strength_model()
+    snap = _season_snapshot(model)
+    if seed is None:
+        seed = derive_seed(get_league_master_seed(), "playoff_odds", snap["current_date"], snap["final_games"])
+
+    sizes = [min(chunk_runs, runs - start) for start in range(0, runs, chunk_runs)]
+    chunk_seeds = [derive_seed(seed, "chunk", i) for i in range(len(sizes))]
+
+    totals = _empty_counts(len(snap["team_ids"]))
+    done = 0
+
+    def _merge(counts: Dict[str, np.ndarray], n: int) -> Dict[str, Any]:
+        nonlocal done
+        for key in totals:
+            totals[key] += counts[key]
+        done += n
+        out = _format_odds(snap, totals, done)
+        out["runs_total"] = runs
+        out["done"] = done >= runs
+        return out
+
+    if target_std_error is not None:
+        # 청크 묶음 단위로만 정지 여부를 보므로 결과는 workers 수가 같으면 항상 같다
+        wave = max(1, workers)
+        for start in range(0, len(sizes), wave):
+            jobs = list(zip(sizes[start:start + wave], chunk_seeds[start:start + wave]))
+            if workers <= 1:
+                results = [_simulate_chunk(snap, n, s, antithetic) for n, s in jobs]
+            else:
+                pool = get_pool(workers)
+                futures_wave = [pool.submit(_simulate_chunk, snap, n, s, antithetic) for n, s in jobs]
+                results = [f.result() for f in futures_wave]
+            for i, ((n, _), counts) in enumerate(zip(jobs, results)):
+                out = _merge(counts, n)
+                if i == len(jobs) - 1 and rule.should_stop(done, math.inf if out["max_std_error"] is None else out["max_std_error"]):
+                    out["done"] = True
+                    yield out
+                    return
+                yield out
+        return
+
+    if workers <= 1:
+        for n, s in zip(sizes, chunk_seeds):
+            yield _merge(_simulate_chunk(snap, n, s, antithetic), n)
+        return
+
+    pool = get_pool(workers)
+    futures = {pool.submit(_simulate_chunk, snap, n, s, antithetic): n for n, s in zip(sizes, chunk_seeds)}
+    for fut in as_completed(futures):
+        yield _merge(fut.result(), futures[fut])
+
+
+def compute_playoff_odds(
+    runs: int = 10_000,
+    workers: int = 1,
+    seed: Optional[int] = None,
+    antithetic: bool = True,
+    target_std_error: Optional[float] = None,
+) -> Dict[str, Any]:
+    """iter_playoff_odds 의 최종 결과만 반환."""
+    result: Dict[str, Any] = {}
+    for result in iter_playoff_odds(
+        runs=runs, workers=workers, seed=seed, antithetic=antithetic, target_std_error=target_std_error
+    ):
+        pass
+    return result
@@ -4,18 +4,27 @@ import random
 from datetime import date, timedelta
 from typing import Any, Dict, List, Optional, Tuple
 
-from config import ROSTER_DF, TEAM_TO_CONF_DIV
-from match_engine import MatchEngine, Team
+from config import TEAM_TO_CONF_DIV
+from event_log import logged_op
+from game_store import get_game_store
+from match_engine import MatchEngine
+from quick_sim import simulate_games_quick
+from roster_registry import get_roster_registry
+from seed_util import derive_rng, derive_seed
 from state import (
     GAME_STATE,
     _ensure_league_state,
     _update_playoff_player_stats_from_boxscore,
+    get_league_master_seed,
     set_current_date,
 )
 from team_utils import get_conference_standings
 
 HomePattern = [True, True, False, False, True, False, True]
 
+# 자동 진행 시 쓸 수 있는 엔진 ("quick" = quick_sim 저정밀 엔진)
+POSTSEASON_ENGINE_MODES = ("standard", "quick")
+
 
 # ---------------------------------------------------------------------------
 # 상태 helpers
@@ -99,6 +108,7 @@ def _next_round_start(series_list: List[Dict[str, Any]], buffer_days: int = 2) -
     return (latest + timedelta(days=buffer_days)).isoformat()
 
 
+@logged_op
 def reset_postseason_state() -> Dict[str, Any]:
     GAME_STATE["postseason"] = {
         "field": None,
@@ -133,16 +143,16 @@ def _seed_entry(row: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
-def _random_seed_entry(team_id: str, seed: Optional[int], conf_key: str) -> Dict[str, Any]:
+def _random_seed_entry(team_id: str, seed: Optional[int], conf_key: str, rng: random.Random) -> Dict[str, Any]:
     info = TEAM_TO_CONF_DIV.get(team_id, {})
     division = info.get("division")
     # 높은 시드가 더 높은 승률을 갖도록 약간의 편차를 둔다.
     base_win_pct = 0.78 - max(seed - 1, 0) * 0.035 if seed else 0.42
-    win_pct = max(0.35, min(0.78, base_win_pct + random.uniform(-0.01, 0.02)))
+    win_pct = max(0.35, min(0.78, base_win_pct + rng.uniform(-0.01, 0.02)))
     wins = int(round(win_pct * 82))
     wins = min(max(wins, 32), 62)
     losses = 82 - wins
-    point_diff = int((0.8 - (seed or 12) * 0.2) + random.uniform(-3, 5))
+    point_diff = int((0.8 - (seed or 12) * 0.2) + rng.uniform(-3, 5))
 
     return {
         "team_id": team_id,
@@ -157,13 +167,13 @@ def _random_seed_entry(team_id: str, seed: Optional[int], conf_key: str) -> Dict
     }
 
 
-def _build_random_conf_field(conf_key: str, my_team_id: Optional[str]) -> Dict[str, Any]:
+def _build_random_conf_field(conf_key: str, my_team_id: Optional[str], rng: random.Random) -> Dict[str, Any]:
     conf_teams = [
         tid
         for tid, meta in TEAM_TO_CONF_DIV.items()
         if (meta.get("conference") or "").lower() == conf_key
     ]
-    random.shuffle(conf_teams)
+    rng.shuffle(conf_teams)
 
     auto_slots = list(range(1, 7))
     play_in_slots = list(range(7, 11))
@@ -172,26 +182,26 @@ def _build_random_conf_field(conf_key: str, my_team_id: Optional[str]) -> Dict[s
     eliminated: List[Dict[str, Any]] = []
 
     remaining = [tid for tid in conf_teams if tid != my_team_id]
-    random.shuffle(remaining)
+    rng.shuffle(remaining)
 
     if my_team_id:
-        my_seed = random.choice(auto_slots)
+        my_seed = rng.choice(auto_slots)
         auto_slots.remove(my_seed)
-        auto_bids.append(_random_seed_entry(my_team_id, my_seed, conf_key))
+        auto_bids.append(_random_seed_entry(my_team_id, my_seed, conf_key, rng))
 
     for seed in auto_slots:
         if not remaining:
             break
-        auto_bids.append(_random_seed_entry(remaining.pop(), seed, conf_key))
+        auto_bids.append(_random_seed_entry(remaining.pop(), seed, conf_key, rng))
 
     for seed in play_in_slots:
         if not remaining:
             break
-        play_in.append(_random_seed_entry(remaining.pop(), seed, conf_key))
+        play_in.append(_random_seed_entry(remaining.pop(), seed, conf_key, rng))
 
     seed_counter = 11
     while remaining:
-        eliminated.append(_random_seed_entry(remaining.pop(), seed_counter, conf_key))
+        eliminated.append(_random_seed_entry(remaining.pop(), seed_counter, conf_key, rng))
         seed_counter += 1
 
     auto_bids = sorted(auto_bids, key=lambda r: r.get("seed") or 99)
@@ -204,15 +214,11 @@ def _build_random_conf_field(conf_key: str, my_team_id: Optional[str]) -> Dict[s
     }
 
 
-def _find_team_df(team_id: str):
-    df = ROSTER_DF[ROSTER_DF["Team"] == team_id]
-    if df.empty:
-        raise ValueError(f"Team '{team_id}' not found in roster data")
-    return df
-
-
 def _simulate_postseason_game(
-    home_team_id: str, away_team_id: str, game_date: Optional[str] = None
+    home_team_id: str,
+    away_team_id: str,
+    game_date: Optional[str] = None,
+    engine_mode: str = "standard",
 ) -> Dict[str, Any]:
     if game_date:
         try:
@@ -224,20 +230,38 @@ def _simulate_postseason_game(
 
     set_current_date(game_date)
 
-    home_df = _find_team_df(home_team_id)
-    away_df = _find_team_df(away_team_id)
-
-    home_team = Team(home_team_id, home_df)
-    away_team = Team(away_team_id, away_df)
-    engine = MatchEngine(home_team, away_team)
-    result = engine.simulate_game()
+    registry = get_roster_registry()
+    home_team = registry.build_team(home_team_id)
+    away_team = registry.build_team(away_team_id)
+    seed = derive_seed(get_league_master_seed(), "postseason", game_date, home_team_id, away_team_id)
+    if engine_mode == "quick":
+        result = simulate_games_quick([(home_team, away_team)], seed=seed)[0]
+    else:
+        result = MatchEngine(home_team, away_team, seed=seed).simulate_game()
     score = result.get("final_score", {})
+    # 포스트시즌 상태에 남으므로 엔진 BoxScore 는 dict 로
+    boxscore = dict(result.get("boxscore") or {})
 
     home_score = int(score.get(home_team_id, 0))
     away_score = int(score.get(away_team_id, 0))
     winner = home_team_id if home_score > away_score else away_team_id
 
-    _update_playoff_player_stats_from_boxscore(result.get("boxscore"))
+    _update_playoff_player_stats_from_boxscore(boxscore)
+
+    store = get_game_store()
+    store.record_game(
+        {
+            "game_id": f"{game_date}_{home_team_id}_{away_team_id}",
+            "date": game_date,
+            "home_team_id": home_team_id,
+            "away_team_id": away_team_id,
+            "home_score": home_score,
+            "away_score": away_score,
+        },
+        boxscore,
+        phase="postseason",
+    )
+    store.flush()
 
     return {
         "date": game_date,
@@ -248,7 +272,7 @@ def _simulate_postseason_game(
         "winner": winner,
         "status": "final",
         "final_score": score,
-        "boxscore": result.get("boxscore"),
+        "boxscore": boxscore,
     }
 
 
@@ -275,7 +299,8 @@ def _pick_home_advantage(entry_a: Dict[str, Any], entry_b: Dict[str, Any]) -> Tu
 # 필드 구축 / 플레이-인
 # ---------------------------------------------------------------------------
 
-def build_postseason_field() -> Dict[str, Any]:
+def compute_postseason_field() -> Dict[str, Any]:
+    """현재 순위 기준 컨퍼런스별 포스트시즌 필드 (상태는 바꾸지 않는다)."""
     standings = get_conference_standings()
     field: Dict[str, Any] = {}
 
@@ -290,7 +315,13 @@ def build_postseason_field() -> Dict[str, Any]:
             "play_in": play_in,
             "eliminated": eliminated,
         }
+    return field
 
+
+@logged_op
+def build_postseason_field() -> Dict[str, Any]:
+    """현재 순위 기준 필드를 만들어 포스트시즌 상태에 저장한다."""
+    field = compute_postseason_field()
     ps = _ensure_postseason_state()
     ps["field"] = field
     return field
@@ -299,10 +330,12 @@ def build_postseason_field() -> Dict[str, Any]:
 def build_random_postseason_field(my_team_id: str) -> Dict[str, Any]:
     field: Dict[str, Any] = {}
     my_conf = (TEAM_TO_CONF_DIV.get(my_team_id, {}).get("conference") or "east").lower()
+    league = _ensure_league_state()
+    rng = derive_rng(get_league_master_seed(), "postseason_field", league.get("season_year"), my_team_id)
 
     for conf_key in ("east", "west"):
         attach_my_team = my_team_id if conf_key == my_conf else None
-        field[conf_key] = _build_random_conf_field(conf_key, attach_my_team)
+        field[conf_key] = _build_random_conf_field(conf_key, attach_my_team, rng)
 
     ps = _ensure_postseason_state()
     ps["field"] = field
@@ -437,6 +470,7 @@ def _auto_play_in_conf(conf_state: Dict[str, Any], my_team_id: Optional[str]) ->
         _apply_play_in_results(conf_state)
 
 
+@logged_op
 def play_my_team_play_in_game() -> Dict[str, Any]:
     postseason = _ensure_postseason_state()
     my_team_id = postseason.get("my_team_id")
@@ -512,7 +546,7 @@ def _is_series_finished(series: Dict[str, Any]) -> bool:
     return any(v >= needed for v in wins.values())
 
 
-def _simulate_one_series_game(series: Dict[str, Any]) -> Dict[str, Any]:
+def _simulate_one_series_game(series: Dict[str, Any], engine_mode: str = "standard") -> Dict[str, Any]:
     if _is_series_finished(series):
         return series
 
@@ -534,7 +568,9 @@ def _simulate_one_series_game(series: Dict[str, Any]) -> Dict[str, Any]:
         rest_days = 1 if prev_home_flag == higher_is_home else 2
         next_game_date = (last_date + timedelta(days=rest_days)).isoformat()
 
-    game_result = _simulate_postseason_game(home_id, away_id, game_date=next_game_date)
+    game_result = _simulate_postseason_game(
+        home_id, away_id, game_date=next_game_date, engine_mode=engine_mode
+    )
     series.setdefault("games", []).append(game_result)
 
     wins = series.setdefault("wins", {})
@@ -741,6 +777,7 @@ def _find_my_series(playoffs: Dict[str, Any], my_team_id: str) -> Optional[Dict[
     return None
 
 
+@logged_op
 def advance_my_team_one_game() -> Dict[str, Any]:
     postseason = _ensure_postseason_state()
     my_team_id = postseason.get("my_team_id")
@@ -769,7 +806,14 @@ def advance_my_team_one_game() -> Dict[str, Any]:
     return postseason
 
 
-def auto_advance_current_round() -> Dict[str, Any]:
+@logged_op
+def auto_advance_current_round(engine_mode: str = "standard") -> Dict[str, Any]:
+    """현재 라운드의 모든 시리즈를 끝까지 자동 진행한다.
+
+    engine_mode="quick" 이면 quick_sim 저정밀 엔진으로 돌린다.
+    """
+    if engine_mode not in POSTSEASON_ENGINE_MODES:
+        raise ValueError(f"invalid engine_mode: {engine_mode}")
     postseason = _ensure_postseason_state()
     playoffs = postseason.get("playoffs")
     if not playoffs:
@@ -781,7 +825,7 @@ def auto_advance_current_round() -> Dict[str, Any]:
         if not series:
             continue
         while not _is_series_finished(series):
-            _simulate_one_series_game(series)
+            _simulate_one_series_game(series, engine_mode=engine_mode)
 
     _advance_round_if_ready()
     return postseason
@@ -880,6 +924,7 @@ def _prepare_play_in(field: Dict[str, Any], my_team_id: Optional[str]) -> Dict[s
     return play_in_state
 
 
+@logged_op
 def initialize_postseason(my_team_id: str, use_random_field: bool = False) -> Dict[str, Any]:
     reset_postseason_state()
     postseason = _ensure_postseason_state()
@@ -899,6 +944,7 @@ def initialize_postseason(my_team_id: str, use_random_field: bool = False) -> Di
 
 
 __all__ = [
+    "compute_postseason_field",
     "build_postseason_field",
     "reset_postseason_state",
     "initialize_postseason",
@@ -0,0 +1,430 @@
+from __future__ import annotations
+
+import weakref
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from batch_engine import _A, _PT, _S, _SHOT, BatchMatchEngine
+from match_engine import BOX_STAT_KEYS, MatchEngine, Team
+from seed_util import derive_seed
+
+# NOTE: MatchEngine 의 포제션 1스텝은 "지금 누가 공격 중인가" 외에는 상태가 없다.
+#       그래서 (공격 팀, 수비 팀) 쌍마다 스텝 결과 분포를 한 번 열거해 두면
+#       경기 전체는 공격권 교대(마르코프 체인) + 다항분포 샘플링으로 바로 뽑을 수 있다.
+
+# 로테이션 최대 인원 (Team._setup 에서 6~10 으로 제한)
+MAX_ROTATION = 10
+
+# 슛 결과 종류 (슈터별). 공격 리바운드(= 같은 팀 공격 유지) 두 종류는 따로 둔다.
+_SHOT_KINDS = ("m2", "m2f", "m3", "m3f", "x2f", "x3f", "x2d", "x3d")
+_STAY_KINDS = ("x2o", "x3o")
+
+# 캐시할 쌍 모델 수 상한 (넘으면 죽은 Team 의 항목부터 정리)
+_MODEL_CACHE_MAX = 4096
+
+
+def _build_layout() -> Dict[str, slice]:
+    P = MAX_ROTATION
+    sizes = (
+        ("switch", (len(_SHOT_KINDS) + 1) * P),  # 공격권이 넘어가는 결과 (슛 8종 + 턴오버)
+        ("stay", len(_STAY_KINDS) * P),          # 공격 리바운드로 공격권이 유지되는 결과
+        ("q", 1),                                # 공격권 유지 확률
+        ("poss", 1),                             # 경기 포제션 수 (두 팀에 대해 대칭)
+        ("ast_p", 1),                            # 성공한 슛이 어시스트될 확률
+        ("ast_dist", P),
+        ("stl_dist", P),                         # 수비 팀
+        ("foul_dist", P),                        # 수비 팀
+        ("dreb_dist", P),                        # 수비 팀
+        ("oreb_dist", P),
+        ("ft_prob", P),
+        ("share", P),                            # 출전 시간 비율
+    )
+    layout: Dict[str, slice] = {}
+    start = 0
+    for name, n in sizes:
+        layout[name] = slice(start, start + n)
+        start += n
+    return layout
+
+
+_LAYOUT = _build_layout()
+MODEL_SIZE = max(s.stop for s in _LAYOUT.values())
+
+_PAIR_MODELS: Dict[Tuple[int, int], Tuple[weakref.ref, weakref.ref, np.ndarray]] = {}
+
+
+# -----------------------------
+# 쌍 모델 (공격 팀 → 수비 팀)
+# -----------------------------
+def _normalize(w: np.ndarray) -> np.ndarray:
+    total = w.sum(axis=-1, keepdims=True)
+    return np.divide(w, total, out=np.zeros_like(w), where=total > 0)
+
+
+def _weights(cum: np.ndarray) -> np.ndarray:
+    """누적 가중치 → 정규화된 확률."""
+    return _normalize(np.diff(cum, axis=-1, prepend=0.0))
+
+
+def _scheme_probs(w: np.ndarray) -> np.ndarray:
+    """(prim_w, total) → (primary, secondary) 선택 확률 (MatchEngine._pick_scheme)."""
+    has_secondary = w[:, 1] > 0
+    p0 = np.where(has_secondary, w[:, 0] / np.where(has_secondary, w[:, 1], 1.0), 1.0)
+    return np.stack([p0, 1.0 - p0], axis=1)
+
+
+def _build_pair_models(pairs: Sequence[Tuple[Team, Team]]) -> np.ndarray:
+    """(공격 팀, 수비 팀) 쌍마다 포제션 1스텝의 결과 분포를 열거한다.
+
+    BatchMatchEngine 의 입력 배열을 (home=공격, away=수비) 로 만들어 그대로 쓰므로
+    확률 모델은 MatchEngine 과 같다. 반환: (쌍 수, MODEL_SIZE) 배열.
+    """
+    eng = BatchMatchEngine(pairs)
+    eng._build_arrays()
+    G, P = eng.G, eng.P
+    n_shot = len(_SHOT)
+
+    off_avg = eng.avg[:, 0]
+    def_avg = eng.avg[:, 1]
+    off_s = eng.off_scheme[:, 0]  # (G, 2)
+    def_s = eng.def_scheme[:, 1]  # (G, 2)
+    pa = _scheme_probs(eng.off_scheme_w[:, 0])
+    pb = _scheme_probs(eng.def_scheme_w[:, 1])
+
+    # 1) 턴오버 (수비 전술별)
+    tov = np.clip(
+        0.11
+        - (off_avg[:, _A["Playmaking"], None] - 75.0) / 250.0
+        + (def_avg[:, _A["Defense"], None] - 75.0) / 250.0
+        + eng.tov_adj[def_s],
+        0.05, 0.25,
+    )  # (G, b)
+
+    # 2) 플레이 타입 / 슈터 / 샷 타입
+    play_p = _weights(eng.play_cum[off_s])  # (G, a, pt)
+    shooter_p = _weights(eng.shooter_cum[:, 0])  # (G, pt, i)
+    shot_p = _weights(
+        eng.shot_cum[off_s[:, :, None, None], np.arange(len(_PT))[None, None, :, None], def_s[:, None, None, :]]
+    )  # (G, a, pt, b, st)
+
+    # 3) 슛 성공 확률 (G, b, pt, i, st)
+    att = eng.att[:, 0].transpose(0, 2, 1)  # (G, i, st)
+    att_pt = np.repeat(att[:, None], len(_PT), axis=1)  # (G, pt, i, st)
+    att_pt[:, _PT["post"]] = (
+        att * 0.3 + (eng.post_skill[:, 0] * 0.4 + eng.post_move[:, 0] * 0.3)[:, :, None]
+    )
+    att_pt[:, _PT["iso"]] = att + ((eng.shot_iq[:, 0] - 70.0) * 0.5)[:, :, None]
+
+    is_rim = np.arange(n_shot) == _SHOT["rim"]
+    def_base = np.where(
+        is_rim, def_avg[:, _A["Interior Defense"], None], def_avg[:, _A["Perimeter Defense"], None]
+    )  # (G, st)
+    def_rating = def_base[:, None, None, :] + eng.def_adj[def_s]  # (G, b, pt, st)
+
+    shot_const = np.full(n_shot, -0.03)
+    shot_const[_SHOT["three"]] = -0.08
+    shot_const[_SHOT["rim"]] = 0.05
+    ath = (eng.athleticism[:, 0] - def_avg[:, _A["Athleticism"], None]) / 20.0 * 0.05  # (G, i)
+    fat = (eng.fatigue[:, 0] - 1.0) * 0.08 - (eng.fatigue[:, 1] - 1.0) * 0.05  # (G,)
+    base = 0.45 + ath[:, :, None] + fat[:, None, None] + shot_const  # (G, i, st)
+
+    make = np.clip(
+        base[:, None, None] + (att_pt[:, None] - def_rating[:, :, :, None, :]) / 150.0, 0.20, 0.80
+    )
+
+    # PnR: 롤맨 분포로 평균 (슈터 제외)
+    roll_w = np.repeat(eng.roll_w[:, 0, None, :], P, axis=1)
+    roll_w[:, np.arange(P), np.arange(P)] = 0.0
+    roll_p = _normalize(roll_w)  # (G, i, r)
+    has_roll = roll_w.sum(axis=2) > 0
+    att_roll = att[:, :, None, :] * 0.6 + eng.roll_ins[:, 0, None, :, None] * 0.4  # (G, i, r, st)
+    make_roll = np.clip(
+        base[:, None, :, None, :]
+        + (att_roll[:, None] - def_rating[:, :, _PT["pnr"], None, None, :]) / 150.0,
+        0.20, 0.80,
+    )  # (G, b, i, r, st)
+    make_pnr = (roll_p[:, None, :, :, None] * make_roll).sum(axis=3)
+    make[:, :, _PT["pnr"]] = np.where(has_roll[:, None, :, None], make_pnr, make[:, :, _PT["pnr"]])
+
+    # 4) 파울 유도 확률 (G, b, pt, i, st)
+    drive = np.zeros((len(_PT), n_shot))
+    drive[[_PT["iso"], _PT["drive_kick"]], _SHOT["rim"]] = 0.03
+    foul = np.clip(
+        0.10
+        + ((eng.draw_foul[:, 0] - 70.0) / 350.0)[:, None, None, :, None]
+        + ((eng.def_agg[def_s] - 1.0) * 0.03)[:, :, None, None, None]
+        - ((def_avg[:, _A["Hands"]] - 70.0) / 400.0)[:, None, None, None, None]
+        + drive[None, None, :, None, :],
+        0.05, 0.30,
+    )
+
+    # 5) 리바운드 / 어시스트
+    def_share = np.clip(
+        0.75
+        + (def_avg[:, _A["Defensive Rebound"], None] - off_avg[:, _A["Offensive Rebound"], None]) / 400.0
+        + eng.reb_adj[def_s],
+        0.60, 0.90,
+    )  # (G, b)
+    ast = np.clip(
+        0.55
+        + (off_avg[:, _A["Playmaking"], None] - def_avg[:, _A["Help Defense IQ"], None]) / 300.0
+        + eng.ast_adj[off_s],
+        0.15, 0.85,
+    )  # (G, a)
+    ast = np.where(eng.n_players[:, 0, None] > 1, ast, 0.0)
+
+    # 6) 결합 가중치 W[g, a, b, pt, i, st]
+    W = (
+        pa[:, :, None, None, None, None]
+        * (pb * (1.0 - tov))[:, None, :, None, None, None]
+        * play_p[:, :, None, :, None, None]
+        * shooter_p[:, None, None, :, :, None]
+        * shot_p.transpose(0, 1, 3, 2, 4)[:, :, :, :, None, :]
+    )
+    made_w = W * make[:, None]
+    made_by_scheme = made_w.sum(axis=(2, 3, 4, 5))  # (G, a)
+    made_by_shooter = made_w.sum(axis=(1, 2, 3, 5))  # (G, i)
+
+    Wb = W.sum(axis=1)  # (G, b, pt, i, st)
+    miss = Wb * (1.0 - make)
+    share_b = def_share[:, :, None, None, None]
+    kinds = {
+        "m{}": Wb * make * (1.0 - foul),
+        "m{}f": Wb * make * foul,
+        "x{}f": miss * foul,
+        "x{}d": miss * (1.0 - foul) * share_b,
+        "x{}o": miss * (1.0 - foul) * (1.0 - share_b),
+    }
+    three = _SHOT["three"]
+    two = [st for st in range(n_shot) if st != three]
+    by_class: Dict[str, np.ndarray] = {}
+    for name, arr in kinds.items():
+        per_shot = arr.sum(axis=(1, 2))  # (G, i, st)
+        by_class[name.format(2)] = per_shot[:, :, two].sum(axis=2)
+        by_class[name.format(3)] = per_shot[:, :, three]
+
+    tov_p = (pb * tov).sum(axis=1)[:, None] * _weights(eng.bh_cum[:, 0])  # (G, i)
+    switch = np.stack([by_class[k] for k in _SHOT_KINDS] + [tov_p], axis=1)  # (G, kind, i)
+    stay = np.stack([by_class[k] for k in _STAY_KINDS], axis=1)
+    q = stay.sum(axis=(1, 2))
+
+    ast_excl = np.repeat(eng.ast_w[:, 0, None, :], P, axis=1)
+    ast_excl[:, np.arange(P), np.arange(P)] = 0.0
+    ast_dist = _normalize((made_by_shooter[:, :, None] * _normalize(ast_excl)).sum(axis=1))
+    made_total = made_by_scheme.sum(axis=1)
+    ast_p = np.divide(
+        (made_by_scheme * ast).sum(axis=1), made_total, out=np.zeros(G), where=made_total > 0
+    )
+    ast_p = np.where(ast_dist.sum(axis=1) > 0, ast_p, 0.0)
+    ast_dist[ast_dist.sum(axis=1) == 0, 0] = 1.0
+
+    # 7) 고정 레이아웃(MAX_ROTATION)으로 패딩해 평면 벡터로 저장
+    def _pad(x: np.ndarray) -> np.ndarray:
+        out = np.zeros(x.shape[:-1] + (MAX_ROTATION,))
+        out[..., :P] = x
+        return out.reshape(G, -1)
+
+    models = np.zeros((G, MODEL_SIZE))
+    models[:, _LAYOUT["switch"]] = _pad(_normalize(switch.reshape(G, -1)).reshape(switch.shape))
+    models[:, _LAYOUT["stay"]] = _pad(_normalize(stay.reshape(G, -1)).reshape(stay.shape))
+    models[:, _LAYOUT["q"]] = q[:, None]
+    models[:, _LAYOUT["poss"]] = eng.poss[:, None]
+    models[:, _LAYOUT["ast_p"]] = ast_p[:, None]
+    models[:, _LAYOUT["ast_dist"]] = _pad(ast_dist)
+    models[:, _LAYOUT["stl_dist"]] = _pad(_weights(eng.stl_cum[:, 1]))
+    models[:, _LAYOUT["foul_dist"]] = _pad(_weights(eng.foul_cum[:, 1]))
+    models[:, _LAYOUT["dreb_dist"]] = _pad(_weights(eng.dreb_cum[:, 1]))
+    models[:, _LAYOUT["oreb_dist"]] = _pad(_weights(eng.oreb_cum[:, 0]))
+    models[:, _LAYOUT["ft_prob"]] = _pad(eng.ft_prob[:, 0])
+    models[:, _LAYOUT["share"]] = _pad(eng.share[:, 0])
+    return models
+
+
+def _purge_model_cache() -> None:
+    for key in [k for k, (o, d, _) in _PAIR_MODELS.items() if o() is None or d() is None]:
+        del _PAIR_MODELS[key]
+    if len(_PAIR_MODELS) >= _MODEL_CACHE_MAX:
+        _PAIR_MODELS.clear()
+
+
+def pair_models(pairs: Sequence[Tuple[Team, Team]]) -> np.ndarray:
+    """(공격 팀, 수비 팀) 쌍 모델들을 (len(pairs), MODEL_SIZE) 로 반환한다.
+
+    Team 객체가 살아 있는 동안 쌍 모델은 캐시된다. Team 은 로스터/전술이 바뀌면
+    새로 만들어지므로 (TeamCache) 캐시가 오래된 레이팅을 돌려줄 일은 없다.
+    """
+    found: Dict[Tuple[int, int], np.ndarray] = {}
+    missing: Dict[Tuple[int, int], Tuple[Team, Team]] = {}
+    for off, dfn in pairs:
+        key = (id(off), id(dfn))
+        if key in found or key in missing:
+            continue
+        entry = _PAIR_MODELS.get(key)
+        if entry is not None and entry[0]() is off and entry[1]() is dfn:
+            found[key] = entry[2]
+        else:
+            missing[key] = (off, dfn)
+
+    if missing:
+        if len(_PAIR_MODELS) + len(missing) > _MODEL_CACHE_MAX:
+            _purge_model_cache()
+        built = _build_pair_models(list(missing.values()))
+        for (key, (off, dfn)), model in zip(missing.items(), built):
+            found[key] = model
+            _PAIR_MODELS[key] = (weakref.ref(off), weakref.ref(dfn), model)
+
+    if not pairs:
+        return np.zeros((0, MODEL_SIZE))
+    return np.stack([found[(id(off), id(dfn))] for off, dfn in pairs])
+
+
+def clear_model_cache() -> None:
+    _PAIR_MODELS.clear()
+
+
+# -----------------------------
+# QuickMatchEngine
+# -----------------------------
+class QuickMatchEngine(BatchMatchEngine):
+    """포제션 루프 없이 경기 결과를 바로 샘플링하는 저정밀(quick) 엔진.
+
+    - 공격권 교대: 팀별 "공격 리바운드로 유지" 확률 q 로 연속 공격 길이를 기하분포로 뽑아
+      정해진 포제션 수 안에서 팀별 스텝 수 / 공격권 전환 수를 정확히 구한다.
+    - 스텝 결과(슈터별 슛 결과, 턴오버)는 다항분포, 자유투는 이항분포로 뽑고
+      스틸 / 파울 / 리바운드 / 어시스트는 팀 합계를 선수 가중치로 다시 나눈다.
+
+    점수와 팀 스탯 분포는 MatchEngine 과 같은 모델에서 나오지만, 선수 사이의 상관
+    (누가 어시스트했는지 등)은 근사이므로 유저 팀 경기가 아닌 AI 경기용이다.
+    반환 형식은 BatchMatchEngine / MatchEngine 과 같다.
+    """
+
+    def _run(self) -> np.ndarray:
+        G, P = len(self.matchups), MAX_ROTATION
+        self.G, self.P = G, P
+        rng = self.rng
+
+        pairs: List[Tuple[Team, Team]] = []
+        for home, away in self.matchups:
+            pairs.append((home, away))
+            pairs.append((away, home))
+        M = pair_models(pairs).reshape(G, 2, MODEL_SIZE)
+
+        def col(name: str) -> np.ndarray:
+            return M[:, :, _LAYOUT[name]]
+
+        poss = M[:, 0, _LAYOUT["poss"]][:, 0].astype(np.int64)
+        self.poss = poss
+
+        # 1) 공격권 체인: 홈 공격부터 번갈아, 연속 공격 길이 ~ Geometric(1 - q)
+        q = col("q")[:, :, 0]
+        T = int(poss.max())
+        parity = np.arange(T) % 2
+        runs = rng.geometric(1.0 - q[:, parity])
+        end = np.cumsum(runs, axis=1)
+        steps = np.clip(poss[:, None] - (end - runs), 0, runs)
+        done = end <= poss[:, None]
+        n_steps = np.stack([steps[:, parity == s].sum(axis=1) for s in (0, 1)], axis=1)
+        n_switch = np.stack([done[:, parity == s].sum(axis=1) for s in (0, 1)], axis=1)
+
+        # 2) 스텝 결과
+        switch = rng.multinomial(n_switch, col("switch")).reshape(G, 2, -1, P)
+        stay = rng.multinomial(n_steps - n_switch, col("stay")).reshape(G, 2, -1, P)
+        k = {name: switch[:, :, i] for i, name in enumerate(_SHOT_KINDS)}
+        k.update({name: stay[:, :, i] for i, name in enumerate(_STAY_KINDS)})
+        tov = switch[:, :, len(_SHOT_KINDS)]
+
+        fgm2 = k["m2"] + k["m2f"]
+        fgm3 = k["m3"] + k["m3f"]
+        fga3 = fgm3 + k["x3f"] + k["x3d"] + k["x3o"]
+        fga = fgm2 + k["x2f"] + k["x2d"] + k["x2o"] + fga3
+        fta = k["m2f"] + k["m3f"] + 2 * k["x2f"] + 3 * k["x3f"]
+        ftm = rng.binomial(fta, col("ft_prob"))
+
+        # 3) 팀 합계 → 선수 분배 (스틸/파울/수비 리바운드는 상대 팀 선수 몫)
+        fouls = (k["m2f"] + k["m3f"] + k["x2f"] + k["x3f"]).sum(axis=2)
+        dreb = (k["x2d"] + k["x3d"]).sum(axis=2)
+        oreb = (k["x2o"] + k["x3o"]).sum(axis=2)
+        n_ast = rng.binomial((fgm2 + fgm3).sum(axis=2), col("ast_p")[:, :, 0])
+
+        stats = np.zeros((G, 2, P, len(BOX_STAT_KEYS)))
+        stats[..., _S["MIN"]] = 48.0 * 5.0 * col("share")
+        stats[..., _S["PTS"]] = 2 * fgm2 + 3 * fgm3 + ftm
+        stats[..., _S["FGM"]] = fgm2 + fgm3
+        stats[..., _S["FGA"]] = fga
+        stats[..., _S["3PM"]] = fgm3
+        stats[..., _S["3PA"]] = fga3
+        stats[..., _S["FTM"]] = ftm
+        stats[..., _S["FTA"]] = fta
+        stats[..., _S["TOV"]] = tov
+        stats[..., _S["AST"]] = rng.multinomial(n_ast, col("ast_dist"))
+        stats[..., _S["REB"]] = rng.multinomial(oreb, col("oreb_dist"))
+        stats[..., _S["REB"]] += rng.multinomial(dreb, col("dreb_dist"))[:, ::-1]
+        stats[..., _S["STL"]] = rng.multinomial(tov.sum(axis=2), col("stl_dist"))[:, ::-1]
+        stats[..., _S["PF"]] = rng.multinomial(fouls, col("foul_dist"))[:, ::-1]
+        return stats
+
+
+def simulate_games_quick(
+    matchups: Sequence[Tuple[Team, Team]],
+    seed: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """(home, away) Team 쌍 리스트를 quick 엔진으로 시뮬레이션한다."""
+    return QuickMatchEngine(matchups, seed=seed).simulate_games()
+
+
+# -----------------------------
+# 보정(calibration) 하네스
+# -----------------------------
+_CALIBRATION_STATS = ("PTS", "FGM", "FGA", "3PM", "3PA", "FTM", "FTA", "REB", "AST", "STL", "TOV", "PF")
+
+
+def _team_lines(results: Sequence[Dict[str, Any]], home_id: str, away_id: str) -> Dict[str, np.ndarray]:
+    """경기 결과들 → 지표별 (경기 수,) 배열 (홈 / 원정 팀 합계, 점수차)."""
+    lines: Dict[str, List[float]] = {}
+    for res in results:
+        for side, tid in (("home", home_id), ("away", away_id)):
+            rows = res["boxscore"][tid]
+            for key in _CALIBRATION_STATS:
+                lines.setdefault(f"{side}_{key}", []).append(sum(r[key] for r in rows))
+        score = res["final_score"]
+        lines.setdefault("margin", []).append(score[home_id] - score[away_id])
+        lines.setdefault("total", []).append(score[home_id] + score[away_id])
+        lines.setdefault("home_win", []).append(1.0 if score[home_id] > score[away_id] else 0.0)
+    return {k: np.asarray(v, dtype=float) for k, v in lines.items()}
+
+
+def calibration_report(
+    home: Team,
+    away: Team,
+    n_games: int = 2000,
+    seed: int = 0,
+) -> Dict[str, Dict[str, float]]:
+    """같은 매치업을 MatchEngine 과 quick 엔진으로 n_games 번씩 돌려 분포를 비교한다.
+
+    지표마다 {"full_mean", "quick_mean", "full_std", "quick_std", "z"} 를 반환한다.
+    z 는 두 평균 차이의 표준 점수 (|z| 가 작을수록 일치).
+    """
+    if n_games < 2:
+        raise ValueError(f"invalid n_games: {n_games}")
+
+    full = [
+        MatchEngine(home, away, seed=derive_seed(seed, "full", i)).simulate_game()
+        for i in range(n_games)
+    ]
+    quick = simulate_games_quick([(home, away)] * n_games, seed=derive_seed(seed, "quick"))
+
+    a = _team_lines(full, home.team_id, away.team_id)
+    b = _team_lines(quick, home.team_id, away.team_id)
+    report: Dict[str, Dict[str, float]] = {}
+    for key in a:
+        var = a[key].var(ddof=1) / n_games + b[key].var(ddof=1) / n_games
+        diff = b[key].mean() - a[key].mean()
+        report[key] = {
+            "full_mean": float(a[key].mean()),
+            "quick_mean": float(b[key].mean()),
+            "full_std": float(a[key].std(ddof=1)),
+            "quick_std": float(b[key].std(ddof=1)),
+            "z": float(diff / np.sqrt(var)) if var > 0 else 0.0,
+        }
+    return report
@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import json
+from bisect import insort
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from config import ROSTER_DF
+from match_engine import Player, Team, _build_ratings, _player_from_row
+
+
+# -----------------------------
+# 로스터 레지스트리
+# -----------------------------
+class RosterRegistry:
+    """ROSTER_DF 를 한 번만 파싱해 두고 Team 객체를 싸게 만들어 주는 저장소.
+
+    - 선수별 레이팅은 시작 시 1회 `_build_ratings` 로 계산해 dict 로 캐싱한다.
+      (같은 dict 를 여러 Team 의 Player 가 공유하므로 읽기 전용으로 다룬다)
+    - ratings_matrix: (선수 수 x 레이팅 키) float 배열. 행 순서는 player_ids 와 같다.
+    - 팀 소속은 player_id → team_id 로 관리하고, 트레이드 등으로 바뀌면
+      move_player 로 갱신한다. 소속이 바뀐 팀은 roster_version 이 올라간다.
+    """
+
+    def __init__(self, roster_df: pd.DataFrame):
+        self.player_ids: List[int] = []
+        self._row_of: Dict[int, int] = {}
+        self._templates: Dict[int, Player] = {}
+        self._team_of: Dict[int, str] = {}
+        self._members: Dict[str, List[Tuple[int, int]]] = {}
+        self._versions: Dict[str, int] = {}
+
+        for row_idx, (pid, row) in enumerate(roster_df.iterrows()):
+            pid = int(pid)
+            team_id = str(row.get("Team"))
+            ratings = _build_ratings(row)
+            self.player_ids.append(pid)
+            self._row_of[pid] = row_idx
+            self._templates[pid] = _player_from_row(pid, row, team_id, ratings)
+            self._team_of[pid] = team_id
+            self._members.setdefault(team_id, []).append((row_idx, pid))
+            self._versions.setdefault(team_id, 0)
+
+        self.rating_keys: Tuple[str, ...] = tuple(
+            dict.fromkeys(k for p in self._templates.values() for k in p.ratings)
+        )
+        self.ratings_matrix = np.array(
+            [
+                [self._templates[pid].ratings.get(k, 50.0) for k in self.rating_keys]
+                for pid in self.player_ids
+            ],
+            dtype=float,
+        ).reshape(len(self.player_ids), len(self.rating_keys))
+
+    # -----------------------------
+    # 조회
+    # -----------------------------
+    def has_team(self, team_id: str) -> bool:
+        return bool(self._members.get(team_id))
+
+    def team_of(self, player_id: int) -> Optional[str]:
+        return self._team_of.get(int(player_id))
+
+    def player_ids_for(self, team_id: str) -> List[int]:
+        """팀 소속 선수 id (ROSTER_DF 행 순서)."""
+        return [pid for _, pid in self._members.get(team_id, [])]
+
+    def roster_version(self, team_id: str) -> int:
+        return self._versions.get(team_id, 0)
+
+    def ratings_for(self, player_id: int) -> Mapping[str, float]:
+        return self._templates[int(player_id)].ratings
+
+    def ratings_row(self, player_id: int) -> np.ndarray:
+        return self.ratings_matrix[self._row_of[int(player_id)]]
+
+    # -----------------------------
+    # Team 생성
+    # -----------------------------
+    def build_team(self, team_id: str, tactics: Optional[Dict[str, Any]] = None) -> Team:
+        """ROSTER_DF 를 다시 읽지 않고 Team 을 만든다.
+
+        팀을 찾을 수 없는 경우 ValueError를 발생시킨다.
+        """
+        members = self._members.get(team_id)
+        if not members:
+            raise ValueError(f"Team '{team_id}' not found in roster data")
+
+        players = []
+        for _, pid in members:
+            t = self._templates[pid]
+            players.append(Player(
+                player_id=t.player_id,
+                name=t.name,
+                team_id=team_id,
+                pos=t.pos,
+                overall=t.overall,
+                ratings=t.ratings,
+            ))
+        return Team.from_players(team_id, players, tactics=tactics)
+
+    # -----------------------------
+    # 소속 변경
+    # -----------------------------
+    def move_player(self, player_id: int, new_team_id: str) -> None:
+        """선수의 소속 팀을 바꾸고 관련된 두 팀의 roster_version 을 올린다."""
+        pid = int(player_id)
+        old_team_id = self._team_of.get(pid)
+        if old_team_id is None or old_team_id == new_team_id:
+            return
+
+        entry = (self._row_of[pid], pid)
+        self._members[old_team_id].remove(entry)
+        insort(self._members.setdefault(new_team_id, []), entry)
+        self._team_of[pid] = new_team_id
+
+        for tid in (old_team_id, new_team_id):
+            self._versions[tid] = self._versions.get(tid, 0) + 1
+
+
+# -----------------------------
+# Team 캐시
+# -----------------------------
+def _normalize_tactics(obj: Any) -> Any:
+    # minutes 처럼 int / str 키가 섞인 dict 도 정렬 가능하도록 키를 문자열로 통일
+    if isinstance(obj, dict):
+        return {str(k): _normalize_tactics(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_normalize_tactics(v) for v in obj]
+    return obj
+
+
+def tactics_key(tactics: Optional[Dict[str, Any]]) -> str:
+    """전술 dict 의 안정적인 해시 키 (키 순서와 무관)."""
+    return json.dumps(_normalize_tactics(tactics or {}), sort_keys=True, default=str)
+
+
+class TeamCache:
+    """(team_id, roster_version, tactics_key) 별로 Team 객체를 재사용한다.
+
+    - 같은 키로 다시 요청하면 새로 만들지 않고 박스스코어만 0으로 리셋해 돌려준다.
+    - 트레이드로 roster_version 이 바뀌거나 전술이 바뀌면 키가 달라지므로 새로 만든다.
+      (roster_version 이 바뀐 팀의 예전 항목은 그때 버린다)
+
+    돌려준 Team 은 캐시와 공유되므로, 한 캐시는 한 번의 리그 진행 안에서만 쓴다.
+    """
+
+    def __init__(self, registry: Optional[RosterRegistry] = None):
+        self.registry = registry or get_roster_registry()
+        self._teams: Dict[Tuple[str, int, str], Team] = {}
+
+    def get(self, team_id: str, tactics: Optional[Dict[str, Any]] = None) -> Team:
+        version = self.registry.roster_version(team_id)
+        key = (team_id, version, tactics_key(tactics))
+        team = self._teams.get(key)
+        if team is not None:
+            team.reset_stats()
+            return team
+
+        for stale in [k for k in self._teams if k[0] == team_id and k[1] != version]:
+            del self._teams[stale]
+
+        team = self.registry.build_team(team_id, tactics=tactics)
+        self._teams[key] = team
+        return team
+
+    def clear(self) -> None:
+        self._teams.clear()
+
+
+_REGISTRY: Optional[RosterRegistry] = None
+
+
+def get_roster_registry() -> RosterRegistry:
+    """config.ROSTER_DF 기반 레지스트리 (최초 호출 시 1회 생성)."""
+    global _REGISTRY
+    if _REGISTRY is None:
+        _REGISTRY = RosterRegistry(ROSTER_DF)
+    return _REGISTRY
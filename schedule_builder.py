@@ -0,0 +1,270 @@
+from __future__ import annotations
+
+import math
+import random
+from typing import Dict, List, Mapping, Optional, Sequence, Set, Tuple
+
+# NOTE: 몬테카를로 시즌마다 스케줄을 다시 만들 수 있도록
+#       GAME_STATE / config 에 의존하지 않는 순수 함수들만 둔다.
+
+# 한 팀의 시즌 백투백 상한 (NBA 평균은 14~15회 정도)
+DEFAULT_MAX_BACK_TO_BACKS = 16
+
+# 휴식 단계: 0 = 백투백 상한 + 3연전 금지, 1 = 3연전 금지만, 2 = 제한 없음
+_REST_LEVELS = (0, 1, 2)
+
+# 어제 경기한 팀의 우선순위 감점 (휴식일 목표)
+_B2B_PENALTY = 0.35
+
+ScheduledGame = Tuple[int, str, str]  # (day_index, home_team_id, away_team_id)
+
+
+# -----------------------------
+# 1) 팀 쌍별 경기 수
+# -----------------------------
+def _four_game_pairs(divisions: Mapping[str, Mapping[str, Sequence[str]]]) -> Set[Tuple[str, str]]:
+    """컨퍼런스 내 다른 디비전 4경기 매칭 (5x5 회전 매핑)."""
+    pairs: Set[Tuple[str, str]] = set()
+    for conf_divs in divisions.values():
+        div_list = list(conf_divs.values())
+        for i in range(len(div_list)):
+            for j in range(i + 1, len(div_list)):
+                a_div = div_list[i]
+                b_div = div_list[j]
+                if not a_div or not b_div:
+                    continue
+                for idx, a_team in enumerate(a_div):
+                    for delta in range(3):  # 각 팀이 상대 디비전 팀 3명에게 4경기 배정
+                        b_team = b_div[(idx + delta) % len(b_div)]
+                        pairs.add(tuple(sorted((a_team, b_team))))
+    return pairs
+
+
+def pair_game_counts(
+    teams: Sequence[str],
+    team_info: Mapping[str, Mapping[str, Optional[str]]],
+    divisions: Mapping[str, Mapping[str, Sequence[str]]],
+) -> Dict[Tuple[str, str], int]:
+    """팀 쌍 (teams 순서 기준 (t1, t2)) → 경기 수.
+
+    - 같은 디비전: 4경기
+    - 같은 컨퍼런스 다른 디비전: 한 팀당 6개 팀과는 4경기, 4개 팀과는 3경기
+    - 다른 컨퍼런스: 2경기
+    """
+    four_game_pairs = _four_game_pairs(divisions)
+    counts: Dict[Tuple[str, str], int] = {}
+    for i in range(len(teams)):
+        for j in range(i + 1, len(teams)):
+            t1, t2 = teams[i], teams[j]
+            conf1, div1 = team_info[t1].get("conference"), team_info[t1].get("division")
+            conf2, div2 = team_info[t2].get("conference"), team_info[t2].get("division")
+
+            if conf1 is None or conf2 is None or conf1 != conf2:
+                num_games = 2
+            elif div1 == div2:
+                num_games = 4
+            else:
+                num_games = 4 if tuple(sorted((t1, t2))) in four_game_pairs else 3
+            counts[(t1, t2)] = num_games
+    return counts
+
+
+# -----------------------------
+# 2) 홈/원정 분배 (오일러 방향 지정)
+# -----------------------------
+def _orient_odd_pairs(odd_pairs: List[Tuple[str, str]], rng: random.Random) -> Dict[Tuple[str, str], str]:
+    """홀수 경기 쌍의 '남는 1경기' 홈 팀을 정한다.
+
+    남는 경기들을 간선으로 보고, 홀수 차수 팀들은 가상 노드에 연결해 모든 차수를
+    짝수로 만든 뒤 미사용 간선을 따라 걷는다. 짝수 차수 그래프에서의 걷기는 항상
+    출발점에서 멈추므로 각 팀의 (홈 - 원정) 차이는 가상 간선 1개 이하가 된다.
+    """
+    dummy = ""
+    edges: List[Tuple[str, str]] = list(odd_pairs)
+    degree: Dict[str, int] = {}
+    for a, b in edges:
+        degree[a] = degree.get(a, 0) + 1
+        degree[b] = degree.get(b, 0) + 1
+    for tid in sorted(degree):
+        if degree[tid] % 2 == 1:
+            edges.append((tid, dummy))
+
+    adj: Dict[str, List[int]] = {}
+    for e, (a, b) in enumerate(edges):
+        adj.setdefault(a, []).append(e)
+        adj.setdefault(b, []).append(e)
+    for lst in adj.values():
+        rng.shuffle(lst)
+
+    used = [False] * len(edges)
+    ptr = {v: 0 for v in adj}
+    home_of: Dict[Tuple[str, str], str] = {}
+
+    for start in sorted(adj):
+        while True:
+            cur = start
+            moved = False
+            while True:
+                lst = adj[cur]
+                while ptr[cur] < len(lst) and used[lst[ptr[cur]]]:
+                    ptr[cur] += 1
+                if ptr[cur] >= len(lst):
+                    break
+                e = lst[ptr[cur]]
+                used[e] = True
+                a, b = edges[e]
+                nxt = b if cur == a else a
+                if e < len(odd_pairs):
+                    home_of[odd_pairs[e]] = cur
+                cur = nxt
+                moved = True
+            if not moved:
+                break
+    return home_of
+
+
+def build_pair_games(
+    pair_counts: Mapping[Tuple[str, str], int],
+    rng: random.Random,
+) -> List[Tuple[str, str]]:
+    """(home, away) 경기 목록. 팀별 홈/원정 차이는 최대 1 (팀당 경기 수가 짝수면 0)."""
+    odd_pairs = [pair for pair, n in pair_counts.items() if n % 2 == 1]
+    extra_home = _orient_odd_pairs(odd_pairs, rng)
+
+    games: List[Tuple[str, str]] = []
+    for (t1, t2), n in pair_counts.items():
+        home_for_t1 = n // 2
+        home_for_t2 = n // 2
+        if n % 2 == 1:
+            if extra_home[(t1, t2)] == t1:
+                home_for_t1 += 1
+            else:
+                home_for_t2 += 1
+        games.extend([(t1, t2)] * home_for_t1)
+        games.extend([(t2, t1)] * home_for_t2)
+    return games
+
+
+# -----------------------------
+# 3) 날짜 배정 (하루 단위 그리디 매칭)
+# -----------------------------
+def _assign_dates(
+    games: List[Tuple[str, str]],
+    n_days: int,
+    max_per_day: int,
+    max_back_to_backs: int,
+    rest_level: int,
+    rng: random.Random,
+) -> Optional[List[ScheduledGame]]:
+    """하루씩 진행하며 남은 경기에서 팀이 겹치지 않는 매칭을 고른다.
+
+    - 남은 경기 수 / 남은 날짜 비율(긴급도)이 높은 팀부터 상대를 고른다.
+    - 어제 경기한 팀은 감점해 휴식일을 우선 보장하고,
+      rest_level 에 따라 3연전 금지 / 백투백 상한을 강제한다.
+    - 하루 경기 수는 ceil(남은 경기 / 남은 날짜) 로 시즌 전체에 고르게 편다.
+    실패(기간 내에 다 배정하지 못함)하면 None.
+    """
+    remaining_games: Dict[Tuple[str, str], List[Tuple[str, str]]] = {}
+    opponents: Dict[str, Dict[str, int]] = {}
+    remaining: Dict[str, int] = {}
+    for home, away in games:
+        key = (home, away) if home < away else (away, home)
+        remaining_games.setdefault(key, []).append((home, away))
+        for a, b in ((home, away), (away, home)):
+            opponents.setdefault(a, {})
+            opponents[a][b] = opponents[a].get(b, 0) + 1
+            remaining[a] = remaining.get(a, 0) + 1
+    for lst in remaining_games.values():
+        rng.shuffle(lst)
+
+    teams = sorted(remaining)
+    last_day = {t: -10 for t in teams}
+    streak = {t: 0 for t in teams}
+    b2b_count = {t: 0 for t in teams}
+
+    scheduled: List[ScheduledGame] = []
+    total_left = len(games)
+
+    for day in range(n_days):
+        if total_left == 0:
+            break
+        days_left = n_days - day
+        target = min(max_per_day, math.ceil(total_left / days_left))
+
+        priority: Dict[str, float] = {}
+        for t in teams:
+            if remaining[t] == 0:
+                continue
+            played_yesterday = last_day[t] == day - 1
+            if played_yesterday and rest_level < 2 and streak[t] >= 2:
+                continue
+            if played_yesterday and rest_level < 1 and b2b_count[t] >= max_back_to_backs:
+                continue
+            p = remaining[t] / days_left + rng.random() * 1e-3
+            if played_yesterday:
+                p -= _B2B_PENALTY
+            priority[t] = p
+
+        booked: Set[str] = set()
+        n_today = 0
+        for t in sorted(priority, key=priority.__getitem__, reverse=True):
+            if n_today >= target:
+                break
+            if t in booked:
+                continue
+            best = None
+            best_p = -math.inf
+            for o, cnt in opponents[t].items():
+                if cnt and o not in booked and o in priority and priority[o] > best_p:
+                    best, best_p = o, priority[o]
+            if best is None:
+                continue
+
+            key = (t, best) if t < best else (best, t)
+            home, away = remaining_games[key].pop()
+            scheduled.append((day, home, away))
+            n_today += 1
+            total_left -= 1
+            for a, b in ((t, best), (best, t)):
+                booked.add(a)
+                opponents[a][b] -= 1
+                remaining[a] -= 1
+                if last_day[a] == day - 1:
+                    streak[a] += 1
+                    b2b_count[a] += 1
+                else:
+                    streak[a] = 1
+                last_day[a] = day
+
+    if total_left:
+        return None
+    return scheduled
+
+
+def build_season_schedule(
+    teams: Sequence[str],
+    team_info: Mapping[str, Mapping[str, Optional[str]]],
+    divisions: Mapping[str, Mapping[str, Sequence[str]]],
+    n_days: int,
+    max_per_day: int,
+    rng: random.Random,
+    max_back_to_backs: int = DEFAULT_MAX_BACK_TO_BACKS,
+) -> List[ScheduledGame]:
+    """정규시즌 전체 스케줄 [(day_index, home, away)] (날짜 순).
+
+    - 한 팀은 하루 최대 1경기, 하루 최대 max_per_day 경기 (더블부킹 없음)
+    - 3연전 금지, 팀당 백투백 max_back_to_backs 회 이하
+    - 제약을 만족하지 못하면 휴식 제약부터 단계적으로 완화해서 다시 배정한다.
+      (팀 중복 / 하루 경기 수 제한은 완화하지 않는다)
+
+    시간은 (날짜 수 x 팀 수^2) 에 비례하는 상한을 가지며 재시도는 최대 3회.
+    어떤 단계로도 배정하지 못하면 ValueError를 발생시킨다.
+    """
+    games = build_pair_games(pair_game_counts(teams, team_info, divisions), rng)
+    for level in _REST_LEVELS:
+        scheduled = _assign_dates(games, n_days, max_per_day, max_back_to_backs, level, rng)
+        if scheduled is not None:
+            return scheduled
+    raise ValueError(
+        f"cannot fit {len(games)} games into {n_days} days with {max_per_day} games per day"
+    )
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import hashlib
+import random
+import secrets
+from typing import Any
+
+# NOTE: 워커 프로세스에서도 쓰일 수 있으므로 config / state 를 import 하지 않는다.
+
+
+def new_master_seed() -> int:
+    """새 리그 마스터 seed (63비트)."""
+    return secrets.randbits(63)
+
+
+def derive_seed(master_seed: int, *keys: Any) -> int:
+    """마스터 seed 와 키들로부터 독립적인 64비트 seed 를 만든다.
+
+    같은 (master_seed, keys) 는 프로세스/실행 순서와 무관하게 항상 같은 값을 준다.
+    예: derive_seed(master, "game", game_id), derive_seed(master, "trade_tick", "2025-11-02")
+    """
+    h = hashlib.blake2b(digest_size=8)
+    h.update(str(int(master_seed)).encode("utf-8"))
+    for key in keys:
+        h.update(b"\x1f")
+        h.update(str(key).encode("utf-8"))
+    return int.from_bytes(h.digest(), "big")
+
+
+def derive_rng(master_seed: int, *keys: Any) -> random.Random:
+    """derive_seed 로 초기화한 독립 RNG 스트림."""
+    return random.Random(derive_seed(master_seed, *keys))
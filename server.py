@@ -5,9 +5,9 @@ import os
 from typing import Any, Dict, Optional, List
 
 import google.generativeai as genai
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, Header, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel, Field
 
@@ -19,15 +19,29 @@ from state import (
     get_schedule_summary,
     initialize_master_schedule_if_needed,
 )
-from league_sim import simulate_single_game, advance_league_until
+from league_sim import simulate_single_game, start_live_single_game, advance_league_until
+from live_games import clear_live_games, get_live_game
+from persistence import list_saves, load_league, save_league
+from event_log import get_event_log, open_event_log
+from game_store import get_game_store
 from playoffs import (
     auto_advance_current_round,
     advance_my_team_one_game,
-    build_postseason_field,
+    compute_postseason_field,
     initialize_postseason,
     play_my_team_play_in_game,
     reset_postseason_state,
 )
+from playoff_odds import iter_playoff_odds
+from matchup_predict import DEFAULT_SIMULATIONS, predict_matchup
+from tactics_optimizer import DEFAULT_CANDIDATES, DEFAULT_GAMES_PER_ROUND, DEFAULT_TOP_K, optimize_tactics
+from lineup_optimizer import (
+    DEFAULT_BEAM_WIDTH,
+    DEFAULT_GAMES,
+    DEFAULT_MAX_ITERATIONS,
+    DEFAULT_TARGET_HALF_WIDTH,
+    optimize_lineup,
+)
 from news_ai import refresh_playoff_news, refresh_weekly_news
 from stats_util import compute_league_leaders, compute_playoff_league_leaders
 from team_utils import (
@@ -56,6 +70,12 @@ static_dir = os.path.join(BASE_DIR, "static")
 app.mount("/static", StaticFiles(directory=static_dir), name="static")
 
 
+@app.on_event("startup")
+def _recover_league_state():
+    """이벤트 로그를 열고 마지막 체크포인트 + 로그 꼬리로 리그 상태를 복구한다."""
+    open_event_log()
+
+
 @app.get("/")
 async def root():
     """간단한 헬스체크 및 NBA.html 링크 안내."""
@@ -76,6 +96,39 @@ class SimGameRequest(BaseModel):
     game_date: Optional[str] = None  # 인게임 날짜 (YYYY-MM-DD)
 
 
+class PredictMatchupRequest(BaseModel):
+    home_team_id: str
+    away_team_id: str
+    home_tactics: Optional[Dict[str, Any]] = None
+    away_tactics: Optional[Dict[str, Any]] = None
+    simulations: int = DEFAULT_SIMULATIONS
+    workers: int = 1  # >1 이면 프로세스 풀로 청크를 나눠 돌린다
+    target_std_error: Optional[float] = None  # 승리 확률 표준오차 목표 (있으면 simulations 는 상한)
+
+
+class OptimizeTacticsRequest(BaseModel):
+    team_id: str
+    opponent_id: str
+    base_tactics: Optional[Dict[str, Any]] = None
+    opponent_tactics: Optional[Dict[str, Any]] = None
+    n_candidates: int = DEFAULT_CANDIDATES
+    games_per_round: int = DEFAULT_GAMES_PER_ROUND  # 첫 라운드 후보당 경기 수
+    top_k: int = DEFAULT_TOP_K
+    workers: int = 1
+
+
+class OptimizeLineupRequest(BaseModel):
+    team_id: str
+    opponent_id: Optional[str] = None  # 없으면 리그 전체 상대
+    base_tactics: Optional[Dict[str, Any]] = None
+    opponent_tactics: Optional[Dict[str, Any]] = None
+    games: int = DEFAULT_GAMES  # 라인업당 평가 경기 수
+    beam_width: int = DEFAULT_BEAM_WIDTH
+    max_iterations: int = DEFAULT_MAX_ITERATIONS
+    workers: int = 1
+    target_half_width: Optional[float] = DEFAULT_TARGET_HALF_WIDTH  # 재평가 정지 기준 (넷 레이팅 차이 95% 반폭)
+
+
 class ChatMainRequest(BaseModel):
     apiKey: str
     # JS 쪽에서 userMessage라는 필드명을 사용하는 경우도 받아줄 수 있게 alias 지정
@@ -92,6 +145,8 @@ class ChatMainRequest(BaseModel):
 class AdvanceLeagueRequest(BaseModel):
     target_date: str  # YYYY-MM-DD, 이 날짜까지 리그를 자동 진행
     user_team_id: Optional[str] = None
+    engine_mode: str = "standard"  # "standard" | "batch" | "quick"
+    workers: int = 1  # >1 이면 프로세스 풀 병렬 시뮬레이션 (standard 모드)
 
 
 class PostseasonSetupRequest(BaseModel):
@@ -103,6 +158,10 @@ class EmptyRequest(BaseModel):
     pass
 
 
+class AutoAdvanceRoundRequest(BaseModel):
+    engine_mode: str = "standard"  # "standard" | "quick"
+
+
 class WeeklyNewsRequest(BaseModel):
     apiKey: str
 
@@ -114,6 +173,14 @@ class ApiKeyRequest(BaseModel):
 class SeasonReportRequest(BaseModel):
     apiKey: str
     user_team_id: str
+
+
+class SaveSlotRequest(BaseModel):
+    slot: str = "default"
+
+
+class RestoreDateRequest(BaseModel):
+    date: str  # YYYY-MM-DD, 이 날짜까지의 이벤트를 포함한 시점으로 되돌린다
 
 
 # -------------------------------------------------------------------------
@@ -160,6 +227,136 @@ async def api_simulate_game(req: SimGameRequest):
         raise HTTPException(status_code=404, detail=str(e))
 
 
+@app.post("/api/live-games")
+async def api_start_live_game(req: SimGameRequest):
+    """/api/simulate-game 의 라이브 버전: 경기를 시작하고 이벤트 스트림 주소를 돌려준다.
+
+    같은 경기를 다시 요청하면 다시 시뮬레이션하지 않고 같은 live_id 를 돌려준다.
+    결과는 경기가 끝나는 시점에 /api/simulate-game 과 똑같이 리그 상태에 반영된다.
+    (이벤트 루프에서 시작하므로 결과 반영도 이 루프에서 다른 상태 변경 핸들러와 차례로 돈다)
+    """
+    try:
+        game = start_live_single_game(
+            home_team_id=req.home_team_id,
+            away_team_id=req.away_team_id,
+            game_date=req.game_date,
+            home_tactics=req.home_tactics,
+            away_tactics=req.away_tactics,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    return {**game.status(), "stream_url": f"/api/live-games/{game.live_id}/events"}
+
+
+@app.get("/api/live-games/{live_id}")
+def api_live_game_status(live_id: str):
+    game = get_live_game(live_id)
+    if game is None:
+        raise HTTPException(status_code=404, detail=f"live game '{live_id}' not found")
+    return {**game.status(), "result": game.result}
+
+
+@app.get("/api/live-games/{live_id}/events")
+async def api_live_game_events(
+    live_id: str,
+    pace: float = 0.0,
+    from_event: int = 0,
+    last_event_id: Optional[str] = Header(None, alias="Last-Event-ID"),
+):
+    """라이브 경기 이벤트를 Server-Sent Events 로 내보낸다.
+
+    - pace: 포제션당 대기 시간(초). 0 이면 만들어지는 대로 바로 보낸다.
+    - 이벤트 id 는 로그 인덱스다. 재연결 시 Last-Event-ID 다음 이벤트부터 이어서 보낸다.
+    - 시청자가 여러 명이어도 경기는 한 번만 시뮬레이션된다.
+    - 스트림은 async 제너레이터라 시청자가 기다리거나 페이싱으로 쉬는 동안 스레드풀을 잡지 않는다.
+    """
+    game = get_live_game(live_id)
+    if game is None:
+        raise HTTPException(status_code=404, detail=f"live game '{live_id}' not found")
+
+    start = from_event
+    if last_event_id is not None and last_event_id.isdigit():
+        start = int(last_event_id) + 1
+    try:
+        events = game.aiter_events(start=start, pace=pace)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    async def _sse():
+        async for i, event in events:
+            data = json.dumps(event, ensure_ascii=False)
+            yield f"id: {i}\nevent: {event['type']}\ndata: {data}\n\n"
+
+    return StreamingResponse(
+        _sse(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.post("/api/predict-matchup")
+def api_predict_matchup(req: PredictMatchupRequest):
+    """두 팀(과 전술)의 경기 프리뷰: 승리 확률, 점수 분포, 선수별 예상 박스 라인.
+
+    GAME_STATE 에는 반영하지 않는다.
+    """
+    try:
+        return predict_matchup(
+            home_team_id=req.home_team_id,
+            away_team_id=req.away_team_id,
+            home_tactics=req.home_tactics,
+            away_tactics=req.away_tactics,
+            simulations=req.simulations,
+            workers=req.workers,
+            target_std_error=req.target_std_error,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@app.post("/api/optimize-tactics")
+def api_optimize_tactics(req: OptimizeTacticsRequest):
+    """상대 팀을 정해 두고 전술(스킴 / 페이스 / 로테이션 인원)을 탐색해 상위 설정을 돌려준다.
+
+    GAME_STATE 에는 반영하지 않는다.
+    """
+    try:
+        return optimize_tactics(
+            team_id=req.team_id,
+            opponent_id=req.opponent_id,
+            base_tactics=req.base_tactics,
+            opponent_tactics=req.opponent_tactics,
+            n_candidates=req.n_candidates,
+            games_per_round=req.games_per_round,
+            top_k=req.top_k,
+            workers=req.workers,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@app.post("/api/optimize-lineup")
+def api_optimize_lineup(req: OptimizeLineupRequest):
+    """선발 / 벤치 순서 / 출전 시간 제안 (시뮬레이션 넷 레이팅 기준).
+
+    GAME_STATE 에는 반영하지 않는다.
+    """
+    try:
+        return optimize_lineup(
+            team_id=req.team_id,
+            opponent_id=req.opponent_id,
+            base_tactics=req.base_tactics,
+            opponent_tactics=req.opponent_tactics,
+            games=req.games,
+            beam_width=req.beam_width,
+            max_iterations=req.max_iterations,
+            workers=req.workers,
+            target_half_width=req.target_half_width,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
 # -------------------------------------------------------------------------
 # 리그 자동 진행 API (다른 팀 경기 일괄 시뮬레이션)
 # -------------------------------------------------------------------------
@@ -170,6 +367,8 @@ async def api_advance_league(req: AdvanceLeagueRequest):
         simulated = advance_league_until(
             target_date_str=req.target_date,
             user_team_id=req.user_team_id,
+            engine_mode=req.engine_mode,
+            workers=req.workers,
         )
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -186,21 +385,35 @@ async def api_advance_league(req: AdvanceLeagueRequest):
 # -------------------------------------------------------------------------
 
 
+def _leader_stats(stats: Optional[str]) -> Optional[List[str]]:
+    """"PTS,AST" -> ["PTS", "AST"] (없으면 기본 스탯)."""
+    if not stats:
+        return None
+    return [s.strip().upper() for s in stats.split(",") if s.strip()]
+
+
 @app.get("/api/stats/leaders")
-async def api_stats_leaders():
+async def api_stats_leaders(k: int = 5, min_games: int = 0, stats: Optional[str] = None):
     # The frontend expects a flat object with an uppercase stat key (e.g., PTS)
     # under `data.leaders`. Some previous iterations of the API wrapped this
     # structure under stats.leaderboards with lowercase keys, which caused the
     # UI to break. Normalize here so the client always receives
     # `{ leaders: { PTS: [...], AST: [...], ... }, updated_at: <iso date> }`.
-    leaders = compute_league_leaders()
+    # k / min_games / stats(쉼표 구분) 로 순위 수, 최소 출전 경기 수, 스탯을 고른다.
+    try:
+        leaders = compute_league_leaders(limit=k, min_games=min_games, stats=_leader_stats(stats))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     current_date = get_current_date()
     return {"leaders": leaders, "updated_at": current_date}
 
 
 @app.get("/api/stats/playoffs/leaders")
-async def api_playoff_stats_leaders():
-    leaders = compute_playoff_league_leaders()
+async def api_playoff_stats_leaders(k: int = 5, min_games: int = 0, stats: Optional[str] = None):
+    try:
+        leaders = compute_playoff_league_leaders(limit=k, min_games=min_games, stats=_leader_stats(stats))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     current_date = get_current_date()
     return {"leaders": leaders, "updated_at": current_date}
 
@@ -223,6 +436,38 @@ async def api_team_detail(team_id: str):
         raise HTTPException(status_code=404, detail=str(e))
 
 
+@app.get("/api/playoff-odds")
+def api_playoff_odds(
+    runs: int = 10000,
+    workers: int = 1,
+    stream: bool = False,
+    target_std_error: Optional[float] = None,
+):
+    """남은 정규시즌을 runs 번 몬테카를로로 돌려 팀별 플레이오프/우승 확률을 계산.
+
+    stream=true 이면 청크가 끝날 때마다 중간 추정치를 NDJSON 한 줄씩 내보낸다.
+    target_std_error 가 있으면 플레이오프 진출 확률의 최대 표준오차가 목표 이하가 되면 일찍 멈춘다.
+    """
+    odds_iter = iter_playoff_odds(runs=runs, workers=workers, target_std_error=target_std_error)
+    try:
+        first = next(odds_iter)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    if not stream:
+        result = first
+        for result in odds_iter:
+            pass
+        return result
+
+    def _ndjson():
+        yield json.dumps(first, ensure_ascii=False) + "\n"
+        for partial in odds_iter:
+            yield json.dumps(partial, ensure_ascii=False) + "\n"
+
+    return StreamingResponse(_ndjson(), media_type="application/x-ndjson")
+
+
 # -------------------------------------------------------------------------
 # 플레이-인 / 플레이오프
 # -------------------------------------------------------------------------
@@ -230,7 +475,8 @@ async def api_team_detail(team_id: str):
 
 @app.get("/api/postseason/field")
 async def api_postseason_field():
-    return build_postseason_field()
+    """현재 순위 기준 필드 미리보기 (저장은 /api/postseason/setup 이 한다)."""
+    return compute_postseason_field()
 
 
 @app.get("/api/postseason/state")
@@ -268,9 +514,9 @@ async def api_playoffs_advance_my_team_game(req: EmptyRequest):
 
 
 @app.post("/api/postseason/playoffs/auto-advance-round")
-async def api_playoffs_auto_advance_round(req: EmptyRequest):
+async def api_playoffs_auto_advance_round(req: AutoAdvanceRoundRequest):
     try:
-        return auto_advance_current_round()
+        return auto_advance_current_round(engine_mode=req.engine_mode)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -453,6 +699,99 @@ async def team_schedule(team_id: str):
     }
 
 
+# -------------------------------------------------------------------------
+# 리그 세이브 / 로드 API
+#   GAME_STATE 전체를 읽거나 바꾸므로 다른 상태 변경 핸들러처럼 async 로 둔다
+#   (스레드풀에서 돌면 진행 중인 advance / 포스트시즌 핸들러와 겹친다)
+# -------------------------------------------------------------------------
+@app.post("/api/league/save")
+async def api_save_league(req: SaveSlotRequest):
+    """GAME_STATE 와 트레이드 로스터 변경분을 슬롯에 저장한다 (바뀐 부분만 다시 쓴다)."""
+    try:
+        return save_league(req.slot)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@app.post("/api/league/load")
+async def api_load_league(req: SaveSlotRequest):
+    """슬롯을 불러와 GAME_STATE 와 로스터를 교체한다."""
+    try:
+        result = load_league(req.slot)
+    except FileNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    # 불러오기 전 리그 기준의 라이브 경기는 버린다
+    clear_live_games()
+    # 불러온 상태가 이벤트 로그의 새 타임라인 시작점이 된다
+    log = get_event_log()
+    if log is not None:
+        log.checkpoint(base=True, reason=f"load:{req.slot}")
+    return result
+
+
+@app.get("/api/league/saves")
+def api_list_saves():
+    return {"saves": list_saves()}
+
+
+@app.get("/api/league/checkpoints")
+def api_list_checkpoints():
+    """이벤트 로그의 마지막 seq 와 체크포인트 목록."""
+    log = get_event_log()
+    if log is None:
+        return {"seq": None, "checkpoints": []}
+    return {"seq": log.seq, "checkpoints": log.checkpoints()}
+
+
+@app.post("/api/league/restore")
+async def api_restore_league(req: RestoreDateRequest):
+    """이벤트 로그로 리그를 과거 날짜 시점으로 되돌린다."""
+    log = get_event_log()
+    if log is None:
+        raise HTTPException(status_code=400, detail="event log is not open")
+    try:
+        result = log.restore_to(req.date)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    clear_live_games()
+    return result
+
+
+# -------------------------------------------------------------------------
+# 경기 기록 조회 API (game_store)
+# -------------------------------------------------------------------------
+@app.get("/api/games")
+def api_games(
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    team_id: Optional[str] = None,
+    phase: Optional[str] = None,
+):
+    """날짜 구간(YYYY-MM-DD) / 팀 / 페이즈(regular | postseason)로 거른 경기 목록."""
+    return {"games": get_game_store().games(start=start, end=end, team_id=team_id.upper() if team_id else None, phase=phase)}
+
+
+@app.get("/api/games/{game_id}/boxscore")
+def api_game_boxscore(game_id: str):
+    boxscore = get_game_store().boxscore(game_id)
+    if boxscore is None:
+        raise HTTPException(status_code=404, detail=f"game '{game_id}' not found")
+    return {"game_id": game_id, "boxscore": boxscore}
+
+
+@app.get("/api/player-games/{player_id}")
+def api_player_games(player_id: int, start: Optional[str] = None, end: Optional[str] = None):
+    """선수의 경기별 박스 라인 (날짜순)."""
+    return {"player_id": player_id, "games": get_game_store().player_games(player_id, start=start, end=end)}
+
+
+@app.get("/api/transactions")
+def api_transactions(team_id: Optional[str] = None, start: Optional[str] = None, end: Optional[str] = None):
+    return {"transactions": get_game_store().transactions(team_id=team_id.upper() if team_id else None, start=start, end=end)}
+
+
 # -------------------------------------------------------------------------
 # STATE 요약 조회 API (프론트/디버그용)
 # -------------------------------------------------------------------------
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import math
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from match_engine import MatchEngine, Team
+
+# NOTE: 이 모듈은 워커 프로세스에서도 import 되므로 config(엑셀 로딩)를 import 하지 않는다.
+
+# 워커 하나당 몇 개의 청크로 나눌지 (부하 분산용)
+CHUNKS_PER_WORKER = 4
+
+_POOL: Optional[ProcessPoolExecutor] = None
+_POOL_WORKERS = 0
+_POOL_LOCK = threading.Lock()
+
+
+# -----------------------------
+# 프로세스 풀
+# -----------------------------
+def get_pool(workers: int) -> ProcessPoolExecutor:
+    """workers 개의 프로세스를 가진 풀 (최초 호출 시 생성, 크기가 바뀌면 다시 생성)."""
+    global _POOL, _POOL_WORKERS
+    with _POOL_LOCK:
+        if _POOL is None or _POOL_WORKERS != workers:
+            if _POOL is not None:
+                _POOL.shutdown(wait=True)
+            _POOL = ProcessPoolExecutor(max_workers=workers)
+            _POOL_WORKERS = workers
+        return _POOL
+
+
+def shutdown_pool() -> None:
+    global _POOL, _POOL_WORKERS
+    with _POOL_LOCK:
+        if _POOL is not None:
+            _POOL.shutdown(wait=True)
+        _POOL = None
+        _POOL_WORKERS = 0
+
+
+# -----------------------------
+# 워커 작업
+# -----------------------------
+def _simulate_chunk(
+    teams: Dict[str, Team],
+    games: List[Tuple[str, str, int]],
+) -> List[Dict[str, Any]]:
+    """워커에서 실행: (home_id, away_id, seed) 목록을 순서대로 시뮬레이션."""
+    return [
+        MatchEngine(teams[home_id], teams[away_id], seed=seed).simulate_game()
+        for home_id, away_id, seed in games
+    ]
+
+
+def simulate_games_parallel(
+    games: Sequence[Tuple[Team, Team, int]],
+    workers: int,
+) -> List[Dict[str, Any]]:
+    """(home, away, seed) 경기들을 프로세스 풀에서 시뮬레이션한다.
+
+    - 경기들은 순서를 유지한 연속 구간(청크)으로 나누어 워커에 보낸다.
+      각 청크에는 그 청크에서 쓰이는 Team 만 한 번씩 담는다.
+    - 결과는 입력 순서대로 반환되며, 같은 seed 로 직렬 실행한
+      MatchEngine(home, away, seed).simulate_game() 결과와 동일하다.
+    """
+    if not games:
+        return []
+    if workers <= 1:
+        return [MatchEngine(home, away, seed=seed).simulate_game() for home, away, seed in games]
+
+    n_chunks = min(len(games), workers * CHUNKS_PER_WORKER)
+    chunk_size = math.ceil(len(games) / n_chunks)
+
+    pool = get_pool(workers)
+    futures = []
+    for start in range(0, len(games), chunk_size):
+        chunk = games[start:start + chunk_size]
+        teams: Dict[str, Team] = {}
+        for home, away, _ in chunk:
+            teams[home.team_id] = home
+            teams[away.team_id] = away
+        payload = [(home.team_id, away.team_id, seed) for home, away, seed in chunk]
+        futures.append(pool.submit(_simulate_chunk, teams, payload))
+
+    results: List[Dict[str, Any]] = []
+    for fut in futures:
+        results.extend(fut.result())
+    return results
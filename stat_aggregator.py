@@ -0,0 +1,244 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from operator import itemgetter
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from batch_engine import BoxScore
+from leaderboards import Leaderboards
+from match_engine import BOX_STAT_KEYS
+
+# 시즌 / 포스트시즌 선수 누적 스탯 (열 방향 NumPy 배열).
+#
+# player_id 마다 행 하나, BOX_STAT_KEYS (엔진 박스스코어의 14개 스탯) 마다 열 하나.
+# 박스스코어 한 개는 행 인덱스 배열을 만든 뒤 한 번의 벡터 덧셈으로 반영한다.
+# 합계 / 경기당 / 36분당 값은 배열 연산으로 바로 나온다.
+#
+# 기존 player_stats dict 와 같은 모양으로도 읽힌다 (Mapping):
+#   stats[player_id] -> {"player_id", "name", "team_id", "games", "totals": {stat: float}}
+# 그래서 GAME_STATE 에 그대로 두고 JSON 응답 / 세이브 / 기존 조회 코드가 바뀌지 않는다.
+#
+# leaders(stat, k, min_games) 는 스탯별 순위표 (leaderboards.Leaderboards) 로 답한다.
+# 순위표는 그 스탯을 처음 조회할 때 만들고, 이후 박스스코어마다 뛴 선수만 다시 자리를 잡는다.
+
+STAT_KEYS: Tuple[str, ...] = tuple(BOX_STAT_KEYS)
+STAT_INDEX: Dict[str, int] = {k: i for i, k in enumerate(STAT_KEYS)}
+
+_INITIAL_CAPACITY = 512
+
+_box_stats = itemgetter(*STAT_KEYS)
+
+
+def _row_values(row: Dict[str, Any]) -> List[float]:
+    """박스 라인 -> STAT_KEYS 순서 값. 빠지거나 잘못된 값은 0."""
+    values = []
+    for k in STAT_KEYS:
+        try:
+            values.append(float(row.get(k, 0) or 0))
+        except (TypeError, ValueError):
+            values.append(0.0)
+    return values
+
+
+def _stat_matrix(rows: List[Dict[str, Any]]) -> np.ndarray:
+    """(len(rows), len(STAT_KEYS)) 값 행렬. 엔진 박스스코어는 한 번에 변환하고,
+    빠지거나 잘못된 값이 있으면 줄마다 따져서 0 으로 채운다."""
+    try:
+        values = np.array([_box_stats(r) for r in rows], dtype=np.float64)
+        if not np.isnan(values).any():
+            return values
+    except (KeyError, TypeError, ValueError):
+        pass
+    return np.array([_row_values(r) for r in rows], dtype=np.float64)
+
+
+class StatAggregator(Mapping):
+    """player_id 행 x 스탯 열 누적 배열."""
+
+    _boards: Optional[Leaderboards] = None
+
+    def __init__(self, capacity: int = _INITIAL_CAPACITY):
+        self._index: Dict[Any, int] = {}
+        self._ids: List[Any] = []
+        self._names: List[Optional[str]] = []
+        self._teams: List[Optional[str]] = []
+        self._totals = np.zeros((capacity, len(STAT_KEYS)), dtype=np.float64)
+        self._games = np.zeros(capacity, dtype=np.int64)
+
+    # -----------------------------
+    # 누적
+    # -----------------------------
+    def _row_for(self, player_id: Any, name: Optional[str], team_id: Optional[str]) -> int:
+        row = self._index.get(player_id)
+        if row is None:
+            row = len(self._ids)
+            if row == len(self._games):
+                self._grow()
+            self._index[player_id] = row
+            self._ids.append(player_id)
+            self._names.append(name)
+            self._teams.append(team_id)
+        else:
+            if name is not None:
+                self._names[row] = name
+            if team_id is not None:
+                self._teams[row] = team_id
+        return row
+
+    def _grow(self) -> None:
+        capacity = max(len(self._games) * 2, _INITIAL_CAPACITY)
+        totals = np.zeros((capacity, len(STAT_KEYS)), dtype=np.float64)
+        totals[: len(self._ids)] = self._totals[: len(self._ids)]
+        games = np.zeros(capacity, dtype=np.int64)
+        games[: len(self._ids)] = self._games[: len(self._ids)]
+        self._totals, self._games = totals, games
+
+    def add_boxscore(self, boxscore: Optional[Mapping]) -> int:
+        """박스스코어 (team_id -> 선수 라인 리스트, 또는 엔진의 BoxScore) 하나를 반영한다. 반영한 라인 수를 반환."""
+        if not boxscore:
+            return 0
+        if isinstance(boxscore, BoxScore):
+            # 배치 / quick 엔진 결과: 선수 라인 dict 를 만들지 않고 배열째 반영
+            idents = boxscore.player_idents()
+            idx = np.fromiter((self._row_for(*who) for who in idents), dtype=np.intp, count=len(idents))
+            values = boxscore.stat_matrix()
+        else:
+            rows = [
+                r
+                for team_rows in boxscore.values() if isinstance(team_rows, list)
+                for r in team_rows if isinstance(r, dict) and r.get("PlayerID") is not None
+            ]
+            if not rows:
+                return 0
+            idx = np.fromiter(
+                (self._row_for(r["PlayerID"], r.get("Name"), r.get("Team")) for r in rows),
+                dtype=np.intp,
+                count=len(rows),
+            )
+            values = _stat_matrix(rows)
+        if not len(idx):
+            return 0
+        # 한 박스스코어 안에 같은 선수가 두 번 나와도 맞도록 add.at
+        np.add.at(self._totals, idx, values)
+        np.add.at(self._games, idx, 1)
+
+        if self._boards is not None:
+            changed = np.unique(idx)
+            per_game = self._totals[changed] / self._games[changed, None]
+            self._boards.update(changed.tolist(), per_game, len(self._ids))
+        return len(idx)
+
+    def set_team(self, player_id: Any, team_id: str) -> None:
+        """선수의 현재 소속 (표시용) 을 바꾼다. 기록은 그대로다."""
+        row = self._index.get(player_id)
+        if row is not None:
+            self._teams[row] = team_id
+
+    # -----------------------------
+    # 열 방향 조회 (배열은 읽기 전용 뷰)
+    # -----------------------------
+    @staticmethod
+    def _readonly(a: np.ndarray) -> np.ndarray:
+        view = a.view()
+        view.flags.writeable = False
+        return view
+
+    def player_ids(self) -> List[Any]:
+        return list(self._ids)
+
+    def row_of(self, player_id: Any) -> Optional[int]:
+        return self._index.get(player_id)
+
+    def team_ids(self) -> List[Optional[str]]:
+        return list(self._teams)
+
+    def games(self) -> np.ndarray:
+        """(n,) 출전 경기 수."""
+        return self._readonly(self._games[: len(self._ids)])
+
+    def totals(self) -> np.ndarray:
+        """(n, len(STAT_KEYS)) 누적 합계."""
+        return self._readonly(self._totals[: len(self._ids)])
+
+    def per_game(self) -> np.ndarray:
+        """(n, len(STAT_KEYS)) 경기당 평균. 경기가 없으면 0."""
+        totals = self._totals[: len(self._ids)]
+        games = self._games[: len(self._ids), None]
+        return np.divide(totals, games, out=np.zeros_like(totals), where=games > 0)
+
+    def per_36(self) -> np.ndarray:
+        """(n, len(STAT_KEYS)) 36분당 값. 출전 시간이 없으면 0."""
+        totals = self._totals[: len(self._ids)]
+        minutes = totals[:, STAT_INDEX["MIN"], None]
+        return np.divide(totals * 36.0, minutes, out=np.zeros_like(totals), where=minutes > 0)
+
+    def leaders(self, stat: str, k: int = 5, min_games: int = 0) -> List[Dict[str, Any]]:
+        """stat 경기당 상위 k 명 (min_games 경기 이상 출전). 잘못된 인자는 ValueError."""
+        col = STAT_INDEX.get(stat)
+        if col is None:
+            raise ValueError(f"unknown stat: {stat}")
+        if k < 1:
+            raise ValueError(f"invalid k: {k}")
+        if min_games < 0:
+            raise ValueError(f"invalid min_games: {min_games}")
+
+        if self._boards is None:
+            self._boards = Leaderboards()
+        if not self._boards.has(col):
+            self._boards.build(col, self.per_game()[:, col], self.games())
+
+        return [
+            {
+                "player_id": self._ids[row],
+                "name": self._names[row],
+                "team_id": self._teams[row],
+                "games": int(self._games[row]),
+                "per_game": value,
+            }
+            for row, value in self._boards.top(col, k, self._games, min_games)
+        ]
+
+    # -----------------------------
+    # 기존 player_stats dict 호환 (Mapping)
+    # -----------------------------
+    def __getitem__(self, player_id: Any) -> Dict[str, Any]:
+        row = self._index[player_id]
+        return {
+            "player_id": player_id,
+            "name": self._names[row],
+            "team_id": self._teams[row],
+            "games": int(self._games[row]),
+            "totals": dict(zip(STAT_KEYS, self._totals[row].tolist())),
+        }
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(list(self._ids))
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __repr__(self) -> str:
+        return f"StatAggregator(players={len(self._ids)})"
+
+    @classmethod
+    def from_legacy(cls, stats: Optional[Dict[Any, Dict[str, Any]]]) -> "StatAggregator":
+        """예전 player_stats dict (player_id -> entry) 로부터 만든다. 없는 스탯은 0."""
+        agg = cls(max(_INITIAL_CAPACITY, len(stats or {})))
+        for key, entry in (stats or {}).items():
+            if not isinstance(entry, dict):
+                continue
+            row = agg._row_for(entry.get("player_id", key), entry.get("name"), entry.get("team_id"))
+            agg._totals[row] = _row_values(entry.get("totals") or {})
+            agg._games[row] = int(entry.get("games", 0) or 0)
+        return agg
+
+
+def ensure_aggregator(container: Dict[str, Any], key: str) -> StatAggregator:
+    """container[key] 를 StatAggregator 로 보장한다 (비어 있거나 예전 dict 면 변환해서 넣는다)."""
+    value = container.get(key)
+    if not isinstance(value, StatAggregator):
+        value = StatAggregator.from_legacy(value)
+        container[key] = value
+    return value
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import random
 from datetime import date, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from config import (
     HARD_CAP,
@@ -14,55 +14,65 @@ from config import (
     MAX_GAMES_PER_DAY,
     DIVISIONS,
 )
+from event_log import record_event
+from game_store import get_game_store
+from schedule_builder import build_season_schedule
+from seed_util import derive_rng, new_master_seed
+from stat_aggregator import ensure_aggregator
 
 # -------------------------------------------------------------------------
 # 1. 전역 GAME_STATE 및 스케줄/리그 상태 유틸
 # -------------------------------------------------------------------------
-GAME_STATE: Dict[str, Any] = {
-    "schema_version": "1.1",
-    "turn": 0,
-    "games": [],  # 각 경기의 메타 데이터
-    "player_stats": {},  # player_id -> 시즌 누적 스탯
-    "cached_views": {
-        "scores": {
-            "latest_date": None,
-            "games": []  # 최근 경기일자 기준 경기 리스트
+def _new_game_state() -> Dict[str, Any]:
+    """비어 있는 GAME_STATE. (세이브 파일을 불러올 때 빠진 키의 기본값으로도 쓴다)"""
+    return {
+        "schema_version": "1.1",
+        "turn": 0,
+        "games": [],  # 각 경기의 메타 데이터
+        "player_stats": {},  # player_id -> 시즌 누적 스탯 (첫 경기 때 StatAggregator 로 바뀐다)
+        "cached_views": {
+            "scores": {
+                "latest_date": None,
+                "games": []  # 최근 경기일자 기준 경기 리스트
+            },
+            "schedule": {
+                "teams": {}  # team_id -> {past_games: [], upcoming_games: []}
+            },
+            "stats": {
+                "leaders": None,
+            },
+            "weekly_news": {
+                "last_generated_week_start": None,
+                "items": [],
+            },
+            "playoff_news": {
+                "series_game_counts": {},
+                "items": [],
+            },
         },
-        "schedule": {
-            "teams": {}  # team_id -> {past_games: [], upcoming_games: []}
+        "postseason": {},  # 플레이-인/플레이오프 시뮬레이션 결과 캐시
+        "league": {
+            "season_year": None,
+            "season_start": None,  # YYYY-MM-DD
+            "current_date": None,  # 마지막으로 리그를 진행한 인게임 날짜
+            "master_schedule": {
+                "games": [],   # 전체 리그 경기 리스트
+                "by_team": {},  # team_id -> [game_id, ...]
+                "by_date": {},  # date_str -> [game_id, ...]
+            },
+            "trade_rules": {
+                "hard_cap": HARD_CAP,
+                "trade_deadline": None,  # YYYY-MM-DD
+            },
+            "last_gm_tick_date": None,  # 마지막 AI GM 트레이드 시도 날짜
         },
-        "stats": {
-            "leaders": None,
-        },
-        "weekly_news": {
-            "last_generated_week_start": None,
-            "items": [],
-        },
-        "playoff_news": {
-            "series_game_counts": {},
-            "items": [],
-        },
-    },
-    "postseason": {},  # 플레이-인/플레이오프 시뮬레이션 결과 캐시
-    "league": {
-        "season_year": None,
-        "season_start": None,  # YYYY-MM-DD
-        "current_date": None,  # 마지막으로 리그를 진행한 인게임 날짜
-        "master_schedule": {
-            "games": [],   # 전체 리그 경기 리스트
-            "by_team": {},  # team_id -> [game_id, ...]
-            "by_date": {},  # date_str -> [game_id, ...]
-        },
-        "trade_rules": {
-            "hard_cap": HARD_CAP,
-            "trade_deadline": None,  # YYYY-MM-DD
-        },
-        "last_gm_tick_date": None,  # 마지막 AI GM 트레이드 시도 날짜
-    },
-    "teams": {},      # 팀 성향 / 메타 정보
-    "players": {},    # 선수 메타 정보
-    "transactions": [],  # 트레이드 등 기록
-}
+        "teams": {},      # 팀 성향 / 메타 정보
+        "players": {},    # 선수 메타 정보
+        "transactions": [],  # 트레이드 등 기록
+    }
+
+
+GAME_STATE: Dict[str, Any] = _new_game_state()
 
 
 def get_current_date() -> Optional[str]:
@@ -90,6 +100,7 @@ def set_current_date(date_str: Optional[str]) -> None:
         GAME_STATE.pop("current_date", None)
     else:
         GAME_STATE["current_date"] = date_str
+    record_event("set_date", {"date": date_str}, date_str)
 
 
 def _ensure_schedule_team(team_id: str) -> Dict[str, Any]:
@@ -118,10 +129,31 @@ def _ensure_league_state() -> Dict[str, Any]:
     league.setdefault("season_start", None)
     league.setdefault("current_date", None)
     league.setdefault("last_gm_tick_date", None)
+    league.setdefault("master_seed", None)
     return league
 
 
-def _build_master_schedule(season_year: int) -> None:
+def get_league_master_seed() -> int:
+    """리그 마스터 seed. 없으면 새로 만들어 저장한다.
+
+    경기별 / 트레이드 틱별 / 스케줄 생성용 RNG 는 모두 이 값에서
+    seed_util.derive_seed(...) 로 파생된다.
+    """
+    league = _ensure_league_state()
+    if league.get("master_seed") is None:
+        league["master_seed"] = new_master_seed()
+        record_event("master_seed", {"seed": league["master_seed"]})
+    return int(league["master_seed"])
+
+
+def set_league_master_seed(seed: int) -> None:
+    """리그 마스터 seed 를 지정한다 (재현 가능한 시즌용). 스케줄 생성 전에 호출한다."""
+    league = _ensure_league_state()
+    league["master_seed"] = int(seed)
+    record_event("master_seed", {"seed": int(seed)})
+
+
+def _build_master_schedule(season_year: int, rng: Optional[random.Random] = None) -> None:
     """30개 팀 전체에 대한 마스터 스케줄(정규시즌)을 생성한다.
 
     - 실제 NBA 규칙을 근사하여 **항상 1230경기, 팀당 82경기**가 되도록
@@ -130,17 +162,20 @@ def _build_master_schedule(season_year: int) -> None:
     - 같은 컨퍼런스 다른 디비전: 한 팀당 6개 팀과는 4경기, 4개 팀과는 3경기
       (규칙적인 회전 매핑으로 결정)
     - 다른 컨퍼런스: 2경기
-    - 홈/원정은 누적 홈 경기 수를 고려해 최대한 41/41에 가깝게 분배한다.
-    - 시즌 기간(SEASON_LENGTH_DAYS) 동안 날짜를 랜덤 배정하되
+    - 홈/원정은 팀마다 41/41 (홀수 경기 쌍은 오일러 방향 지정으로 분배)
+    - 시즌 기간(SEASON_LENGTH_DAYS) 동안 하루 단위 매칭으로 날짜를 배정한다.
       * 하루 최대 MAX_GAMES_PER_DAY 경기
-      * 한 팀은 하루에 최대 1경기
+      * 한 팀은 하루에 최대 1경기 (더블부킹 없음)
+      * 3연전 금지, 백투백 횟수 제한, 어제 경기한 팀은 가능하면 쉬게 함
+      (자세한 내용은 schedule_builder.build_season_schedule)
+    - rng 를 주지 않으면 리그 마스터 seed 에서 파생한 스트림을 쓴다.
     """
-    league = _ensure_league_state()
+    if rng is None:
+        rng = derive_rng(get_league_master_seed(), "schedule", season_year)
 
-    season_start = date(season_year, SEASON_START_MONTH, SEASON_START_DAY)
     teams = list(ALL_TEAM_IDS)
 
-    # 팀별 컨퍼런스/디비전 정보 캐시
+    # 팀별 컨퍼런스/디비전 정보
     team_info: Dict[str, Dict[str, Optional[str]]] = {}
     for tid in teams:
         info = TEAM_TO_CONF_DIV.get(tid, {"conference": None, "division": None})
@@ -149,140 +184,44 @@ def _build_master_schedule(season_year: int) -> None:
             "division": info.get("division"),
         }
 
-    # 컨퍼런스 내 다른 디비전 4경기 매칭을 결정하는 헬퍼 (5x5 회전 매핑)
-    def _four_game_pairs_for_conf(conf_name: str) -> set[tuple[str, str]]:
-        pairs: set[tuple[str, str]] = set()
-        conf_divs = DIVISIONS.get(conf_name, {})
-        div_list = list(conf_divs.values())
-        if len(div_list) < 2:
-            return pairs
-
-        for i in range(len(div_list)):
-            for j in range(i + 1, len(div_list)):
-                a_div = div_list[i]
-                b_div = div_list[j]
-                if not a_div or not b_div:
-                    continue
-                for idx, a_team in enumerate(a_div):
-                    for delta in range(3):  # 각 팀이 상대 디비전 팀 3명에게 4경기 배정
-                        b_team = b_div[(idx + delta) % len(b_div)]
-                        pair = tuple(sorted((a_team, b_team)))
-                        pairs.add(pair)
-        return pairs
-
-    four_game_pairs_east = _four_game_pairs_for_conf("East")
-    four_game_pairs_west = _four_game_pairs_for_conf("West")
-    four_game_pairs = four_game_pairs_east | four_game_pairs_west
-
-    # 1) 팀 쌍별로 경기 수 결정 + 홈/원정 분배
-    pair_games: List[Dict[str, Any]] = []
-    home_counts: Dict[str, int] = {tid: 0 for tid in teams}
-
-    for i in range(len(teams)):
-        for j in range(i + 1, len(teams)):
-            t1 = teams[i]
-            t2 = teams[j]
-            info1 = team_info[t1]
-            info2 = team_info[t2]
-
-            conf1, div1 = info1["conference"], info1["division"]
-            conf2, div2 = info2["conference"], info2["division"]
-
-            if conf1 is None or conf2 is None:
-                num_games = 2
-            elif conf1 != conf2:
-                num_games = 2  # 다른 컨퍼런스는 2경기 고정
-            elif div1 == div2:
-                num_games = 4  # 같은 디비전
-            else:
-                # 같은 컨퍼런스 다른 디비전
-                pair_key = tuple(sorted((t1, t2)))
-                num_games = 4 if pair_key in four_game_pairs else 3
-
-            # 홈/원정 분배 (3경기일 때는 현재 홈 수가 적은 팀에 추가 배정)
-            home_for_t1 = num_games // 2
-            home_for_t2 = num_games // 2
-            if num_games % 2 == 1:
-                if home_counts[t1] <= home_counts[t2]:
-                    home_for_t1 += 1
-                else:
-                    home_for_t2 += 1
-
-            for _ in range(home_for_t1):
-                pair_games.append({
-                    "home_team_id": t1,
-                    "away_team_id": t2,
-                })
-            for _ in range(home_for_t2):
-                pair_games.append({
-                    "home_team_id": t2,
-                    "away_team_id": t1,
-                })
-
-            home_counts[t1] += home_for_t1
-            home_counts[t2] += home_for_t2
-
-    # 2) 날짜 배정
-    random.shuffle(pair_games)
+    # 1) 팀 쌍별 경기 수 / 홈·원정 결정 + 2) 날짜 배정
+    season_games = build_season_schedule(
+        teams,
+        team_info,
+        DIVISIONS,
+        n_days=SEASON_LENGTH_DAYS,
+        max_per_day=MAX_GAMES_PER_DAY,
+        rng=rng,
+    )
+    _install_master_schedule(season_year, season_games)
+
+
+def _install_master_schedule(season_year: int, season_games: List[Tuple[int, str, str]]) -> None:
+    """(day_index, home_id, away_id) 리스트로 마스터 스케줄과 시즌 정보를 세팅한다.
+
+    이벤트 로그에는 생성된 경기 리스트를 그대로 남긴다 (재생 시 스케줄 생성기를 다시 돌리지 않는다).
+    새 스케줄은 새 타임라인이므로 이전 리그의 경기 기록 (game_store) 도 비운다.
+    """
+    league = _ensure_league_state()
+    get_game_store().clear()
+    season_start = date(season_year, SEASON_START_MONTH, SEASON_START_DAY)
+    teams = list(ALL_TEAM_IDS)
 
     by_date: Dict[str, List[str]] = {}
-    teams_per_date: Dict[str, set] = {}
     scheduled_games: List[Dict[str, Any]] = []
-
-    for game in pair_games:
-        home_id = game["home_team_id"]
-        away_id = game["away_team_id"]
-
-        assigned = False
-        for _ in range(100):
-            day_index = random.randint(0, SEASON_LENGTH_DAYS - 1)
-            game_date = season_start + timedelta(days=day_index)
-            date_str = game_date.isoformat()
-
-            teams_today = teams_per_date.setdefault(date_str, set())
-            games_today = by_date.setdefault(date_str, [])
-
-            if len(games_today) >= MAX_GAMES_PER_DAY:
-                continue
-            if home_id in teams_today or away_id in teams_today:
-                continue
-
-            teams_today.add(home_id)
-            teams_today.add(away_id)
-
-            game_id = f"{date_str}_{home_id}_{away_id}"
-            scheduled_games.append({
-                "game_id": game_id,
-                "date": date_str,
-                "home_team_id": home_id,
-                "away_team_id": away_id,
-                "status": "scheduled",
-                "home_score": None,
-                "away_score": None,
-            })
-            games_today.append(game_id)
-            assigned = True
-            break
-
-        if not assigned:
-            day_index = random.randint(0, SEASON_LENGTH_DAYS - 1)
-            game_date = season_start + timedelta(days=day_index)
-            date_str = game_date.isoformat()
-            teams_today = teams_per_date.setdefault(date_str, set())
-            games_today = by_date.setdefault(date_str, [])
-            teams_today.add(home_id)
-            teams_today.add(away_id)
-            game_id = f"{date_str}_{home_id}_{away_id}"
-            scheduled_games.append({
-                "game_id": game_id,
-                "date": date_str,
-                "home_team_id": home_id,
-                "away_team_id": away_id,
-                "status": "scheduled",
-                "home_score": None,
-                "away_score": None,
-            })
-            games_today.append(game_id)
+    for day_index, home_id, away_id in season_games:
+        date_str = (season_start + timedelta(days=day_index)).isoformat()
+        game_id = f"{date_str}_{home_id}_{away_id}"
+        scheduled_games.append({
+            "game_id": game_id,
+            "date": date_str,
+            "home_team_id": home_id,
+            "away_team_id": away_id,
+            "status": "scheduled",
+            "home_score": None,
+            "away_score": None,
+        })
+        by_date.setdefault(date_str, []).append(game_id)
 
     # 3) by_team 인덱스 생성
     by_team: Dict[str, List[str]] = {tid: [] for tid in teams}
@@ -292,6 +231,7 @@ def _build_master_schedule(season_year: int) -> None:
 
     master_schedule = league["master_schedule"]
     master_schedule["games"] = scheduled_games
+    _rebuild_game_index(scheduled_games)
     master_schedule["by_team"] = by_team
     master_schedule["by_date"] = by_date
 
@@ -301,6 +241,7 @@ def _build_master_schedule(season_year: int) -> None:
     league["trade_rules"]["trade_deadline"] = trade_deadline_date.isoformat()
     set_current_date(None)
     league["last_gm_tick_date"] = None
+    record_event("schedule", {"season_year": season_year, "games": [list(g) for g in season_games]})
 
 
 def initialize_master_schedule_if_needed() -> None:
@@ -315,6 +256,102 @@ def initialize_master_schedule_if_needed() -> None:
     _build_master_schedule(season_year)
 
 
+# game_id -> master_schedule 경기 엔트리 (games 리스트가 교체되거나 길이가 바뀌면 다시 만든다)
+_GAME_INDEX: Dict[str, Dict[str, Any]] = {}
+_GAME_INDEX_SOURCE: Optional[List[Dict[str, Any]]] = None
+_GAME_INDEX_LEN = 0
+
+
+def _rebuild_game_index(games: List[Dict[str, Any]]) -> None:
+    global _GAME_INDEX, _GAME_INDEX_SOURCE, _GAME_INDEX_LEN
+    _GAME_INDEX = {}
+    for g in games:
+        # 중복 game_id 가 있으면 선형 탐색과 같게 앞쪽 엔트리를 쓴다.
+        _GAME_INDEX.setdefault(g.get("game_id"), g)
+    _GAME_INDEX_SOURCE = games
+    _GAME_INDEX_LEN = len(games)
+
+
+def _get_master_schedule_game(game_id: str) -> Optional[Dict[str, Any]]:
+    """master_schedule 에서 game_id 에 해당하는 경기 엔트리를 O(1)로 찾는다."""
+    league = GAME_STATE.get("league")
+    if not league:
+        return None
+    games = (league.get("master_schedule") or {}).get("games") or []
+
+    if games is not _GAME_INDEX_SOURCE or len(games) != _GAME_INDEX_LEN:
+        _rebuild_game_index(games)
+    g = _GAME_INDEX.get(game_id)
+    if g is not None and g.get("game_id") != game_id:
+        # 엔트리가 바깥에서 수정된 경우
+        _rebuild_game_index(games)
+        g = _GAME_INDEX.get(game_id)
+    return g
+
+
+# 팀별 승/패/득실점 (master_schedule 의 final 경기 기준)
+# 경기가 확정될 때마다 증분 갱신하고, games 리스트가 교체되면 다시 집계한다.
+_TEAM_RECORDS: Dict[str, Dict[str, int]] = {}
+_TEAM_RECORDS_SOURCE: Optional[List[Dict[str, Any]]] = None
+_TEAM_RECORDS_LEN = 0
+_TEAM_RECORDS_VERSION = 0
+
+
+def _apply_game_to_records(records: Dict[str, Dict[str, int]], g: Dict[str, Any], sign: int) -> None:
+    if g.get("status") != "final":
+        return
+    home_id = g.get("home_team_id")
+    away_id = g.get("away_team_id")
+    home_score = g.get("home_score")
+    away_score = g.get("away_score")
+    if home_id not in records or away_id not in records:
+        return
+    if home_score is None or away_score is None:
+        return
+
+    records[home_id]["pf"] += sign * home_score
+    records[home_id]["pa"] += sign * away_score
+    records[away_id]["pf"] += sign * away_score
+    records[away_id]["pa"] += sign * home_score
+
+    if home_score > away_score:
+        records[home_id]["wins"] += sign
+        records[away_id]["losses"] += sign
+    elif away_score > home_score:
+        records[away_id]["wins"] += sign
+        records[home_id]["losses"] += sign
+
+
+def _master_schedule_games() -> List[Dict[str, Any]]:
+    league = GAME_STATE.get("league") or {}
+    return (league.get("master_schedule") or {}).get("games") or []
+
+
+def _ensure_team_records() -> Dict[str, Dict[str, int]]:
+    global _TEAM_RECORDS, _TEAM_RECORDS_SOURCE, _TEAM_RECORDS_LEN, _TEAM_RECORDS_VERSION
+    games = _master_schedule_games()
+    if games is not _TEAM_RECORDS_SOURCE or len(games) != _TEAM_RECORDS_LEN:
+        records = {tid: {"wins": 0, "losses": 0, "pf": 0, "pa": 0} for tid in ALL_TEAM_IDS}
+        for g in games:
+            _apply_game_to_records(records, g, 1)
+        _TEAM_RECORDS = records
+        _TEAM_RECORDS_SOURCE = games
+        _TEAM_RECORDS_LEN = len(games)
+        _TEAM_RECORDS_VERSION += 1
+    return _TEAM_RECORDS
+
+
+def get_team_records() -> Dict[str, Dict[str, int]]:
+    """팀별 {"wins","losses","pf","pa"} 복사본 (O(팀 수))."""
+    return {tid: dict(rec) for tid, rec in _ensure_team_records().items()}
+
+
+def get_team_records_version() -> int:
+    """팀 성적이 바뀔 때마다 증가하는 버전 (뷰 캐싱용)."""
+    _ensure_team_records()
+    return _TEAM_RECORDS_VERSION
+
+
 def _mark_master_schedule_game_final(
     game_id: str,
     game_date_str: str,
@@ -323,20 +360,20 @@ def _mark_master_schedule_game_final(
     home_score: int,
     away_score: int,
 ) -> None:
-    """마스터 스케줄에 동일한 game_id가 있으면 결과를 반영한다."""
-    league = GAME_STATE.get("league")
-    if not league:
+    """마스터 스케줄에 동일한 game_id가 있으면 결과를 반영한다 (팀 성적도 증분 갱신)."""
+    global _TEAM_RECORDS_VERSION
+    g = _get_master_schedule_game(game_id)
+    if g is None:
         return
-    master_schedule = (league.get("master_schedule") or {})
-    games = master_schedule.get("games") or []
 
-    for g in games:
-        if g.get("game_id") == game_id:
-            g["status"] = "final"
-            g["date"] = game_date_str
-            g["home_score"] = home_score
-            g["away_score"] = away_score
-            return
+    records = _ensure_team_records()
+    _apply_game_to_records(records, g, -1)  # 이미 final 이었다면 이전 결과를 뺀다
+    g["status"] = "final"
+    g["date"] = game_date_str
+    g["home_score"] = home_score
+    g["away_score"] = away_score
+    _apply_game_to_records(records, g, 1)
+    _TEAM_RECORDS_VERSION += 1
 
 
 # -------------------------------------------------------------------------
@@ -353,6 +390,8 @@ def update_state_with_game(
 
     - game_date 가 주어지면 그 값을 사용, 없으면 서버 기준 오늘 날짜 사용.
     - boxscore 가 주어지면 시즌 누적 player_stats 에 반영한다.
+    - 경기와 박스스코어는 game_store 버퍼에도 기록한다 (flush 는 호출자가 하루 / 경기 단위로).
+    - 이벤트 로그가 열려 있으면 "game" 이벤트로 남긴다.
     """
     game_date_str = str(game_date) if game_date else date.today().isoformat()
     game_id = f"{game_date_str}_{home_id}_{away_id}"
@@ -379,6 +418,7 @@ def update_state_with_game(
 
     if boxscore:
         _update_player_stats_from_boxscore(boxscore)
+    get_game_store().record_game(game_obj, boxscore)
 
     # scores 캐시 업데이트 (가장 최근 일자 기준)
     scores_view = GAME_STATE["cached_views"]["scores"]
@@ -414,93 +454,28 @@ def update_state_with_game(
         away_score=away_score,
     )
 
+    # 상태 반영이 끝난 뒤에 기록한다 (기록 중 체크포인트가 찍힐 수 있으므로)
+    record_event(
+        "game",
+        {"home_id": home_id, "away_id": away_id, "score": score, "boxscore": boxscore, "game_date": game_date_str},
+        game_date_str,
+    )
     return game_obj
 
 
 def _update_player_stats_from_boxscore(boxscore: Dict[str, List[Dict[str, Any]]]) -> None:
-    """박스스코어를 시즌 누적 player_stats에 반영한다."""
+    """박스스코어를 시즌 누적 player_stats (StatAggregator, 14개 박스 스탯 전부) 에 반영한다."""
     if not boxscore:
         return
-
-    season_stats = GAME_STATE.setdefault("player_stats", {})
-    track_stats = ["PTS", "AST", "REB", "3PM"]
-
-    for team_rows in boxscore.values():
-        if not isinstance(team_rows, list):
-            continue
-        for row in team_rows:
-            if not isinstance(row, dict):
-                continue
-            player_id = row.get("PlayerID")
-            if player_id is None:
-                continue
-            stat_entry = season_stats.setdefault(
-                player_id,
-                {
-                    "player_id": player_id,
-                    "name": row.get("Name"),
-                    "team_id": row.get("Team"),
-                    "games": 0,
-                    "totals": {s: 0.0 for s in track_stats},
-                },
-            )
-
-            stat_entry["name"] = row.get("Name", stat_entry.get("name"))
-            stat_entry["team_id"] = row.get("Team", stat_entry.get("team_id"))
-            stat_entry["games"] = stat_entry.get("games", 0) + 1
-
-            totals = stat_entry.setdefault("totals", {s: 0.0 for s in track_stats})
-            for stat_name in track_stats:
-                try:
-                    totals[stat_name] = float(totals.get(stat_name, 0.0)) + float(
-                        row.get(stat_name, 0) or 0
-                    )
-                except (TypeError, ValueError):
-                    continue
-
+    ensure_aggregator(GAME_STATE, "player_stats").add_boxscore(boxscore)
 
 
 def _update_playoff_player_stats_from_boxscore(boxscore: Dict[str, List[Dict[str, Any]]]) -> None:
-    """박스스코어를 포스트시즌 누적 player_stats에 반영한다."""
+    """박스스코어를 포스트시즌 누적 player_stats 에 반영한다."""
     if not boxscore:
         return
-
     postseason = GAME_STATE.setdefault("postseason", {})
-    playoff_stats = postseason.setdefault("playoff_player_stats", {})
-    track_stats = ["PTS", "AST", "REB", "3PM"]
-
-    for team_rows in boxscore.values():
-        if not isinstance(team_rows, list):
-            continue
-        for row in team_rows:
-            if not isinstance(row, dict):
-                continue
-            player_id = row.get("PlayerID")
-            if player_id is None:
-                continue
-            stat_entry = playoff_stats.setdefault(
-                player_id,
-                {
-                    "player_id": player_id,
-                    "name": row.get("Name"),
-                    "team_id": row.get("Team"),
-                    "games": 0,
-                    "totals": {s: 0.0 for s in track_stats},
-                },
-            )
-
-            stat_entry["name"] = row.get("Name", stat_entry.get("name"))
-            stat_entry["team_id"] = row.get("Team", stat_entry.get("team_id"))
-            stat_entry["games"] = stat_entry.get("games", 0) + 1
-
-            totals = stat_entry.setdefault("totals", {s: 0.0 for s in track_stats})
-            for stat_name in track_stats:
-                try:
-                    totals[stat_name] = float(totals.get(stat_name, 0.0)) + float(
-                        row.get(stat_name, 0) or 0
-                    )
-                except (TypeError, ValueError):
-                    continue
+    ensure_aggregator(postseason, "playoff_player_stats").add_boxscore(boxscore)
 
 
 def get_schedule_summary() -> Dict[str, Any]:
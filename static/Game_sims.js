@@ -3,11 +3,19 @@
 // - /api/team-schedule
 // - /api/advance-league
 // - /api/simulate-game
+// - /api/live-games (SSE 로 경기 이벤트를 받아 진행 상황 표시, 미지원 시 /api/simulate-game)
 //
 // 전역으로 존재하는 것들에 의존함:
 //   appState, TEAMS, seasonDateLabel, progressLabel,
 //   homeLog, homeLLMOutput, renderAllTabs, renderSidebarRecentGames, callSubLLMStateUpdate
 
+// 라이브 경기 페이싱 (초 / 포제션, 0 이면 대기 없이 바로)
+const LIVE_GAME_PACE = 0.02;
+const LIVE_GAME_EVENT_TYPES = [
+  "game_start", "turnover", "shot", "assist", "foul", "free_throws",
+  "rebound", "box_score", "quarter_end", "game_end", "game_error"
+];
+
 // 다음에 치를 경기 찾기 (아직 점수가 없는 첫 경기)
 function getNextScheduledGame() {
   const schedule = appState.cachedViews.schedule;
@@ -103,6 +111,60 @@ function buildTacticsForTeam(teamId, fatigueFactor) {
     fatigue_factor: fatigueFactor
   };
 }
+
+// 라이브 경기 진행 표시 (홈 화면 LLM 박스 재사용)
+function renderLiveGameProgress(event, homeTeam, awayTeam) {
+  if (typeof homeLLMOutput === "undefined" || !homeLLMOutput || !event.score) return;
+  const hs = event.score[homeTeam.id] ?? 0;
+  const as = event.score[awayTeam.id] ?? 0;
+  const clock = event.quarter ? `${event.quarter}Q ${event.clock || "00:00"} · ` : "";
+  const label = event.type === "game_end" ? "경기 종료 · " : clock;
+  homeLLMOutput.textContent = `${label}${homeTeam.name} ${hs} : ${as} ${awayTeam.name}`;
+}
+
+// /api/live-games 로 경기를 시작하고 SSE 이벤트를 따라가며 최종 결과를 반환한다.
+// EventSource 를 쓸 수 없으면 null (호출자가 /api/simulate-game 으로 대신 진행)
+async function runLiveGame(body, onEvent) {
+  if (typeof EventSource === "undefined") return null;
+
+  const res = await fetch("/api/live-games", {
+    method: "POST",
+    headers: { "Content-Type": "application/json" },
+    body: JSON.stringify(body)
+  });
+  if (!res.ok) {
+    throw new Error(await res.text());
+  }
+  const live = await res.json();
+  const pace = appState.liveGamePace ?? LIVE_GAME_PACE;
+
+  return new Promise((resolve, reject) => {
+    // 연결이 끊기면 EventSource 가 Last-Event-ID 로 자동 재연결한다.
+    const source = new EventSource(`${live.stream_url}?pace=${pace}`);
+
+    LIVE_GAME_EVENT_TYPES.forEach(type => {
+      source.addEventListener(type, msg => {
+        const event = JSON.parse(msg.data);
+        if (type === "game_error") {
+          source.close();
+          reject(new Error(event.detail || "live game failed"));
+          return;
+        }
+        if (typeof onEvent === "function") onEvent(event);
+        if (type === "game_end") {
+          source.close();
+          resolve(event.result);
+        }
+      });
+    });
+
+    source.onerror = () => {
+      if (source.readyState === EventSource.CLOSED) {
+        reject(new Error("live game stream closed"));
+      }
+    };
+  });
+}
 
 // 시즌 스케줄을 서버에서 받아오기 (신버전: /api/team-schedule/{teamId})
 async function generateSeasonSchedule(teamId) {
@@ -356,30 +418,43 @@ async function simulateGameProgress() {
   const homeFatigue = isUserHome ? fatigueFactor : 1.0;
   const awayFatigue = !isUserHome ? fatigueFactor : 1.0;
 
-  // 🔹 3) 우리 팀 경기 시뮬레이션 (/api/simulate-game)
+  // 🔹 3) 우리 팀 경기 시뮬레이션 (/api/live-games, 미지원 시 /api/simulate-game)
   try {
     const homeTactics = buildTacticsForTeam(homeTeam.id, homeFatigue);
     const awayTactics = buildTacticsForTeam(awayTeam.id, awayFatigue);
+    const gameRequest = {
+      home_team_id: homeTeam.id,
+      away_team_id: awayTeam.id,
+      home_tactics: homeTactics,
+      away_tactics: awayTactics,
+      game_date: gameDate
+    };
 
-    const res = await fetch("/api/simulate-game", {
-      method: "POST",
-      headers: { "Content-Type": "application/json" },
-      body: JSON.stringify({
-        home_team_id: homeTeam.id,
-        away_team_id: awayTeam.id,
-        home_tactics: homeTactics,
-        away_tactics: awayTactics,
-        game_date: gameDate
-      })
-    });
-
-    if (!res.ok) {
-      const msg = await res.text();
-      alert("매치 엔진 호출 실패: " + msg);
+    let data = null;
+    try {
+      data = await runLiveGame(gameRequest, event =>
+        renderLiveGameProgress(event, homeTeam, awayTeam)
+      );
+    } catch (e) {
+      alert("매치 엔진 호출 실패: " + e.message);
       return false;
     }
 
-    const data = await res.json();
+    if (!data) {
+      const res = await fetch("/api/simulate-game", {
+        method: "POST",
+        headers: { "Content-Type": "application/json" },
+        body: JSON.stringify(gameRequest)
+      });
+
+      if (!res.ok) {
+        const msg = await res.text();
+        alert("매치 엔진 호출 실패: " + msg);
+        return false;
+      }
+
+      data = await res.json();
+    }
     const finalScore = data.final_score || {};
     const homeScore = finalScore[homeTeam.id] ?? 0;
     const awayScore = finalScore[awayTeam.id] ?? 0;
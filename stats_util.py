@@ -1,81 +1,56 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Sequence
 
+from stat_aggregator import ensure_aggregator
 from state import GAME_STATE
 
 
 TRACKED_STATS = ["PTS", "AST", "REB", "3PM"]
 
 
-def compute_league_leaders() -> Dict[str, List[Dict[str, Any]]]:
-    """player_stats 기반으로 per game 리그 리더 상위 5명을 계산한다."""
-    season_stats = GAME_STATE.get("player_stats") or {}
-    leaders: Dict[str, List[Dict[str, Any]]] = {s: [] for s in TRACKED_STATS}
+def _leaders(
+    container: Dict[str, Any],
+    key: str,
+    limit: int,
+    min_games: int,
+    stats: Optional[Sequence[str]],
+) -> Dict[str, List[Dict[str, Any]]]:
+    """container[key] 누적 스탯의 스탯별 경기당 상위 limit 명 (증분 유지되는 순위표에서 읽는다)."""
+    agg = ensure_aggregator(container, key)
+    leaders: Dict[str, List[Dict[str, Any]]] = {}
+    for stat_name in stats or TRACKED_STATS:
+        rows = agg.leaders(stat_name, k=limit, min_games=min_games)
+        for row in rows:
+            row["GP"] = row["games"]
+            row[stat_name] = row["per_game"]
+        leaders[stat_name] = rows
+    return leaders
 
-    for stat_name in TRACKED_STATS:
-        rows: List[Dict[str, Any]] = []
-        for entry in season_stats.values():
-            games = entry.get("games", 0) or 0
-            if games <= 0:
-                continue
-            totals = entry.get("totals", {}) or {}
-            try:
-                per_game = float(totals.get(stat_name, 0.0)) / games
-            except (TypeError, ValueError, ZeroDivisionError):
-                per_game = 0.0
-            rows.append(
-                {
-                    "player_id": entry.get("player_id"),
-                    "name": entry.get("name"),
-                    "team_id": entry.get("team_id"),
-                    "games": games,
-                    "GP": games,
-                    "per_game": per_game,
-                    stat_name: per_game,
-                }
-            )
 
-        rows_sorted = sorted(rows, key=lambda r: r.get("per_game", 0), reverse=True)
-        leaders[stat_name] = rows_sorted[:5]
+def compute_league_leaders(
+    limit: int = 5,
+    min_games: int = 0,
+    stats: Optional[Sequence[str]] = None,
+) -> Dict[str, List[Dict[str, Any]]]:
+    """player_stats 기반으로 per game 리그 리더 상위 limit 명을 계산한다.
 
+    min_games 경기 미만 출전 선수는 제외한다. 잘못된 스탯 / 인자는 ValueError.
+    """
+    leaders = _leaders(GAME_STATE, "player_stats", limit, min_games, stats)
     GAME_STATE.setdefault("cached_views", {}).setdefault("stats", {})[
         "leaders"
     ] = leaders
     return leaders
 
 
-def compute_playoff_league_leaders() -> Dict[str, List[Dict[str, Any]]]:
+def compute_playoff_league_leaders(
+    limit: int = 5,
+    min_games: int = 0,
+    stats: Optional[Sequence[str]] = None,
+) -> Dict[str, List[Dict[str, Any]]]:
     postseason = GAME_STATE.get("postseason") or {}
-    playoff_stats = postseason.get("playoff_player_stats") or {}
-    leaders: Dict[str, List[Dict[str, Any]]] = {s: [] for s in TRACKED_STATS}
-
-    for stat_name in TRACKED_STATS:
-        rows: List[Dict[str, Any]] = []
-        for entry in playoff_stats.values():
-            games = entry.get("games", 0) or 0
-            if games <= 0:
-                continue
-            totals = entry.get("totals", {}) or {}
-            try:
-                per_game = float(totals.get(stat_name, 0.0)) / games
-            except (TypeError, ValueError, ZeroDivisionError):
-                per_game = 0.0
-            rows.append(
-                {
-                    "player_id": entry.get("player_id"),
-                    "name": entry.get("name"),
-                    "team_id": entry.get("team_id"),
-                    "games": games,
-                    "GP": games,
-                    "per_game": per_game,
-                    stat_name: per_game,
-                }
-            )
-
-        rows_sorted = sorted(rows, key=lambda r: r.get("per_game", 0), reverse=True)
-        leaders[stat_name] = rows_sorted[:5]
-
+    leaders = _leaders(postseason, "playoff_player_stats", limit, min_games, stats)
     GAME_STATE.setdefault("cached_views", {}).setdefault("stats", {})[
         "playoff_leaders"
     ] = leaders
@@ -0,0 +1,256 @@
+from __future__ import annotations
+
+import math
+import random
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from batch_engine import simulate_paired
+from match_engine import Team
+from roster_registry import get_roster_registry
+from seed_util import derive_seed
+from state import get_league_master_seed
+from variance_reduction import estimate, mirrored, pair_means
+
+# NOTE: 탐색 공간은 전술 중 팀 단위 설정(스킴 / 보조 스킴 비중 / 페이스 / 로테이션 인원)이다.
+#       선발 / 벤치 순서 / 출전 시간은 base 전술의 값을 그대로 쓴다.
+
+OFFENSE_SCHEMES = ("pace_space", "five_out_motion", "pnr_heavy", "post_up_focus", "iso_heavy", "drive_kick")
+DEFENSE_SCHEMES = ("drop_coverage", "switch_all", "hedge_recover", "blitz_pnr", "zone_2_3", "full_court_press")
+
+PACE_RANGE = (-2, 2)
+ROTATION_RANGE = (6, 10)
+# 보조 스킴 비중 (주 스킴 비중은 SCHEME_WEIGHT_TOTAL - 보조)
+SECONDARY_WEIGHT_RANGE = (0, 5)
+SCHEME_WEIGHT_TOTAL = 10
+
+DEFAULT_CANDIDATES = 32
+MAX_CANDIDATES = 256
+DEFAULT_GAMES_PER_ROUND = 32   # 첫 라운드 후보당 경기 수 (라운드마다 두 배)
+MAX_GAMES_PER_ROUND = 2048
+DEFAULT_TOP_K = 3
+
+_SEARCH_KEYS = (
+    "pace",
+    "offense_scheme",
+    "offense_secondary_scheme",
+    "offense_primary_weight",
+    "offense_secondary_weight",
+    "defense_scheme",
+    "defense_secondary_scheme",
+    "defense_primary_weight",
+    "defense_secondary_weight",
+    "rotation_size",
+)
+
+Config = Tuple[Any, ...]
+
+
+# -----------------------------
+# 후보 생성
+# -----------------------------
+def _config_of(tactics: Dict[str, Any]) -> Config:
+    return tuple(tactics.get(k) for k in _SEARCH_KEYS)
+
+
+def _scheme_fields(kind: str, primary: str, secondary: str, secondary_weight: int) -> Dict[str, Any]:
+    if secondary == "none" or secondary == primary:
+        secondary, secondary_weight = "none", 0
+    return {
+        f"{kind}_scheme": primary,
+        f"{kind}_secondary_scheme": secondary,
+        f"{kind}_primary_weight": SCHEME_WEIGHT_TOTAL - secondary_weight,
+        f"{kind}_secondary_weight": secondary_weight,
+    }
+
+
+def _random_config(rng: random.Random) -> Config:
+    tactics: Dict[str, Any] = {
+        "pace": rng.randint(*PACE_RANGE),
+        "rotation_size": rng.randint(*ROTATION_RANGE),
+    }
+    for kind, schemes in (("offense", OFFENSE_SCHEMES), ("defense", DEFENSE_SCHEMES)):
+        tactics.update(_scheme_fields(
+            kind,
+            rng.choice(schemes),
+            rng.choice(("none",) + schemes),
+            rng.randint(*SECONDARY_WEIGHT_RANGE),
+        ))
+    return _config_of(tactics)
+
+
+def _neighbours(base: Dict[str, Any]) -> List[Config]:
+    """base 에서 한 항목만 바꾼 설정들 (페이스 / 로테이션 ±1, 주 스킴 교체)."""
+    out: List[Config] = []
+    for key, (lo, hi) in (("pace", PACE_RANGE), ("rotation_size", ROTATION_RANGE)):
+        for step in (-1, 1):
+            value = int(base[key]) + step
+            if lo <= value <= hi:
+                out.append(_config_of({**base, key: value}))
+    for kind, schemes in (("offense", OFFENSE_SCHEMES), ("defense", DEFENSE_SCHEMES)):
+        for scheme in schemes:
+            if scheme != base[f"{kind}_scheme"]:
+                out.append(_config_of({**base, f"{kind}_scheme": scheme}))
+    return out
+
+
+def _candidate_configs(base: Dict[str, Any], n: int, rng: random.Random) -> List[Config]:
+    """첫 번째는 항상 base 설정. 이웃 설정을 섞어 넣고 나머지는 무작위로 채운다."""
+    baseline = _config_of(base)
+    configs = [baseline]
+    seen = {baseline}
+    neighbours = _neighbours(base)
+    rng.shuffle(neighbours)
+    for config in neighbours[: (n - 1) // 2]:
+        if config not in seen:
+            seen.add(config)
+            configs.append(config)
+    # 탐색 공간은 수만 개라 중복은 드물다. 공간이 후보 수보다 작을 일은 없지만 무한 루프는 막는다.
+    for _ in range(n * 20):
+        if len(configs) >= n:
+            break
+        config = _random_config(rng)
+        if config not in seen:
+            seen.add(config)
+            configs.append(config)
+    return configs
+
+
+# -----------------------------
+# 시뮬레이션 (CRN + 안티테틱)
+# -----------------------------
+def _run_round(
+    teams: Sequence[Team], opponent: Team, n_games: int, seed: int, workers: int
+) -> np.ndarray:
+    """후보별 n_games 경기의 점수차 (후보 관점) (후보 수, n_games).
+
+    홈 / 원정을 번갈아 두고 안티테틱 쌍(j, j + n/2)이 같은 홈 / 원정이 되도록 일정을 짠다.
+    """
+    schedule = mirrored([(opponent, True), (opponent, False)], n_games)
+    margin, _ = simulate_paired(teams, schedule, seed, antithetic=True, workers=workers)
+    return margin
+
+
+def _summary(
+    config: Config, rounds: List[np.ndarray], baseline: List[np.ndarray]
+) -> Dict[str, Any]:
+    """라운드별 점수차로 요약. 표준오차는 안티테틱 쌍 평균을 독립 표본으로 본다."""
+    margins = np.concatenate(rounds)
+    own = estimate(np.concatenate([pair_means(r) for r in rounds]))
+    diff = estimate(np.concatenate([pair_means(r - b) for r, b in zip(rounds, baseline)]))
+    return {
+        "tactics": dict(zip(_SEARCH_KEYS, config)),
+        "games": int(len(margins)),
+        "mean_margin": own.mean,
+        "margin_ci95": own.ci95,
+        "win_rate": float((margins > 0).mean()),
+        "vs_baseline": {"mean_margin": diff.mean, "ci95": diff.ci95},
+    }
+
+
+# -----------------------------
+# 공개 API
+# -----------------------------
+def optimize_tactics(
+    team_id: str,
+    opponent_id: str,
+    base_tactics: Optional[Dict[str, Any]] = None,
+    opponent_tactics: Optional[Dict[str, Any]] = None,
+    n_candidates: int = DEFAULT_CANDIDATES,
+    games_per_round: int = DEFAULT_GAMES_PER_ROUND,
+    top_k: int = DEFAULT_TOP_K,
+    workers: int = 1,
+) -> Dict[str, Any]:
+    """team 의 전술을 opponent 상대로 탐색해 점수차 기대값이 큰 설정 top_k 개를 돌려준다.
+
+    - 후보: base 전술(기준선) + base 의 이웃 설정 + 무작위 설정.
+    - successive halving: 라운드마다 살아남은 후보가 같은 seed 로 경기를 (홈 / 원정 절반씩)
+      추가로 치르고, 누적 평균 점수차 상위 절반만 남는다. 라운드 경기 수는 games_per_round 에서
+      시작해 라운드마다 두 배. 후보가 top_k 개 이하로 줄어든 라운드까지 돌린다.
+    - 같은 라운드의 후보들은 common random numbers 를 쓰고, 기준선은 탈락과 무관하게
+      매 라운드 함께 돌므로 vs_baseline 은 짝지은 차이의 평균 / 신뢰구간이다.
+      라운드 안의 경기는 안티테틱 쌍으로 돌리고 신뢰구간은 쌍 평균 기준이다.
+    - 탐색 점수는 후보를 고른 표본 그대로라 낙관적이므로, 최종 top_k 후보와 기준선은 따로 뗀 seed 로
+      (마지막 라운드 경기 수의 두 배만큼) 다시 돌리고 best / baseline 의 점수차 / 신뢰구간과 순위는
+      그 재평가 결과로 보고한다. 탐색 점수는 best 의 search_mean_margin 으로 남긴다.
+    - seed 는 (마스터 seed, 두 팀) 으로 정해진다. GAME_STATE 는 바꾸지 않는다.
+
+    팀을 찾을 수 없거나 인자가 범위를 벗어나면 ValueError를 발생시킨다.
+    """
+    if not 2 <= n_candidates <= MAX_CANDIDATES:
+        raise ValueError(f"n_candidates must be between 2 and {MAX_CANDIDATES}")
+    if not 4 <= games_per_round <= MAX_GAMES_PER_ROUND or games_per_round % 4:
+        raise ValueError(f"games_per_round must be a multiple of 4 between 4 and {MAX_GAMES_PER_ROUND}")
+    if not 1 <= top_k <= n_candidates:
+        raise ValueError(f"invalid top_k: {top_k}")
+    if workers < 1:
+        raise ValueError(f"invalid workers: {workers}")
+
+    team_upper = team_id.upper()
+    opponent_upper = opponent_id.upper()
+    registry = get_roster_registry()
+    for tid in (team_upper, opponent_upper):
+        if not registry.has_team(tid):
+            raise ValueError(f"Team '{tid}' not found in roster excel")
+    if team_upper == opponent_upper:
+        raise ValueError("team and opponent must differ")
+
+    base = registry.build_team(team_upper, tactics=base_tactics or {}).tactics
+    opponent = registry.build_team(opponent_upper, tactics=opponent_tactics or {})
+
+    seed = derive_seed(get_league_master_seed(), "tactics_opt", team_upper, opponent_upper)
+    configs = _candidate_configs(base, n_candidates, random.Random(derive_seed(seed, "candidates")))
+    teams = [
+        registry.build_team(team_upper, tactics={**base, **dict(zip(_SEARCH_KEYS, config))})
+        for config in configs
+    ]
+
+    margins: List[List[np.ndarray]] = [[] for _ in configs]
+    survivors = list(range(len(configs)))
+    rounds: List[Dict[str, int]] = []
+    n_games = games_per_round
+    while True:
+        # 기준선(0번)은 탈락해도 계속 돌린다
+        active = survivors if 0 in survivors else [0] + survivors
+        result = _run_round(
+            [teams[i] for i in active], opponent, n_games, derive_seed(seed, "round", len(rounds)), workers
+        )
+        for i, row in zip(active, result):
+            margins[i].append(row)
+        rounds.append({"candidates": len(survivors), "games_per_candidate": n_games})
+        if len(survivors) <= top_k:
+            break
+
+        means = {i: float(np.concatenate(margins[i]).mean()) for i in survivors}
+        survivors.sort(key=lambda i: -means[i])
+        survivors = survivors[: max(top_k, math.ceil(len(survivors) / 2))]
+        n_games *= 2
+
+    search_means = {i: float(np.concatenate(margins[i]).mean()) for i in survivors}
+    finalists = sorted(survivors, key=lambda i: -search_means[i])[:top_k]
+
+    # 탐색 점수는 같은 표본으로 고른 최댓값이라 낙관적이다: 최종 후보와 기준선을
+    # 따로 뗀 seed 로 다시 돌려 그 결과로 순위 / 점수차 / 신뢰구간을 보고한다.
+    validation_games = n_games * 2
+    validate = [0] + [i for i in finalists if i != 0]
+    validation = dict(zip(validate, _run_round(
+        [teams[i] for i in validate], opponent, validation_games, derive_seed(seed, "validate"), workers
+    )))
+    ranked = sorted(finalists, key=lambda i: -float(validation[i].mean()))
+
+    best = []
+    for i in ranked:
+        entry = _summary(configs[i], [validation[i]], [validation[0]])
+        entry["search_mean_margin"] = search_means[i]
+        best.append(entry)
+
+    return {
+        "team_id": team_upper,
+        "opponent_id": opponent_upper,
+        "baseline": _summary(configs[0], [validation[0]], [validation[0]]),
+        "best": best,
+        "rounds": rounds,
+        "validation_games": validation_games,
+        "total_games": int(sum(len(row) for rows in margins for row in rows) + validation_games * len(validate)),
+    }
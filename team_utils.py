@@ -6,7 +6,7 @@ from typing import Any, Dict, List
 import pandas as pd
 
 from config import HARD_CAP, ROSTER_DF, ALL_TEAM_IDS, TEAM_TO_CONF_DIV
-from state import GAME_STATE, _ensure_league_state, initialize_master_schedule_if_needed
+from state import GAME_STATE, get_team_records, initialize_master_schedule_if_needed
 
 
 def _init_players_and_teams_if_needed() -> None:
@@ -100,42 +100,10 @@ def _compute_team_records() -> Dict[str, Dict[str, Any]]:
     """master_schedule.games를 기준으로 각 팀의 승/패/득실점 계산.
 
     반환: {team_id: {"wins":..,"losses":..,"pf":..,"pa":..}}
+    (state 에서 경기 확정 시 증분 갱신하는 집계를 복사해 돌려준다)
     """
     initialize_master_schedule_if_needed()
-    league = _ensure_league_state()
-    master_schedule = league["master_schedule"]
-    games = master_schedule.get("games") or []
-
-    records: Dict[str, Dict[str, Any]] = {
-        tid: {"wins": 0, "losses": 0, "pf": 0, "pa": 0}
-        for tid in ALL_TEAM_IDS
-    }
-
-    for g in games:
-        if g.get("status") != "final":
-            continue
-        home_id = g.get("home_team_id")
-        away_id = g.get("away_team_id")
-        home_score = g.get("home_score")
-        away_score = g.get("away_score")
-        if home_id not in records or away_id not in records:
-            continue
-        if home_score is None or away_score is None:
-            continue
-
-        records[home_id]["pf"] += home_score
-        records[home_id]["pa"] += away_score
-        records[away_id]["pf"] += away_score
-        records[away_id]["pa"] += home_score
-
-        if home_score > away_score:
-            records[home_id]["wins"] += 1
-            records[away_id]["losses"] += 1
-        elif away_score > home_score:
-            records[away_id]["wins"] += 1
-            records[home_id]["losses"] += 1
-
-    return records
+    return get_team_records()
 
 
 def get_conference_standings() -> Dict[str, List[Dict[str, Any]]]:
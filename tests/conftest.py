@@ -0,0 +1,15 @@
+import pytest
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _temporary_game_store(tmp_path_factory):
+    """테스트 중 경기 기록은 저장소 기본 경로(saves/) 대신 임시 파일에 쓴다."""
+    try:
+        import game_store
+    except ImportError:  # pandas 등이 없으면 각 테스트가 skip 된다
+        yield
+        return
+
+    game_store.set_game_store(game_store.GameStore(str(tmp_path_factory.mktemp("store") / "games.sqlite")))
+    yield
+    game_store.set_game_store(None)
@@ -0,0 +1,73 @@
+import pytest
+
+pytest.importorskip("pandas")
+pytest.importorskip("numpy")
+
+from config import ALL_TEAM_IDS, ROSTER_DF
+from batch_engine import simulate_games_batch
+from league_sim import advance_league_until
+from match_engine import MatchEngine, Team
+from state import GAME_STATE, _build_master_schedule, _new_game_state, set_league_master_seed
+
+
+def _team(team_id, tactics=None):
+    return Team(team_id, ROSTER_DF[ROSTER_DF["Team"] == team_id], tactics=tactics)
+
+
+def test_batch_results_match_single_game_shape():
+    home_id, away_id = ALL_TEAM_IDS[0], ALL_TEAM_IDS[1]
+    single = MatchEngine(_team(home_id), _team(away_id), seed=7).simulate_game()
+    batch = simulate_games_batch([(_team(home_id), _team(away_id))], seed=7)
+
+    assert len(batch) == 1
+    result = batch[0]
+    assert set(result) == set(single)
+    assert set(result["final_score"]) == {home_id, away_id}
+    for team_id in (home_id, away_id):
+        assert [r["PlayerID"] for r in result["boxscore"][team_id]] == [
+            r["PlayerID"] for r in single["boxscore"][team_id]
+        ]
+        assert set(result["boxscore"][team_id][0]) == set(single["boxscore"][team_id][0])
+
+
+def test_batch_box_totals_are_consistent():
+    matchups = [
+        (_team(ALL_TEAM_IDS[i]), _team(ALL_TEAM_IDS[i + 1], {"defense_scheme": "zone_2_3"}))
+        for i in range(0, 10, 2)
+    ]
+    results = simulate_games_batch(matchups, seed=3)
+
+    for (home, away), result in zip(matchups, results):
+        for team in (home, away):
+            rows = result["boxscore"][team.team_id]
+            assert result["final_score"][team.team_id] == round(sum(r["PTS"] for r in rows))
+            assert sum(r["MIN"] for r in rows) == pytest.approx(240.0, abs=0.6)
+            for r in rows:
+                assert r["FGM"] <= r["FGA"]
+                assert r["3PM"] <= r["3PA"] <= r["FGA"]
+                assert r["FTM"] <= r["FTA"]
+                assert r["PTS"] == 2 * r["FGM"] + r["3PM"] + r["FTM"]
+
+
+def test_batch_is_reproducible_for_seed():
+    matchups = [(_team(ALL_TEAM_IDS[2]), _team(ALL_TEAM_IDS[3]))] * 3
+    assert simulate_games_batch(matchups, seed=11) == simulate_games_batch(matchups, seed=11)
+
+
+def _advance_in_steps(engine_mode, steps):
+    GAME_STATE.clear()
+    GAME_STATE.update(_new_game_state())
+    set_league_master_seed(8)
+    _build_master_schedule(2024)
+    start = GAME_STATE["league"]["season_start"]
+    days = sorted(d for d in GAME_STATE["league"]["master_schedule"]["by_date"] if d >= start)[:3]
+    for day in (days if steps else days[-1:]):
+        advance_league_until(day, engine_mode=engine_mode)
+    return [(g["game_id"], g["home_score"], g["away_score"]) for g in GAME_STATE["games"]], dict(GAME_STATE["player_stats"])
+
+
+@pytest.mark.parametrize("engine_mode", ["batch", "quick"])
+def test_advancing_day_by_day_matches_one_advance(engine_mode):
+    once = _advance_in_steps(engine_mode, steps=False)
+    assert once[0]
+    assert _advance_in_steps(engine_mode, steps=True) == once
@@ -0,0 +1,141 @@
+import copy
+import json
+import os
+
+import pytest
+
+pytest.importorskip("pandas")
+
+import persistence
+from config import ROSTER_DF
+from event_log import EventLog, get_event_log, set_event_log
+from game_store import get_game_store
+from league_sim import advance_league_until
+from playoffs import build_postseason_field, compute_postseason_field, reset_postseason_state
+from roster_registry import get_roster_registry
+from state import (
+    GAME_STATE,
+    _build_master_schedule,
+    _new_game_state,
+    initialize_master_schedule_if_needed,
+    set_league_master_seed,
+)
+from trades_ai import _execute_trade, _would_break_hard_cap
+
+_KEYS = ("games", "player_stats", "transactions", "league", "postseason", "turn")
+
+
+def _snapshot():
+    return {key: copy.deepcopy(GAME_STATE.get(key)) for key in _KEYS}, ROSTER_DF["Team"].to_dict()
+
+
+@pytest.fixture
+def log(tmp_path):
+    GAME_STATE.clear()
+    GAME_STATE.update(_new_game_state())
+    log = EventLog(str(tmp_path), checkpoint_every=150)
+    set_event_log(log)
+    log.recover()
+    yield log
+    set_event_log(None)
+    persistence._apply_roster_deltas({})
+
+
+def test_recover_and_restore_to_past_date(log, tmp_path):
+    set_league_master_seed(4)
+    _build_master_schedule(2025)
+    advance_league_until("2025-11-10", engine_mode="quick")
+    early = _snapshot()
+
+    registry = get_roster_registry()
+    a, b = next(
+        (a, b)
+        for a in registry.player_ids_for("ATL")
+        for b in registry.player_ids_for("BOS")
+        if not _would_break_hard_cap("ATL", "BOS", [a], [b])
+    )
+    _execute_trade("2025-11-11", "ATL", "BOS", [a], [b])
+    assert GAME_STATE["transactions"]
+    advance_league_until("2025-11-30", engine_mode="quick")
+    reset_postseason_state()
+    final = _snapshot()
+    assert len(log.checkpoints()) > 2
+
+    # 프로세스가 죽은 것처럼 메모리 상태를 버리고 다시 연다
+    log.close()
+    GAME_STATE.clear()
+    GAME_STATE.update(_new_game_state())
+    persistence._apply_roster_deltas({})
+    reopened = EventLog(str(tmp_path), checkpoint_every=150)
+    set_event_log(reopened)
+    recovered = reopened.recover()
+    assert 0 < recovered["replayed"] < 150
+    assert _snapshot() == final
+
+    # 트레이드 이전 날짜로 되돌리면 로스터도 돌아간다
+    restored = reopened.restore_to("2025-11-10")
+    assert _snapshot() == early
+    assert registry.team_of(a) == "ATL"
+    assert reopened.checkpoints()[-1]["base"]
+    with pytest.raises(ValueError):
+        reopened.restore_to("2025-10-01")
+    with pytest.raises(ValueError):
+        reopened.restore_to("not-a-date")
+    assert restored["restored_seq"] < reopened.seq
+
+
+def test_nested_changes_are_one_event_and_torn_tail_is_dropped(log, tmp_path):
+    reset_postseason_state()
+    events = list(log.events())
+    assert [(e["type"], e["data"]["op"]) for e in events] == [("postseason", "reset_postseason_state")]
+
+    seq = log.seq
+    log.close()
+    with open(os.path.join(str(tmp_path), "events.jsonl"), "ab") as f:
+        f.write(json.dumps({"seq": seq + 1, "type": "set_date"})[:10].encode("utf-8"))
+    reopened = EventLog(str(tmp_path))
+    assert reopened.seq == seq
+    assert len(list(reopened.events())) == len(events)
+    reopened.close()
+
+    # 열린 로그가 없으면 기록하지 않는다
+    set_event_log(None)
+    reset_postseason_state()
+    assert get_event_log() is None
+
+
+def test_field_preview_is_read_only_and_building_it_is_logged(log):
+    initialize_master_schedule_if_needed()
+    before, seq = _snapshot(), log.seq
+    field = compute_postseason_field()
+    assert set(field) == {"east", "west"}
+    assert _snapshot() == before and log.seq == seq
+
+    assert build_postseason_field() == field
+    assert GAME_STATE["postseason"]["field"] == field
+    new = [e for e in log.events() if e["seq"] > seq]
+    assert [(e["type"], e["data"]["op"]) for e in new] == [("postseason", "build_postseason_field")]
+
+
+def test_new_timeline_drops_stale_store_games(log, tmp_path):
+    store = get_game_store()
+    stale = {"game_id": "2020-11-01_ATL_BOS", "date": "2020-11-01", "home_team_id": "ATL",
+             "away_team_id": "BOS", "home_score": 100, "away_score": 99}
+
+    # 이전 리그가 남긴 경기는 새 로그를 열 때 지워진다
+    store.record_game(stale, {})
+    store.flush()
+    assert store.count_games() == 1
+    fresh = EventLog(str(tmp_path / "fresh"))
+    set_event_log(fresh)
+    fresh.recover()
+    assert store.count_games() == 0
+
+    # 새 마스터 스케줄도 새 타임라인이다
+    store.record_game(stale, {})
+    store.flush()
+    assert store.count_games() == 1
+    set_league_master_seed(4)
+    _build_master_schedule(2025)
+    assert store.count_games() == 0
+    fresh.close()
@@ -0,0 +1,39 @@
+import pytest
+
+pytest.importorskip("pandas")
+pytest.importorskip("numpy")
+
+from config import ALL_TEAM_IDS, ROSTER_DF
+from batch_engine import BatchMatchEngine
+from expected_outcome import expected_outcome, expected_outcomes
+from match_engine import Team
+
+
+def _team(team_id, tactics=None):
+    return Team(team_id, ROSTER_DF[ROSTER_DF["Team"] == team_id], tactics=tactics)
+
+
+def test_expected_outcome_matches_simulated_distribution():
+    home, away = _team(ALL_TEAM_IDS[4]), _team(ALL_TEAM_IDS[7], {"defense_scheme": "zone_2_3"})
+    outcome = expected_outcome(home, away)
+
+    scores = BatchMatchEngine([(home, away)] * 3000, seed=21).simulate_scores()
+    margin = scores[:, 0] - scores[:, 1]
+
+    assert outcome.home_score == pytest.approx(scores[:, 0].mean(), abs=1.0)
+    assert outcome.away_score == pytest.approx(scores[:, 1].mean(), abs=1.0)
+    assert outcome.margin_std == pytest.approx(margin.std(), rel=0.08)
+    assert outcome.home_win_prob == pytest.approx((margin > 0).mean(), abs=0.04)
+    assert outcome.away_win_prob == pytest.approx((margin < 0).mean(), abs=0.04)
+    assert outcome.home_possessions + outcome.away_possessions == pytest.approx(outcome.possessions)
+
+
+def test_expected_outcomes_batch_matches_single_calls():
+    teams = [_team(tid) for tid in ALL_TEAM_IDS[:4]]
+    matchups = [(h, a) for h in teams for a in teams if h is not a]
+    outcomes = expected_outcomes(matchups)
+
+    assert [(o.home_team_id, o.away_team_id) for o in outcomes] == [
+        (h.team_id, a.team_id) for h, a in matchups
+    ]
+    assert expected_outcome(*matchups[3]) == outcomes[3]
@@ -0,0 +1,91 @@
+import json
+
+import pytest
+
+pytest.importorskip("pandas")
+
+import game_store
+from config import HARD_CAP
+from game_store import GameStore
+from league_sim import advance_league_until
+from quick_sim import simulate_games_quick
+from roster_registry import get_roster_registry
+from state import GAME_STATE, _build_master_schedule, set_league_master_seed
+
+
+def _game(date, home, away, seed):
+    registry = get_roster_registry()
+    result = simulate_games_quick([(registry.build_team(home), registry.build_team(away))], seed=seed)[0]
+    game = {
+        "game_id": f"{date}_{home}_{away}",
+        "date": date,
+        "home_team_id": home,
+        "away_team_id": away,
+        "home_score": result["final_score"][home],
+        "away_score": result["final_score"][away],
+    }
+    return game, result["boxscore"]
+
+
+def test_store_round_trips_boxscores_and_filters():
+    store = GameStore(":memory:")
+    g1, box1 = _game("2024-11-01", "ATL", "BOS", 1)
+    g2, box2 = _game("2024-11-03", "BOS", "CHI", 2)
+    store.record_game(g1, box1)
+    store.record_game(g2, box2)
+    store.record_transaction({"date": "2024-11-02", "type": "trade", "teams_involved": ["BOS", "LAL"]})
+
+    assert store.boxscore(g1["game_id"]) == box1
+    # 카운팅 스탯은 정수, 나머지는 실수 (엔진 결과와 JSON 모양까지 같다)
+    assert json.dumps(store.boxscore(g1["game_id"])) == json.dumps(dict(box1))
+    assert store.boxscore("nope") is None
+    assert store.count_games() == 2
+
+    assert [g["game_id"] for g in store.games(team_id="BOS")] == [g1["game_id"], g2["game_id"]]
+    assert [g["game_id"] for g in store.games(start="2024-11-02")] == [g2["game_id"]]
+    assert [g["game_id"] for g in store.games(team_id="ATL", end="2024-11-02")] == [g1["game_id"]]
+
+    pid = box1["BOS"][0]["PlayerID"]
+    lines = store.player_games(pid)
+    assert [l["date"] for l in lines] == ["2024-11-01", "2024-11-03"]
+    assert lines[0]["opponent_id"] == "ATL" and lines[0]["is_home"] == 0
+    assert lines[0]["PTS"] == box1["BOS"][0]["PTS"]
+    assert len(store.team_player_games("BOS", start="2024-11-02")) == len(box2["BOS"])
+    assert [t["type"] for t in store.transactions(team_id="LAL")] == ["trade"]
+    assert store.transactions(team_id="ATL") == []
+
+    # 같은 game_id 를 다시 쓰면 덮어쓴다
+    g1_again, box1_again = _game("2024-11-01", "ATL", "BOS", 7)
+    store.record_game(g1_again, box1_again)
+    assert store.count_games() == 2
+    assert store.boxscore(g1["game_id"]) == box1_again
+
+
+def test_advance_league_writes_one_batch_per_day(monkeypatch):
+    GAME_STATE["games"] = []
+    GAME_STATE["player_stats"] = {}
+    GAME_STATE["league"] = {
+        "master_schedule": {"games": [], "by_team": {}, "by_date": {}},
+        "trade_rules": {"hard_cap": HARD_CAP, "trade_deadline": None},
+    }
+    set_league_master_seed(3)
+    _build_master_schedule(2024)
+
+    store = GameStore(":memory:")
+    monkeypatch.setattr(game_store, "_STORE", store)
+    flushed = []
+    flush = store.flush
+    monkeypatch.setattr(store, "flush", lambda: flushed.append(flush()) or flushed[-1])
+
+    start = GAME_STATE["league"]["season_start"]
+    by_date = GAME_STATE["league"]["master_schedule"]["by_date"]
+    days = sorted(d for d in by_date if d >= start)[:4]
+    simulated = advance_league_until(days[-1], engine_mode="quick")
+
+    # 하루치씩 flush (+ 마지막 트레이드 틱 뒤 flush)
+    assert [n for n in flushed if n] == [len(by_date[d]) for d in days]
+    assert store.count_games() == len(simulated)
+    g = simulated[0]
+    box = store.boxscore(g["game_id"])
+    assert set(box) == {g["home_team_id"], g["away_team_id"]}
+    assert sum(r["PTS"] for r in box[g["home_team_id"]]) == g["home_score"]
@@ -0,0 +1,61 @@
+import pytest
+
+pytest.importorskip("pandas")
+
+import persistence
+from quick_sim import simulate_games_quick
+from roster_registry import get_roster_registry
+from stat_aggregator import STAT_INDEX, StatAggregator
+from state import GAME_STATE
+from stats_util import compute_league_leaders
+from trades_ai import _execute_trade, _would_break_hard_cap
+
+
+def _boxscores():
+    registry = get_roster_registry()
+    teams = ["ATL", "BOS", "CHI", "DAL"]
+    pairs = [(registry.build_team(h), registry.build_team(a)) for h in teams for a in teams if h != a]
+    return [r["boxscore"] for r in simulate_games_quick(pairs, seed=8)]
+
+
+def _full_sort(agg, stat, k, min_games):
+    per_game, games, ids = agg.per_game()[:, STAT_INDEX[stat]], agg.games(), agg.player_ids()
+    rows = [(per_game[r], ids[r]) for r in range(len(ids)) if games[r] > 0 and games[r] >= min_games]
+    rows.sort(key=lambda t: t[0], reverse=True)
+    return [(pid, value) for value, pid in rows[:k]]
+
+
+def test_incremental_boards_match_full_sort():
+    agg = StatAggregator()
+    agg.leaders("PTS")  # 빈 상태에서 순위표를 만든 뒤 증분 갱신
+    for i, box in enumerate(_boxscores()):
+        agg.add_boxscore(box)
+        for stat in ("PTS", "3PM"):
+            for k, min_games in ((5, 0), (3, i // 2), (1000, 1)):
+                got = [(r["player_id"], r["per_game"]) for r in agg.leaders(stat, k=k, min_games=min_games)]
+                assert got == _full_sort(agg, stat, k, min_games)
+
+    # 처음 조회하는 스탯은 그 시점에 만든다
+    assert [(r["player_id"], r["per_game"]) for r in agg.leaders("BLK", k=4)] == _full_sort(agg, "BLK", 4, 0)
+
+    for bad in ({"stat": "XYZ"}, {"stat": "PTS", "k": 0}, {"stat": "PTS", "min_games": -1}):
+        with pytest.raises(ValueError):
+            agg.leaders(**bad)
+
+
+def test_leaders_follow_traded_player():
+    GAME_STATE["player_stats"] = agg = StatAggregator()
+    for box in _boxscores():
+        agg.add_boxscore(box)
+
+    leader = compute_league_leaders(limit=1)["PTS"][0]
+    pid, team = leader["player_id"], leader["team_id"]
+    other = "BOS" if team != "BOS" else "ATL"
+    registry = get_roster_registry()
+    partner = next(b for b in registry.player_ids_for(other) if not _would_break_hard_cap(team, other, [pid], [b]))
+    try:
+        _execute_trade("2025-12-01", team, other, [pid], [partner])
+        leaders = compute_league_leaders(limit=1)["PTS"]
+        assert [(r["player_id"], r["team_id"], r["PTS"]) for r in leaders] == [(pid, other, leader["PTS"])]
+    finally:
+        persistence._apply_roster_deltas({})
@@ -0,0 +1,72 @@
+import pytest
+
+pytest.importorskip("pandas")
+np = pytest.importorskip("numpy")
+
+from config import ALL_TEAM_IDS
+from lineup_optimizer import _neighbours, clear_lineup_cache, optimize_lineup
+
+
+def test_neighbours_change_one_player():
+    key = (frozenset({1, 2, 3, 4, 5}), frozenset({6, 7}))
+    roster = list(range(1, 10))
+    neighbours = _neighbours(key, roster)
+
+    # 선발<->벤치 5*2 + 선발<->밖 5*2 + 벤치<->밖 2*2
+    assert len(neighbours) == len(set(neighbours)) == 24
+    for starters, bench in neighbours:
+        assert len(starters) == 5 and len(bench) == 2
+        assert not starters & bench
+        assert len((starters | bench) ^ (key[0] | key[1])) in (0, 2)
+
+
+def test_optimizer_proposes_lineup_and_reuses_scores():
+    clear_lineup_cache()
+    team_id, opponent_id = ALL_TEAM_IDS[0], ALL_TEAM_IDS[1]
+    kwargs = dict(base_tactics={"rotation_size": 7}, games=8, max_iterations=2)
+    result = optimize_lineup(team_id, opponent_id, **kwargs)
+
+    starters, bench = result["lineup"]["starters"], result["lineup"]["bench"]
+    assert len(starters) == 5 and len(bench) == 2
+    assert not set(starters) & set(bench)
+    assert sum(result["minutes"].values()) == pytest.approx(240.0)
+    assert [p["PlayerID"] for p in result["players"]] == starters + bench
+    assert result["evaluated_lineups"] > 1
+    lo, hi = result["vs_baseline"]["ci95"]
+    assert lo <= result["vs_baseline"]["net_rating"] <= hi
+
+    again = optimize_lineup(team_id.lower(), opponent_id, **kwargs)
+    assert again["evaluated_lineups"] == 0
+    assert again["lineup"] == result["lineup"]
+    assert again["net_rating"] == result["net_rating"]
+
+
+def test_optimizer_rejects_bad_input():
+    with pytest.raises(ValueError):
+        optimize_lineup("NOPE")
+    with pytest.raises(ValueError):
+        optimize_lineup(ALL_TEAM_IDS[0], ALL_TEAM_IDS[0])
+    with pytest.raises(ValueError):
+        optimize_lineup(ALL_TEAM_IDS[0], games=0)
+
+
+def test_league_mode_plays_every_opponent_equally(monkeypatch):
+    import lineup_optimizer
+
+    schedules = []
+
+    def fake_ratings(teams, schedule, seed, workers):
+        schedules.append([opp.team_id for opp, _ in schedule])
+        return np.zeros((len(teams), (len(schedule) + 1) // 2))
+
+    clear_lineup_cache()
+    monkeypatch.setattr(lineup_optimizer, "_net_ratings", fake_ratings)
+    result = optimize_lineup(ALL_TEAM_IDS[0], games=48, max_iterations=1)
+
+    opponents = [tid for tid in ALL_TEAM_IDS if tid != ALL_TEAM_IDS[0]]
+    assert result["games_per_lineup"] == 2 * len(opponents)
+    for schedule in schedules:
+        # 안티테틱 쌍은 같은 경기이므로 앞 절반만으로 모든 상대를 같은 횟수만큼 만나야 한다
+        half = schedule[: len(schedule) // 2]
+        assert sorted(half) == sorted(opponents * (len(half) // len(opponents)))
+    clear_lineup_cache()
@@ -0,0 +1,120 @@
+import asyncio
+import threading
+
+import pytest
+
+pytest.importorskip("pandas")
+
+from config import ALL_TEAM_IDS
+from live_games import MAX_PACE, LiveGame, clear_live_games, get_live_game, start_live_game
+from match_engine import MatchEngine
+from roster_registry import get_roster_registry
+
+
+def _teams():
+    registry = get_roster_registry()
+    return registry.build_team(ALL_TEAM_IDS[0]), registry.build_team(ALL_TEAM_IDS[1])
+
+
+def test_viewers_share_one_simulation():
+    clear_live_games()
+    home, away = _teams()
+    finished = []
+
+    game = start_live_game("g1", home, away, seed=21, on_finish=finished.append)
+    assert start_live_game("g1", *_teams(), seed=99) is game
+    assert get_live_game("g1") is game
+
+    # 여러 시청자가 동시에 따라 읽어도 같은 이벤트 로그를 본다
+    seen = [None, None, None]
+
+    def watch(k):
+        seen[k] = list(game.iter_events(pace=0.001 if k == 0 else 0.0))
+
+    threads = [threading.Thread(target=watch, args=(k,)) for k in range(3)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(30)
+
+    assert seen[0] == seen[1] == seen[2]
+    assert [i for i, _ in seen[0]] == list(range(len(seen[0])))
+    assert seen[0][-1][1]["type"] == "game_end"
+    assert any(e["type"] == "box_score" for _, e in seen[0])
+
+    # 경기는 한 번만 끝났고, 결과는 같은 seed 의 simulate_game 과 같다
+    assert game.wait(5)
+    home, away = _teams()
+    assert finished == [game.result] == [MatchEngine(home, away, seed=21).simulate_game()]
+
+    # 중간부터 이어 보기 (재연결)
+    resumed = list(game.iter_events(start=10))
+    assert resumed == seen[0][10:]
+
+
+def test_bad_viewer_arguments():
+    clear_live_games()
+    game = start_live_game("g2", *_teams(), seed=1)
+    with pytest.raises(ValueError):
+        game.iter_events(pace=-1.0)
+    with pytest.raises(ValueError):
+        game.iter_events(start=-1)
+    assert get_live_game("missing") is None
+
+
+def test_cancelled_game_never_reports_its_result():
+    clear_live_games()
+    finished = []
+    game = LiveGame("g3", *_teams(), seed=5, on_finish=finished.append)
+    game.cancel()
+    assert game.start().wait(30)
+    assert finished == [] and game.result is None
+    assert [e["type"] for e in game.events] == ["game_cancelled"]
+
+    # 리그를 바꿀 때 (clear_live_games) 진행 중인 경기도 취소된다
+    running = start_live_game("g4", *_teams(), seed=5)
+    clear_live_games()
+    assert running.cancelled and get_live_game("g4") is None
+
+
+def test_result_is_handed_back_to_the_starting_event_loop():
+    clear_live_games()
+    finished = []
+
+    async def main():
+        game = start_live_game("g5", *_teams(), seed=6, on_finish=lambda r: finished.append(threading.get_ident()))
+        while not finished:
+            await asyncio.sleep(0.01)
+        return game
+
+    game = asyncio.run(main())
+    assert finished == [threading.get_ident()]
+    assert game.wait(5) and game.events[-1]["type"] == "game_end"
+
+
+def test_async_viewers_wait_on_the_event_loop_without_threads():
+    clear_live_games()
+    game = start_live_game("g6", *_teams(), seed=7)
+    threads_before = threading.active_count()
+    seen_threads = []
+
+    async def watch(k):
+        out = []
+        async for i, event in game.aiter_events(pace=0.001 if k % 2 else 0.0):
+            out.append((i, event))
+            if len(out) == 20:
+                seen_threads.append(threading.active_count())
+        return out
+
+    async def main():
+        return await asyncio.gather(*(watch(k) for k in range(30)))
+
+    views = asyncio.run(main())
+    assert game.wait(5)
+    assert all(v == views[0] for v in views)
+    assert views[0] == list(game.iter_events())
+    assert views[0][-1][1]["type"] == "game_end"
+    # 시청자 수만큼 스레드가 늘지 않는다 (프로듀서 스레드만)
+    assert max(seen_threads) <= threads_before
+    with pytest.raises(ValueError):
+        game.aiter_events(pace=MAX_PACE + 1)
@@ -0,0 +1,47 @@
+import pytest
+
+pytest.importorskip("pandas")
+pytest.importorskip("numpy")
+
+from config import ALL_TEAM_IDS
+from matchup_predict import clear_prediction_cache, predict_matchup
+
+
+def test_prediction_is_consistent_and_cached():
+    clear_prediction_cache()
+    home_id, away_id = ALL_TEAM_IDS[0], ALL_TEAM_IDS[1]
+    first = predict_matchup(home_id, away_id, simulations=300)
+
+    assert first["cached"] is False
+    assert first["home_win_prob"] + first["away_win_prob"] + first["tie_prob"] == pytest.approx(1.0)
+    assert first["win_prob_std_error"] > 0
+    for key in (home_id, away_id, "margin"):
+        values = list(first["score_percentiles"][key].values())
+        assert values == sorted(values)
+    for team_id in (home_id, away_id):
+        lines = first["projected_box"][team_id]
+        assert sum(line["PTS"] for line in lines) == pytest.approx(first["expected_score"][team_id], abs=1.0)
+
+    again = predict_matchup(home_id.lower(), away_id, simulations=300)
+    assert again["cached"] is True
+    assert again["home_win_prob"] == first["home_win_prob"]
+
+    other = predict_matchup(home_id, away_id, home_tactics={"pace": 2}, simulations=300)
+    assert other["cached"] is False
+
+
+def test_prediction_rejects_bad_input():
+    with pytest.raises(ValueError):
+        predict_matchup(ALL_TEAM_IDS[0], "NOPE")
+    with pytest.raises(ValueError):
+        predict_matchup(ALL_TEAM_IDS[0], ALL_TEAM_IDS[1], simulations=0)
+
+
+def test_prediction_stops_early_at_target_std_error():
+    clear_prediction_cache()
+    home_id, away_id = ALL_TEAM_IDS[2], ALL_TEAM_IDS[3]
+    loose = predict_matchup(home_id, away_id, simulations=3000, target_std_error=0.5)
+    assert loose["simulations"] == 500
+
+    with pytest.raises(ValueError):
+        predict_matchup(home_id, away_id, target_std_error=0.0)
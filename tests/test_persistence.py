@@ -0,0 +1,104 @@
+import copy
+import json
+import os
+
+import pytest
+
+pytest.importorskip("pandas")
+
+import persistence
+from config import ROSTER_DF
+from game_store import get_game_store
+from persistence import list_saves, load_league, save_league
+from quick_sim import simulate_games_quick
+from roster_registry import get_roster_registry
+from state import (
+    GAME_STATE,
+    _build_master_schedule,
+    _ensure_league_state,
+    set_league_master_seed,
+    update_state_with_game,
+)
+
+
+def _finished_season():
+    """마스터 스케줄 전체가 끝난 시즌 + 경기마다 박스스코어."""
+    GAME_STATE["games"] = []
+    GAME_STATE["player_stats"] = {}
+    GAME_STATE["league"] = {"master_schedule": {"games": [], "by_team": {}, "by_date": {}}}
+    set_league_master_seed(5)
+    _build_master_schedule(2024)
+
+    registry = get_roster_registry()
+    box = simulate_games_quick([(registry.build_team("ATL"), registry.build_team("BOS"))], seed=1)[0]["boxscore"]
+    for g in _ensure_league_state()["master_schedule"]["games"]:
+        g.update(status="final", home_score=100, away_score=90)
+        GAME_STATE["games"].append(dict(g, boxscore=copy.deepcopy(box)))
+
+
+def test_save_load_round_trip(tmp_path):
+    _finished_season()
+    registry = get_roster_registry()
+    pid = registry.player_ids_for("ATL")[0]
+    try:
+        # 트레이드처럼 소속 변경
+        ROSTER_DF.at[pid, "Team"] = "BOS"
+        registry.move_player(pid, "BOS")
+
+        get_game_store().clear()
+        stored_games = get_game_store().count_games()
+        save_league("s1", str(tmp_path))
+        save_league("s2", str(tmp_path))
+        expected = {key: copy.deepcopy(GAME_STATE[key]) for key in ("games", "league", "turn")}
+
+        # 저장 후 진행된 경기는 불러오면 사라진다
+        g = expected["league"]["master_schedule"]["games"][0]
+        update_state_with_game(g["home_team_id"], g["away_team_id"], {g["home_team_id"]: 1}, game_date=g["date"])
+        assert get_game_store().count_games() == stored_games + 1
+
+        # 되돌린 뒤 s1 을 불러오면 상태와 로스터가 돌아온다
+        ROSTER_DF.at[pid, "Team"] = "ATL"
+        registry.move_player(pid, "ATL")
+        loaded = load_league("s1", str(tmp_path))
+
+        assert loaded["games"] == len(expected["games"])
+        assert loaded["seconds"] < 1.0
+        for key, value in expected.items():
+            assert GAME_STATE[key] == value
+        assert ROSTER_DF.at[pid, "Team"] == "BOS"
+        assert registry.team_of(pid) == "BOS"
+        assert get_game_store().count_games() == stored_games
+        assert {s["slot"] for s in list_saves(str(tmp_path))} == {"s1", "s2"}
+    finally:
+        persistence._apply_roster_deltas({})
+    assert registry.team_of(pid) == "ATL"
+
+
+def test_incremental_save_only_rewrites_changed_chunks(tmp_path):
+    _finished_season()
+    first = save_league("s", str(tmp_path))
+    GAME_STATE["games"][-1]["home_score"] = 101
+    second = save_league("s", str(tmp_path))
+    assert first["written_blobs"] > 10
+    assert second["written_blobs"] == 1
+
+    blob_dir = os.path.join(str(tmp_path), "s", persistence.BLOB_DIR)
+    assert len(os.listdir(blob_dir)) == second["blobs"]  # 참조되지 않는 블롭은 정리
+
+
+def test_load_rejects_bad_slots_and_newer_formats(tmp_path):
+    with pytest.raises(ValueError):
+        save_league("../escape", str(tmp_path))
+    with pytest.raises(FileNotFoundError):
+        load_league("missing", str(tmp_path))
+
+    _finished_season()
+    save_league("s", str(tmp_path))
+    path = os.path.join(str(tmp_path), "s", persistence.MANIFEST_NAME)
+    with open(path, encoding="utf-8") as f:
+        manifest = json.load(f)
+    manifest["format"] = persistence.SNAPSHOT_FORMAT + 1
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f)
+    with pytest.raises(ValueError):
+        load_league("s", str(tmp_path))
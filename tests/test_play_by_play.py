@@ -0,0 +1,85 @@
+import time
+
+import pytest
+
+pytest.importorskip("pandas")
+
+import match_engine
+from config import ALL_TEAM_IDS
+from match_engine import MatchEngine
+from play_by_play import stream_game
+from roster_registry import get_roster_registry
+
+
+def _teams():
+    registry = get_roster_registry()
+    return registry.build_team(ALL_TEAM_IDS[0]), registry.build_team(ALL_TEAM_IDS[1])
+
+
+def test_stream_matches_simulate_game():
+    home, away = _teams()
+    expected = MatchEngine(home, away, seed=11).simulate_game()
+    events = list(stream_game(home, away, seed=11))
+
+    assert events[0]["type"] == "game_start"
+    assert events[-1]["type"] == "game_end"
+    assert events[-1]["result"] == expected
+    assert events[-1]["score"] == expected["final_score"]
+    assert [e["quarter"] for e in events if e["type"] == "quarter_end"] == [1, 2, 3, 4]
+
+    # 이벤트 득점 합 = 최종 스코어, 이벤트 수 = 박스스코어 합계
+    points = {home.team_id: 0, away.team_id: 0}
+    for e in events:
+        if e["type"] == "shot":
+            points[e["team_id"]] += e["points"]
+        elif e["type"] == "free_throws":
+            points[e["team_id"]] += e["made"]
+    assert points == expected["final_score"]
+
+    for kind, key in (("rebound", "REB"), ("assist", "AST"), ("turnover", "TOV"), ("foul", "PF")):
+        n_events = sum(1 for e in events if e["type"] == kind)
+        box_total = sum(row[key] for rows in expected["boxscore"].values() for row in rows)
+        assert n_events == box_total, kind
+
+    shots = [e for e in events if e["type"] == "shot"]
+    assert all(e["shot_type"] in match_engine.SHOT_TYPES for e in shots)
+    assert all(e["play_type"] in match_engine.PLAY_TYPES for e in shots)
+    order = [(e["possession"], e["quarter"]) for e in events if "possession" in e]
+    assert order == sorted(order)
+
+    # box_every 는 이벤트를 끼워 넣기만 하고 결과는 그대로
+    boxed = list(stream_game(home, away, seed=11, box_every=20))
+    assert boxed[-1]["result"] == expected
+    snapshots = [e for e in boxed if e["type"] == "box_score"]
+    assert [e["possession"] for e in snapshots] == list(range(19, expected["meta"]["possessions"] - 1, 20))
+    assert [e for e in boxed if e["type"] != "box_score"] == events
+
+
+def _time_games(home, away, n=20, repeats=5):
+    best = float("inf")
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        for seed in range(n):
+            MatchEngine(home, away, seed=seed).simulate_game()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def test_unsubscribed_simulate_game_has_no_overhead():
+    """벤치마크 가드: 스트림이 있어도 simulate_game 의 핫 루프는 그대로여야 한다."""
+    hot = ("simulate_game", "_simulate_possession", "_pick_play_type", "_pick_shot_type", "_resolve_shot")
+    original = {name: MatchEngine.__dict__[name] for name in hot}
+
+    home, away = _teams()
+    baseline = _time_games(home, away)
+
+    # 진행 중인 구독자가 있어도 다른 경기의 simulate_game 은 느려지지 않는다
+    other_home, other_away = _teams()
+    stream = stream_game(other_home, other_away, seed=3)
+    for _ in range(50):
+        next(stream)
+    with_subscriber = _time_games(home, away)
+    stream.close()
+
+    assert {name: MatchEngine.__dict__[name] for name in hot} == original
+    assert with_subscriber < baseline * 1.25 + 0.005
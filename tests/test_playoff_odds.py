@@ -0,0 +1,81 @@
+import pytest
+
+pytest.importorskip("pandas")
+np = pytest.importorskip("numpy")
+
+from config import ALL_TEAM_IDS
+from playoff_odds import StrengthModel, _format_odds, _season_snapshot, _simulate_chunk
+from state import initialize_master_schedule_if_needed
+
+
+def _snapshot():
+    initialize_master_schedule_if_needed()
+    strength = np.linspace(-6.0, 6.0, len(ALL_TEAM_IDS))
+    model = StrengthModel(tuple(ALL_TEAM_IDS), strength, home_adv=2.0, sigma=12.0)
+    return _season_snapshot(model)
+
+
+def test_probabilities_are_consistent():
+    snap = _snapshot()
+    runs = 300
+    odds = _format_odds(snap, _simulate_chunk(snap, runs, seed=5), runs)["teams"]
+
+    assert sum(t["title"] for t in odds.values()) == pytest.approx(1.0)
+    assert sum(t["make_playoffs"] for t in odds.values()) == pytest.approx(16.0)
+    assert sum(t["make_play_in"] for t in odds.values()) == pytest.approx(8.0)
+    for t in odds.values():
+        assert sum(t["seed"].values()) == pytest.approx(1.0)
+        rounds = list(t["win_round"].values())
+        assert t["make_playoffs"] >= rounds[0] >= rounds[1] >= rounds[2] >= rounds[3]
+
+
+def test_chunks_are_reproducible_for_seed():
+    snap = _snapshot()
+    a = _simulate_chunk(snap, 50, seed=9)
+    b = _simulate_chunk(snap, 50, seed=9)
+    assert all((a[k] == b[k]).all() for k in a)
+
+
+def test_antithetic_chunks_report_paired_std_error():
+    snap = _snapshot()
+    runs = 200
+    counts = _simulate_chunk(snap, runs, seed=5, antithetic=True)
+    assert int(counts["units"][0]) == runs // 2
+
+    odds = _format_odds(snap, counts, runs)
+    assert 0.0 < odds["max_std_error"] < 0.5
+    for t in odds["teams"].values():
+        p = t["make_playoffs"]
+        if 0.0 < p < 1.0:
+            assert t["make_playoffs_std_error"] > 0.0
+
+
+def test_zero_std_error_meets_the_stopping_target(monkeypatch):
+    import playoff_odds
+
+    snap = _snapshot()
+    # 남은 경기가 없고 성적이 좋은 팀이 항상 이기면 진출 팀이 정해져 표준오차가 정확히 0 이다
+    snap["rem_home"] = snap["rem_away"] = snap["mu"] = np.zeros(0, dtype=np.int64)
+    snap["wins"] = np.arange(len(ALL_TEAM_IDS), dtype=np.int64)
+    snap["losses"] = snap["wins"][::-1].copy()
+    snap["p_home"] = (snap["wins"][:, None] > snap["wins"][None, :]).astype(float)
+    monkeypatch.setattr(playoff_odds, "get_strength_model", lambda: None)
+    monkeypatch.setattr(playoff_odds, "_season_snapshot", lambda model: snap)
+
+    outs = list(playoff_odds.iter_playoff_odds(runs=400, seed=3, chunk_runs=100, target_std_error=0.01))
+    assert outs[-1]["max_std_error"] == 0.0
+    assert outs[-1]["done"] and outs[-1]["runs"] == 100
+
+
+def test_default_seed_follows_league_content_not_process_counters(monkeypatch):
+    import playoff_odds
+    import state
+
+    initialize_master_schedule_if_needed()
+    model = StrengthModel(tuple(ALL_TEAM_IDS), np.linspace(-6.0, 6.0, len(ALL_TEAM_IDS)), 2.0, 12.0)
+    monkeypatch.setattr(playoff_odds, "get_strength_model", lambda: model)
+
+    first = playoff_odds.compute_playoff_odds(runs=60, antithetic=False)
+    # 다른 프로세스에서 같은 리그를 불러온 것처럼 성적 캐시 버전만 달라져도 결과는 같다
+    monkeypatch.setattr(state, "_TEAM_RECORDS_VERSION", state._TEAM_RECORDS_VERSION + 1000)
+    assert playoff_odds.compute_playoff_odds(runs=60, antithetic=False) == first
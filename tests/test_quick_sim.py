@@ -0,0 +1,78 @@
+import time
+
+import pytest
+
+pytest.importorskip("pandas")
+pytest.importorskip("numpy")
+
+from config import ALL_TEAM_IDS, ROSTER_DF
+from match_engine import MatchEngine, Team
+from quick_sim import calibration_report, simulate_games_quick
+from stat_aggregator import StatAggregator
+
+
+def _team(team_id, tactics=None):
+    return Team(team_id, ROSTER_DF[ROSTER_DF["Team"] == team_id], tactics=tactics)
+
+
+def test_quick_results_match_engine_shape_and_box_totals():
+    home, away = _team(ALL_TEAM_IDS[0]), _team(ALL_TEAM_IDS[1], {"defense_scheme": "zone_2_3"})
+    single = MatchEngine(home, away, seed=1).simulate_game()
+    results = simulate_games_quick([(home, away)] * 20, seed=4)
+
+    for result in results:
+        assert set(result) == set(single)
+        for team in (home, away):
+            rows = result["boxscore"][team.team_id]
+            assert [r["PlayerID"] for r in rows] == [p.player_id for p in team.rotation_players]
+            assert set(rows[0]) == set(single["boxscore"][team.team_id][0])
+            assert result["final_score"][team.team_id] == sum(r["PTS"] for r in rows)
+            for r in rows:
+                assert r["PTS"] == 2 * r["FGM"] + r["3PM"] + r["FTM"]
+                assert r["FGM"] <= r["FGA"] and r["FTM"] <= r["FTA"]
+
+    again = simulate_games_quick([(home, away)] * 20, seed=4)
+    assert [r["final_score"] for r in again] == [r["final_score"] for r in results]
+
+
+def test_quick_engine_is_calibrated_against_full_engine():
+    home, away = _team(ALL_TEAM_IDS[2]), _team(ALL_TEAM_IDS[3], {"offense_scheme": "post_up_focus", "defense_scheme": "switch_all"})
+    report = calibration_report(home, away, n_games=300, seed=11)
+
+    for key in ("home_PTS", "away_PTS", "margin", "total", "home_REB", "away_AST", "home_FTA", "away_TOV"):
+        assert abs(report[key]["z"]) < 4.0, (key, report[key])
+        assert report[key]["quick_std"] == pytest.approx(report[key]["full_std"], rel=0.25), key
+
+
+def _best_time(fn, repeats):
+    best = float("inf")
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def test_quick_boxscore_path_is_50x_faster_than_full_engine():
+    """벤치마크 가드: 박스스코어까지 포함한 quick 경로가 MatchEngine 보다 50배 이상 빠르다."""
+    teams = [_team(t) for t in ALL_TEAM_IDS]
+    pairs = [(teams[i % len(teams)], teams[(i * 7 + 3) % len(teams)]) for i in range(420)]
+    pairs = [(h, a) for h, a in pairs if h is not a][:400]
+
+    def full():
+        for seed, (home, away) in enumerate(pairs[:20]):
+            MatchEngine(home, away, seed=seed).simulate_game()
+
+    simulate_games_quick(pairs, seed=1)  # 쌍 모델 캐시
+    full_per_game = _best_time(full, 3) / 20
+    quick_per_game = _best_time(lambda: simulate_games_quick(pairs, seed=1), 5) / len(pairs)
+    assert full_per_game / quick_per_game >= 50.0, (full_per_game, quick_per_game)
+
+
+def test_stat_aggregator_reads_engine_boxscore_arrays():
+    home, away = _team(ALL_TEAM_IDS[4]), _team(ALL_TEAM_IDS[5])
+    arrays, rows = StatAggregator(), StatAggregator()
+    for result in simulate_games_quick([(home, away), (away, home)] * 5, seed=2):
+        arrays.add_boxscore(result["boxscore"])
+        rows.add_boxscore({tid: list(r) for tid, r in result["boxscore"].items()})
+    assert dict(arrays) == dict(rows)
@@ -0,0 +1,63 @@
+import pytest
+
+pytest.importorskip("pandas")
+
+from config import ALL_TEAM_IDS, ROSTER_DF
+from match_engine import MatchEngine, Team
+from roster_registry import RosterRegistry, TeamCache
+
+
+def _df_team(df, team_id):
+    return Team(team_id, df[df["Team"] == team_id])
+
+
+def test_build_team_matches_dataframe_team():
+    registry = RosterRegistry(ROSTER_DF)
+    home_id, away_id = ALL_TEAM_IDS[4], ALL_TEAM_IDS[5]
+
+    from_df = MatchEngine(_df_team(ROSTER_DF, home_id), _df_team(ROSTER_DF, away_id), seed=21)
+    from_registry = MatchEngine(registry.build_team(home_id), registry.build_team(away_id), seed=21)
+
+    assert from_registry.simulate_game() == from_df.simulate_game()
+
+
+def test_move_player_updates_roster_and_version():
+    df = ROSTER_DF.copy()
+    registry = RosterRegistry(df)
+    src, dst = ALL_TEAM_IDS[0], ALL_TEAM_IDS[1]
+    pid = registry.player_ids_for(src)[0]
+    versions = (registry.roster_version(src), registry.roster_version(dst))
+
+    df.at[pid, "Team"] = dst
+    registry.move_player(pid, dst)
+
+    assert registry.team_of(pid) == dst
+    assert registry.roster_version(src) == versions[0] + 1
+    assert registry.roster_version(dst) == versions[1] + 1
+    for team_id in (src, dst):
+        assert [p.player_id for p in registry.build_team(team_id).players] == [
+            p.player_id for p in _df_team(df, team_id).players
+        ]
+
+
+def test_build_team_unknown_team_raises():
+    with pytest.raises(ValueError):
+        RosterRegistry(ROSTER_DF).build_team("XXX")
+
+
+def test_team_cache_reuses_until_roster_or_tactics_change():
+    df = ROSTER_DF.copy()
+    registry = RosterRegistry(df)
+    cache = TeamCache(registry)
+    team_id, other_id = ALL_TEAM_IDS[0], ALL_TEAM_IDS[1]
+
+    team = cache.get(team_id, {"minutes": {1: 30}, "pace": 1})
+    team.players[0].add(1, 12.0)
+    again = cache.get(team_id, {"pace": 1, "minutes": {"1": 30}})
+    assert again is team
+    assert again.players[0].stats["PTS"] == 0.0
+
+    assert cache.get(team_id, {"pace": 2}) is not team
+
+    registry.move_player(registry.player_ids_for(team_id)[0], other_id)
+    assert cache.get(team_id, {"pace": 1, "minutes": {"1": 30}}) is not team
@@ -1,9 +1,12 @@
+from datetime import date
+
 import pytest
 
 pytest.importorskip("pandas")
 
-from config import ALL_TEAM_IDS, HARD_CAP
-from state import GAME_STATE, _build_master_schedule, _ensure_league_state
+from config import ALL_TEAM_IDS, HARD_CAP, MAX_GAMES_PER_DAY
+from schedule_builder import DEFAULT_MAX_BACK_TO_BACKS
+from state import GAME_STATE, _build_master_schedule, _ensure_league_state, set_league_master_seed
 
 
 def _reset_schedule_state():
@@ -46,3 +49,38 @@ def test_home_away_balance_is_evenly_split():
         diff = abs(home_counts[tid] - away_counts[tid])
         assert diff <= 2, f"Home/away split too uneven for {tid}: {diff}"
         assert home_counts[tid] + away_counts[tid] == 82
+
+
+def test_schedule_is_reproducible_for_master_seed():
+    schedules = []
+    for _ in range(2):
+        _reset_schedule_state()
+        set_league_master_seed(2024)
+        _build_master_schedule(2024)
+        schedules.append([g["game_id"] for g in _ensure_league_state()["master_schedule"]["games"]])
+
+    assert schedules[0] == schedules[1]
+
+
+def test_schedule_never_double_books_and_respects_rest_limits():
+    _reset_schedule_state()
+    _build_master_schedule(2024)
+    master = _ensure_league_state()["master_schedule"]
+
+    for date_str, game_ids in master["by_date"].items():
+        assert len(game_ids) <= MAX_GAMES_PER_DAY
+        teams_today = [tid for gid in game_ids for tid in gid.split("_")[1:]]
+        assert len(teams_today) == len(set(teams_today)), date_str
+
+    days_by_team = {tid: [] for tid in ALL_TEAM_IDS}
+    for g in master["games"]:
+        day = date.fromisoformat(g["date"]).toordinal()
+        days_by_team[g["home_team_id"]].append(day)
+        days_by_team[g["away_team_id"]].append(day)
+
+    for tid, days in days_by_team.items():
+        days.sort()
+        back_to_backs = sum(1 for a, b in zip(days, days[1:]) if b == a + 1)
+        three_in_a_row = sum(1 for a, c in zip(days, days[2:]) if c == a + 2)
+        assert back_to_backs <= DEFAULT_MAX_BACK_TO_BACKS, tid
+        assert three_in_a_row == 0, tid
@@ -0,0 +1,12 @@
+from seed_util import derive_rng, derive_seed
+
+
+def test_derive_seed_is_stable_and_key_sensitive():
+    assert derive_seed(7, "game", "2025-10-21_BOS_NYK") == derive_seed(7, "game", "2025-10-21_BOS_NYK")
+    assert derive_seed(7, "game", "2025-10-21_BOS_NYK") != derive_seed(8, "game", "2025-10-21_BOS_NYK")
+    assert derive_seed(7, "game", "a") != derive_seed(7, "trade_tick", "a")
+    assert derive_seed(7, "ab", "c") != derive_seed(7, "a", "bc")
+
+
+def test_derive_rng_streams_are_reproducible():
+    assert derive_rng(3, "schedule", 2025).random() == derive_rng(3, "schedule", 2025).random()
@@ -0,0 +1,27 @@
+import pytest
+
+pytest.importorskip("pandas")
+
+from config import ALL_TEAM_IDS
+from match_engine import MatchEngine
+from roster_registry import get_roster_registry
+from sim_pool import shutdown_pool, simulate_games_parallel
+
+
+def test_parallel_results_match_serial_run():
+    registry = get_roster_registry()
+    teams = {tid: registry.build_team(tid) for tid in ALL_TEAM_IDS[:6]}
+    ids = list(teams)
+    games = [
+        (teams[ids[i]], teams[ids[(i + k) % 6]], 500 + 10 * k + i)
+        for k in (1, 2)
+        for i in range(6)
+    ]
+
+    serial = [MatchEngine(home, away, seed=seed).simulate_game() for home, away, seed in games]
+    try:
+        parallel = simulate_games_parallel(games, workers=2)
+    finally:
+        shutdown_pool()
+
+    assert parallel == serial
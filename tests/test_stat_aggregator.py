@@ -0,0 +1,71 @@
+import json
+import pickle
+
+import numpy as np
+import pytest
+
+pytest.importorskip("pandas")
+
+from match_engine import BOX_STAT_KEYS
+from quick_sim import simulate_games_quick
+from roster_registry import get_roster_registry
+from stat_aggregator import STAT_INDEX, StatAggregator
+from state import GAME_STATE, _update_player_stats_from_boxscore
+from stats_util import compute_league_leaders
+
+
+def _boxscores(n):
+    registry = get_roster_registry()
+    pairs = [(registry.build_team("ATL"), registry.build_team("BOS")), (registry.build_team("BOS"), registry.build_team("CHI"))]
+    return [r["boxscore"] for r in simulate_games_quick(pairs * (n // 2), seed=3)]
+
+
+def test_accumulates_every_box_stat():
+    boxes = _boxscores(6)
+    agg = StatAggregator(capacity=4)  # 중간에 배열이 늘어나도 값은 그대로
+    for box in boxes:
+        agg.add_boxscore(box)
+
+    lines = [r for box in boxes for rows in box.values() for r in rows]
+    pid = lines[0]["PlayerID"]
+    mine = [r for r in lines if r["PlayerID"] == pid]
+    entry = agg[pid]
+    assert entry["games"] == len(mine)
+    for k in BOX_STAT_KEYS:
+        assert entry["totals"][k] == pytest.approx(sum(r[k] for r in mine))
+
+    row = agg.row_of(pid)
+    minutes = entry["totals"]["MIN"]
+    assert agg.per_game()[row, STAT_INDEX["PTS"]] == pytest.approx(entry["totals"]["PTS"] / len(mine))
+    assert agg.per_36()[row, STAT_INDEX["PTS"]] == pytest.approx(entry["totals"]["PTS"] * 36 / minutes)
+    assert agg.totals().shape == (len(agg), len(BOX_STAT_KEYS))
+    with pytest.raises(ValueError):
+        agg.totals()[0, 0] = 1.0
+
+    # 빠지거나 잘못된 값은 0
+    agg.add_boxscore({"ATL": [{"PlayerID": pid, "PTS": None, "MIN": "x"}]})
+    assert agg[pid]["games"] == len(mine) + 1
+    assert agg[pid]["totals"]["PTS"] == entry["totals"]["PTS"]
+
+
+def test_reads_like_legacy_player_stats():
+    GAME_STATE["player_stats"] = {7: {"player_id": 7, "name": "Old", "team_id": "ATL", "games": 2, "totals": {"PTS": 40.0}}}
+    box = _boxscores(2)[0]
+    _update_player_stats_from_boxscore(box)
+    stats = GAME_STATE["player_stats"]
+
+    assert isinstance(stats, StatAggregator)
+    assert stats[7]["totals"]["PTS"] == 40.0 and stats[7]["games"] == 2
+    assert stats.get(-1, {}) == {}
+    assert len(stats) == 1 + sum(len(rows) for rows in box.values())
+    assert pickle.loads(pickle.dumps(stats)) == stats
+    assert json.loads(json.dumps(dict(stats)))["7"]["name"] == "Old"
+
+    leaders = compute_league_leaders()
+    per_game = sorted(
+        ((e["totals"]["PTS"] / e["games"], pid) for pid, e in stats.items() if e["games"]),
+        key=lambda t: t[0],
+        reverse=True,
+    )
+    assert [r["player_id"] for r in leaders["PTS"]] == [pid for _, pid in per_game[:5]]
+    assert np.isclose(leaders["PTS"][0]["PTS"], per_game[0][0])
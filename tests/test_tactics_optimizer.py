@@ -0,0 +1,78 @@
+import pytest
+
+pytest.importorskip("pandas")
+np = pytest.importorskip("numpy")
+
+from batch_engine import BatchMatchEngine
+from config import ALL_TEAM_IDS
+from roster_registry import get_roster_registry
+from seed_util import derive_seed
+from state import get_league_master_seed
+from tactics_optimizer import _SEARCH_KEYS, _run_round, optimize_tactics
+
+
+def test_crn_block_shares_uniforms_across_blocks():
+    registry = get_roster_registry()
+    a = registry.build_team(ALL_TEAM_IDS[0])
+    b = registry.build_team(ALL_TEAM_IDS[1])
+    c = registry.build_team(ALL_TEAM_IDS[0], tactics={"pace": 2})
+
+    # 블록 수가 달라도 같은 seed / 블록 크기면 각 블록은 같은 결과
+    single = BatchMatchEngine([(a, b)] * 4, seed=5, crn_block=4).simulate_scores()
+    double = BatchMatchEngine([(a, b)] * 4 + [(c, b)] * 4, seed=5, crn_block=4).simulate_scores()
+    assert np.array_equal(single, double[:4])
+
+    with pytest.raises(ValueError):
+        BatchMatchEngine([(a, b)] * 3, seed=5, crn_block=2)
+
+
+def test_optimizer_returns_ranked_configs_with_paired_intervals():
+    team_id, opponent_id = ALL_TEAM_IDS[0], ALL_TEAM_IDS[1]
+    result = optimize_tactics(team_id, opponent_id, n_candidates=8, games_per_round=8, top_k=2)
+
+    assert [r["candidates"] for r in result["rounds"]] == [8, 4, 2]
+    assert [r["games_per_candidate"] for r in result["rounds"]] == [8, 16, 32]
+
+    best = result["best"]
+    assert len(best) == 2
+    assert best[0]["mean_margin"] >= best[1]["mean_margin"]
+    assert result["validation_games"] == 64
+    for entry in best:
+        assert entry["games"] == 64
+        lo, hi = entry["margin_ci95"]
+        assert lo <= entry["mean_margin"] <= hi
+        lo, hi = entry["vs_baseline"]["ci95"]
+        assert lo <= entry["vs_baseline"]["mean_margin"] <= hi
+        assert 6 <= entry["tactics"]["rotation_size"] <= 10
+
+    assert result["baseline"]["games"] == 64
+    assert result["baseline"]["vs_baseline"]["mean_margin"] == 0.0
+
+    again = optimize_tactics(team_id.lower(), opponent_id, n_candidates=8, games_per_round=8, top_k=2)
+    assert again["best"] == best
+
+
+def test_reported_intervals_come_from_the_held_out_run():
+    team_id, opponent_id = ALL_TEAM_IDS[2], ALL_TEAM_IDS[3]
+    result = optimize_tactics(team_id, opponent_id, n_candidates=8, games_per_round=8, top_k=2)
+
+    # best / baseline 의 수치는 탐색 표본이 아니라 validate seed 로 다시 돌린 경기에서 나온다
+    registry = get_roster_registry()
+    base = registry.build_team(team_id).tactics
+    entries = [result["baseline"]] + result["best"]
+    teams = [registry.build_team(team_id, tactics={**base, **e["tactics"]}) for e in entries]
+    seed = derive_seed(derive_seed(get_league_master_seed(), "tactics_opt", team_id, opponent_id), "validate")
+    margins = _run_round(teams, registry.build_team(opponent_id), result["validation_games"], seed, workers=1)
+
+    for entry, row in zip(entries, margins):
+        assert set(entry["tactics"]) == set(_SEARCH_KEYS)
+        assert entry["mean_margin"] == pytest.approx(float(row.mean()))
+        assert entry["vs_baseline"]["mean_margin"] == pytest.approx(float((row - margins[0]).mean()))
+    assert all("search_mean_margin" in e for e in result["best"])
+
+
+def test_optimizer_rejects_bad_input():
+    with pytest.raises(ValueError):
+        optimize_tactics(ALL_TEAM_IDS[0], ALL_TEAM_IDS[0])
+    with pytest.raises(ValueError):
+        optimize_tactics(ALL_TEAM_IDS[0], ALL_TEAM_IDS[1], games_per_round=7)
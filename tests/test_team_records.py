@@ -0,0 +1,50 @@
+import pytest
+
+pytest.importorskip("pandas")
+
+from config import HARD_CAP
+from state import (
+    GAME_STATE,
+    _build_master_schedule,
+    _ensure_league_state,
+    get_team_records,
+    get_team_records_version,
+    set_league_master_seed,
+    update_state_with_game,
+)
+
+
+def _reset_league():
+    GAME_STATE["games"] = []
+    GAME_STATE["player_stats"] = {}
+    GAME_STATE["league"] = {
+        "master_schedule": {"games": [], "by_team": {}, "by_date": {}},
+        "trade_rules": {"hard_cap": HARD_CAP, "trade_deadline": None},
+    }
+    set_league_master_seed(11)
+    _build_master_schedule(2024)
+
+
+def test_records_update_when_games_go_final():
+    _reset_league()
+    games = _ensure_league_state()["master_schedule"]["games"]
+    g = games[0]
+    home, away = g["home_team_id"], g["away_team_id"]
+    before = get_team_records()
+    version = get_team_records_version()
+
+    update_state_with_game(home, away, {home: 101, away: 99}, game_date=g["date"])
+
+    after = get_team_records()
+    assert get_team_records_version() > version
+    assert after[home]["wins"] == before[home]["wins"] + 1
+    assert after[away]["losses"] == before[away]["losses"] + 1
+    assert after[home]["pf"] == before[home]["pf"] + 101
+
+    # 같은 경기를 다시 확정하면 이전 결과를 대체한다
+    update_state_with_game(home, away, {home: 90, away: 100}, game_date=g["date"])
+    again = get_team_records()
+    assert again[home]["wins"] == before[home]["wins"]
+    assert again[home]["losses"] == before[home]["losses"] + 1
+    assert again[away]["wins"] == before[away]["wins"] + 1
+    assert again[away]["pa"] == before[away]["pa"] + 90
@@ -0,0 +1,57 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from variance_reduction import (
+    RandomStream,
+    StoppingRule,
+    antithetic_pairs,
+    estimate,
+    mirrored,
+    pair_means,
+)
+
+
+def test_plain_stream_matches_generator():
+    a = RandomStream(np.random.default_rng(3)).uniforms(6, 4)
+    b = np.random.default_rng(3).random((6, 4))
+    assert np.array_equal(a, b)
+
+    z = RandomStream(np.random.default_rng(3)).normals(6, 4)
+    assert np.array_equal(z, np.random.default_rng(3).standard_normal((6, 4)))
+
+
+def test_blocks_share_draws_and_antithetic_mirrors():
+    U = RandomStream(np.random.default_rng(1), antithetic=True, block=4).uniforms(12, 3)
+    assert np.array_equal(U[:4], U[4:8])
+    assert np.allclose(U[:2] + U[2:4], 1.0)
+
+    Z = RandomStream(np.random.default_rng(1), antithetic=True).normals(5, 2)
+    assert np.allclose(Z[:2], -Z[3:5])
+
+    with pytest.raises(ValueError):
+        RandomStream(np.random.default_rng(1), block=4).uniforms(6, 1)
+
+
+def test_pairing_helpers():
+    assert antithetic_pairs(5).tolist() == [[0, 3], [1, 4]]
+    assert mirrored(["a", "b", "c"], 6) == ["a", "b", "c", "a", "b", "c"]
+    assert mirrored(["a", "b"], 5) == ["a", "b", "a", "a", "b"]
+    # 홀수 길이: 가운데 값은 짝 없이 남는다
+    assert pair_means(np.array([1.0, 2.0, 3.0, 5.0, 6.0])).tolist() == [3.0, 4.0, 3.0]
+
+
+def test_estimate_and_stopping_rule():
+    est = estimate(np.array([1.0, 2.0, 3.0, 4.0]))
+    assert est.mean == pytest.approx(2.5)
+    lo, hi = est.ci95
+    assert lo < 2.5 < hi and hi - lo == pytest.approx(2 * est.half_width)
+
+    rule = StoppingRule(max_samples=100, target_std_error=0.5, min_samples=10)
+    assert not rule.should_stop(5, 0.1)
+    assert rule.should_stop(10, 0.4)
+    assert not rule.should_stop(10, 0.6)
+    assert rule.should_stop(100, 9.0)
+    assert not StoppingRule(max_samples=100).should_stop(50, 0.0)
+    with pytest.raises(ValueError):
+        StoppingRule(max_samples=10, target_std_error=0.0)
@@ -1,12 +1,17 @@
 from __future__ import annotations
 
 from datetime import date
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 import random
 
 from config import ROSTER_DF, HARD_CAP
-from state import GAME_STATE, _ensure_league_state
+from event_log import record_event
+from game_store import get_game_store
+from roster_registry import get_roster_registry
+from seed_util import derive_rng
+from stat_aggregator import ensure_aggregator
+from state import GAME_STATE, _ensure_league_state, get_league_master_seed
 from team_utils import (
     _init_players_and_teams_if_needed,
     _compute_team_payroll,
@@ -52,26 +57,31 @@ def _execute_trade(
 ) -> None:
     """실제로 트레이드를 적용.
 
-    - ROSTER_DF의 Team 값을 교환
-    - GAME_STATE["players"]의 team_id 업데이트
+    - ROSTER_DF의 Team 값을 교환 (로스터 레지스트리 소속도 함께 갱신)
+    - GAME_STATE["players"], 시즌 player_stats 의 team_id 업데이트
     - GAME_STATE["transactions"], GAME_STATE["cached_views"]["news"]에 기록
     """
     # 먼저 하드캡 체크
     if _would_break_hard_cap(team_a_id, team_b_id, players_from_a, players_from_b):
         return
 
-    # 선수 이동
+    # 선수 이동 (시즌 스탯 / 리그 리더의 소속 표시도 새 팀으로)
+    season_stats = ensure_aggregator(GAME_STATE, "player_stats")
     for pid in players_from_a:
         if pid in ROSTER_DF.index:
             ROSTER_DF.at[pid, "Team"] = team_b_id
+            get_roster_registry().move_player(pid, team_b_id)
         if pid in GAME_STATE["players"]:
             GAME_STATE["players"][pid]["team_id"] = team_b_id
+        season_stats.set_team(pid, team_b_id)
 
     for pid in players_from_b:
         if pid in ROSTER_DF.index:
             ROSTER_DF.at[pid, "Team"] = team_a_id
+            get_roster_registry().move_player(pid, team_a_id)
         if pid in GAME_STATE["players"]:
             GAME_STATE["players"][pid]["team_id"] = team_a_id
+        season_stats.set_team(pid, team_a_id)
 
     # 트랜잭션 로그
     transaction = {
@@ -82,9 +92,10 @@ def _execute_trade(
         "players_from_b": players_from_b,
     }
     GAME_STATE["transactions"].append(transaction)
+    get_game_store().record_transaction(transaction)
 
     # 뉴스 추가
-    news_items = GAME_STATE["cached_views"]["news"]["items"]
+    news_items = GAME_STATE["cached_views"].setdefault("news", {}).setdefault("items", [])
 
     def _player_name(pid: int) -> str:
         pmeta = GAME_STATE["players"].get(pid)
@@ -112,13 +123,24 @@ def _execute_trade(
         "related_player_ids": players_from_a + players_from_b,
     })
 
+    record_event("trade", {
+        "trade_date": trade_date,
+        "team_a_id": team_a_id,
+        "team_b_id": team_b_id,
+        "players_from_a": players_from_a,
+        "players_from_b": players_from_b,
+    }, trade_date)
+
 
-def _run_ai_gm_tick(current_date: date) -> None:
+def _run_ai_gm_tick(current_date: date, rng: Optional[random.Random] = None) -> None:
     """리그 전체를 대상으로 AI GM 트레이드를 시도.
 
     - 트레이드 데드라인 이후에는 아무 것도 하지 않음.
     - 일주일에 한 번 정도 호출되도록 외부에서 제어.
+    - rng 를 주지 않으면 리그 마스터 seed 에서 (틱 날짜별로) 파생한 스트림을 쓴다.
     """
+    if rng is None:
+        rng = derive_rng(get_league_master_seed(), "trade_tick", current_date.isoformat())
     _init_players_and_teams_if_needed()
     from state import initialize_master_schedule_if_needed  # 지연 import
     initialize_master_schedule_if_needed()
@@ -144,8 +166,8 @@ def _run_ai_gm_tick(current_date: date) -> None:
     if not contenders or not rebuilders:
         return
 
-    random.shuffle(contenders)
-    random.shuffle(rebuilders)
+    rng.shuffle(contenders)
+    rng.shuffle(rebuilders)
 
     trades_done = 0    # 한 번의 틱에서 최대 3건 정도만
     max_trades = 3
@@ -156,7 +178,7 @@ def _run_ai_gm_tick(current_date: date) -> None:
 
         # 파트너 리빌딩 팀 선택
         partner_candidates = rebuilders[:]
-        random.shuffle(partner_candidates)
+        rng.shuffle(partner_candidates)
         for rebuild_id in partner_candidates:
             if cont_id == rebuild_id:
                 continue
@@ -291,3 +313,4 @@ def _run_ai_gm_tick_if_needed(current_date: date) -> None:
     # 트레이드 데드라인 지난 경우 _run_ai_gm_tick 내부에서 조용히 리턴됨
     _run_ai_gm_tick(current_date)
     league["last_gm_tick_date"] = current_date.isoformat()
+    record_event("gm_tick", {"date": league["last_gm_tick_date"]}, league["last_gm_tick_date"])
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, TypeVar
+
+import numpy as np
+
+# NOTE: 엔진 / 워커 프로세스에서도 쓰이므로 numpy 외에는 import 하지 않는다.
+#
+# 몬테카를로 API 공통의 분산 감소 도구.
+#   - common random numbers: 비교하는 설정들이 같은 난수 블록을 쓰게 해 차이를 짝짓는다.
+#   - antithetic: 블록 안에서 j 와 j + ceil(n/2) 가 반대 난수 (U / 1 - U, Z / -Z) 를 쓴다.
+#     이 쌍의 평균을 독립 표본 하나로 보고 표준오차를 계산한다.
+#   - StoppingRule: 표준오차가 목표 이하가 되면 표본 추가를 멈춘다.
+
+T = TypeVar("T")
+
+Z_95 = 1.96
+
+
+# -----------------------------
+# 난수 스트림
+# -----------------------------
+class RandomStream:
+    """행 단위 난수 블록 스트림.
+
+    block=n 이면 행을 n 개씩 묶어 각 묶음의 j 번째 행이 같은 난수를 쓴다 (CRN).
+    같은 rng 상태 / 같은 n 이면 묶음 수와 무관하게 같은 난수가 나온다.
+    block 과 antithetic 이 모두 꺼져 있으면 rng.random / rng.standard_normal 과 똑같이 뽑는다.
+    """
+
+    def __init__(self, rng: np.random.Generator, antithetic: bool = False, block: Optional[int] = None):
+        if block is not None and block <= 0:
+            raise ValueError(f"invalid block: {block}")
+        self.rng = rng
+        self.antithetic = antithetic
+        self.block = block
+
+    def _draw(self, rows: int, cols: int, normal: bool) -> np.ndarray:
+        n = self.block or rows
+        if rows % n:
+            raise ValueError(f"block must divide the number of rows: {n}")
+        draw = self.rng.standard_normal if normal else self.rng.random
+        if self.antithetic:
+            half = draw(((n + 1) // 2, cols))
+            mirror = -half if normal else 1.0 - half
+            out = np.concatenate([half, mirror])[:n]
+        else:
+            out = draw((n, cols))
+        return out if n == rows else np.tile(out, (rows // n, 1))
+
+    def uniforms(self, rows: int, cols: int) -> np.ndarray:
+        """(rows, cols) 균등 난수 [0, 1)."""
+        return self._draw(rows, cols, normal=False)
+
+    def normals(self, rows: int, cols: int) -> np.ndarray:
+        """(rows, cols) 표준정규 난수."""
+        return self._draw(rows, cols, normal=True)
+
+
+# -----------------------------
+# 안티테틱 쌍
+# -----------------------------
+def antithetic_pairs(n: int) -> np.ndarray:
+    """길이 n 블록의 안티테틱 쌍 인덱스 (n // 2, 2). (n 이 홀수면 가운데 하나는 짝이 없다)"""
+    half = (n + 1) // 2
+    j = np.arange(n - half)
+    return np.stack([j, j + half], axis=1)
+
+
+def mirrored(items: Sequence[T], n: int) -> List[T]:
+    """items 를 돌아가며 길이 n 으로 늘리되 j 와 j + ceil(n/2) 가 같은 항목이 되게 한다.
+
+    안티테틱 쌍이 같은 매치업(같은 홈 / 원정)끼리 묶이도록 일정을 짤 때 쓴다.
+    """
+    half = [items[i % len(items)] for i in range((n + 1) // 2)]
+    return half + half[: n - len(half)]
+
+
+def pair_means(values: np.ndarray) -> np.ndarray:
+    """마지막 축(길이 n)의 안티테틱 쌍 평균. 짝 없는 가운데 값은 그대로 남긴다.
+
+    결과의 각 값은 서로 독립인 표본이다.
+    """
+    n = values.shape[-1]
+    half = (n + 1) // 2
+    m = n - half
+    means = (values[..., :m] + values[..., half:half + m]) / 2.0
+    if half > m:
+        means = np.concatenate([means, values[..., m:half]], axis=-1)
+    return means
+
+
+# -----------------------------
+# 추정 / 정지 규칙
+# -----------------------------
+@dataclass(frozen=True)
+class Estimate:
+    mean: float
+    std_error: float
+    samples: int
+
+    @property
+    def ci95(self) -> List[float]:
+        half = Z_95 * self.std_error
+        return [self.mean - half, self.mean + half]
+
+    @property
+    def half_width(self) -> float:
+        return Z_95 * self.std_error
+
+
+def estimate(samples: np.ndarray) -> Estimate:
+    """독립 표본들의 평균과 표준오차 (정규 근사)."""
+    n = len(samples)
+    mean = float(samples.mean()) if n else 0.0
+    std_error = float(samples.std(ddof=1)) / math.sqrt(n) if n > 1 else math.inf
+    return Estimate(mean, std_error, n)
+
+
+def proportion_std_error(p: np.ndarray, n: int) -> np.ndarray:
+    """n 번 중 비율 p 의 이항 표준오차. (안티테틱 표본이면 보수적인 값)"""
+    return np.sqrt(p * (1.0 - p) / max(1, n))
+
+
+@dataclass(frozen=True)
+class StoppingRule:
+    """표준오차가 target_std_error 이하가 되면 멈춘다.
+
+    - target_std_error=None 이면 항상 max_samples 까지 돈다.
+    - min_samples 전에는 멈추지 않는다 (초반 분산 추정이 불안정하므로).
+    """
+
+    max_samples: int
+    target_std_error: Optional[float] = None
+    min_samples: int = 0
+
+    def __post_init__(self):
+        if self.target_std_error is not None and self.target_std_error <= 0:
+            raise ValueError(f"target_std_error must be positive: {self.target_std_error}")
+
+    def should_stop(self, samples: int, std_error: float) -> bool:
+        if samples >= self.max_samples:
+            return True
+        if self.target_std_error is None or samples < self.min_samples:
+            return False
+        return std_error <= self.target_std_error
+
+
+def split_batches(total: int, batch: int) -> List[int]:
+    """total 을 batch 크기 조각들로 나눈 크기 목록 (마지막 조각은 나머지)."""
+    sizes = [batch] * (total // batch)
+    if total % batch:
+        sizes.append(total % batch)
+    return sizes
+
+
+def paired_difference(a: np.ndarray, b: np.ndarray) -> Estimate:
+    """같은 난수로 돌린 두 설정의 표본(같은 길이 접두부)으로 차이 a - b 를 추정한다."""
+    n = min(len(a), len(b))
+    return estimate(a[:n] - b[:n])